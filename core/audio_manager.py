@@ -4,8 +4,9 @@ AudioManager: Queue-Based Audio Input/Output
 
 Responsibilities:
 - Manage sounddevice InputStream and OutputStream
-- Buffer audio frames in a queue (non-blocking)
-- Maintain ring buffer for pre-roll
+- Buffer input in a preallocated SPSC ring (core/audio_ring.py): bounded
+  memory, no per-frame allocation
+- Serve frames, pre-roll and the whole utterance as views into that ring
 - Provide synchronous read_frame() for main loop
 - Handle forceful playback stopping for barge-in
 """
@@ -14,13 +15,11 @@ Responsibilities:
 # 1) IMPORTS
 # ============================================================================
 import sounddevice as sd
-import numpy as np
 import threading
-import queue
 import logging
-import collections
 
 from core.audio_owner import get_audio_owner
+from core.audio_ring import AudioRingBuffer
 
 try:
     from core.instrumentation import log_event
@@ -37,6 +36,7 @@ BLOCK_SIZE = 512
 CHANNELS = 1
 INPUT_DTYPE = 'float32'
 PRE_ROLL_SECONDS = 0.5
+INPUT_BUFFER_SECONDS = 30.0  # ring capacity: pre-roll + longest utterance
 
 # ============================================================================
 # 3) OUTPUT CONSTANTS (PIPER DEFAULT)
@@ -49,7 +49,7 @@ OUTPUT_DTYPE = 'int16'
 # 4) AUDIO MANAGER
 # ============================================================================
 class AudioManager:
-    def __init__(self, input_device_index=None, output_device_index=None, on_owner_change=None):
+    def __init__(self, input_device_index=None, output_device_index=None, on_owner_change=None, buffer_seconds=INPUT_BUFFER_SECONDS):
         self.logger = logging.getLogger("ARGO.Audio")
         self.running = False
 
@@ -72,12 +72,10 @@ class AudioManager:
         self.logger.info(f"[AUDIO] Using output device: {output_device_index}")
         self.logger.info("[AUDIO] ================================")
         
-        # Audio Data Queue
-        self.input_queue = queue.Queue()
-        
-        # Ring Buffer for Pre-roll
-        maxlen = int(PRE_ROLL_SECONDS * INPUT_SAMPLE_RATE / BLOCK_SIZE)
-        self.ring_buffer = collections.deque(maxlen=maxlen)
+        # Input ring: frames, pre-roll and utterance audio all live here
+        self.input_ring = AudioRingBuffer(int(buffer_seconds * INPUT_SAMPLE_RATE), frame_size=BLOCK_SIZE)
+        self._preroll_samples = int(PRE_ROLL_SECONDS * INPUT_SAMPLE_RATE)
+        self._reported_overruns = 0
         
         # Streams
         self.input_stream = None
@@ -260,17 +258,20 @@ class AudioManager:
         if status:
             pass # Ignore underflows/overflows in logs to reduce noise
         
-        data = indata.copy()
-        self.input_queue.put(data)
+        self.input_ring.write(indata)
 
     def read_frame(self):
-        """Blocking read for main loop. Returns 512 samples."""
-        try:
-            frame = self.input_queue.get(timeout=1.0)
-            self.ring_buffer.append(frame)
-            return frame
-        except queue.Empty:
+        """Blocking read for main loop. Returns 512 samples, shape (512, 1), as a view into the ring."""
+        frame = self.input_ring.read(BLOCK_SIZE, timeout=1.0)
+        if frame is None:
             return None
+        if self.input_ring.overruns != self._reported_overruns:
+            self._reported_overruns = self.input_ring.overruns
+            self.logger.warning(
+                f"[AUDIO] Input overrun: consumer fell behind, "
+                f"{self.input_ring.dropped_samples} samples dropped so far"
+            )
+        return frame.reshape(-1, CHANNELS)
 
     def play_chunk(self, data):
         """Play raw PCM audio. Blocking write to stream."""
@@ -360,11 +361,17 @@ class AudioManager:
         return self._audio_owner.get_owner() or "NONE"
 
     def get_preroll(self):
-        if not self.ring_buffer:
-            return np.array([], dtype=INPUT_DTYPE)
-        return np.concatenate(list(self.ring_buffer))
+        """Last PRE_ROLL_SECONDS of input (including the frame just read)."""
+        return self.input_ring.preroll(self._preroll_samples).reshape(-1, CHANNELS)
+
+    def begin_utterance(self):
+        """Mark the utterance start (pre-roll included) and return the pre-roll."""
+        self.input_ring.mark(self._preroll_samples)
+        return self.input_ring.utterance().reshape(-1, CHANNELS)
+
+    def get_utterance(self):
+        """Audio from begin_utterance() through the last frame read (view unless it wraps)."""
+        return self.input_ring.utterance().reshape(-1, CHANNELS)
 
     def clear_buffers(self):
-        with self.input_queue.mutex:
-            self.input_queue.queue.clear()
-        self.ring_buffer.clear()
+        self.input_ring.clear()
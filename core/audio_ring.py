@@ -0,0 +1,153 @@
+"""
+AudioRingBuffer: preallocated single-producer/single-consumer sample ring
+
+Replaces the unbounded queue.Queue + pre-roll deque in AudioManager.
+
+- One float32 array allocated up front; memory stays bounded if the consumer stalls
+- Producer (sounddevice callback thread) copies each block in and publishes
+  it by advancing the write index; the consumer (main loop) only advances the
+  read index. No lock on the data path, just an Event to wake a blocked reader
+- Indices are absolute sample counts (monotonic), so pre-roll and the
+  whole-utterance slice are index ranges, served as views when they don't
+  wrap (zero-copy) and as one copy when they do
+- Overruns: when the consumer falls more than a buffer behind, the oldest
+  unread audio is skipped and counted (overruns / dropped_samples); an
+  utterance longer than the buffer is clipped to the newest audio and
+  counted in utterance_overruns
+
+Views are only valid until the producer wraps around to that slot (capacity
+seconds later); copy anything that must outlive the current utterance.
+"""
+
+# ============================================================================
+# 1) IMPORTS
+# ============================================================================
+import threading
+import time
+from typing import Optional
+
+import numpy as np
+
+
+# ============================================================================
+# 2) RING BUFFER
+# ============================================================================
+class AudioRingBuffer:
+    def __init__(self, capacity_samples: int, frame_size: int = 512, slack_frames: int = 4):
+        frames = max(slack_frames + 2, -(-int(capacity_samples) // frame_size))
+        self.capacity = frames * frame_size
+        self.frame_size = frame_size
+        self._slack = slack_frames * frame_size
+        self._buf = np.zeros(self.capacity, dtype=np.float32)
+        self._write = 0            # producer-owned: samples written (absolute)
+        self._read = 0             # consumer-owned: samples consumed (absolute)
+        self._floor = 0            # consumer-owned: oldest sample usable for pre-roll
+        self._mark: Optional[int] = None  # consumer-owned: utterance start
+        self._ready = threading.Event()
+        self.overruns = 0
+        self.dropped_samples = 0
+        self.utterance_overruns = 0
+
+    # ------------------------------------------------------------------
+    # Producer side
+    # ------------------------------------------------------------------
+    def write(self, data) -> None:
+        samples = np.asarray(data, dtype=np.float32).reshape(-1)
+        n = samples.size
+        if not n:
+            return
+        if n > self.capacity:
+            samples = samples[-self.capacity:]
+            n = self.capacity
+        start = self._write
+        pos = start % self.capacity
+        first = min(n, self.capacity - pos)
+        self._buf[pos:pos + first] = samples[:first]
+        if first < n:
+            self._buf[:n - first] = samples[first:]
+        self._write = start + n  # publish after the copy
+        self._ready.set()
+
+    # ------------------------------------------------------------------
+    # Consumer side
+    # ------------------------------------------------------------------
+    @property
+    def available(self) -> int:
+        return self._write - self._read
+
+    @property
+    def read_index(self) -> int:
+        return self._read
+
+    def _oldest(self) -> int:
+        """Oldest absolute index not at risk of being overwritten."""
+        return max(0, self._write - self.capacity + self._slack)
+
+    def _skip_overrun(self) -> None:
+        oldest = self._oldest()
+        if self._read < oldest:
+            self.overruns += 1
+            self.dropped_samples += oldest - self._read
+            self._read = oldest
+
+    def _view(self, start: int, end: int) -> np.ndarray:
+        if end <= start:
+            return self._buf[:0]
+        pos = start % self.capacity
+        length = end - start
+        if pos + length <= self.capacity:
+            return self._buf[pos:pos + length]
+        first = self.capacity - pos
+        return np.concatenate((self._buf[pos:], self._buf[:length - first]))
+
+    def read(self, n: Optional[int] = None, timeout: Optional[float] = None) -> Optional[np.ndarray]:
+        """Next n samples (default one frame) as a view, or None on timeout."""
+        n = n or self.frame_size
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.available < n:
+            self._ready.clear()
+            if self.available >= n:  # re-check after clear: no lost wake-up
+                break
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return None
+            self._ready.wait(remaining)
+        self._skip_overrun()
+        start = self._read
+        self._read = start + n
+        return self._view(start, start + n)
+
+    def preroll(self, samples: int) -> np.ndarray:
+        """Last `samples` consumed (not older than the last clear())."""
+        start = max(self._floor, self._read - samples, self._oldest())
+        return self._view(start, self._read)
+
+    def mark(self, preroll_samples: int = 0) -> int:
+        """Start an utterance at the read position minus pre-roll."""
+        self._mark = max(self._floor, self._read - preroll_samples, self._oldest())
+        return self._mark
+
+    def utterance(self) -> np.ndarray:
+        """Audio from mark() up to the read position (empty if no mark)."""
+        if self._mark is None:
+            return self._buf[:0]
+        oldest = self._oldest()
+        if self._mark < oldest:
+            self.utterance_overruns += 1
+            self._mark = oldest
+        return self._view(self._mark, self._read)
+
+    def clear(self) -> None:
+        """Drop unread audio and forget pre-roll / utterance mark."""
+        self._read = self._write
+        self._floor = self._read
+        self._mark = None
+
+    def stats(self) -> dict:
+        return {
+            "capacity_samples": self.capacity,
+            "available": self.available,
+            "overruns": self.overruns,
+            "dropped_samples": self.dropped_samples,
+            "utterance_overruns": self.utterance_overruns,
+        }
@@ -13,6 +13,7 @@ Usage:
 # ============================================================================
 # 1) IMPORTS
 # ============================================================================
+import copy
 import json
 import os
 import logging
@@ -233,7 +234,8 @@ class Config:
 _DEFAULT_CONFIG = {
     "system": {
         "log_level": "INFO",
-        "debug_mode": False
+        "debug_mode": False,
+        "import_budget_ms": 500
     },
     "audio": {
         "sample_rate": 16000,
@@ -243,7 +245,26 @@ _DEFAULT_CONFIG = {
         "always_listen": True,
         "max_recording_duration": 10.0,
         "silence_timeout_seconds": 2.5,
-        "silence_threshold": 30
+        "silence_threshold": 30,
+        "vad": {
+            "engine": "energy",
+            "start_threshold": 0.5,
+            "end_threshold": 0.35,
+            "start_ms": 64,
+            "hangover_ms": 160,
+            "end_silence_ms": 800,
+            "min_speech_ms": 180,
+            "snr_db": 9.0,
+            "silero_model_path": None,
+            "adaptive_endpoint": {
+                "enabled": True,
+                "min_silence_ms": 300,
+                "complete_silence_ms": 500,
+                "max_silence_ms": 1400,
+                "short_voiced_ms": 800,
+                "long_voiced_ms": 3000
+            }
+        }
     },
     "wake_word": {
         "model": "argo",
@@ -252,13 +273,36 @@ _DEFAULT_CONFIG = {
     "speech_to_text": {
         "model": "base",
         "device": "cpu",
+        "compute_type": None,
+        "cpu_threads": 0,
+        "num_workers": 1,
         "prompt_profile": "general",
         "initial_prompt_profiles": {
             "general": "",
             "technical": "float, integer, database, SQL, SQLite, engine, buffer, memory, Argo",
         },
         "min_rms_threshold": 0.005,
-        "silence_ratio_threshold": 0.90
+        "silence_ratio_threshold": 0.90,
+        "incremental": {
+            "enabled": True,
+            "step_ms": 500,
+            "min_window_ms": 1000,
+            "max_window_s": 12.0,
+            "commit_margin_s": 1.0
+        },
+        "speculative": {
+            "enabled": True,
+            "max_words": 4,
+            "min_confidence": 1.0,
+            "early_step_ms": 200,
+            "early_window_s": 2.0
+        },
+        "queue": {
+            "max_pending": 16,
+            "max_batch": 4,
+            "batch_window_ms": 0,
+            "busy_wait_s": 30
+        }
     },
     "text_to_speech": {
         "engine": "piper",
@@ -280,7 +324,15 @@ _DEFAULT_CONFIG = {
         "backend": None,
         "library_path": r"I:\My Music",
         "index_file": "data/music_index.json",
-        "supported_extensions": [".mp3", ".wav", ".flac", ".m4a"]
+        "supported_extensions": [".mp3", ".wav", ".flac", ".m4a"],
+        "scan_workers": 0,
+        "watch_enabled": True,
+        "watch_backend": "auto",
+        "watch_debounce_seconds": 2.0,
+        "watch_poll_seconds": 30.0,
+        "shuffle_history": 50,
+        "jellyfin_page_size": 1000,
+        "jellyfin_fetch_workers": 4
     },
     "music_backend": None,
     "music_db_path": MUSIC_DB_PATH,
@@ -357,21 +409,15 @@ _runtime_overrides = dict(_RUNTIME_OVERRIDES_DEFAULT)
 # ============================================================================
 # 8) LOAD / GET CONFIG
 # ============================================================================
-def load_config(config_path: str = "config.json") -> Config:
+def read_config(config_path: str = "config.json") -> Config:
     """
-    Load configuration from JSON file.
+    Read a config file merged over the defaults, without making it the
+    active config (tools such as STT calibration resolve settings this way).
     
     Falls back to defaults if file not found or on error.
-    
-    Args:
-        config_path: Path to config.json
-        
-    Returns:
-        Config instance
     """
-    global _config_instance
-    
-    config_data = _DEFAULT_CONFIG.copy()
+    # Deep copy: the merge below mutates nested sections in place
+    config_data = copy.deepcopy(_DEFAULT_CONFIG)
     
     if os.path.exists(config_path):
         try:
@@ -385,7 +431,23 @@ def load_config(config_path: str = "config.json") -> Config:
     else:
         logger.debug(f"[Config] No config file at {config_path}, using defaults")
     
-    _config_instance = Config(config_data)
+    return Config(config_data)
+
+
+def load_config(config_path: str = "config.json") -> Config:
+    """
+    Load configuration from JSON file.
+    
+    Falls back to defaults if file not found or on error.
+    
+    Args:
+        config_path: Path to config.json
+        
+    Returns:
+        Config instance
+    """
+    global _config_instance
+    _config_instance = read_config(config_path)
     return _config_instance
 
 
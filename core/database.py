@@ -15,10 +15,13 @@ import tempfile
 import time
 import functools
 import re
+from array import array
 from pathlib import Path
-from typing import Iterable, Optional, Dict, List, Tuple
+from typing import Iterable, Iterator, Optional, Dict, List, Tuple
 
 from core.config import MUSIC_DB_PATH, AUTO_INIT_DB
+from core.music_shuffle import TrackShuffler
+from core.phonetic import PhoneticIndex, rank_matches, phonetic_keys
 
 # ============================================================================
 # 2) LOGGER
@@ -29,7 +32,7 @@ logger = logging.getLogger(__name__)
 # 3) PATHS / VERSIONING
 # ============================================================================
 _DEFAULT_DB_PATH = Path(MUSIC_DB_PATH)
-EXPECTED_SCHEMA_VERSION = "1.0"
+EXPECTED_SCHEMA_VERSION = "1.1"
 
 # ============================================================================
 # 4) SCHEMA DEFINITION
@@ -54,7 +57,8 @@ CREATE TABLE IF NOT EXISTS tracks (
     title TEXT,
     year INTEGER,
     duration INTEGER,
-    path TEXT
+    path TEXT,
+    title_key TEXT
 );
 
 CREATE TABLE IF NOT EXISTS genres (
@@ -85,6 +89,59 @@ CREATE INDEX IF NOT EXISTS idx_tracks_title ON tracks(title);
 CREATE INDEX IF NOT EXISTS idx_artists_name ON artists(name);
 CREATE INDEX IF NOT EXISTS idx_genres_name ON genres(name);
 CREATE INDEX IF NOT EXISTS idx_tracks_year ON tracks(year);
+
+-- 1.1: case-insensitive lookups and the joins behind them, all index-driven
+CREATE INDEX IF NOT EXISTS idx_tracks_title_nocase ON tracks(title COLLATE NOCASE, album_id);
+CREATE INDEX IF NOT EXISTS idx_tracks_title_key ON tracks(title_key);
+CREATE INDEX IF NOT EXISTS idx_tracks_album ON tracks(album_id);
+CREATE INDEX IF NOT EXISTS idx_artists_name_nocase ON artists(name COLLATE NOCASE, id);
+CREATE INDEX IF NOT EXISTS idx_albums_artist ON albums(artist_id, id);
+CREATE INDEX IF NOT EXISTS idx_genres_name_nocase ON genres(name COLLATE NOCASE, id);
+CREATE INDEX IF NOT EXISTS idx_track_genres_genre ON track_genres(genre_id, track_id);
+CREATE INDEX IF NOT EXISTS idx_tracks_path ON tracks(path);
+"""
+
+# Substring search over title/artist/album (rowid = tracks.id). Kept out of
+# _SCHEMA_SQL so a SQLite built without FTS5 still opens; lookups fall back to LIKE.
+_SEARCH_TABLE_SQL = """
+CREATE VIRTUAL TABLE IF NOT EXISTS track_search USING fts5(
+    title, artist, album, tokenize = 'trigram'
+)
+"""
+
+# Ingest staging (per connection, dropped after each load)
+_STAGING_SQL = """
+CREATE TEMP TABLE IF NOT EXISTS staging_tracks (
+    path TEXT PRIMARY KEY,
+    artist TEXT NOT NULL,
+    album TEXT,
+    title TEXT NOT NULL,
+    title_key TEXT,
+    year INTEGER,
+    duration INTEGER,
+    has_genres INTEGER NOT NULL
+);
+
+CREATE TEMP TABLE IF NOT EXISTS staging_genres (
+    path TEXT NOT NULL,
+    genre TEXT NOT NULL,
+    PRIMARY KEY (path, genre)
+);
+"""
+
+# Tracks staged and committed per transaction by ingest_jellyfin_tracks
+INGEST_BATCH_SIZE = 5000
+_JUNK_ARTISTS = ("unknown artist", "unknown")
+_JUNK_GENRES = ("unknown", "unknown genre")
+
+# Created on first use (rebuild/lookup), so DBs from before it existed keep validating
+_PHONETIC_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS phonetic_keys (
+    key TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (key, kind, value)
+)
 """
 
 # ============================================================================
@@ -118,11 +175,68 @@ def music_db_exists(path: str) -> bool:
     return db_path.exists()
 
 
+def _sync_search_table(cur: sqlite3.Cursor, full: bool = False) -> None:
+    """Bring track_search in line with tracks (only missing/stale rows unless full)."""
+    if full:
+        cur.execute("DELETE FROM track_search")
+    else:
+        cur.execute("DELETE FROM track_search WHERE rowid NOT IN (SELECT id FROM tracks)")
+    cur.execute(
+        """
+        INSERT INTO track_search(rowid, title, artist, album)
+        SELECT t.id, t.title, a.name, al.title
+        FROM tracks t
+        LEFT JOIN albums al ON al.id = t.album_id
+        LEFT JOIN artists a ON a.id = al.artist_id
+        WHERE t.id NOT IN (SELECT rowid FROM track_search)
+        """
+    )
+
+
+def migrate_schema(conn: sqlite3.Connection) -> None:
+    """
+    Upgrade an existing music DB in place (no-op on a current or empty one).
+
+    1.0 -> 1.1: tracks.title_key (normalize_title of the title), NOCASE and
+    covering indexes for the lookup joins, and the track_search FTS5 table.
+    """
+    cur = conn.cursor()
+    cur.execute("PRAGMA table_info(tracks)")
+    columns = {row[1] for row in cur.fetchall()}
+    if not columns:
+        return
+
+    if "title_key" not in columns:
+        logger.info("[DB] Migrating schema: adding tracks.title_key")
+        cur.execute("ALTER TABLE tracks ADD COLUMN title_key TEXT")
+        conn.create_function("normalize_title", 1, normalize_title, deterministic=True)
+        cur.execute("UPDATE tracks SET title_key = normalize_title(title)")
+    conn.executescript(_SCHEMA_SQL)
+
+    cur.execute("SELECT 1 FROM sqlite_master WHERE name = 'track_search'")
+    if cur.fetchone() is None:
+        try:
+            cur.execute(_SEARCH_TABLE_SQL)
+            _sync_search_table(cur)
+        except sqlite3.OperationalError as e:
+            logger.warning("[DB] FTS5 unavailable, substring lookups will scan: %s", e)
+
+    cur.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'meta'")
+    if cur.fetchone() is not None:
+        cur.execute(
+            "UPDATE meta SET value = ? WHERE key = 'schema_version' AND value = '1.0'",
+            (EXPECTED_SCHEMA_VERSION,),
+        )
+    conn.commit()
+
+
 def init_schema(path: str) -> None:
     db_path = Path(path)
     db_path.parent.mkdir(parents=True, exist_ok=True)
     conn = sqlite3.connect(db_path)
     try:
+        # Older DBs first: the 1.1 indexes in _SCHEMA_SQL need their columns
+        migrate_schema(conn)
         conn.executescript(_SCHEMA_SQL)
         conn.execute(
             """
@@ -145,6 +259,7 @@ def init_schema(path: str) -> None:
             raise RuntimeError(
                 f"[DB] Schema version mismatch: expected {EXPECTED_SCHEMA_VERSION}, found {row[0]}"
             )
+        migrate_schema(conn)
 
         cur.execute("SELECT COUNT(*) FROM genre_adjacency")
         count = cur.fetchone()[0]
@@ -224,6 +339,132 @@ def _normalize_title_for_match(value: Optional[str]) -> Optional[str]:
     return normalize_title(value)
 
 
+def _prepare_ingest_row(track: Dict) -> Optional[Tuple[Tuple, List[str]]]:
+    """
+    staging_tracks row and genre names for one provider track, or None (logged)
+    when it has no title or Jellyfin id.
+    """
+    artist_name = _normalize_text(track.get("artist"))
+    if artist_name and artist_name.lower() in _JUNK_ARTISTS:
+        artist_name = None
+    if not artist_name:
+        artist_name = "Unknown Artist"
+    title = _normalize_text(track.get("song")) or _normalize_text(track.get("name"))
+    album_title = _normalize_text(track.get("album"))
+    jellyfin_id = track.get("jellyfin_id") or track.get("jellyfin_item_id")
+    genres = track.get("genres") or []
+    if not isinstance(genres, list):
+        genres = [genres]
+    if not genres:
+        genres = [track.get("genre")]
+    normalized_genres = []
+    for genre_value in genres:
+        cleaned = _normalize_text(genre_value)
+        if cleaned and cleaned not in normalized_genres:
+            normalized_genres.append(cleaned)
+
+    if not title or not jellyfin_id:
+        logger.warning(
+            "[DB] Ingest error: missing title or jellyfin_id (title=%s, jellyfin_id=%s)",
+            title,
+            jellyfin_id,
+        )
+        return None
+
+    row = (
+        f"jellyfin://{jellyfin_id}",
+        artist_name,
+        album_title,
+        title,
+        normalize_title(title),
+        track.get("year"),
+        track.get("duration"),
+        1 if normalized_genres else 0,
+    )
+    return row, [genre for genre in normalized_genres if genre.lower() not in _JUNK_GENRES]
+
+
+def _ingest_batch(
+    cur: sqlite3.Cursor,
+    batch: List[Tuple[Tuple, List[str]]],
+    incremental: bool,
+    search: bool = False,
+) -> Tuple[int, int]:
+    """
+    Stage one batch and apply it with set-based upserts. Returns (ingested, skipped).
+
+    search: also drop track_search rows of replaced tracks (their ids may be reused).
+    """
+    cur.execute("DELETE FROM staging_tracks")
+    cur.execute("DELETE FROM staging_genres")
+    cur.executemany("INSERT INTO staging_tracks VALUES (?, ?, ?, ?, ?, ?, ?, ?)", [row for row, _ in batch])
+    cur.executemany(
+        "INSERT OR IGNORE INTO staging_genres(path, genre) VALUES (?, ?)",
+        [(row[0], genre) for row, genres in batch for genre in genres],
+    )
+
+    cur.execute("SELECT COUNT(*) FROM staging_tracks s WHERE EXISTS (SELECT 1 FROM tracks t WHERE t.path = s.path)")
+    existing = cur.fetchone()[0]
+    if not incremental and existing:
+        if search:
+            cur.execute(
+                "DELETE FROM track_search WHERE rowid IN "
+                "(SELECT t.id FROM staging_tracks s JOIN tracks t ON t.path = s.path)"
+            )
+        cur.execute(
+            "DELETE FROM track_genres WHERE track_id IN "
+            "(SELECT t.id FROM staging_tracks s JOIN tracks t ON t.path = s.path)"
+        )
+        cur.execute("DELETE FROM tracks WHERE path IN (SELECT path FROM staging_tracks)")
+
+    # New paths only: artists, then their albums (one row per artist + title), then tracks
+    new_rows = "NOT EXISTS (SELECT 1 FROM tracks t WHERE t.path = s.path)"
+    cur.execute(f"INSERT OR IGNORE INTO artists(name) SELECT DISTINCT s.artist FROM staging_tracks s WHERE {new_rows}")
+    cur.execute(
+        f"""
+        INSERT INTO albums(artist_id, title, year)
+        SELECT a.id, s.album, MIN(s.year)
+        FROM staging_tracks s
+        JOIN artists a ON a.name = s.artist
+        WHERE {new_rows}
+          AND NOT EXISTS (SELECT 1 FROM albums al WHERE al.artist_id = a.id AND al.title IS s.album)
+        GROUP BY a.id, s.album
+        """
+    )
+    cur.execute(
+        f"""
+        INSERT INTO tracks(album_id, title, year, duration, path, title_key)
+        SELECT
+            (SELECT MIN(al.id) FROM albums al WHERE al.artist_id = a.id AND al.title IS s.album),
+            s.title, s.year, s.duration, s.path, s.title_key
+        FROM staging_tracks s
+        JOIN artists a ON a.name = s.artist
+        WHERE {new_rows}
+        ORDER BY s.rowid
+        """
+    )
+
+    # Genres replace a track's old ones whenever the record lists any
+    cur.execute("INSERT OR IGNORE INTO genres(name) SELECT DISTINCT genre FROM staging_genres")
+    cur.execute(
+        "DELETE FROM track_genres WHERE track_id IN "
+        "(SELECT t.id FROM staging_tracks s JOIN tracks t ON t.path = s.path WHERE s.has_genres)"
+    )
+    cur.execute(
+        """
+        INSERT OR IGNORE INTO track_genres(track_id, genre_id)
+        SELECT t.id, g.id
+        FROM staging_genres sg
+        JOIN tracks t ON t.path = sg.path
+        JOIN genres g ON g.name = sg.genre
+        """
+    )
+
+    if incremental:
+        return len(batch) - existing, existing
+    return len(batch), 0
+
+
 def _atomic_initialize_db(db_path: Path) -> None:
     if not AUTO_INIT_DB:
         return
@@ -250,26 +491,49 @@ def _atomic_initialize_db(db_path: Path) -> None:
                 pass
 
 
+def _track_from_row(row: Tuple) -> Dict:
+    return {
+        "id": row[0],
+        "song": row[1],
+        "year": row[2],
+        "duration": row[3],
+        "path": row[4],
+        "artist": row[5],
+        "sovereignty_rank": row[6],
+        "album": row[7],
+        "genre": row[8].split(",") if row[8] else [],
+    }
+
+
 class MusicDatabase:
     def __init__(self, db_path: Optional[Path] = None):
         self.db_path = Path(db_path) if db_path else _DEFAULT_DB_PATH
         self._conn: Optional[sqlite3.Connection] = None
         self._lock = threading.Lock()
         self._cached_query = functools.lru_cache(maxsize=64)(self._query_tracks_uncached)
+        self._has_search = False
+        self._shuffle = TrackShuffler()
+        self._data_version: Optional[int] = None
 
     def _ensure_connection(self) -> sqlite3.Connection:
         if self._conn is None:
             if not music_db_exists(str(self.db_path)):
                 raise RuntimeError("Music DB not present")
-            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
-            self._conn.execute("PRAGMA foreign_keys = ON")
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.execute("PRAGMA foreign_keys = ON")
+            migrate_schema(conn)
+            self._conn = conn
             self.validate_schema()
+            self._has_search = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'track_search'"
+            ).fetchone() is not None
             self._cached_query.cache_clear()
         return self._conn
 
     def validate_schema(self) -> None:
         if self._conn is None:
             conn = sqlite3.connect(self.db_path)
+            migrate_schema(conn)
             should_close = True
         else:
             conn = self._conn
@@ -278,16 +542,25 @@ class MusicDatabase:
             expected_columns = {
                 "artists": {"id", "name", "sovereignty_rank"},
                 "albums": {"id", "artist_id", "title", "year"},
-                "tracks": {"id", "album_id", "title", "year", "duration", "path"},
+                "tracks": {"id", "album_id", "title", "year", "duration", "path", "title_key"},
                 "genres": {"id", "name"},
                 "track_genres": {"track_id", "genre_id"},
                 "genre_adjacency": {"genre_id", "adjacent_genre_id"},
                 "ingest_anomalies": {"jellyfin_id", "issue", "raw_name", "path"},
             }
             expected_indexes = {
-                "tracks": {"idx_tracks_title", "idx_tracks_year"},
-                "artists": {"idx_artists_name"},
-                "genres": {"idx_genres_name"},
+                "tracks": {
+                    "idx_tracks_title",
+                    "idx_tracks_year",
+                    "idx_tracks_title_nocase",
+                    "idx_tracks_title_key",
+                    "idx_tracks_album",
+                    "idx_tracks_path",
+                },
+                "artists": {"idx_artists_name", "idx_artists_name_nocase"},
+                "albums": {"idx_albums_artist"},
+                "genres": {"idx_genres_name", "idx_genres_name_nocase"},
+                "track_genres": {"idx_track_genres_genre"},
             }
 
             cur = conn.cursor()
@@ -348,158 +621,107 @@ class MusicDatabase:
                 )
             conn.commit()
 
-    def ingest_jellyfin_tracks(self, tracks: List[Dict], incremental: bool = True) -> Dict[str, int]:
-        if not tracks:
-            return {"ingested": 0, "skipped": 0, "errors": 0}
-
-        conn = self._ensure_connection()
-        existing_paths = set()
-        if incremental:
-            with self._lock:
-                cur = conn.cursor()
-                cur.execute("SELECT path FROM tracks")
-                existing_paths = {row[0] for row in cur.fetchall() if row[0]}
-
-        ingested = 0
-        skipped = 0
-        errors = 0
+    def ingest_jellyfin_tracks(self, tracks: Iterable[Dict], incremental: bool = True) -> Dict[str, int]:
+        """
+        Bulk-load provider tracks. Records are normalized in Python, then each
+        batch of INGEST_BATCH_SIZE goes through the staging tables and set-based
+        upserts (artists, albums, genres, tracks, track_genres) in one transaction.
 
-        junk_artist = {"unknown artist", "unknown"}
-        if not incremental:
-            self._cached_query.cache_clear()
+        tracks may be any iterable (e.g. JellyfinMusicProvider.iter_music_library):
+        it is consumed a batch at a time and the DB lock is only held while a batch
+        is applied, so lookups keep working while pages are still being fetched.
 
+        incremental=True skips paths already in the DB (their genres are refreshed);
+        otherwise those tracks are replaced, and a path repeated in tracks keeps the
+        last copy.
+        """
+        counts = {"ingested": 0, "skipped": 0, "errors": 0}
+        conn = self._ensure_connection()
         with self._lock:
+            conn.commit()
             cur = conn.cursor()
-            for track in tracks:
-                try:
-                    artist_name = _normalize_text(track.get("artist"))
-                    if artist_name and artist_name.lower() in junk_artist:
-                        artist_name = None
-                    if not artist_name:
-                        artist_name = "Unknown Artist"
-                    title = _normalize_text(track.get("song")) or _normalize_text(track.get("name"))
-                    album_title = _normalize_text(track.get("album"))
-                    year = track.get("year")
-                    duration = track.get("duration")
-                    jellyfin_id = track.get("jellyfin_id") or track.get("jellyfin_item_id")
-                    genres = track.get("genres") or []
-                    if not isinstance(genres, list):
-                        genres = [genres]
-                    if not genres:
-                        genres = [track.get("genre")]
-                    normalized_genres = []
-                    for genre_value in genres:
-                        cleaned = _normalize_text(genre_value)
-                        if cleaned and cleaned not in normalized_genres:
-                            normalized_genres.append(cleaned)
-
-                    if not title or not jellyfin_id:
-                        logger.warning(
-                            "[DB] Ingest error: missing title or jellyfin_id (title=%s, jellyfin_id=%s)",
-                            title,
-                            jellyfin_id,
-                        )
-                        errors += 1
-                        continue
-
-                    path = f"jellyfin://{jellyfin_id}"
-                    def apply_genres(target_track_id: int) -> None:
-                        if not normalized_genres:
-                            return
-                        cur.execute("DELETE FROM track_genres WHERE track_id = ?", (target_track_id,))
-                        for genre in normalized_genres:
-                            if genre.lower() in ("unknown", "unknown genre"):
-                                continue
-                            cur.execute("INSERT OR IGNORE INTO genres(name) VALUES (?)", (genre,))
-                            cur.execute("SELECT id FROM genres WHERE name = ?", (genre,))
-                            genre_id = cur.fetchone()[0]
-                            cur.execute(
-                                "INSERT OR IGNORE INTO track_genres(track_id, genre_id) VALUES (?, ?)",
-                                (target_track_id, genre_id),
-                            )
-
-                    if incremental and path in existing_paths:
-                        cur.execute("SELECT id FROM tracks WHERE path = ?", (path,))
-                        row = cur.fetchone()
-                        if row:
-                            apply_genres(row[0])
-                        skipped += 1
-                        continue
-
-                    cur.execute("INSERT OR IGNORE INTO artists(name) VALUES (?)", (artist_name,))
-                    cur.execute("SELECT id FROM artists WHERE name = ?", (artist_name,))
-                    artist_id = cur.fetchone()[0]
-
-                    album_id = None
-                    if album_title is None:
-                        cur.execute(
-                            "SELECT id FROM albums WHERE artist_id = ? AND title IS NULL",
-                            (artist_id,),
-                        )
-                        row = cur.fetchone()
-                        if row:
-                            album_id = row[0]
-                        else:
-                            cur.execute(
-                                "INSERT INTO albums(artist_id, title, year) VALUES (?, NULL, ?)",
-                                (artist_id, year),
-                            )
-                            album_id = cur.lastrowid
-                    else:
-                        cur.execute(
-                            "INSERT OR IGNORE INTO albums(artist_id, title, year) VALUES (?, ?, ?)",
-                            (artist_id, album_title, year),
-                        )
-                        cur.execute(
-                            "SELECT id FROM albums WHERE artist_id = ? AND title = ?",
-                            (artist_id, album_title),
-                        )
-                        album_id = cur.fetchone()[0]
-
-                    if not incremental:
-                        cur.execute("DELETE FROM track_genres WHERE track_id IN (SELECT id FROM tracks WHERE path = ?)", (path,))
-                        cur.execute("DELETE FROM tracks WHERE path = ?", (path,))
-
-                    cur.execute(
-                        """
-                        INSERT INTO tracks(album_id, title, year, duration, path)
-                        VALUES (?, ?, ?, ?, ?)
-                        """,
-                        (album_id, title, year, duration, path),
-                    )
-
-                    cur.execute("SELECT id FROM tracks WHERE path = ?", (path,))
-                    track_id = cur.fetchone()[0]
-
-                    apply_genres(track_id)
-
-                    ingested += 1
-                except Exception as e:
-                    logger.warning(
-                        "[DB] Ingest error for jellyfin_id=%s title=%s artist=%s: %s",
-                        track.get("jellyfin_id") or track.get("jellyfin_item_id"),
-                        track.get("song") or track.get("name"),
-                        track.get("artist"),
-                        e,
-                    )
-                    errors += 1
+            # WAL keeps lookups readable during the load; fsyncs wait for the end
+            cur.execute("PRAGMA journal_mode = WAL")
+            cur.execute("PRAGMA synchronous")
+            synchronous = int(cur.fetchone()[0])
+            cur.execute("PRAGMA synchronous = OFF")
+            conn.executescript(_STAGING_SQL)
+        try:
+            for batch in self._prepared_batches(tracks, counts):
+                with self._lock:
+                    added, existing = _ingest_batch(cur, batch, incremental, search=self._has_search)
+                    conn.commit()
+                counts["ingested"] += added
+                counts["skipped"] += existing
+            if self._has_search and (counts["ingested"] or counts["skipped"]):
+                with self._lock:
+                    _sync_search_table(cur)
+                    conn.commit()
+        except Exception:
+            with self._lock:
+                conn.rollback()
+            raise
+        finally:
+            with self._lock:
+                cur.execute("DROP TABLE IF EXISTS temp.staging_tracks")
+                cur.execute("DROP TABLE IF EXISTS temp.staging_genres")
+                cur.execute(f"PRAGMA synchronous = {synchronous}")
 
-            conn.commit()
+        if not any(counts.values()):
+            return counts
 
         self._cached_query.cache_clear()
+        self._shuffle.invalidate()
 
         try:
-            conn = self._ensure_connection()
-            with self._lock:
-                conn.execute(
-                    "INSERT OR REPLACE INTO meta(key, value) VALUES (?, ?)",
-                    ("last_ingest_time", time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())),
-                )
-                conn.commit()
+            self.rebuild_phonetic_keys()
+        except Exception as e:
+            logger.warning("[DB] Phonetic key rebuild failed: %s", e)
+
+        try:
+            self.set_meta("last_ingest_time", time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()))
         except Exception:
             pass
 
-        return {"ingested": ingested, "skipped": skipped, "errors": errors}
+        return counts
+
+    @staticmethod
+    def _prepared_batches(tracks: Iterable[Dict], counts: Dict[str, int]) -> Iterator[List[Tuple[Tuple, List[str]]]]:
+        """Normalized rows in batches of INGEST_BATCH_SIZE (one per path), counting errors."""
+        staged: Dict[str, Tuple[Tuple, List[str]]] = {}
+        for track in tracks:
+            try:
+                prepared = _prepare_ingest_row(track)
+            except Exception as e:
+                logger.warning(
+                    "[DB] Ingest error for jellyfin_id=%s title=%s artist=%s: %s",
+                    track.get("jellyfin_id") or track.get("jellyfin_item_id"),
+                    track.get("song") or track.get("name"),
+                    track.get("artist"),
+                    e,
+                )
+                prepared = None
+            if prepared is None:
+                counts["errors"] += 1
+                continue
+            staged[prepared[0][0]] = prepared
+            if len(staged) >= INGEST_BATCH_SIZE:
+                yield list(staged.values())
+                staged = {}
+        if staged:
+            yield list(staged.values())
+
+    def get_meta(self, key: str) -> Optional[str]:
+        conn = self._ensure_connection()
+        with self._lock:
+            row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: str) -> None:
+        conn = self._ensure_connection()
+        with self._lock:
+            conn.execute("INSERT OR REPLACE INTO meta(key, value) VALUES (?, ?)", (key, value))
+            conn.commit()
 
     def record_ingest_anomaly(
         self,
@@ -520,6 +742,58 @@ class MusicDatabase:
             )
             conn.commit()
 
+    def rebuild_phonetic_keys(self) -> int:
+        """
+        Bring phonetic keys in line with artist names and track titles. Keys depend
+        only on the name, so only names new since the last run are keyed and names
+        no longer present are dropped. Returns rows written.
+        """
+        conn = self._ensure_connection()
+        with self._lock:
+            cur = conn.cursor()
+            cur.execute(_PHONETIC_TABLE_SQL)
+            cur.execute(
+                "SELECT 'artist', name FROM artists WHERE name IS NOT NULL "
+                "UNION SELECT 'song', title FROM tracks WHERE title IS NOT NULL"
+            )
+            current = set(cur.fetchall())
+            cur.execute("SELECT DISTINCT kind, value FROM phonetic_keys")
+            known = set(cur.fetchall())
+            stale = known - current
+            if stale:
+                cur.execute("CREATE TEMP TABLE IF NOT EXISTS stale_phonetic (kind TEXT, value TEXT)")
+                cur.executemany("INSERT INTO stale_phonetic(kind, value) VALUES (?, ?)", stale)
+                cur.execute("DELETE FROM phonetic_keys WHERE (kind, value) IN (SELECT kind, value FROM stale_phonetic)")
+                cur.execute("DROP TABLE temp.stale_phonetic")
+            rows = list(PhoneticIndex(current - known).rows())
+            cur.executemany("INSERT OR IGNORE INTO phonetic_keys(key, kind, value) VALUES (?, ?, ?)", rows)
+            conn.commit()
+        logger.info("[DB] Phonetic keys rebuilt: %s new, %s names dropped", len(rows), len(stale))
+        return len(rows)
+
+    def phonetic_lookup(self, text: str) -> List[Tuple[float, str, str]]:
+        """
+        Artist/title names that sound like text, as (spelling_ratio, kind, value),
+        best first. Builds the key table on first use for DBs ingested before it existed.
+        """
+        keys = sorted(phonetic_keys(text))
+        if not keys:
+            return []
+        conn = self._ensure_connection()
+        with self._lock:
+            cur = conn.cursor()
+            cur.execute(_PHONETIC_TABLE_SQL)
+            cur.execute("SELECT EXISTS(SELECT 1 FROM phonetic_keys)")
+            populated = bool(cur.fetchone()[0])
+        if not populated:
+            self.rebuild_phonetic_keys()
+        placeholders = ",".join("?" for _ in keys)
+        with self._lock:
+            cur = conn.cursor()
+            cur.execute(f"SELECT kind, value FROM phonetic_keys WHERE key IN ({placeholders})", keys)
+            hits = [(row[0], row[1]) for row in cur.fetchall()]
+        return rank_matches(text, hits)
+
     def query_tracks(
         self,
         *,
@@ -531,61 +805,7 @@ class MusicDatabase:
         limit: int = 50,
         intent: Optional[str] = None,
     ) -> List[Dict]:
-        conditions = []
-        params: List = []
-
-        if title:
-            conditions.append("LOWER(t.title) = LOWER(?)")
-            params.append(title)
-        if artist:
-            conditions.append("LOWER(a.name) = LOWER(?)")
-            params.append(artist)
-        if genre:
-            conditions.append("LOWER(g.name) = LOWER(?)")
-            params.append(genre)
-        if year_start is not None:
-            conditions.append("t.year >= ?")
-            params.append(year_start)
-        if year_end is not None:
-            conditions.append("t.year <= ?")
-            params.append(year_end)
-
-        where_clause = " AND ".join(conditions)
-        if where_clause:
-            where_clause = "WHERE " + where_clause
-
-        exact_title_param = title or ""
-        year_match_clause = "0"
-
-        sql = f"""
-            SELECT
-                t.id,
-                t.title,
-                t.year,
-                t.duration,
-                t.path,
-                a.name AS artist,
-                COALESCE(a.sovereignty_rank, 0) AS sovereignty_rank,
-                al.title AS album,
-                GROUP_CONCAT(g.name) AS genres,
-                CASE WHEN LOWER(t.title) = LOWER(?) THEN 1 ELSE 0 END AS exact_title_match,
-                {year_match_clause} AS era_match
-            FROM tracks t
-            LEFT JOIN albums al ON al.id = t.album_id
-            LEFT JOIN artists a ON a.id = al.artist_id
-            LEFT JOIN track_genres tg ON tg.track_id = t.id
-            LEFT JOIN genres g ON g.id = tg.genre_id
-            {where_clause}
-            GROUP BY t.id
-            ORDER BY
-                exact_title_match DESC,
-                COALESCE(a.sovereignty_rank, 0) DESC,
-                COALESCE(t.year, 9999) ASC,
-                t.title ASC
-            LIMIT ?
-        """
-
-        params = params + [exact_title_param, limit]
+        sql, _params = self._track_query_sql(title, artist, genre, year_start, year_end, limit)
         normalized_intent = (intent or "").strip().lower()
         start = time.perf_counter()
         results = self._cached_query(title, artist, genre, year_start, year_end, limit, normalized_intent)
@@ -605,11 +825,9 @@ class MusicDatabase:
         normalized = normalize_title(title)
         if not normalized:
             return []
-        tokens = normalized.split()
-        if not tokens:
-            return []
 
-        seed_token = tokens[0]
+        # title_key holds normalize_title(title); the id subquery keeps both passes on
+        # its index (a bare range on t loses to scanning tracks in GROUP BY order)
         sql = """
             SELECT
                 t.id,
@@ -626,7 +844,7 @@ class MusicDatabase:
             LEFT JOIN artists a ON a.id = al.artist_id
             LEFT JOIN track_genres tg ON tg.track_id = t.id
             LEFT JOIN genres g ON g.id = tg.genre_id
-            WHERE LOWER(t.title) LIKE ?
+            WHERE t.id IN (SELECT id FROM tracks WHERE title_key BETWEEN ? AND ?)
             GROUP BY t.id
             ORDER BY
                 COALESCE(a.sovereignty_rank, 0) DESC,
@@ -638,77 +856,14 @@ class MusicDatabase:
         conn = self._ensure_connection()
         with self._lock:
             cur = conn.cursor()
-            cur.execute(sql, (f"%{seed_token}%", limit))
+            # Exact key first; with no exact hit, every key that starts with it
+            cur.execute(sql, (normalized, normalized, limit))
             rows = cur.fetchall()
+            if not rows:
+                cur.execute(sql, (normalized, normalized + "\U0010ffff", limit))
+                rows = cur.fetchall()
 
-        results = []
-        seen_ids = set()
-        for row in rows:
-            if normalize_title(row[1]) != normalized:
-                continue
-            results.append(
-                {
-                    "id": row[0],
-                    "song": row[1],
-                    "year": row[2],
-                    "duration": row[3],
-                    "path": row[4],
-                    "artist": row[5],
-                    "sovereignty_rank": row[6],
-                    "album": row[7],
-                    "genre": row[8].split(",") if row[8] else [],
-                }
-            )
-            seen_ids.add(row[0])
-
-        if not results:
-            prefix_sql = """
-                SELECT
-                    t.id,
-                    t.title,
-                    t.year,
-                    t.duration,
-                    t.path,
-                    a.name AS artist,
-                    COALESCE(a.sovereignty_rank, 0) AS sovereignty_rank,
-                    al.title AS album,
-                    GROUP_CONCAT(g.name) AS genres
-                FROM tracks t
-                LEFT JOIN albums al ON al.id = t.album_id
-                LEFT JOIN artists a ON a.id = al.artist_id
-                LEFT JOIN track_genres tg ON tg.track_id = t.id
-                LEFT JOIN genres g ON g.id = tg.genre_id
-                WHERE LOWER(t.title) LIKE LOWER(? || '%')
-                GROUP BY t.id
-                ORDER BY
-                    COALESCE(a.sovereignty_rank, 0) DESC,
-                    COALESCE(t.year, 9999) ASC,
-                    t.title ASC
-                LIMIT ?
-            """
-            with self._lock:
-                cur = conn.cursor()
-                cur.execute(prefix_sql, (normalized, limit))
-                prefix_rows = cur.fetchall()
-            for row in prefix_rows:
-                if row[0] in seen_ids:
-                    continue
-                normalized_row = normalize_title(row[1])
-                if not normalized_row or not normalized_row.startswith(normalized):
-                    continue
-                results.append(
-                    {
-                        "id": row[0],
-                        "song": row[1],
-                        "year": row[2],
-                        "duration": row[3],
-                        "path": row[4],
-                        "artist": row[5],
-                        "sovereignty_rank": row[6],
-                        "album": row[7],
-                        "genre": row[8].split(",") if row[8] else [],
-                    }
-                )
+        results = [_track_from_row(row) for row in rows]
         if intent is not None:
             logger.info("[DB] soft_title intent=\"%s\" results=%s", intent, len(results))
         return results
@@ -722,7 +877,13 @@ class MusicDatabase:
     ) -> List[Dict]:
         if not artist:
             return []
-        sql = """
+        conn = self._ensure_connection()
+        if self._has_search:
+            # Trigram FTS answers '%x%' from its index instead of scanning artists
+            match_clause = "t.id IN (SELECT rowid FROM track_search WHERE artist LIKE ?)"
+        else:
+            match_clause = "LOWER(a.name) LIKE LOWER(?)"
+        sql = f"""
             SELECT
                 t.id,
                 t.title,
@@ -738,7 +899,7 @@ class MusicDatabase:
             JOIN artists a ON a.id = al.artist_id
             LEFT JOIN track_genres tg ON tg.track_id = t.id
             LEFT JOIN genres g ON g.id = tg.genre_id
-            WHERE LOWER(a.name) LIKE LOWER(?)
+            WHERE {match_clause}
             GROUP BY t.id
             ORDER BY
                 COALESCE(a.sovereignty_rank, 0) DESC,
@@ -747,52 +908,37 @@ class MusicDatabase:
             LIMIT ?
         """
 
-        conn = self._ensure_connection()
         with self._lock:
             cur = conn.cursor()
             cur.execute(sql, (f"%{artist}%", limit))
             rows = cur.fetchall()
 
-        results = []
-        for row in rows:
-            results.append(
-                {
-                    "id": row[0],
-                    "song": row[1],
-                    "year": row[2],
-                    "duration": row[3],
-                    "path": row[4],
-                    "artist": row[5],
-                    "sovereignty_rank": row[6],
-                    "album": row[7],
-                    "genre": row[8].split(",") if row[8] else [],
-                }
-            )
+        results = [_track_from_row(row) for row in rows]
         if intent is not None:
             logger.info("[DB] artist_like intent=\"%s\" results=%s", intent, len(results))
         return results
 
-    def _query_tracks_uncached(
-        self,
+    @staticmethod
+    def _track_query_sql(
         title: Optional[str],
         artist: Optional[str],
         genre: Optional[str],
         year_start: Optional[int],
         year_end: Optional[int],
         limit: int,
-        _intent_key: str,
-    ) -> tuple:
+    ) -> Tuple[str, List]:
+        # "= ? COLLATE NOCASE" matches the NOCASE indexes; LOWER(col) would force a scan
         conditions = []
         params: List = []
 
         if title:
-            conditions.append("LOWER(t.title) = LOWER(?)")
+            conditions.append("t.title = ? COLLATE NOCASE")
             params.append(title)
         if artist:
-            conditions.append("LOWER(a.name) = LOWER(?)")
+            conditions.append("a.name = ? COLLATE NOCASE")
             params.append(artist)
         if genre:
-            conditions.append("LOWER(g.name) = LOWER(?)")
+            conditions.append("g.name = ? COLLATE NOCASE")
             params.append(genre)
         if year_start is not None:
             conditions.append("t.year >= ?")
@@ -805,7 +951,10 @@ class MusicDatabase:
         if where_clause:
             where_clause = "WHERE " + where_clause
 
-        exact_title_param = title or ""
+        # A filter on a joined table already drops its NULL rows; saying JOIN lets
+        # the planner start from that table's index instead of scanning tracks
+        artist_join = "JOIN" if artist else "LEFT JOIN"
+        genre_join = "JOIN" if genre else "LEFT JOIN"
 
         sql = f"""
             SELECT
@@ -819,14 +968,14 @@ class MusicDatabase:
                 al.title AS album,
                 GROUP_CONCAT(g.name) AS genres
             FROM tracks t
-            LEFT JOIN albums al ON al.id = t.album_id
-            LEFT JOIN artists a ON a.id = al.artist_id
-            LEFT JOIN track_genres tg ON tg.track_id = t.id
-            LEFT JOIN genres g ON g.id = tg.genre_id
+            {artist_join} albums al ON al.id = t.album_id
+            {artist_join} artists a ON a.id = al.artist_id
+            {genre_join} track_genres tg ON tg.track_id = t.id
+            {genre_join} genres g ON g.id = tg.genre_id
             {where_clause}
             GROUP BY t.id
             ORDER BY
-                CASE WHEN LOWER(t.title) = LOWER(?) THEN 1 ELSE 0 END DESC,
+                CASE WHEN t.title = ? COLLATE NOCASE THEN 1 ELSE 0 END DESC,
                 COALESCE(a.sovereignty_rank, 0) DESC,
                 COALESCE(t.year, 9999) ASC,
                 t.title ASC
@@ -834,31 +983,74 @@ class MusicDatabase:
         """
 
         # WHERE clause params first, then ORDER BY params, then LIMIT
-        final_params = params + [exact_title_param, limit]
+        return sql, params + [title or "", limit]
+
+    def _query_tracks_uncached(
+        self,
+        title: Optional[str],
+        artist: Optional[str],
+        genre: Optional[str],
+        year_start: Optional[int],
+        year_end: Optional[int],
+        limit: int,
+        _intent_key: str,
+    ) -> tuple:
+        sql, params = self._track_query_sql(title, artist, genre, year_start, year_end, limit)
         conn = self._ensure_connection()
         with self._lock:
             cur = conn.cursor()
-            cur.execute(sql, final_params)
+            cur.execute(sql, params)
             rows = cur.fetchall()
+        return tuple(_track_from_row(row) for row in rows)
 
-        results = []
-        for row in rows:
-            results.append(
-                {
-                    "id": row[0],
-                    "song": row[1],
-                    "year": row[2],
-                    "duration": row[3],
-                    "path": row[4],
-                    "artist": row[5],
-                    "sovereignty_rank": row[6],
-                    "album": row[7],
-                    "genre": row[8].split(",") if row[8] else [],
-                }
-            )
-        return tuple(results)
+    def random_track(self, genre: Optional[str] = None) -> Optional[Dict]:
+        """
+        Random track from the library, or from one genre (case-insensitive).
 
-    def random_track(self) -> Optional[Dict]:
+        Picks come from shuffle bags over dense track-id arrays (core/music_shuffle.py),
+        built once per library/genre and rebuilt after an ingest, so a pick is a
+        primary-key lookup instead of sorting every track by RANDOM().
+        """
+        conn = self._ensure_connection()
+        with self._lock:
+            # data_version moves when another connection (a separate ingest) commits
+            data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+        if data_version != self._data_version:
+            self._data_version = data_version
+            self._shuffle.invalidate()
+        key = genre.strip().lower() if genre else None
+        return self._shuffle.pick(key, lambda: self._random_candidates(genre), self._track_by_id)
+
+    def _random_candidates(self, genre: Optional[str]) -> array:
+        """Ids of playable tracks (with album and artist), optionally in one genre."""
+        if genre:
+            sql = """
+                SELECT DISTINCT t.id
+                FROM genres g
+                JOIN track_genres tg ON tg.genre_id = g.id
+                JOIN tracks t ON t.id = tg.track_id
+                JOIN albums al ON al.id = t.album_id
+                JOIN artists a ON a.id = al.artist_id
+                WHERE g.name = ? COLLATE NOCASE
+                ORDER BY t.id
+            """
+            params: Tuple = (genre.strip(),)
+        else:
+            sql = """
+                SELECT t.id
+                FROM tracks t
+                JOIN albums al ON al.id = t.album_id
+                JOIN artists a ON a.id = al.artist_id
+                ORDER BY t.id
+            """
+            params = ()
+        conn = self._ensure_connection()
+        with self._lock:
+            cur = conn.cursor()
+            cur.execute(sql, params)
+            return array("q", (row[0] for row in cur.fetchall()))
+
+    def _track_by_id(self, track_id: int) -> Optional[Dict]:
         conn = self._ensure_connection()
         with self._lock:
             cur = conn.cursor()
@@ -871,29 +1063,21 @@ class MusicDatabase:
                     t.duration,
                     t.path,
                     a.name AS artist,
-                    al.title AS album
+                    COALESCE(a.sovereignty_rank, 0) AS sovereignty_rank,
+                    al.title AS album,
+                    GROUP_CONCAT(g.name) AS genres
                 FROM tracks t
                 JOIN albums al ON al.id = t.album_id
                 JOIN artists a ON a.id = al.artist_id
-                ORDER BY RANDOM()
-                LIMIT 1
-                """
+                LEFT JOIN track_genres tg ON tg.track_id = t.id
+                LEFT JOIN genres g ON g.id = tg.genre_id
+                WHERE t.id = ?
+                GROUP BY t.id
+                """,
+                (track_id,),
             )
             row = cur.fetchone()
-
-        if not row:
-            return None
-
-        return {
-            "id": row[0],
-            "song": row[1],
-            "year": row[2],
-            "duration": row[3],
-            "path": row[4],
-            "artist": row[5],
-            "album": row[6],
-            "genre": [],
-        }
+        return _track_from_row(row) if row else None
 
     def count_tracks(self) -> int:
         conn = self._ensure_connection()
@@ -913,7 +1097,7 @@ class MusicDatabase:
                 FROM genres g1
                 JOIN genre_adjacency ga ON ga.genre_id = g1.id
                 JOIN genres g2 ON g2.id = ga.adjacent_genre_id
-                WHERE LOWER(g1.name) = LOWER(?)
+                WHERE g1.name = ? COLLATE NOCASE
                 ORDER BY g2.name ASC
                 """,
                 (genre,),
@@ -0,0 +1,82 @@
+"""
+Fuzzy Index
+
+Character-trigram index for fuzzy lookups over a fixed list of normalized
+strings (artist/album/song names).
+
+- Built once: trigram -> int32 postings arrays, plus a length array
+- Shortlist: numpy bincount over the query's postings, then the length
+  bound any candidate must meet to reach min_ratio
+  (ratio <= 2*min(len)/(len_a+len_b)), then the top `limit` by shared trigrams
+- Exact scoring only on the shortlist: SequenceMatcher(None, query, value),
+  the same ratio the resolver always used, behind the cheap
+  real_quick_ratio/quick_ratio upper bounds
+
+Recall is heuristic (a candidate sharing no trigram with the query is never
+scored), but any string within ratio 0.85 of the query shares most of its
+trigrams, so the shortlist holds every real contender.
+"""
+
+from __future__ import annotations
+
+import math
+from difflib import SequenceMatcher
+from typing import Dict, List, Sequence, Set, Tuple
+
+import numpy as np
+
+DEFAULT_SHORTLIST = 256
+
+
+def trigrams(text: str) -> Set[str]:
+    """Padded character trigrams ("  b", " be", "bea", ..., "es ")."""
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TrigramIndex:
+    def __init__(self, values: Sequence[str]):
+        self.values: List[str] = list(values)
+        self._lengths = np.fromiter((len(v) for v in self.values), dtype=np.int32, count=len(self.values))
+        postings: Dict[str, List[int]] = {}
+        for position, value in enumerate(self.values):
+            for gram in trigrams(value):
+                postings.setdefault(gram, []).append(position)
+        self._postings = {gram: np.asarray(ids, dtype=np.int32) for gram, ids in postings.items()}
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def shortlist(self, query: str, min_ratio: float = 0.0, limit: int = DEFAULT_SHORTLIST) -> np.ndarray:
+        """Positions of the candidates worth scoring, best trigram overlap first."""
+        if not query or not self.values:
+            return np.empty(0, dtype=np.int32)
+        arrays = [self._postings[g] for g in trigrams(query) if g in self._postings]
+        if not arrays:
+            return np.empty(0, dtype=np.int32)
+        counts = np.bincount(np.concatenate(arrays), minlength=len(self.values))
+        eligible = counts > 0
+        if min_ratio > 0.0:
+            length = len(query)
+            eligible &= self._lengths >= math.ceil(length * min_ratio / (2.0 - min_ratio))
+            eligible &= self._lengths <= math.floor(length * (2.0 - min_ratio) / min_ratio)
+        positions = np.flatnonzero(eligible)
+        if positions.size > limit:
+            top = np.argpartition(-counts[positions], limit - 1)[:limit]
+            positions = positions[top]
+        return positions[np.argsort(-counts[positions], kind="stable")]
+
+    def search(self, query: str, min_ratio: float, limit: int = DEFAULT_SHORTLIST) -> List[Tuple[float, int]]:
+        """(ratio, position) for shortlisted candidates scoring >= min_ratio, best first."""
+        matcher = SequenceMatcher(None, query, "")
+        scored = []
+        for position in self.shortlist(query, min_ratio, limit).tolist():
+            matcher.set_seq2(self.values[position])
+            if matcher.real_quick_ratio() < min_ratio or matcher.quick_ratio() < min_ratio:
+                continue
+            ratio = matcher.ratio()
+            if ratio >= min_ratio:
+                scored.append((ratio, position))
+        # Ties keep candidate order, like the stable sort over the full list did
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return scored
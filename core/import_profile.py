@@ -0,0 +1,117 @@
+"""
+IMPORT PROFILE
+
+Import-time profiling: runs `python -X importtime -c "import <module>"` in a
+fresh interpreter and turns the stderr trace into a report (slowest modules
+by cumulative and self time, and the total cost of the import).
+
+Used by tests/test_import_budget.py to hold `import core.pipeline` under
+system.import_budget_ms.
+
+Usage:
+    python -m core.import_profile core.pipeline
+    python -m core.import_profile core.pipeline --top 40 --json profile.json
+    python -m core.import_profile core.pipeline --budget-ms 500   # exit 1 if over
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+@dataclass
+class ImportRecord:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(text: str) -> List[ImportRecord]:
+    """Records from -X importtime output, in the order they finished."""
+    records = []
+    for line in text.splitlines():
+        match = _LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        records.append(ImportRecord(module, int(self_us), int(cumulative_us), max(0, (len(indent) - 1) // 2)))
+    return records
+
+
+def import_cost_us(records: List[ImportRecord], module: str) -> int:
+    """Cumulative time of `import module`: the module plus parent packages it pulled in."""
+    parts = module.split(".")
+    names = {".".join(parts[: i + 1]) for i in range(len(parts))}
+    return sum(r.cumulative_us for r in records if r.depth == 0 and r.module in names)
+
+
+def profile_import(module: str, python: Optional[str] = None) -> Dict:
+    """
+    Import module in a fresh interpreter (repo root on sys.path) and profile it.
+
+    Returns:
+        {"module", "total_ms", "records": [ImportRecord, ...]}
+
+    Raises:
+        RuntimeError: The import failed
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(ROOT), env.get("PYTHONPATH")]))
+    proc = subprocess.run(
+        [python or sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=str(ROOT),
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        tail = "\n".join(line for line in proc.stderr.splitlines() if not line.startswith("import time:"))
+        raise RuntimeError(f"import {module} failed:\n{tail[-2000:]}")
+    records = parse_importtime(proc.stderr)
+    return {"module": module, "total_ms": import_cost_us(records, module) / 1000, "records": records}
+
+
+def report(profile: Dict, top: int = 20) -> str:
+    """Human-readable summary of a profile_import() result."""
+    records = profile["records"]
+    lines = [f"import {profile['module']}: {profile['total_ms']:.1f} ms ({len(records)} modules)", ""]
+    for title, key in (("cumulative", "cumulative_us"), ("self", "self_us")):
+        lines.append(f"Top {top} by {title} time:")
+        for record in sorted(records, key=lambda r: getattr(r, key), reverse=True)[:top]:
+            lines.append(f"  {getattr(record, key) / 1000:9.1f} ms  {'  ' * record.depth}{record.module}")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Profile a module's import time (python -X importtime)")
+    parser.add_argument("module", nargs="?", default="core.pipeline")
+    parser.add_argument("--top", type=int, default=20, help="Modules listed per table")
+    parser.add_argument("--budget-ms", type=float, default=None, help="Exit 1 if the import costs more")
+    parser.add_argument("--json", dest="json_out", default=None, help="Optional path to write the profile JSON")
+    args = parser.parse_args()
+
+    profile = profile_import(args.module)
+    print(report(profile, top=args.top))
+    if args.json_out:
+        data = dict(profile, records=[asdict(r) for r in profile["records"]])
+        Path(args.json_out).write_text(json.dumps(data, indent=2), encoding="utf-8")
+    if args.budget_ms is not None and profile["total_ms"] > args.budget_ms:
+        print(f"Over budget: {profile['total_ms']:.1f} ms > {args.budget_ms:.1f} ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,19 @@
-"""Jellyfin to SQLite ingest (owns schema creation)."""
+"""
+Jellyfin to SQLite ingest (owns schema creation).
 
+Provider pages stream straight into MusicDatabase.ingest_jellyfin_tracks.
+The first sync loads everything; later syncs are deltas: only items Jellyfin
+saved since the last complete sync (meta jellyfin_last_sync, less a small
+overlap for clock skew) are fetched, and they replace their DB rows. Items
+deleted in Jellyfin are not pruned by either mode.
+"""
+
+import argparse
 import time
 import logging
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Optional
 
 try:
     from dotenv import load_dotenv
@@ -17,10 +27,33 @@ from core.jellyfin_provider import get_jellyfin_provider
 
 logger = logging.getLogger(__name__)
 LOCK_FILE = Path("data/.ingest.lock")
+SYNC_META_KEY = "jellyfin_last_sync"
+DELTA_OVERLAP_SECONDS = 300
+
+
+def _sync_time(moment: datetime) -> str:
+    return moment.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _delta_since(watermark: str) -> str:
+    synced = datetime.strptime(watermark, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
+    return _sync_time(synced - timedelta(seconds=DELTA_OVERLAP_SECONDS))
 
 
+def ingest_jellyfin_library(
+    delta: bool = True,
+    db_path: Optional[str] = None,
+    provider=None,
+) -> Dict[str, int]:
+    """
+    Sync the Jellyfin library into the music DB.
 
-def ingest_jellyfin_library() -> Dict[str, int]:
+    Args:
+        delta: Fetch only items changed since the last complete sync (a full fetch
+            when there is none yet); False always fetches the whole library
+        db_path: Music DB path (default MUSIC_DB_PATH)
+        provider: Jellyfin provider (default get_jellyfin_provider())
+    """
     if LOCK_FILE.exists():
         logger.warning("[JELLYFIN] Ingest already running (lock file present)")
         return {"ingested": 0, "skipped": 0, "errors": 0, "locked": 1}
@@ -29,20 +62,32 @@ def ingest_jellyfin_library() -> Dict[str, int]:
     LOCK_FILE.write_text(time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()), encoding="utf-8")
 
     try:
+        db_path = db_path or MUSIC_DB_PATH
         logger.info("[DB] Creating schema")
-        logger.info("[DB] Path: %s", MUSIC_DB_PATH)
-        init_schema(MUSIC_DB_PATH)
+        logger.info("[DB] Path: %s", db_path)
+        init_schema(db_path)
+
+        db = MusicDatabase(db_path)
+        provider = provider or get_jellyfin_provider()
+        is_first = db.count_tracks() == 0
+        watermark = None if is_first or not delta else db.get_meta(SYNC_META_KEY)
+        since = _delta_since(watermark) if watermark else None
+        sync_started = _sync_time(datetime.now(timezone.utc))
 
-        provider = get_jellyfin_provider()
         start = time.perf_counter()
-        logger.info("[JELLYFIN] Fetching artists/albums/tracks")
-        tracks = provider.load_music_library()
+        logger.info("[JELLYFIN] Fetching artists/albums/tracks (%s)", f"delta since {since}" if since else "full")
+        # Deltas replace changed rows; a full refresh only adds new paths
+        ingest_result = db.ingest_jellyfin_tracks(
+            provider.iter_music_library(since=since),
+            incremental=not (is_first or since),
+        )
         duration_ms = int((time.perf_counter() - start) * 1000)
-        logger.info("[JELLYFIN] Fetched %s tracks in %sms", len(tracks), duration_ms)
+        logger.info("[JELLYFIN] Fetched and ingested library in %sms", duration_ms)
 
-        db = MusicDatabase()
-        is_first = db.count_tracks() == 0
-        ingest_result = db.ingest_jellyfin_tracks(tracks, incremental=not is_first)
+        if provider.last_fetch_complete:
+            db.set_meta(SYNC_META_KEY, sync_started)
+        else:
+            logger.warning("[JELLYFIN] Library fetch incomplete; next sync repeats this window")
 
         anomalies = getattr(provider, "anomalies", [])
         if anomalies:
@@ -74,6 +119,9 @@ def ingest_jellyfin_library() -> Dict[str, int]:
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sync the Jellyfin library into the music DB")
+    parser.add_argument("--full", action="store_true", help="Fetch the whole library instead of a delta")
+    args = parser.parse_args()
     logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
-    result = ingest_jellyfin_library()
+    result = ingest_jellyfin_library(delta=not args.full)
     print(result)
@@ -14,15 +14,26 @@ Configuration (set in .env):
   JELLYFIN_URL=http://localhost:8096
   JELLYFIN_API_KEY=your_api_key
   JELLYFIN_USER_ID=your_user_id
+
+Library fetches page through /Items (music.jellyfin_page_size items per
+request, music.jellyfin_fetch_workers requests in flight on the shared
+session) and stream track records as pages arrive. Passing since= fetches
+only items saved after that time (minDateLastSaved) for delta syncs; album
+and artist genres are then looked up by ID for the changed tracks only,
+instead of paging through the whole artist/album catalogue.
 """
 
 import os
 import requests
 import logging
 import hashlib
-from typing import List, Dict, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional
 from datetime import datetime
 
+from core.config import get_config
+
 logger = logging.getLogger(__name__)
 
 # ============================================================================
@@ -36,6 +47,19 @@ JELLYFIN_USER_ID = os.getenv("JELLYFIN_USER_ID", "")
 # Music library parent types in Jellyfin
 MUSIC_LIBRARY_TYPES = {"MusicArtist", "MusicAlbum", "Audio"}
 
+AUDIO_FIELDS = "PrimaryImageAspectRatio,SortName,BasicSyncInfo,Genres,AlbumId,AlbumArtists,ArtistItems"
+
+# Parent (album/artist) IDs per /Items?ids= request in delta syncs (keeps the URL short)
+PARENT_LOOKUP_BATCH = 100
+
+
+def _get_page_size() -> int:
+    return max(1, int(get_config().get("music.jellyfin_page_size", 1000)))
+
+
+def _get_fetch_workers() -> int:
+    return max(1, int(get_config().get("music.jellyfin_fetch_workers", 4)))
+
 
 # ============================================================================
 # JELLYFIN MUSIC PROVIDER
@@ -51,6 +75,13 @@ class JellyfinMusicProvider:
         self.user_id = JELLYFIN_USER_ID
         self.tracks: List[Dict] = []
         self.session = requests.Session()
+        # Page fetches share the session; keep a pooled connection per worker
+        workers = _get_fetch_workers()
+        if workers > 10:
+            adapter = requests.adapters.HTTPAdapter(pool_maxsize=workers)
+            self.session.mount("http://", adapter)
+            self.session.mount("https://", adapter)
+        self.last_fetch_complete = True
         self.album_genres_by_id: Dict[str, List[str]] = {}
         self.album_genres_by_name: Dict[str, List[str]] = {}
         self.artist_genres_by_id: Dict[str, List[str]] = {}
@@ -125,84 +156,172 @@ class JellyfinMusicProvider:
             "path": details.get("path"),
         })
 
+    def _fetch_page(self, params: Dict, start: int, page_size: int) -> Optional[Dict]:
+        return self._api_call("/Items", {**params, "startIndex": start, "limit": page_size})
+
+    def _iter_item_pages(self, params: Dict) -> Iterator[List[Dict]]:
+        """
+        /Items results page by page, in order. The first page reports the total;
+        the rest are fetched fetch_workers at a time (a bounded window, so a slow
+        consumer doesn't pull the whole library into memory). A failed page is
+        logged and skipped, and clears self.last_fetch_complete.
+        """
+        page_size = _get_page_size()
+        workers = _get_fetch_workers()
+        params = {**params, "sortBy": "DateCreated,SortName", "sortOrder": "Ascending"}
+
+        first = self._api_call("/Items", {**params, "startIndex": 0, "limit": page_size, "enableTotalRecordCount": "true"})
+        if first is None:
+            self.last_fetch_complete = False
+            return
+        items = first.get("Items", [])
+        yield items
+
+        total = first.get("TotalRecordCount")
+        if total is None:
+            # Server without counts: walk pages until a short one
+            start = page_size
+            while len(items) == page_size:
+                result = self._fetch_page(params, start, page_size)
+                if result is None:
+                    self.last_fetch_complete = False
+                    return
+                items = result.get("Items", [])
+                yield items
+                start += page_size
+            return
+
+        starts = iter(range(page_size, int(total), page_size))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ARGO.Jellyfin") as pool:
+            pending = deque()
+            for start in starts:
+                pending.append((start, pool.submit(self._fetch_page, params, start, page_size)))
+                if len(pending) >= workers * 2:
+                    break
+            while pending:
+                start, future = pending.popleft()
+                next_start = next(starts, None)
+                if next_start is not None:
+                    pending.append((next_start, pool.submit(self._fetch_page, params, next_start, page_size)))
+                result = future.result()
+                if result is None:
+                    logger.error("[JELLYFIN] Page at %s failed; library fetch incomplete", start)
+                    self.last_fetch_complete = False
+                    continue
+                yield result.get("Items", [])
+
     def _fetch_items(self, item_type: str) -> List[Dict]:
         params = {
             "userId": self.user_id,
             "includeItemTypes": item_type,
             "recursive": "true",
             "fields": "Genres",
-            "limit": 10000,
-            "startIndex": 0,
         }
-        result = self._api_call("/Items", params)
-        if not result:
-            return []
-        return result.get("Items", [])
+        return [item for page in self._iter_item_pages(params) for item in page]
+
+    def _remember_genres(self, item: Dict, by_id: Dict[str, List[str]], by_name: Dict[str, List[str]]) -> None:
+        item_id = item.get("Id")
+        name = item.get("Name")
+        genres = self._normalize_genres(item.get("Genres"))
+        if item_id and genres:
+            by_id[item_id] = genres
+        if name and genres:
+            by_name[name.strip().lower()] = genres
 
     def _load_album_genres(self) -> None:
-        items = self._fetch_items("MusicAlbum")
-        for item in items:
-            item_id = item.get("Id")
-            name = item.get("Name")
-            genres = self._normalize_genres(item.get("Genres"))
-            if item_id and genres:
-                self.album_genres_by_id[item_id] = genres
-            if name and genres:
-                self.album_genres_by_name[name.strip().lower()] = genres
+        for item in self._fetch_items("MusicAlbum"):
+            self._remember_genres(item, self.album_genres_by_id, self.album_genres_by_name)
         logger.info("[JELLYFIN] Loaded %s album genre entries", len(self.album_genres_by_id))
 
     def _load_artist_genres(self) -> None:
-        items = self._fetch_items("MusicArtist")
-        for item in items:
-            item_id = item.get("Id")
-            name = item.get("Name")
-            genres = self._normalize_genres(item.get("Genres"))
-            if item_id and genres:
-                self.artist_genres_by_id[item_id] = genres
-            if name and genres:
-                self.artist_genres_by_name[name.strip().lower()] = genres
+        for item in self._fetch_items("MusicArtist"):
+            self._remember_genres(item, self.artist_genres_by_id, self.artist_genres_by_name)
         logger.info("[JELLYFIN] Loaded %s artist genre entries", len(self.artist_genres_by_id))
+
+    def _load_parent_genres(self, items: List[Dict], looked_up: set) -> None:
+        """
+        Delta sync: fetch genres for the albums/artists of these tracks only,
+        for tracks without genres of their own. looked_up holds the IDs
+        already requested this sync.
+        """
+        wanted = []
+        for item in items:
+            if self._normalize_genres(item.get("Genres")):
+                continue
+            parents = [item.get("AlbumId")]
+            parents += [a.get("Id") for a in (item.get("AlbumArtists") or item.get("ArtistItems") or []) if isinstance(a, dict)]
+            for parent_id in parents:
+                if parent_id and parent_id not in looked_up:
+                    looked_up.add(parent_id)
+                    wanted.append(parent_id)
+        for offset in range(0, len(wanted), PARENT_LOOKUP_BATCH):
+            result = self._api_call("/Items", {
+                "userId": self.user_id,
+                "ids": ",".join(wanted[offset:offset + PARENT_LOOKUP_BATCH]),
+                "fields": "Genres",
+            })
+            if result is None:
+                self.last_fetch_complete = False
+                continue
+            for parent in result.get("Items", []):
+                if parent.get("Type") == "MusicAlbum":
+                    self._remember_genres(parent, self.album_genres_by_id, self.album_genres_by_name)
+                elif parent.get("Type") == "MusicArtist":
+                    self._remember_genres(parent, self.artist_genres_by_id, self.artist_genres_by_name)
     
-    def load_music_library(self) -> List[Dict]:
+    def iter_music_library(self, since: Optional[str] = None) -> Iterator[Dict]:
         """
-        Fetch all music tracks from Jellyfin library.
-        
-        Stores tracks in self.tracks for later searches.
-        
-        Returns:
-            List of track dictionaries
+        Stream track records from Jellyfin, page by page.
+
+        Args:
+            since: ISO 8601 UTC time; only items saved (added or changed) after it
+
+        Sets self.last_fetch_complete once exhausted (False if any page failed).
         """
         logger.info(f"[JELLYFIN] Connecting to {self.url}...")
-        
-        self._load_artist_genres()
-        self._load_album_genres()
+        self.last_fetch_complete = True
+
+        if not since:
+            self._load_artist_genres()
+            self._load_album_genres()
+        looked_up: set = set()
 
-        # Query all audio items (songs)
         params = {
             "userId": self.user_id,
             "includeItemTypes": "Audio",
             "recursive": "true",
-            "fields": "PrimaryImageAspectRatio,SortName,BasicSyncInfo,Genres,AlbumId,AlbumArtists,ArtistItems",
-            "limit": 10000,  # Pagination: max items per request
-            "startIndex": 0
+            "fields": AUDIO_FIELDS,
         }
+        if since:
+            params["minDateLastSaved"] = since
+            logger.info(f"[JELLYFIN] Delta fetch: items saved since {since}")
+
+        found = 0
+        valid = 0
+        for items in self._iter_item_pages(params):
+            found += len(items)
+            if since:
+                self._load_parent_genres(items, looked_up)
+            for item in items:
+                track = self._build_track_record(item)
+                if track:
+                    valid += 1
+                    yield track
+        logger.info(f"[JELLYFIN] Found {found} audio items, {valid} valid tracks")
+
+    def load_music_library(self, since: Optional[str] = None) -> List[Dict]:
+        """
+        Fetch all music tracks from Jellyfin library (or those saved since a time).
         
-        result = self._api_call("/Items", params)
+        Stores tracks in self.tracks for later searches.
         
-        if not result:
+        Returns:
+            List of track dictionaries
+        """
+        tracks = list(self.iter_music_library(since=since))
+        if not tracks and not self.last_fetch_complete:
             logger.error("[JELLYFIN] Failed to fetch library")
-            return []
-        
-        items = result.get("Items", [])
-        logger.info(f"[JELLYFIN] Found {len(items)} audio items")
-        
-        # Convert to track records
-        tracks = []
-        for item in items:
-            track = self._build_track_record(item)
-            if track:
-                tracks.append(track)
-        
+
         # Store for later use
         self.tracks = tracks
         
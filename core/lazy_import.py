@@ -0,0 +1,98 @@
+"""
+LAZY IMPORTS
+
+Deferred imports for heavy optional subsystems (LLM client, music player,
+Bluetooth, audio routing, app control, system health/profile), so importing
+a module like core.pipeline doesn't pay for all of them up front.
+
+- lazy_module(name): a module object whose code runs on first attribute
+  access (importlib.util.LazyLoader). Returns the real module if it is
+  already imported. A module that isn't installed still fails at import
+  time, so hard dependencies stay hard. The first access is serialized:
+  before Python 3.12 LazyLoader lets a second thread see the module half
+  executed, and ollama is first touched from both the startup and the
+  pipeline threads
+- lazy_callable(module, name): a function stand-in that imports module and
+  forwards to module.name on first call. The stub belongs to this module;
+  once resolved it carries the target's name, docstring and __wrapped__
+
+Both keep the usual patch points: tests can monkeypatch the module-level
+name, or patch attributes through the lazy module (patch("x.ollama.Client")).
+"""
+
+import functools
+import importlib
+import importlib.util
+import sys
+import threading
+import types
+from typing import Any, Callable
+
+_lock = threading.Lock()
+_load_lock = threading.RLock()
+
+
+class _LazyModule(types.ModuleType):
+    """
+    Module whose code runs on first attribute access, under _load_lock.
+
+    Replaces LazyLoader's own module class, which before Python 3.12 lets a
+    second thread read the module while the first is still executing it.
+    Attributes set before the load (test patches) win over the module's own.
+    """
+
+    def __getattribute__(self, attr):
+        get = types.ModuleType.__getattribute__
+        if object.__getattribute__(self, "__class__") is _LazyModule:
+            with _load_lock:
+                spec = get(self, "__spec__")
+                state = spec.loader_state
+                # Re-entrant access from the loading thread reads the partial module
+                if object.__getattribute__(self, "__class__") is _LazyModule and not state.get("loading"):
+                    state["loading"] = True
+                    try:
+                        attrs_then = state["__dict__"]
+                        attrs_now = get(self, "__dict__")
+                        patched = {k: v for k, v in attrs_now.items() if attrs_then.get(k, attrs_now) is not v}
+                        spec.loader.exec_module(self)
+                        attrs_now.update(patched)
+                        self.__class__ = types.ModuleType
+                    finally:
+                        state["loading"] = False
+        return get(self, attr)
+
+
+def lazy_module(name: str):
+    """Module `name`, executed on first attribute access."""
+    with _lock:
+        module = sys.modules.get(name)
+        if module is not None:
+            return module
+        spec = importlib.util.find_spec(name)
+        if spec is None or spec.loader is None:
+            raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+        spec.loader = importlib.util.LazyLoader(spec.loader)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)  # records loader_state, restores the real loader
+        module.__class__ = _LazyModule
+    if "." in name:
+        parent, _, child = name.rpartition(".")
+        setattr(importlib.import_module(parent), child, module)
+    return module
+
+
+def lazy_callable(module: str, name: str) -> Callable[..., Any]:
+    """Stand-in for `from module import name` that imports on first call."""
+    target = []
+
+    def call(*args, **kwargs):
+        if not target:
+            fn = getattr(importlib.import_module(module), name)
+            functools.update_wrapper(call, fn, assigned=("__name__", "__qualname__", "__doc__"))
+            target.append(fn)
+        return target[0](*args, **kwargs)
+
+    call.__name__ = call.__qualname__ = name
+    call.__doc__ = f"Lazily imported {module}.{name}."
+    return call
@@ -0,0 +1,304 @@
+"""
+MODEL REGISTRY
+
+One process-wide home for heavyweight models (Whisper today). Every caller
+that asks for the same (engine, size, device, compute_type, cpu_threads,
+num_workers) shares one loaded instance instead of loading its own copy.
+
+- load(): load on the calling thread and return the model (main.py uses
+  this before any other thread starts; see below)
+- preload(): start loading in the background; returns a Future that
+  resolves to the model (the UI can wait on it, or wrap it with
+  asyncio.wrap_future)
+- acquire(): a ModelHandle for the shared instance, loading it if needed
+  (waits for an in-flight preload instead of starting a second load)
+- ModelHandle.release() (or the handle being garbage collected) drops the
+  reference. Once the last holder lets go the model stays resident for
+  idle_ttl seconds (MODEL_IDLE_TTL_SECONDS), so a short-lived holder such as
+  a calibration run does not force a full reload; an acquire() inside that
+  window reuses it. A model that was only loaded/preloaded stays resident
+  until someone acquires and releases it
+
+Background loads run one at a time on a dedicated thread, so two large models
+never peak in memory together. A failed load is not cached: the next request
+retries, and acquire() raises the loader's exception.
+
+The first Whisper load still happens on the main thread, before asyncio and
+the worker threads start: torch/CTranslate2 initialize their native thread
+pools and allocators on first use, and doing that on a secondary thread while
+other threads are already running is what crashed natively before. Later
+loads (a different size after a config change) run on the loader thread
+once those runtimes are initialized.
+
+Calls into a shared model must be serialized; ModelHandle.lock is the one
+lock every holder of that model uses.
+"""
+
+import logging
+import os
+import threading
+import time
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger("MODEL_REGISTRY")
+
+MODEL_IDLE_TTL_SECONDS = float(os.getenv("ARGO_MODEL_IDLE_TTL_SECONDS", "120"))
+"""How long a model with no holders stays loaded (0 = unload as soon as the last handle is released)."""
+
+
+@dataclass(frozen=True)
+class ModelKey:
+    """Identity of a loaded model; equal keys share one instance."""
+    engine: str
+    size: str
+    device: str = "cpu"
+    compute_type: Optional[str] = None
+    cpu_threads: int = 0      # 0 = engine default
+    num_workers: int = 1      # faster-whisper: concurrent transcriptions
+
+
+def default_compute_type(engine: str, device: str) -> Optional[str]:
+    """compute_type an engine uses when none is configured (None = engine default)."""
+    if engine == "faster":
+        return "float16" if device == "cuda" else "int8"
+    return None
+
+
+def _load_openai_whisper(key: ModelKey) -> Any:
+    import whisper
+    if key.cpu_threads:
+        import torch
+        torch.set_num_threads(key.cpu_threads)
+    return whisper.load_model(key.size, device=key.device)
+
+
+def _load_faster_whisper(key: ModelKey) -> Any:
+    from faster_whisper import WhisperModel
+    return WhisperModel(
+        key.size,
+        device=key.device,
+        compute_type=key.compute_type,
+        cpu_threads=key.cpu_threads,
+        num_workers=key.num_workers,
+    )
+
+
+class _Entry:
+    __slots__ = ("future", "refs", "lock", "idle")
+
+    def __init__(self, future: Future):
+        self.future = future
+        self.refs = 0
+        self.lock = threading.Lock()
+        self.idle: Optional[object] = None  # token of the pending idle unload
+
+
+class ModelHandle:
+    """A counted reference to a shared model."""
+
+    def __init__(self, registry: "ModelRegistry", key: ModelKey, entry: _Entry):
+        self.key = key
+        self.model = entry.future.result()
+        self.lock = entry.lock
+        self._finalizer = weakref.finalize(self, registry._release, key, entry)
+
+    @property
+    def released(self) -> bool:
+        return not self._finalizer.alive
+
+    def release(self) -> None:
+        """Drop this reference (idempotent)."""
+        self._finalizer()
+
+
+class ModelRegistry:
+    """Shared, lazily loaded, reference-counted models keyed by ModelKey."""
+
+    def __init__(
+        self,
+        loaders: Optional[Dict[str, Callable[[ModelKey], Any]]] = None,
+        idle_ttl: Optional[float] = None,
+    ):
+        self._loaders: Dict[str, Callable[[ModelKey], Any]] = {
+            "openai": _load_openai_whisper,
+            "faster": _load_faster_whisper,
+        }
+        if loaders:
+            self._loaders.update(loaders)
+        self.idle_ttl = MODEL_IDLE_TTL_SECONDS if idle_ttl is None else max(0.0, idle_ttl)
+        self._entries: Dict[ModelKey, _Entry] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ARGO.ModelLoad")
+
+    @staticmethod
+    def key(
+        engine: str,
+        size: str,
+        device: str = "cpu",
+        compute_type: Optional[str] = None,
+        cpu_threads: int = 0,
+        num_workers: int = 1,
+    ) -> ModelKey:
+        return ModelKey(
+            engine,
+            size,
+            device,
+            compute_type or default_compute_type(engine, device),
+            int(cpu_threads or 0),
+            max(1, int(num_workers or 1)),
+        )
+
+    def _load(self, key: ModelKey) -> Any:
+        logger.info(f"[MODEL_REGISTRY] Loading {key.engine} model={key.size} device={key.device}...")
+        start = time.perf_counter()
+        try:
+            model = self._loaders[key.engine](key)
+        except Exception as e:
+            logger.error(f"[MODEL_REGISTRY] Failed to load {key.engine} model={key.size}: {e}")
+            raise
+        logger.info(
+            f"[MODEL_REGISTRY] {key.engine} model={key.size} ready "
+            f"({(time.perf_counter() - start) * 1000:.0f}ms)"
+        )
+        return model
+
+    def _entry(self, key: ModelKey) -> _Entry:
+        """Existing entry for key, or a new one with its load scheduled. Caller holds _lock."""
+        entry = self._entries.get(key)
+        if entry is not None and entry.future.done() and entry.future.exception() is not None:
+            entry = None  # last load failed: retry
+        if entry is None:
+            if key.engine not in self._loaders:
+                raise ValueError(f"No model loader for engine: {key.engine}")
+            entry = _Entry(self._executor.submit(self._load, key))
+            self._entries[key] = entry
+        return entry
+
+    def load(self, engine: str, size: str, device: str = "cpu", compute_type: Optional[str] = None, **options) -> Any:
+        """
+        Load on the calling thread (or wait for an existing load) and return the model.
+
+        Raises:
+            Whatever the loader raised
+        """
+        key = self.key(engine, size, device, compute_type, **options)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.future.done() and entry.future.exception() is not None:
+                entry = None  # last load failed: retry
+            if entry is None:
+                if key.engine not in self._loaders:
+                    raise ValueError(f"No model loader for engine: {key.engine}")
+                entry = _Entry(Future())
+                entry.future.set_running_or_notify_cancel()
+                self._entries[key] = entry
+                owner = True
+            else:
+                owner = False
+        if owner:
+            try:
+                entry.future.set_result(self._load(key))
+            except BaseException as e:
+                entry.future.set_exception(e)
+        return entry.future.result()
+
+    def preload(self, engine: str, size: str, device: str = "cpu", compute_type: Optional[str] = None, **options) -> Future:
+        """Start loading in the background (no-op if loaded or loading). Returns its Future."""
+        key = self.key(engine, size, device, compute_type, **options)
+        with self._lock:
+            return self._entry(key).future
+
+    def ready(self, engine: str, size: str, device: str = "cpu", compute_type: Optional[str] = None, **options) -> bool:
+        """True once the model is loaded (never starts a load)."""
+        key = self.key(engine, size, device, compute_type, **options)
+        with self._lock:
+            entry = self._entries.get(key)
+        return entry is not None and entry.future.done() and entry.future.exception() is None
+
+    def acquire(
+        self,
+        engine: str,
+        size: str,
+        device: str = "cpu",
+        compute_type: Optional[str] = None,
+        timeout: Optional[float] = None,
+        **options,
+    ) -> ModelHandle:
+        """
+        Shared model for the key, waiting for it to load.
+
+        options: cpu_threads / num_workers (part of the key)
+
+        Raises:
+            Whatever the loader raised (e.g. ImportError, RuntimeError)
+        """
+        key = self.key(engine, size, device, compute_type, **options)
+        with self._lock:
+            entry = self._entry(key)
+            entry.refs += 1
+            entry.idle = None  # cancel a pending idle unload
+        try:
+            entry.future.result(timeout=timeout)
+        except BaseException:
+            self._release(key, entry)
+            raise
+        return ModelHandle(self, key, entry)
+
+    def _release(self, key: ModelKey, entry: _Entry) -> None:
+        with self._lock:
+            if entry.refs <= 0:
+                return
+            entry.refs -= 1
+            if entry.refs or not entry.future.done() or self._entries.get(key) is not entry:
+                return
+            if self.idle_ttl <= 0:
+                del self._entries[key]
+                logger.info(f"[MODEL_REGISTRY] Unloaded {key.engine} model={key.size} (no holders)")
+                return
+            token = entry.idle = object()
+        timer = threading.Timer(self.idle_ttl, self._expire, (key, entry, token))
+        timer.daemon = True
+        timer.name = "ARGO.ModelIdle"
+        timer.start()
+
+    def _expire(self, key: ModelKey, entry: _Entry, token: object) -> None:
+        """Unload an entry that stayed without holders for idle_ttl (no-op if reacquired since)."""
+        with self._lock:
+            if entry.idle is not token or entry.refs or self._entries.get(key) is not entry:
+                return
+            del self._entries[key]
+        logger.info(
+            f"[MODEL_REGISTRY] Unloaded {key.engine} model={key.size} "
+            f"(no holders for {self.idle_ttl:.0f}s)"
+        )
+
+    def refcount(self, engine: str, size: str, device: str = "cpu", compute_type: Optional[str] = None, **options) -> int:
+        key = self.key(engine, size, device, compute_type, **options)
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry.refs if entry else 0
+
+    def loaded(self) -> Dict[ModelKey, int]:
+        """Loaded models and their holder counts."""
+        with self._lock:
+            return {
+                key: entry.refs
+                for key, entry in self._entries.items()
+                if entry.future.done() and entry.future.exception() is None
+            }
+
+
+_registry: Optional[ModelRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_model_registry() -> ModelRegistry:
+    """Process-wide registry."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = ModelRegistry()
+        return _registry
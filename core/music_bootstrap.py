@@ -5,7 +5,7 @@ Runs at application startup to:
 1. Verify music configuration (env vars)
 2. Ensure music directory exists
 3. Create or load music index
-4. Validate index content
+4. Validate index content (compact store, or the JSON index it imports)
 5. Fail fast with clear errors if configuration is invalid
 
 This ensures zero manual setup for the music system.
@@ -18,6 +18,8 @@ from pathlib import Path
 
 from core.config import get_config
 from core.database import MusicDatabase
+from core.music_index import store_path_for
+from core.music_store import TrackStore
 
 logger = logging.getLogger(__name__)
 
@@ -120,7 +122,32 @@ def bootstrap_music_system() -> bool:
         
         logger.info(f"[MUSIC BOOTSTRAP] Music index file: {index_path}")
         
-        # Step 3: Check if index exists and is valid
+        # Step 3: Check if index exists and is valid (store first, JSON is imported on load)
+        store_path = Path(store_path_for(str(index_path)))
+        if store_path.exists():
+            try:
+                store = TrackStore.load(str(store_path))
+            except (OSError, ValueError) as e:
+                raise RuntimeError(
+                    f"[MUSIC BOOTSTRAP] FATAL: Invalid index store: {e}. "
+                    f"Delete {store_path} and restart to rebuild index."
+                )
+            try:
+                logger.info(f"[MUSIC BOOTSTRAP] Loaded index: {len(store)} tracks")
+                for i in range(len(store)):
+                    path = store.value("path", i)
+                    if not path:
+                        raise RuntimeError(
+                            f"[MUSIC BOOTSTRAP] FATAL: Invalid index schema: Track {i}: missing 'path' field. "
+                            f"Delete {store_path} and restart to rebuild index."
+                        )
+                    if not os.path.exists(path):
+                        logger.warning(f"[MUSIC BOOTSTRAP] Track {i}: file not found: {path}")
+            finally:
+                store.close()
+            logger.info("[MUSIC BOOTSTRAP] Index validation passed")
+            return True
+
         if index_path.exists():
             try:
                 with open(index_path, "r") as f:
@@ -1,16 +1,29 @@
 """
 MUSIC INDEX AUTHORITATIVE v1.1.0 (Hardened)
 
-Persistent JSON catalog of local music library.
+Persistent catalog of local music library.
 
 Responsibilities:
-- Scan directory recursively
+- Scan directory recursively (tag reads on a process pool)
+- Incremental rescan: only new or changed files (path, size, mtime) are re-read
+- Live updates (core/music_watcher.py): changed paths go into an in-memory
+  overlay on the store, journaled to data/music_index.delta.json and folded
+  into the store once it grows (compact)
 - Extract genre from folder names (using GENRE_ALIASES)
 - Extract metadata using ID3 tags (PRIMARY)
 - Fallback to Folder/Filename heuristics (SECONDARY)
 - Tokenize for keyword search
-- Save/load JSON for fast startup
+- Save/load a compact columnar store (core/music_store.py) via mmap for fast
+  startup; JSON stays the import/export format. Each save writes a new
+  generation (data/music_index.<n>.idx) named by data/music_index.current, so
+  a file is never replaced while it is mapped (Windows); old generations are
+  deleted once no store reads them
 - Filter by genre or keyword
+- Lookup postings stored with the tracks: token and normalized
+  artist/album/song/genre keys, year order (O(result) filters)
+- Phonetic (Double Metaphone) keys for artist/album/song, stored in the
+  index so sound-alike names resolve without rebuilding them
+- Random picks (library or genre) from shuffle bags (core/music_shuffle.py)
 - NO audio decoding
 - NO ffmpeg dependency
 
@@ -25,8 +38,8 @@ Data plumbing only.
 Startup behavior:
 - IF MUSIC_ENABLED=true:
   - Check MUSIC_DIR exists (fail fast if not)
-  - Load existing index OR build new one
-  - Save to MUSIC_INDEX_FILE
+  - Load existing store, import MUSIC_INDEX_FILE (JSON) once, OR build new one
+  - Save the store beside MUSIC_INDEX_FILE (.<n>.idx + .current pointer)
   - Log exactly one message: "loaded" or "created"
 - IF MUSIC_ENABLED=false:
   - Skip all initialization
@@ -38,11 +51,28 @@ import json
 import logging
 import hashlib
 import re
+import threading
+import time
+import weakref
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Callable, Iterable, List, Dict, Optional, Set, Tuple
 from datetime import datetime
 
+import numpy as np
+
 from core.config import get_config
+from core.music_store import (
+    KEY_FIELDS,
+    PHONETIC_FIELDS,
+    StorePhoneticIndex,
+    TrackChain,
+    TrackList,
+    TrackStore,
+    normalize_key,
+)
+from core.music_shuffle import TrackShuffler
+from core.phonetic import PhoneticIndex
 
 # Try to import mutagen for ID3 support
 try:
@@ -113,6 +143,58 @@ GENRE_ALIASES = {
 SUPPORTED_FORMATS = {".mp3", ".wav", ".flac", ".m4a"}
 FILLER_WORDS = {"the", "a", "an", "some", "track", "music"}
 INVALID_TAG_VALUES = {"unknown", "unknown artist", "unknown album", "track", "title"}
+INDEXED_FIELDS = KEY_FIELDS
+POOL_MIN_FILES = 64              # below this, reading tags serially beats pool startup
+SCAN_PROGRESS_INTERVAL = 0.5     # seconds between progress callbacks
+DELTA_VERSION = 1
+POINTER_VERSION = 1
+DELTA_COMPACT_MIN = 2000         # overlay entries before it's folded into the store...
+DELTA_COMPACT_RATIO = 0.05       # ...or this share of the store, whichever is larger
+_normalize_key = normalize_key
+
+
+def store_path_for(index_file: str) -> str:
+    """Single-file store path next to the JSON index (data/music_index.json -> .idx).
+
+    Stores written before generations existed; loaded when there is no pointer.
+    """
+    if not index_file:
+        return ""
+    return os.path.splitext(index_file)[0] + ".idx"
+
+
+def pointer_path_for(index_file: str) -> str:
+    """Pointer naming the current store generation (data/music_index.json -> .current)."""
+    if not index_file:
+        return ""
+    return os.path.splitext(index_file)[0] + ".current"
+
+
+def _is_supported(filename: str) -> bool:
+    return any(filename.lower().endswith(fmt) for fmt in SUPPORTED_FORMATS)
+
+
+class _IndexState:
+    """
+    Base store plus live-update overlay. Replaced as one object, so a reader
+    that takes self._state once sees a consistent view while updates land.
+    """
+
+    __slots__ = ("store", "live", "delta", "delta_tracks", "removed", "delta_phonetic")
+
+    def __init__(self, store: TrackStore, live: Optional[np.ndarray] = None, delta: Optional[TrackStore] = None,
+                 delta_tracks: Optional[Dict[str, Tuple[Dict, int, int]]] = None, removed: frozenset = frozenset(),
+                 delta_phonetic: Optional[PhoneticIndex] = None):
+        self.store = store                      # base TrackStore
+        self.live = live                        # bool mask over base positions (None = all live)
+        self.delta = delta                      # TrackStore over delta_tracks (None = empty)
+        self.delta_tracks = delta_tracks or {}  # path -> (record, size, mtime_ns), added or changed
+        self.removed = removed                  # base paths deleted or superseded by delta_tracks
+        self.delta_phonetic = delta_phonetic
+
+    @property
+    def has_overlay(self) -> bool:
+        return self.delta is not None or bool(self.removed)
 
 
 # ============================================================================
@@ -120,22 +202,34 @@ INVALID_TAG_VALUES = {"unknown", "unknown artist", "unknown album", "track", "ti
 # ============================================================================
 
 class MusicIndex:
-    """Persistent JSON catalog of local music library."""
+    """Persistent catalog of local music library (compact store, JSON import/export)."""
 
     def __init__(self, music_dir: str, index_file: str):
         """
         Initialize music index.
         
         Args:
-            music_dir: Path to music directory (e.g., I:\My Music)
-            index_file: Path to JSON index file (e.g., data/music_index.json)
+            music_dir: Path to music directory (e.g., I:\\My Music)
+            index_file: Path to JSON index file (e.g., data/music_index.json);
+                the compact store lives beside it (data/music_index.idx)
             
         Raises:
             ValueError: If MUSIC_ENABLED=true but music_dir doesn't exist
         """
         self.music_dir = music_dir
         self.index_file = index_file
-        self.tracks: List[Dict] = []
+        self.store_file = store_path_for(index_file)  # current generation once loaded or saved
+        self.pointer_file = pointer_path_for(index_file)
+        self.delta_file = os.path.splitext(self.store_file)[0] + ".delta.json" if self.store_file else ""
+        self.save_error: Optional[str] = None
+        self._generation = 0
+        # generation file -> store mapping it; the file stays until that store is collected
+        self._mapped: Dict[str, "weakref.ref[TrackStore]"] = {}
+        self._write_lock = threading.RLock()
+        self._base_stats: Optional[Tuple[TrackStore, Dict[str, Tuple[int, int, int]]]] = None
+        self._shuffle = TrackShuffler()
+        self._shuffle_state: Optional[_IndexState] = None
+        self.tracks = []
         self.no_music_available = False
         
         # Validate music directory exists if music is enabled
@@ -145,85 +239,571 @@ class MusicIndex:
             logger.error(msg)
             raise ValueError(msg)
 
+    @property
+    def tracks(self) -> TrackList:
+        """All tracks, in library order. Records are materialized on access."""
+        return self._select(lambda store: None)
+
+    @tracks.setter
+    def tracks(self, tracks: List[Dict]) -> None:
+        # Every assignment (callers resetting to [], tests) builds a fresh in-memory store
+        self._set_store(TrackStore.build(tracks if tracks is not None else []))
+
+    def _set_store(self, store: TrackStore) -> None:
+        """
+        Adopt a TrackStore. Filters answer from its postings:
+        - token / normalized artist/album/song/genre -> positions
+        - per-field value order (filter_where runs per distinct value)
+        - year-sorted positions
+        """
+        # The previous store isn't closed: results handed out earlier (a play
+        # queue, a query racing a rescan) keep reading it until they're dropped;
+        # its file is pruned once it has been collected
+        self._phonetic: Optional[PhoneticIndex] = StorePhoneticIndex(store) if store.has_phonetic else None
+        self._state = _IndexState(store)
+        self._base_stats = None
+
+    @property
+    def _store(self) -> TrackStore:
+        return self._state.store
+
+    def _select(self, positions: Callable[[TrackStore], Optional[np.ndarray]]) -> TrackList:
+        """
+        Tracks at positions(store) (None = all) in the base store, minus
+        removed ones, followed by matches in the live-update delta.
+        """
+        state = self._state
+        base = positions(state.store)
+        if state.live is not None:
+            base = np.flatnonzero(state.live) if base is None else base[state.live[base]]
+        result = TrackList(state.store, base)
+        if state.delta is None:
+            return result
+        return TrackChain([result, TrackList(state.delta, positions(state.delta))])
+
+    def _lookup(self, field: str, value: str) -> TrackList:
+        key = _normalize_key(value)
+        return self._select(lambda store: store.postings(field, key))
+
+    @property
+    def phonetic(self) -> PhoneticIndex:
+        """Phonetic keys over the store's artist/album/song names (built on first use if not loaded)."""
+        if self._phonetic is None:
+            self._phonetic = _phonetic_index(self._store)
+        return self._phonetic
+
+    # ------------------------------------------------------------------
+    # Store generations (data/music_index.<n>.idx + .current pointer)
+    # ------------------------------------------------------------------
+    def _generation_path(self, generation: int) -> str:
+        return f"{os.path.splitext(self.pointer_file)[0]}.{generation}.idx"
+
+    def _generation_files(self) -> Dict[int, str]:
+        stem = os.path.basename(os.path.splitext(self.pointer_file)[0])
+        directory = os.path.dirname(os.path.abspath(self.pointer_file))
+        pattern = re.compile(re.escape(stem) + r"\.(\d+)\.idx$")
+        files = {}
+        for name in os.listdir(directory) if os.path.isdir(directory) else ():
+            match = pattern.match(name)
+            if match:
+                files[int(match.group(1))] = os.path.join(directory, name)
+        return files
+
+    def _current_store_file(self) -> Tuple[int, str]:
+        """(generation, path) named by the pointer, else the pre-generation .idx (0)."""
+        try:
+            with open(self.pointer_file, "r", encoding="utf-8") as f:
+                pointer = json.load(f)
+            if pointer.get("version") == POINTER_VERSION:
+                path = os.path.join(os.path.dirname(os.path.abspath(self.pointer_file)), pointer["file"])
+                return int(pointer["generation"]), path
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"[ARGO] Ignoring index pointer {self.pointer_file}: {e}")
+        return 0, store_path_for(self.index_file)
+
+    def _load_store(self) -> Optional[TrackStore]:
+        generation, path = self._current_store_file()
+        if not os.path.exists(path):
+            return None
+        store = TrackStore.load(path)
+        self._generation, self.store_file = generation, path
+        self._mapped[path] = weakref.ref(store)
+        return store
+
+    def _save_store(self, store: TrackStore) -> bool:
+        """
+        Write store as a new generation and point .current at it.
+
+        The current file is never replaced (it may be mapped, and Windows
+        refuses to replace a mapped file). On failure save_error says why
+        and the pointer still names the previous generation.
+        """
+        generation = max([self._generation, *self._generation_files()]) + 1
+        path = self._generation_path(generation)
+        try:
+            store.save(path)
+            pointer = {"version": POINTER_VERSION, "generation": generation, "file": os.path.basename(path)}
+            tmp_path = self.pointer_file + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(pointer, f)
+            os.replace(tmp_path, self.pointer_file)
+        except Exception as e:
+            self.save_error = f"{type(e).__name__}: {e}"
+            logger.warning(f"[ARGO] Failed to save index: {e}")
+            for leftover in (path, self.pointer_file + ".tmp"):
+                try:
+                    os.remove(leftover)
+                except OSError:
+                    pass
+            return False
+        self.save_error = None
+        self._generation, self.store_file = generation, path
+        return True
+
+    def _prune_generations(self) -> None:
+        """Delete superseded store files that no live TrackStore maps anymore."""
+        stale = [path for generation, path in self._generation_files().items() if generation != self._generation]
+        legacy = store_path_for(self.index_file)
+        if self._generation and os.path.exists(legacy):
+            stale.append(legacy)
+        for path in stale:
+            ref = self._mapped.get(path)
+            if ref is not None and ref() is not None:
+                continue  # results handed out earlier still read it
+            try:
+                os.remove(path)
+                self._mapped.pop(path, None)
+            except OSError as e:
+                logger.debug(f"[ARGO] Keeping old index generation {path}: {e}")
+
+    def _document(self) -> Dict:
+        meta = self._store.meta
+        return {
+            "version": "1.0",
+            "generated_at": meta.get("generated_at"),
+            "music_dir": meta.get("music_dir", self.music_dir),
+            "track_count": len(self.tracks),
+            "tracks": self.tracks,
+        }
+
+    def export_json(self, path: Optional[str] = None) -> str:
+        """
+        Write the index in the JSON format (tracks + phonetic keys).
+        
+        Args:
+            path: Target file (default: index_file)
+            
+        Returns:
+            Path written
+        """
+        path = path or self.index_file
+        document = self._document()
+        document["tracks"] = list(self.tracks)
+        entries = [(field, track.get(field)) for track in document["tracks"] for field in PHONETIC_FIELDS]
+        document["phonetic"] = self.phonetic.rebuilt(entries).to_dict()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(document, f, indent=2)
+        return path
+
+    def import_json(self, path: Optional[str] = None) -> Dict:
+        """
+        Load a JSON index (export or pre-store file) and write the compact store.
+        
+        Args:
+            path: Source file (default: index_file)
+            
+        Returns:
+            Index dictionary with metadata and tracks
+        """
+        with open(path or self.index_file, "r", encoding="utf-8") as f:
+            index = json.load(f)
+        tracks = index.get("tracks", [])
+        phonetic = PhoneticIndex.from_dict(index.get("phonetic"))
+        self._create_store(tracks, index.get("generated_at"), phonetic)
+        return self._document()
+
+    def _create_store(self, tracks: List[Dict], generated_at: Optional[str] = None, phonetic: Optional[PhoneticIndex] = None,
+                      stats: Optional[List[Tuple[int, int]]] = None, keep_state_on_failure: bool = False) -> bool:
+        """
+        Build a store from tracks, save it and adopt it.
+
+        Returns True if the store was written. With keep_state_on_failure the
+        current state (store, overlay, journal) is left untouched when the
+        write fails, so nothing journaled since the last good save is lost.
+        """
+        if phonetic is None:
+            phonetic = PhoneticIndex(
+                (field, track.get(field)) for track in tracks for field in PHONETIC_FIELDS
+            )
+        meta = {
+            "generated_at": generated_at or datetime.utcnow().isoformat() + "Z",
+            "music_dir": self.music_dir,
+            "track_count": len(tracks),
+        }
+        store = TrackStore.build(tracks, meta, phonetic, stats)
+        saved = bool(self.pointer_file) and self._save_store(store)
+        if self.pointer_file and not saved and keep_state_on_failure:
+            return False
+        self._set_store(store)
+        self.no_music_available = not bool(len(store))
+        if saved:
+            # A new store already holds whatever the journal recorded; a
+            # journal we can't delete no longer matches it and is ignored on load
+            try:
+                os.remove(self.delta_file)
+            except OSError:
+                pass
+            self._prune_generations()
+        return saved
+
     def is_empty(self) -> bool:
         """Return True if the index contains no tracks."""
         return not bool(self.tracks)
         
     def load_or_create(self) -> Dict:
         """
-        Load existing index or create new one.
+        Load the compact store, else import the JSON index, else scan.
         
         Returns:
             Index dictionary with metadata and tracks
         """
-        # Try to load existing index
+        # Compact store: mmap, nothing parsed up front
+        if self.pointer_file:
+            try:
+                store = self._load_store()
+                if store is not None:
+                    self._set_store(store)
+                    self._load_delta()
+                    self._prune_generations()
+                    self.no_music_available = not bool(len(self.tracks))
+                    logger.info(f"[ARGO] Music index loaded: {len(self.tracks)} tracks")
+                    return self._document()
+            except Exception as e:
+                logger.warning(f"[ARGO] Failed to load index store: {e}")
+
+        # JSON index (written before the store existed, or an export): import once
         if os.path.exists(self.index_file):
             try:
-                with open(self.index_file, "r", encoding="utf-8") as f:
-                    index = json.load(f)
-                logger.info(f"[ARGO] Music index loaded: {len(index.get('tracks', []))} tracks")
-                self.tracks = index.get("tracks", [])
-                self.no_music_available = not bool(self.tracks)
+                index = self.import_json()
+                logger.info(f"[ARGO] Music index loaded: {index['track_count']} tracks (imported {self.index_file})")
                 return index
             except Exception as e:
                 logger.warning(f"[ARGO] Failed to load index: {e}. Rescanning...")
         
         # Create new index
         logger.info(f"[ARGO] Scanning music directory: {self.music_dir}")
-        self.tracks = self._scan_directory()
-        self.no_music_available = not bool(self.tracks)
+        tracks, stats, _ = self._scan_directory()
+        if self._create_store(tracks, stats=stats):
+            logger.info(f"[ARGO] Music index created: {len(self._store)} tracks")
         
-        # Build index document
-        index = {
-            "version": "1.0",
-            "generated_at": datetime.utcnow().isoformat() + "Z",
-            "music_dir": self.music_dir,
-            "track_count": len(self.tracks),
-            "tracks": self.tracks
-        }
-        
-        # Save to JSON
-        try:
-            os.makedirs(os.path.dirname(self.index_file), exist_ok=True)
-            with open(self.index_file, "w", encoding="utf-8") as f:
-                json.dump(index, f, indent=2)
-            logger.info(f"[ARGO] Music index created: {len(self.tracks)} tracks")
-        except Exception as e:
-            logger.warning(f"[ARGO] Failed to save index: {e}")
+        return self._document()
+
+    def rescan(self, incremental: bool = True, progress: Optional[Callable[[Dict], None]] = None) -> Dict:
+        """
+        Rescan music_dir and replace the store.
         
-        return index
-    
-    def _scan_directory(self) -> List[Dict]:
+        Args:
+            incremental: Keep stored records for files whose (path, size,
+                mtime) are unchanged; only new or changed files are read
+            progress: Called with {"phase", "done", "total", ...} while
+                tags are read, and once with the summary at the end
+            
+        Returns:
+            Summary: total, added, updated, removed, unchanged, failed,
+            elapsed_ms, saved (False -> save_error says why; the index
+            keeps its previous state)
         """
-        Recursively scan music directory.
+        start = time.monotonic()
+        with self._write_lock:
+            if incremental:
+                self.compact()
+            previous = self._store if incremental else None
+            tracks, stats, summary = self._scan_directory(previous, progress)
+            previous = None  # let the old generation's file be pruned once the new one is saved
+
+            entries = [(field, track.get(field)) for track in tracks for field in PHONETIC_FIELDS]
+            phonetic = self._phonetic.rebuilt(entries) if incremental and self._phonetic is not None else None
+            saved = self._create_store(tracks, phonetic=phonetic, stats=stats, keep_state_on_failure=True)
+
+        summary["elapsed_ms"] = round((time.monotonic() - start) * 1000, 1)
+        summary["saved"] = saved or not self.pointer_file
+        if summary["saved"]:
+            logger.info(
+                f"[ARGO] Music index rescanned: {summary['total']} tracks "
+                f"(+{summary['added']} ~{summary['updated']} -{summary['removed']}, {summary['elapsed_ms']} ms)"
+            )
+        else:
+            summary["save_error"] = self.save_error
+            logger.error(f"[ARGO] Music index rescan not saved, keeping the previous index: {self.save_error}")
+        if progress:
+            progress({"phase": "done", **summary})
+        return summary
+
+    # ------------------------------------------------------------------
+    # Live updates (overlay on the store)
+    # ------------------------------------------------------------------
+    def _base_stat_map(self) -> Dict[str, Tuple[int, int, int]]:
+        store = self._store
+        if self._base_stats is None or self._base_stats[0] is not store:
+            self._base_stats = (store, store.stat_map())
+        return self._base_stats[1]
+
+    def apply_changes(self, paths: Iterable[str]) -> Dict:
+        """
+        Re-check changed paths and update the index in place.
+        
+        Files are re-read if new or changed (size, mtime); missing files and
+        directories drop their tracks; existing directories are walked. The
+        change is journaled to delta_file, and folded into the store once the
+        overlay grows past DELTA_COMPACT_MIN / DELTA_COMPACT_RATIO.
         
+        Args:
+            paths: Files or directories under music_dir (created, modified,
+                moved or deleted)
+            
         Returns:
-            List of track dictionaries
+            Counts: added, updated, removed
         """
-        tracks = []
+        with self._write_lock:
+            state = self._state
+            base_stats = self._base_stat_map()
+            known = {path: entry[1:] for path, entry in base_stats.items() if path not in state.removed}
+            known.update({path: (size, mtime_ns) for path, (_, size, mtime_ns) in state.delta_tracks.items()})
+
+            present: Dict[str, Tuple[int, int]] = {}
+            gone: Set[str] = set()
+            for path in dict.fromkeys(p.rstrip("/\\") for p in paths):
+                prefix = path + os.sep
+                if os.path.isdir(path):
+                    present.update((file, (size, mtime_ns)) for file, size, mtime_ns in self._walk_library(path))
+                    gone.update(p for p in known if p.startswith(prefix) and p not in present)
+                elif os.path.isfile(path) and _is_supported(path):
+                    st = os.stat(path)
+                    present[path] = (st.st_size, st.st_mtime_ns)
+                elif path in known:
+                    gone.add(path)
+                else:
+                    # A deleted or moved-away directory (or a file we never indexed)
+                    gone.update(p for p in known if p.startswith(prefix))
+
+            to_read = [path for path, stat in present.items() if known.get(path) != stat]
+            counts = {
+                "added": sum(1 for path in to_read if path not in known),
+                "updated": sum(1 for path in to_read if path in known),
+                "removed": len(gone),
+            }
+            if not to_read and not gone:
+                return counts
+
+            delta_tracks = dict(state.delta_tracks)
+            removed = set(state.removed)
+            for path in gone:
+                delta_tracks.pop(path, None)
+                if path in base_stats:
+                    removed.add(path)
+            for path, record in zip(to_read, self._read_records(to_read)):
+                delta_tracks.pop(path, None)
+                if path in base_stats:
+                    removed.add(path)
+                if record:
+                    delta_tracks[path] = (record, *present[path])
+
+            self._apply_overlay(delta_tracks, removed)
+            self.no_music_available = not bool(len(self.tracks))
+            logger.info(
+                f"[ARGO] Music index updated: +{counts['added']} ~{counts['updated']} -{counts['removed']}"
+            )
+            large = len(delta_tracks) + len(removed) > max(DELTA_COMPACT_MIN, DELTA_COMPACT_RATIO * len(self._store))
+            if not (large and self.compact()):
+                self._save_delta()
+            return counts
+
+    def compact(self) -> bool:
+        """
+        Fold the live-update overlay into a new store and drop the journal.
+
+        Returns False if the new store couldn't be written; the overlay and
+        its journal are then kept as they are.
+        """
+        with self._write_lock:
+            state = self._state
+            if not state.has_overlay:
+                return True
+            positions = range(len(state.store)) if state.live is None else np.flatnonzero(state.live).tolist()
+            tracks = [state.store.track(pos) for pos in positions]
+            stats = [state.store.stat(pos) for pos in positions]
+            for record, size, mtime_ns in state.delta_tracks.values():
+                tracks.append(record)
+                stats.append((size, mtime_ns))
+            entries = [(field, track.get(field)) for track in tracks for field in PHONETIC_FIELDS]
+            if not self._create_store(tracks, phonetic=self.phonetic.rebuilt(entries), stats=stats,
+                                      keep_state_on_failure=True) and self.pointer_file:
+                logger.warning(f"[ARGO] Music index not compacted, keeping the changes journal: {self.save_error}")
+                return False
+            logger.info(f"[ARGO] Music index compacted: {len(tracks)} tracks")
+            return True
+
+    def _apply_overlay(self, delta_tracks: Dict[str, Tuple[Dict, int, int]], removed: Set[str]) -> None:
+        state = self._state
+        base_stats = self._base_stat_map()
+        live = None
+        if removed:
+            live = np.ones(len(state.store), dtype=bool)
+            live[[base_stats[path][0] for path in removed if path in base_stats]] = False
+        delta = delta_phonetic = None
+        if delta_tracks:
+            values = list(delta_tracks.values())
+            delta = TrackStore.build([record for record, _, _ in values], stats=[(size, mtime) for _, size, mtime in values])
+            entries = [(field, record.get(field)) for record, _, _ in values for field in PHONETIC_FIELDS]
+            delta_phonetic = (state.delta_phonetic or PhoneticIndex()).rebuilt(entries)
+        self._state = _IndexState(state.store, live, delta, delta_tracks, frozenset(removed), delta_phonetic)
+
+    def _save_delta(self) -> None:
+        if not self.delta_file:
+            return
+        state = self._state
+        document = {
+            "version": DELTA_VERSION,
+            "base": state.store.meta.get("generated_at"),
+            "tracks": [
+                {"size": size, "mtime_ns": mtime_ns, "track": record}
+                for record, size, mtime_ns in state.delta_tracks.values()
+            ],
+            "removed": sorted(state.removed),
+        }
+        tmp_path = self.delta_file + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(document, f)
+            os.replace(tmp_path, self.delta_file)
+        except Exception as e:
+            logger.warning(f"[ARGO] Failed to save index changes: {e}")
+
+    def _load_delta(self) -> None:
+        if not self.delta_file or not os.path.exists(self.delta_file):
+            return
+        try:
+            with open(self.delta_file, "r", encoding="utf-8") as f:
+                document = json.load(f)
+            if document.get("version") != DELTA_VERSION or document.get("base") != self._store.meta.get("generated_at"):
+                raise ValueError("journal doesn't belong to this store")
+            delta_tracks = {
+                entry["track"]["path"]: (entry["track"], entry["size"], entry["mtime_ns"])
+                for entry in document.get("tracks", [])
+            }
+            self._apply_overlay(delta_tracks, set(document.get("removed", [])))
+        except Exception as e:
+            logger.warning(f"[ARGO] Ignoring index changes journal: {e}")
+            try:
+                os.remove(self.delta_file)
+            except OSError as e:
+                logger.debug(f"[ARGO] Keeping unusable index changes journal {self.delta_file}: {e}")
+
+    def _walk_library(self, top: Optional[str] = None) -> List[Tuple[str, int, int]]:
+        """(path, size, mtime_ns) for every supported file under top (default music_dir)."""
+        files = []
+        top = top or self.music_dir
         
-        if not os.path.exists(self.music_dir):
-            logger.warning(f"[ARGO] Music directory not found: {self.music_dir}")
-            return tracks
+        if not os.path.exists(top):
+            logger.warning(f"[ARGO] Music directory not found: {top}")
+            return files
         
         try:
-            for root, dirs, files in os.walk(self.music_dir):
-                for filename in files:
+            for root, dirs, names in os.walk(top):
+                for filename in names:
                     # Check format
-                    if not any(filename.lower().endswith(fmt) for fmt in SUPPORTED_FORMATS):
+                    if not _is_supported(filename):
                         continue
                     
                     full_path = os.path.join(root, filename)
-                    
-                    # Build track record
-                    track = self._build_track_record(full_path)
-                    if track:
-                        tracks.append(track)
+                    try:
+                        st = os.stat(full_path)
+                    except OSError:
+                        continue
+                    files.append((full_path, st.st_size, st.st_mtime_ns))
         
         except Exception as e:
             logger.error(f"[ARGO] Scan error: {e}")
         
-        return tracks
+        return files
+
+    def _scan_directory(self, previous: Optional[TrackStore] = None,
+                        progress: Optional[Callable[[Dict], None]] = None) -> Tuple[List[Dict], List[Tuple[int, int]], Dict]:
+        """
+        Recursively scan music directory.
+        
+        Args:
+            previous: Store to reuse records from (unchanged files aren't re-read)
+            progress: Progress callback (see rescan)
+            
+        Returns:
+            (track dictionaries, (size, mtime_ns) per track, counts)
+        """
+        files = self._walk_library()
+        known = previous.stat_map() if previous is not None else {}
+
+        reuse: Dict[str, int] = {}
+        to_read: List[str] = []
+        for path, size, mtime_ns in files:
+            entry = known.get(path)
+            if entry is not None and entry[1:] == (size, mtime_ns):
+                reuse[path] = entry[0]
+            else:
+                to_read.append(path)
+
+        read = dict(zip(to_read, self._read_records(to_read, progress)))
+
+        tracks, stats = [], []
+        for path, size, mtime_ns in files:
+            track = previous.track(reuse[path]) if path in reuse else read.get(path)
+            if track:
+                tracks.append(track)
+                stats.append((size, mtime_ns))
+
+        added = sum(1 for path in to_read if path not in known)
+        counts = {
+            "total": len(tracks),
+            "added": added,
+            "updated": len(to_read) - added,
+            "removed": len(known.keys() - {path for path, _, _ in files}),
+            "unchanged": len(reuse),
+            "failed": sum(1 for path in to_read if not read.get(path)),
+        }
+        return tracks, stats, counts
+
+    def _read_records(self, paths: List[str], progress: Optional[Callable[[Dict], None]] = None) -> List[Optional[Dict]]:
+        """Build track records for paths, on a process pool when there are enough of them."""
+        total = len(paths)
+        if progress:
+            progress({"phase": "reading", "done": 0, "total": total})
+
+        workers = _get_scan_workers()
+        records: List[Optional[Dict]] = []
+        last = time.monotonic()
+        executor = None
+        if workers > 1 and total >= POOL_MIN_FILES:
+            try:
+                executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_scan_worker, initargs=(self.music_dir,))
+                results = executor.map(_scan_worker, paths, chunksize=max(1, min(64, total // (workers * 4))))
+            except (OSError, NotImplementedError) as e:
+                logger.warning(f"[ARGO] Scan process pool unavailable ({e}); reading tags serially")
+                executor = None
+        if executor is None:
+            results = map(self._build_track_record, paths)
+
+        try:
+            for record in results:
+                records.append(record)
+                if progress and time.monotonic() - last >= SCAN_PROGRESS_INTERVAL:
+                    last = time.monotonic()
+                    progress({"phase": "reading", "done": len(records), "total": total})
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        return records
     
     def _clean_tag(self, value: str) -> Optional[str]:
         """Normalize and validate a metadata tag."""
@@ -574,11 +1154,7 @@ class MusicIndex:
         Returns:
             List of matching tracks
         """
-        genre_lower = genre.lower()
-        matches = [
-            t for t in self.tracks 
-            if t.get("genre") and t.get("genre", "").lower() == genre_lower
-        ]
+        matches = self._lookup("genre", genre)
         
         if matches:
             logger.info(f"[ARGO] Music genre match: {genre} ({len(matches)} tracks)")
@@ -595,11 +1171,7 @@ class MusicIndex:
         Returns:
             List of matching tracks
         """
-        artist_lower = artist.lower()
-        matches = [
-            t for t in self.tracks
-            if t.get("artist") and t.get("artist", "").lower() == artist_lower
-        ]
+        matches = self._lookup("artist", artist)
         
         if matches:
             logger.info(f"[ARGO] Music artist match: {artist} ({len(matches)} tracks)")
@@ -616,16 +1188,67 @@ class MusicIndex:
         Returns:
             List of matching tracks
         """
-        song_lower = song.lower()
-        matches = [
-            t for t in self.tracks
-            if t.get("song") and t.get("song", "").lower() == song_lower
-        ]
+        matches = self._lookup("song", song)
         
         if matches:
             logger.info(f"[ARGO] Music song match: {song} ({len(matches)} tracks)")
         
         return matches
+
+    def filter_by_album(self, album: str) -> List[Dict]:
+        """
+        Filter tracks by album name.
+        
+        Args:
+            album: Album name (case-insensitive)
+            
+        Returns:
+            List of matching tracks
+        """
+        matches = self._lookup("album", album)
+        
+        if matches:
+            logger.info(f"[ARGO] Music album match: {album} ({len(matches)} tracks)")
+        
+        return matches
+
+    def filter_by_year_range(self, year_start: Optional[int], year_end: Optional[int] = None) -> List[Dict]:
+        """
+        Filter tracks by release year (inclusive range, open-ended if None).
+        
+        Args:
+            year_start: First year (None = no lower bound)
+            year_end: Last year (None = same as year_start)
+            
+        Returns:
+            List of matching tracks, oldest first
+        """
+        if year_start is None and year_end is None:
+            return []
+        if year_end is None:
+            year_end = year_start
+        tracks = self._select(lambda store: store.year_range(year_start, year_end))
+        if isinstance(tracks, TrackChain):
+            return sorted(tracks, key=lambda track: track["year"])
+        return tracks
+
+    def filter_where(self, field: str, predicate: Callable[[str], bool]) -> List[Dict]:
+        """
+        Filter tracks whose `field` value satisfies predicate (substring or
+        soft matches). The predicate runs once per distinct value, not per track.
+        
+        Args:
+            field: One of artist, album, song, genre
+            predicate: Called with the raw field value
+            
+        Returns:
+            List of matching tracks in library order
+        """
+        def positions(store: TrackStore) -> np.ndarray:
+            hits = [positions for value, positions in store.distinct_values(field) if predicate(value)]
+            return np.sort(np.concatenate(hits)) if hits else np.empty(0, dtype=np.int32)
+
+        return self._select(positions)
     
     def filter_by_keyword(self, keyword: str) -> List[Dict]:
         """
@@ -637,26 +1260,60 @@ class MusicIndex:
         Returns:
             List of matching tracks
         """
-        keyword_lower = keyword.lower()
-        matches = [t for t in self.tracks if keyword_lower in t.get("tokens", [])]
+        token = keyword.lower()
+        matches = self._select(lambda store: store.postings("token", token))
         
         if matches:
             logger.info(f"[ARGO] Music keyword match: {keyword} ({len(matches)} tracks)")
         
         return matches
     
-    def get_random_track(self) -> Optional[Dict]:
+    def filter_by_phonetic(self, query: str) -> List[Dict]:
         """
-        Get random track from entire library.
+        Filter tracks by the artist/album/song name that sounds like query
+        (for names Whisper misspells). Best spelling match wins.
         
+        Args:
+            query: Spoken name as transcribed
+            
         Returns:
-            Random track or None if library empty
+            List of matching tracks
         """
-        if not self.tracks:
-            return None
-        
-        import random
-        return random.choice(self.tracks)
+        matches = self.phonetic.lookup(query)
+        delta_phonetic = self._state.delta_phonetic
+        if delta_phonetic is not None:
+            matches = sorted(matches + delta_phonetic.lookup(query), key=lambda match: -match[0])
+        # Names whose tracks were all removed since the store was built yield nothing; try the next
+        for _, field, value in matches:
+            tracks = self._lookup(field, value)
+            if tracks:
+                logger.info(f"[ARGO] Music phonetic match: {query} -> {field} {value} ({len(tracks)} tracks)")
+                return tracks
+        return []
+    
+    def get_random_track(self, genre: Optional[str] = None) -> Optional[Dict]:
+        """
+        Get random track from entire library, or from one genre.
+
+        Shuffle-bag picks (core/music_shuffle.py): O(1) per pick, no repeats
+        until the library (or genre) has been played through, and recent
+        tracks held back across reshuffles. Bags are rebuilt when the index
+        changes (rescan, live updates).
+
+        Args:
+            genre: Canonical genre name (None = whole library)
+
+        Returns:
+            Random track or None if library (or genre) empty
+        """
+        state = self._state
+        if self._shuffle_state is not state:
+            self._shuffle_state = state
+            self._shuffle.invalidate()
+        key = _normalize_key(genre) if genre else None
+        if key is None:
+            return self._shuffle.pick(None, lambda: self.tracks)
+        return self._shuffle.pick(key, lambda: self._lookup("genre", genre))
     
     def search(self, query: str) -> List[Dict]:
         """
@@ -687,6 +1344,30 @@ class MusicIndex:
         return []
 
 
+def _phonetic_index(store: TrackStore) -> PhoneticIndex:
+    return PhoneticIndex(
+        (field, value) for field in PHONETIC_FIELDS for value, _ in store.distinct_values(field)
+    )
+
+
+# ============================================================================
+# SCAN WORKERS (process pool)
+# ============================================================================
+
+_worker_index: Optional[MusicIndex] = None
+
+
+def _init_scan_worker(music_dir: str) -> None:
+    # Tag reading only needs music_dir; skip __init__ (config, MUSIC_DIR checks)
+    global _worker_index
+    _worker_index = MusicIndex.__new__(MusicIndex)
+    _worker_index.music_dir = music_dir
+
+
+def _scan_worker(path: str) -> Optional[Dict]:
+    return _worker_index._build_track_record(path)
+
+
 # ============================================================================
 # SINGLETON INSTANCE
 # ============================================================================
@@ -725,6 +1406,12 @@ def _get_music_index_file() -> str:
     return str(config.get("music.index_file", "data/music_index.json"))
 
 
+def _get_scan_workers() -> int:
+    config = get_config()
+    workers = int(config.get("music.scan_workers", 0) or 0)
+    return workers if workers > 0 else (os.cpu_count() or 1)
+
+
 def get_music_index() -> MusicIndex:
     """
     Get or create global music index instance.
@@ -99,6 +99,7 @@ from core.jellyfin_ingest import ingest_jellyfin_library
 
 # Import music index for catalog and filtering
 from core.music_index import get_music_index
+from core.music_watcher import start_music_watcher
 from core.playback_state import get_playback_state
 from core.audio_owner import get_audio_owner
 
@@ -343,6 +344,8 @@ class MusicPlayer:
         self.current_track: Dict = {}  # Track metadata (artist, song, path, etc.)
         self._pygame_module = None
         self._simpleaudio_playback = None
+        # (offset into the track in seconds, time.monotonic() when it started there)
+        self._position_anchor: Optional[tuple] = None
         self._audio_owner = get_audio_owner()
         self._db = MusicDatabase()
         self._music_backend = MUSIC_BACKEND
@@ -381,6 +384,8 @@ class MusicPlayer:
             self.index = get_music_index()
             track_count = len(self.index.tracks) if self.index.tracks else 0
             logger.info(f"[ARGO] Music index loaded: {track_count} tracks")
+            # Library edits under MUSIC_DIR update the index while we run
+            start_music_watcher(self.index)
         except Exception as e:
             logger.error(f"[ARGO] Error loading music index: {e}")
             self.index = None
@@ -463,25 +468,24 @@ class MusicPlayer:
                     output_sink.speak("Music library not indexed yet.")
                 return False
             genre_normalized = normalize_genre(genre)
-            tracks = self._db.query_tracks(genre=genre_normalized, limit=200, intent=f"play {genre}")
+            track = self._db.random_track(genre=genre_normalized)
             used_genre = genre_normalized
 
-            if not tracks:
+            if not track:
                 for adjacent in self._get_adjacent_genres(genre_normalized):
                     adjacent_normalized = normalize_genre(adjacent)
-                    tracks = self._db.query_tracks(genre=adjacent_normalized, limit=200, intent=f"play {genre}")
-                    if tracks:
+                    track = self._db.random_track(genre=adjacent_normalized)
+                    if track:
                         used_genre = adjacent_normalized
                         logger.info(
                             f"[ARGO] Genre '{genre_normalized}' not found, using adjacent: '{used_genre}'"
                         )
                         break
 
-            if not tracks:
+            if not track:
                 logger.warning(f"[ARGO] No tracks found for genre '{genre}' or adjacent genres")
                 return False
 
-            track = tracks[0]
             announcement = self._build_announcement(track)
             result = self._play_jellyfin_track(track, announcement, output_sink)
             if result:
@@ -495,26 +499,25 @@ class MusicPlayer:
         # Normalize genre (apply aliases)
         genre_normalized = normalize_genre(genre)
         
-        # Try primary genre
-        tracks = self.index.filter_by_genre(genre_normalized)
+        # Try primary genre (shuffle-bag pick, see MusicIndex.get_random_track)
+        track = self.index.get_random_track(genre_normalized)
         used_genre = genre_normalized
         
         # Try adjacent genres if primary not found
-        if not tracks:
+        if not track:
             for adjacent in self._get_adjacent_genres(genre_normalized):
                 adjacent_normalized = normalize_genre(adjacent)
-                tracks = self.index.filter_by_genre(adjacent_normalized)
-                if tracks:
+                track = self.index.get_random_track(adjacent_normalized)
+                if track:
                     used_genre = adjacent_normalized
                     logger.info(f"[ARGO] Genre '{genre_normalized}' not found, using adjacent: '{used_genre}'")
                     break
         
         # No tracks found even with adjacent fallback
-        if not tracks:
+        if not track:
             logger.warning(f"[ARGO] No tracks found for genre '{genre}' or adjacent genres")
             return False
 
-        track = random.choice(tracks)
         track_path = track.get("path", "")
         announcement = self._build_announcement(track)
         
@@ -576,12 +579,11 @@ class MusicPlayer:
         tracks = self.index.filter_by_artist(artist_cleaned)
         if not tracks:
             artist_lower = artist_cleaned.lower()
-            tracks = [
-                t for t in self.index.tracks
-                if t.get("artist") and artist_lower in t.get("artist", "").lower()
-            ]
+            tracks = self.index.filter_where("artist", lambda name: artist_lower in name.lower())
             if tracks:
                 logger.info(f"[ARGO] Music artist LIKE match: {artist_cleaned} ({len(tracks)} tracks)")
+        if not tracks:
+            tracks = self.index.filter_by_phonetic(artist_cleaned)
         if not tracks:
             if output_sink:
                 output_sink.speak(f"No tracks by {artist_cleaned} found.")
@@ -645,12 +647,11 @@ class MusicPlayer:
         if not tracks:
             normalized = normalize_title_for_match(song)
             if normalized:
-                tracks = [
-                    t for t in self.index.tracks
-                    if normalize_title_for_match(t.get("song", "")) == normalized
-                ]
+                tracks = self.index.filter_where("song", lambda title: normalize_title_for_match(title) == normalized)
                 if tracks:
                     logger.info(f"[ARGO] Music song soft match: {song} ({len(tracks)} tracks)")
+        if not tracks:
+            tracks = self.index.filter_by_phonetic(song)
         if not tracks:
             if output_sink:
                 output_sink.speak(f"Song {song} not found.")
@@ -741,6 +742,8 @@ class MusicPlayer:
             return False
 
         resolution_tracks = self.index.filter_by_keyword(keyword)
+        if not resolution_tracks:
+            resolution_tracks = self.index.filter_by_phonetic(keyword)
         if not resolution_tracks:
             logger.info(f"music_unresolved_phrase = \"{keyword}\"")
             if output_sink:
@@ -1200,6 +1203,11 @@ Response (JSON ONLY):"""
                 "year_end": None,
             }
 
+        # Sound-alike artist/title (misheard names) resolves locally, before the LLM round trip
+        phonetic = self._phonetic_query_fields(keyword)
+        if phonetic:
+            return phonetic
+
         extracted = self._extract_metadata_with_llm(keyword)
         if not extracted:
             extracted = self._parse_music_keyword(keyword)
@@ -1225,7 +1233,29 @@ Response (JSON ONLY):"""
             "year_end": year_end,
         }
 
-    def play(self, track_path: str, track_name: str, output_sink=None, track_data: Dict = None) -> bool:
+    def _phonetic_query_fields(self, keyword: str) -> Optional[Dict]:
+        """Query fields from a phonetic artist/title match, or None if no single clear match."""
+        try:
+            matches = self._db.phonetic_lookup(keyword)
+        except Exception as e:
+            logger.debug(f"[ARGO] Phonetic lookup failed: {e}")
+            return None
+        if not matches:
+            return None
+        best_ratio, kind, value = matches[0]
+        if len(matches) > 1 and best_ratio - matches[1][0] <= 0.02:
+            logger.info(f"[ARGO] Phonetic match ambiguous for '{keyword}': {value} / {matches[1][2]}")
+            return None
+        logger.info(f"[ARGO] Phonetic match: '{keyword}' -> {kind} {value} (spelling {best_ratio:.2f})")
+        return {
+            "artist": value if kind == "artist" else None,
+            "song": value if kind == "song" else None,
+            "genre": None,
+            "year_start": None,
+            "year_end": None,
+        }
+
+    def play(self, track_path: str, track_name: str, output_sink=None, track_data: Dict = None, start_s: float = 0.0) -> bool:
         """
         Play a specific track.
         
@@ -1234,6 +1264,7 @@ Response (JSON ONLY):"""
             track_name: Human-readable track name (for announcement)
             output_sink: Optional output sink to announce track
             track_data: Optional full track metadata dictionary
+            start_s: Offset into the track to start from (seconds)
             
         Returns:
             True if playback started, False otherwise
@@ -1260,9 +1291,10 @@ Response (JSON ONLY):"""
             # Start playback in background thread (fire-and-forget)
             thread = threading.Thread(
                 target=self._play_background,
-                args=(track_path,),
+                args=(track_path, start_s),
                 daemon=True
             )
+            self._position_anchor = (max(0.0, start_s), time.monotonic())
             thread.start()
 
             logger.info(f"[ARGO] Playing music: {track_path}")
@@ -1275,6 +1307,38 @@ Response (JSON ONLY):"""
             self._release_music_audio()
             return False
 
+    def playback_position(self) -> Optional[float]:
+        """
+        Seconds into the current track, or None when nothing is playing or the
+        position is unknown (wall-clock estimate from when playback started).
+        """
+        if self._position_anchor is None or not self.is_playing():
+            return None
+        offset, started = self._position_anchor
+        return offset + (time.monotonic() - started)
+
+    def resume_track(self, track: Dict, position_s: Optional[float] = None) -> bool:
+        """
+        Restart a previously playing track without announcement.
+
+        Used to undo a speculative stop/skip. Jellyfin tracks are re-streamed,
+        local tracks replayed from their path, both seeked to position_s
+        (from playback_position() before the speculative action).
+
+        Returns:
+            True if playback started, False otherwise
+        """
+        if not track:
+            return False
+        start_s = max(0.0, position_s or 0.0)
+        if track.get("jellyfin_id") or track.get("jellyfin_item_id"):
+            return self._play_jellyfin_track(track, "", None, start_s=start_s)
+        path = track.get("path")
+        if not path:
+            return False
+        name = track.get("name") or track.get("song") or os.path.basename(path)
+        return self.play(path, name, None, track_data=track, start_s=start_s)
+
     def play_next(self, output_sink=None) -> bool:
         """
         Play next track in current playback mode.
@@ -1314,7 +1378,7 @@ Response (JSON ONLY):"""
             logger.info("[ARGO] Next: Playing random track")
             return self.play_random(output_sink)
 
-    def _play_jellyfin_track(self, track: Dict, announcement: str, output_sink=None) -> bool:
+    def _play_jellyfin_track(self, track: Dict, announcement: str, output_sink=None, start_s: float = 0.0) -> bool:
         """
         Play a track from Jellyfin via streaming.
         
@@ -1322,6 +1386,7 @@ Response (JSON ONLY):"""
             track: Track dictionary from Jellyfin
             announcement: What to say before playing
             output_sink: Optional output sink for announcement
+            start_s: Offset into the track to start from (seconds)
             
         Returns:
             True if playback started, False otherwise
@@ -1365,6 +1430,8 @@ Response (JSON ONLY):"""
             self.current_track = track
             self._is_playing_flag = True
             self.playback_mode = "music"
+            self._position_anchor = (start_s, time.monotonic())
+            seek = f"{start_s:.2f}"
             
             # Direct streaming with ffplay (no download, no temp file, instant start)
             import shutil
@@ -1400,6 +1467,7 @@ Response (JSON ONLY):"""
                         "-probesize", "32",  # Fast stream probing
                         "-analyzeduration", "0",  # Don't analyze duration
                         "-infbuf",           # CRITICAL: Infinite buffer for network stability
+                        "-ss", seek,         # Resume offset (0 for a fresh track)
                         stream_url
                     ],
                     stdout=subprocess.DEVNULL,
@@ -1418,7 +1486,7 @@ Response (JSON ONLY):"""
                 logger.debug("[ARGO] Using mpv for streaming")
                 vol = get_volume_percent()
                 self.current_process = subprocess.Popen(
-                    [mpv_path, "--no-video", f"--volume={vol}", stream_url],
+                    [mpv_path, "--no-video", f"--volume={vol}", f"--start={seek}", stream_url],
                     stdout=subprocess.DEVNULL,
                     stderr=subprocess.DEVNULL
                 )
@@ -1431,7 +1499,7 @@ Response (JSON ONLY):"""
             if mpv_path:
                 logger.debug("[ARGO] Using mpv for streaming")
                 self.current_process = subprocess.Popen(
-                    [mpv_path, "--no-video", stream_url],
+                    [mpv_path, "--no-video", f"--start={seek}", stream_url],
                     stdout=subprocess.DEVNULL,
                     stderr=subprocess.DEVNULL
                 )
@@ -1444,7 +1512,7 @@ Response (JSON ONLY):"""
             if vlc_path:
                 logger.debug("[ARGO] Using VLC for streaming")
                 self.current_process = subprocess.Popen(
-                    [vlc_path, "--play-and-exit", stream_url],
+                    [vlc_path, "--play-and-exit", f"--start-time={seek}", stream_url],
                     stdout=subprocess.DEVNULL,
                     stderr=subprocess.DEVNULL
                 )
@@ -1464,8 +1532,8 @@ Response (JSON ONLY):"""
             self._release_music_audio()
             return False
 
-    def _play_background(self, track_path: str) -> None:
-        """Play audio in background thread."""
+    def _play_background(self, track_path: str, start_s: float = 0.0) -> None:
+        """Play audio in background thread, starting start_s seconds into the track."""
         try:
             with Watchdog("AUDIO", AUDIO_WATCHDOG_SECONDS) as wd:
                 # Try Python audio libraries (no external dependency)
@@ -1479,7 +1547,7 @@ Response (JSON ONLY):"""
                     vol = get_volume_percent()
                     pygame.mixer.music.set_volume(vol / 100.0)
                     pygame.mixer.music.load(track_path)
-                    pygame.mixer.music.play()
+                    pygame.mixer.music.play(start=start_s)
                     
                     # Wait for playback to finish
                     while pygame.mixer.music.get_busy():
@@ -1500,6 +1568,8 @@ Response (JSON ONLY):"""
                     
                     logger.info(f"[ARGO] Loading audio with pydub...")
                     sound = AudioSegment.from_file(track_path)
+                    if start_s > 0:
+                        sound = sound[int(start_s * 1000):]
                     # Apply global volume
                     vol = get_volume_percent()
                     gain_db = _percent_to_db(vol)
@@ -1529,7 +1599,7 @@ Response (JSON ONLY):"""
                         vol = get_volume_percent()
                         logger.info(f"[ARGO] Playing via ffplay: {ffplay_path}")
                         self.current_process = subprocess.Popen(
-                            [ffplay_path, "-nodisp", "-autoexit", "-volume", str(vol), track_path],
+                            [ffplay_path, "-nodisp", "-autoexit", "-volume", str(vol), "-ss", f"{start_s:.2f}", track_path],
                             stdout=subprocess.DEVNULL,
                             stderr=subprocess.DEVNULL,
                         )
@@ -1600,6 +1670,7 @@ Response (JSON ONLY):"""
 
             self._is_playing_flag = False
             self.current_track = {}
+            self._position_anchor = None
             self._release_music_audio()
             self._pygame_module = None
             self._simpleaudio_playback = None
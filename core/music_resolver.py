@@ -3,6 +3,9 @@ Music Resolver
 
 Resolves human music requests into local metadata matches using a strict cascade.
 Local authority: the index decides the file, never the LLM.
+
+Normalized field maps and the fuzzy candidate index are built once per
+track list (lazily, on first use) instead of per query.
 """
 
 from __future__ import annotations
@@ -15,8 +18,14 @@ import re
 from difflib import SequenceMatcher
 from typing import Callable, Dict, List, Optional, Tuple
 
+from core.fuzzy_index import TrigramIndex
+from core.phonetic import PhoneticIndex
+
 logger = logging.getLogger(__name__)
 
+FUZZY_THRESHOLD = 0.85
+CLARIFY_MARGIN = 0.02
+
 
 @dataclass
 class Resolution:
@@ -30,6 +39,19 @@ class MusicResolver:
         self.tracks = tracks
         self.aliases = self._load_aliases()
 
+    @property
+    def tracks(self) -> List[Dict]:
+        return self._tracks
+
+    @tracks.setter
+    def tracks(self, tracks: List[Dict]) -> None:
+        self._tracks = tracks
+        self._field_maps: Optional[Dict[str, Dict[str, List[Dict]]]] = None
+        self._first_seen: Dict[Tuple[str, str], int] = {}
+        self._candidates: Optional[List[Tuple[str, str]]] = None
+        self._fuzzy_index: Optional[TrigramIndex] = None
+        self._phonetic_index: Optional[PhoneticIndex] = None
+
     def resolve(self, query: str, llm_interpret: Optional[Callable[[str], Optional[Dict]]] = None) -> Resolution:
         clean = self._normalize(query)
         if not clean:
@@ -59,7 +81,12 @@ class MusicResolver:
         if fuzzy.tracks or fuzzy.clarification:
             return fuzzy
 
-        # Step 5: LLM intent extraction (interpret only)
+        # Step 5: Phonetic match (misheard names, e.g. "deaf leopard")
+        phonetic = self._phonetic_match(clean)
+        if phonetic.tracks or phonetic.clarification:
+            return phonetic
+
+        # Step 6: LLM intent extraction (interpret only)
         if llm_interpret:
             parsed = llm_interpret(query)
             if parsed:
@@ -139,24 +166,37 @@ class MusicResolver:
         if not candidates:
             return Resolution([], None, "fuzzy_none")
 
-        scored = []
-        for label, value in candidates:
-            ratio = self._ratio(clean, value)
-            scored.append((ratio, label, value))
-
-        scored.sort(reverse=True, key=lambda item: item[0])
-        best_ratio, best_label, best_value = scored[0]
-        if best_ratio < 0.85:
+        # Only candidates at or above the threshold can win or force a clarification
+        scored = [
+            (ratio, *candidates[position])
+            for ratio, position in self._get_fuzzy_index().search(clean, FUZZY_THRESHOLD)
+        ]
+        if not scored:
             return Resolution([], None, "fuzzy_below_threshold")
 
+        best_ratio, best_label, best_value = scored[0]
         if len(scored) > 1:
             second_ratio, second_label, second_value = scored[1]
-            if second_ratio >= 0.85 and abs(best_ratio - second_ratio) <= 0.02:
+            if second_ratio >= FUZZY_THRESHOLD and abs(best_ratio - second_ratio) <= CLARIFY_MARGIN:
                 clarification = self._format_clarification(best_label, best_value, second_label, second_value)
                 return Resolution([], clarification, "fuzzy_clarify")
 
         return self._resolve_best_candidate(best_label, best_value, "fuzzy")
 
+    def _phonetic_match(self, clean: str) -> Resolution:
+        matches = self._get_phonetic_index().lookup(clean)
+        if not matches:
+            return Resolution([], None, "phonetic_none")
+
+        best_ratio, best_label, best_value = matches[0]
+        if len(matches) > 1:
+            second_ratio, second_label, second_value = matches[1]
+            if abs(best_ratio - second_ratio) <= CLARIFY_MARGIN:
+                clarification = self._format_clarification(best_label, best_value, second_label, second_value)
+                return Resolution([], clarification, "phonetic_clarify")
+
+        return self._resolve_best_candidate(best_label, best_value, "phonetic")
+
     # ------------------------------------------------------------
     # Era/vibe handling
     # ------------------------------------------------------------
@@ -216,9 +256,7 @@ class MusicResolver:
         genre = era.get("genre")
         artist = era.get("artist")
 
-        tracks = self.tracks
-        if artist:
-            tracks = self._filter_by_artist_and_tracks(artist, tracks)
+        tracks = self._filter_by_artist(artist) if artist else self.tracks
         if genre:
             tracks = self._filter_by_genre_and_tracks(genre, tracks)
         if year_start is not None and year_end is not None:
@@ -288,19 +326,43 @@ class MusicResolver:
         return SequenceMatcher(None, a, b).ratio()
 
     def _collect_candidates(self) -> List[Tuple[str, str]]:
-        candidates = []
-        seen = set()
-        for t in self.tracks:
+        if self._candidates is None:
+            candidates = []
             for label in ("artist", "album", "song"):
-                value = t.get(label)
-                if not value:
-                    continue
-                clean = self._normalize(str(value))
-                key = (label, clean)
-                if clean and key not in seen:
-                    seen.add(key)
-                    candidates.append((label, clean))
-        return candidates
+                candidates.extend((label, clean) for clean in self._get_field_maps()[label] if clean)
+            # Library order, as the per-track scan produced them (ties resolve the same way)
+            first_seen = self._first_seen
+            candidates.sort(key=lambda item: first_seen[item])
+            self._candidates = candidates
+        return self._candidates
+
+    def _get_fuzzy_index(self) -> TrigramIndex:
+        if self._fuzzy_index is None:
+            self._fuzzy_index = TrigramIndex([value for _, value in self._collect_candidates()])
+        return self._fuzzy_index
+
+    def _get_phonetic_index(self) -> PhoneticIndex:
+        if self._phonetic_index is None:
+            self._phonetic_index = PhoneticIndex(self._collect_candidates())
+        return self._phonetic_index
+
+    def _get_field_maps(self) -> Dict[str, Dict[str, List[Dict]]]:
+        """Normalized artist/album/song/genre -> tracks, built once per track list."""
+        if self._field_maps is None:
+            maps: Dict[str, Dict[str, List[Dict]]] = {label: {} for label in ("artist", "album", "song", "genre")}
+            first_seen: Dict[Tuple[str, str], int] = {}
+            for t in self.tracks:
+                for label, by_value in maps.items():
+                    value = t.get(label)
+                    if not value:
+                        continue
+                    clean = self._normalize(str(value))
+                    by_value.setdefault(clean, []).append(t)
+                    if clean:
+                        first_seen.setdefault((label, clean), len(first_seen))
+            self._field_maps = maps
+            self._first_seen = first_seen
+        return self._field_maps
 
     def _format_clarification(self, label_a: str, value_a: str, label_b: str, value_b: str) -> str:
         def pretty(label: str, value: str) -> str:
@@ -324,13 +386,14 @@ class MusicResolver:
         genre_clean = self._normalize(genre)
         return [t for t in tracks if t.get("genre") and self._normalize(t.get("genre")) == genre_clean]
 
+    def _filter_by_field(self, label: str, value: str) -> List[Dict]:
+        return list(self._get_field_maps()[label].get(self._normalize(value), ()))
+
     def _filter_by_artist(self, artist: str) -> List[Dict]:
-        return self._filter_by_artist_and_tracks(artist, self.tracks)
+        return self._filter_by_field("artist", artist)
 
     def _filter_by_album(self, album: str) -> List[Dict]:
-        album_clean = self._normalize(album)
-        return [t for t in self.tracks if t.get("album") and self._normalize(t.get("album")) == album_clean]
+        return self._filter_by_field("album", album)
 
     def _filter_by_song(self, song: str) -> List[Dict]:
-        song_clean = self._normalize(song)
-        return [t for t in self.tracks if t.get("song") and self._normalize(t.get("song")) == song_clean]
+        return self._filter_by_field("song", song)
@@ -0,0 +1,141 @@
+"""
+MUSIC SHUFFLE
+
+Constant-time random track picks for "play something" and genre play, shared
+by the local index (MusicIndex.get_random_track) and the Jellyfin SQLite
+backend (MusicDatabase.random_track).
+
+- ShuffleBag: a dense index array over one candidate list (the library or
+  one genre), drawn with an incremental Fisher-Yates shuffle: each draw is
+  O(1), and every candidate comes up once before any repeats
+- TrackShuffler: one bag per key (None = whole library, or a genre), built
+  on first use and dropped by invalidate() when the library changes (ingest,
+  rescan, live updates). A history of recent picks, shared by all bags, is
+  deferred when a bag reshuffles (put back among the undrawn candidates, so
+  it still plays once later in the pass), so the end of one pass and the
+  start of the next don't replay the same tracks
+
+Config (music.*): shuffle_history (recent tracks held back; capped at half
+a bag so small genres still play).
+"""
+
+import random
+import threading
+from array import array
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional, Sequence
+
+from core.config import get_config
+
+
+class ShuffleBag:
+    """Random order over range(size) without repeats until every index is drawn."""
+
+    __slots__ = ("_order", "_next", "_rng")
+
+    def __init__(self, size: int, rng: Optional[random.Random] = None):
+        self._order = array("q", range(size))
+        self._next = 0
+        self._rng = rng or random.Random()
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def draw(self) -> int:
+        """Next index; starts a fresh pass once all have been drawn. Bag must be non-empty."""
+        order = self._order
+        size = len(order)
+        if self._next >= size:
+            self._next = 0
+        i = self._next
+        j = self._rng.randrange(i, size)
+        order[i], order[j] = order[j], order[i]
+        self._next = i + 1
+        return order[i]
+
+    def defer(self) -> bool:
+        """
+        Put the index just drawn back among the undrawn ones (it is drawn
+        again later in this pass). False if it was the last one left.
+        """
+        if not 0 < self._next < len(self._order):
+            return False
+        self._next -= 1
+        return True
+
+
+class TrackShuffler:
+    """Shuffle bags per key with a shared recent-play history (keyed by track path)."""
+
+    def __init__(self, history: Optional[int] = None, rng: Optional[random.Random] = None):
+        if history is None:
+            history = int(get_config().get("music.shuffle_history", 50))
+        self.history = max(0, history)
+        self._rng = rng or random.Random()
+        self._bags: Dict[Hashable, tuple] = {}
+        self._recent: "OrderedDict[str, int]" = OrderedDict()  # path -> pick number
+        self._picks = 0
+        self._lock = threading.Lock()
+
+    def invalidate(self) -> None:
+        """Drop every bag (the candidate lists changed). Recent history is kept."""
+        with self._lock:
+            self._bags.clear()
+
+    def pick(
+        self,
+        key: Hashable,
+        load: Callable[[], Sequence],
+        resolve: Optional[Callable[[object], Optional[Dict]]] = None,
+    ) -> Optional[Dict]:
+        """
+        Random track for key.
+
+        Args:
+            key: Bag key (None = whole library, or a normalized genre)
+            load: Returns the candidates (tracks, or ids for resolve); called
+                once per key until invalidate()
+            resolve: Maps a candidate to its track (None = candidates are tracks)
+
+        Returns:
+            Track dict, or None if there are no candidates
+        """
+        with self._lock:
+            entry = self._bags.get(key)
+            if entry is None:
+                items = load()
+                entry = (items, ShuffleBag(len(items), self._rng))
+                self._bags[key] = entry
+            items, bag = entry
+            if not len(bag):
+                return None
+
+            window = min(self.history, len(bag) // 2)
+            # Recent tracks are at most half the bag, so this ends after a draw or two;
+            # a deferred track stays in the pass and ages out of the window before
+            # it is all that's left
+            attempts = len(bag)
+            for attempt in range(attempts):
+                item = items[bag.draw()]
+                track = resolve(item) if resolve else item
+                if not track:
+                    continue
+                recent = window and self._is_recent(track.get("path"), window)
+                if recent and attempt < attempts - 1 and bag.defer():
+                    continue
+                self._remember(track.get("path"))
+                return track
+            return None
+
+    def _is_recent(self, path: Optional[str], window: int) -> bool:
+        seen = self._recent.get(path)
+        return seen is not None and self._picks - seen < window
+
+    def _remember(self, path: Optional[str]) -> None:
+        self._picks += 1
+        if path is None or not self.history:
+            return
+        self._recent[path] = self._picks
+        self._recent.move_to_end(path)
+        while len(self._recent) > self.history:
+            self._recent.popitem(last=False)
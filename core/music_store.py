@@ -0,0 +1,460 @@
+"""
+Compact Music Index Store
+
+Versioned binary, columnar on-disk format for the local music index
+(data/music_index.<n>.idx), loaded with mmap instead of parsing JSON. The JSON
+index stays the import/export format (MusicIndex.export_json, legacy files
+are imported once).
+
+Layout (little-endian):
+    b"ARGOMIX1" | u32 header length | header JSON | sections (8-byte aligned)
+
+Header JSON: {"version", "meta", "sections": {name: [offset, dtype, count]}}
+
+Sections:
+- str.offsets / str.blob     interned UTF-8 string table (ids are int32, -1 = None)
+- col.<field>                int32 string id per track (id, path, filename, ...)
+- col.year                   int32 year per track (0 = unknown)
+- tok.offsets / tok.ids      per-track token lists (CSR)
+- key.<name>.{keys,offsets,positions}
+                             postings: sorted key string ids -> track positions
+                             (token, and normalized artist/album/song/genre)
+- ph.{keys,offsets,fields,values}
+                             phonetic key -> (field, value string id) entries
+- stat.size / stat.mtime_ns  int64 file size and mtime per track, for
+                             incremental rescans (optional)
+
+Nothing is decoded at load; strings are decoded on access and key lookups
+binary-search the sorted key arrays. Materialized tracks are plain dicts
+(the shape scan records always had), built only for results actually used.
+"""
+
+# ============================================================================
+# 1) IMPORTS
+# ============================================================================
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import tempfile
+from collections.abc import Sequence
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from core.phonetic import PhoneticIndex
+
+# ============================================================================
+# 2) FORMAT CONSTANTS
+# ============================================================================
+MAGIC = b"ARGOMIX1"
+STORE_VERSION = 1
+STRING_FIELDS = ("id", "path", "filename", "name", "artist", "song", "album", "genre", "ext")
+KEY_FIELDS = ("artist", "album", "song", "genre")
+POSTING_NAMES = ("token",) + KEY_FIELDS
+PHONETIC_FIELDS = ("artist", "album", "song")
+_ALIGN = 8
+_EMPTY = np.empty(0, dtype=np.int32)
+
+
+def normalize_key(value) -> str:
+    """Lookup key for exact field matches: case-folded, whitespace collapsed."""
+    if not value:
+        return ""
+    return " ".join(str(value).casefold().split())
+
+
+def _as_year(value) -> int:
+    try:
+        return int(value) if value else 0
+    except (TypeError, ValueError):
+        return 0
+
+
+# ============================================================================
+# 3) BUILDER
+# ============================================================================
+class _Builder:
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+        self.strings: List[str] = []
+
+    def intern(self, value) -> int:
+        if value is None or value == "":
+            return -1
+        value = str(value)
+        sid = self.ids.get(value)
+        if sid is None:
+            sid = self.ids[value] = len(self.strings)
+            self.strings.append(value)
+        return sid
+
+    def postings(self, name: str, mapping: Dict[str, List[int]], sections: Dict[str, np.ndarray]) -> None:
+        keys = sorted(mapping)
+        offsets = np.zeros(len(keys) + 1, dtype=np.uint32)
+        positions = []
+        for i, key in enumerate(keys):
+            positions.extend(mapping[key])
+            offsets[i + 1] = len(positions)
+        sections[f"key.{name}.keys"] = np.fromiter((self.intern(k) for k in keys), dtype=np.int32, count=len(keys))
+        sections[f"key.{name}.offsets"] = offsets
+        sections[f"key.{name}.positions"] = np.asarray(positions, dtype=np.int32)
+
+
+def build_sections(tracks: Iterable[Dict], phonetic=None, stats: Optional[List[Tuple[int, int]]] = None) -> Dict[str, np.ndarray]:
+    """
+    Columnar sections for tracks, plus phonetic rows if a PhoneticIndex is
+    given and (size, mtime_ns) per track if stats are.
+    """
+    builder = _Builder()
+    columns: Dict[str, List[int]] = {field: [] for field in STRING_FIELDS}
+    years: List[int] = []
+    tok_offsets = [0]
+    tok_ids: List[int] = []
+    maps: Dict[str, Dict[str, List[int]]] = {name: {} for name in POSTING_NAMES}
+
+    for pos, track in enumerate(tracks):
+        for field in STRING_FIELDS:
+            columns[field].append(builder.intern(track.get(field)))
+        years.append(_as_year(track.get("year")))
+        tokens = list(dict.fromkeys(track.get("tokens") or ()))
+        tok_ids.extend(builder.intern(token) for token in tokens)
+        tok_offsets.append(len(tok_ids))
+        for token in tokens:
+            maps["token"].setdefault(token, []).append(pos)
+        for field in KEY_FIELDS:
+            key = normalize_key(track.get(field))
+            if key:
+                maps[field].setdefault(key, []).append(pos)
+
+    sections: Dict[str, np.ndarray] = {}
+    for field in STRING_FIELDS:
+        sections[f"col.{field}"] = np.asarray(columns[field], dtype=np.int32)
+    sections["col.year"] = np.asarray(years, dtype=np.int32)
+    sections["tok.offsets"] = np.asarray(tok_offsets, dtype=np.uint32)
+    sections["tok.ids"] = np.asarray(tok_ids, dtype=np.int32)
+    for name in POSTING_NAMES:
+        builder.postings(name, maps[name], sections)
+
+    if phonetic is not None:
+        rows: Dict[str, List[Tuple[int, int]]] = {}
+        for key, field, value in phonetic.rows():
+            if field in PHONETIC_FIELDS:
+                rows.setdefault(key, []).append((PHONETIC_FIELDS.index(field), builder.intern(value)))
+        keys = sorted(rows)
+        entries = [entry for key in keys for entry in rows[key]]
+        offsets = np.cumsum([0] + [len(rows[key]) for key in keys], dtype=np.uint32)
+        sections["ph.keys"] = np.fromiter((builder.intern(k) for k in keys), dtype=np.int32, count=len(keys))
+        sections["ph.offsets"] = offsets
+        sections["ph.fields"] = np.asarray([field for field, _ in entries], dtype=np.uint8)
+        sections["ph.values"] = np.asarray([sid for _, sid in entries], dtype=np.int32)
+
+    if stats is not None:
+        sections["stat.size"] = np.asarray([size for size, _ in stats], dtype=np.int64).reshape(-1)
+        sections["stat.mtime_ns"] = np.asarray([mtime for _, mtime in stats], dtype=np.int64).reshape(-1)
+
+    encoded = [s.encode("utf-8") for s in builder.strings]
+    sections["str.offsets"] = np.cumsum([0] + [len(b) for b in encoded], dtype=np.uint32)
+    sections["str.blob"] = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+    return sections
+
+
+# ============================================================================
+# 4) STORE
+# ============================================================================
+class TrackStore:
+    """Columnar track table over in-memory arrays or an mmap'd .idx file."""
+
+    __slots__ = ("meta", "_s", "_mv", "_mmap", "_order_cache", "_year_cache", "__weakref__")
+
+    def __init__(self, sections: Dict[str, np.ndarray], meta: Optional[Dict] = None, mapped: Optional[mmap.mmap] = None):
+        self.meta = dict(meta or {})
+        self._s = sections
+        # memoryviews over the same buffers: per-item indexing returns plain ints,
+        # several times cheaper than numpy scalar access when materializing tracks
+        self._mv = {name: memoryview(array) for name, array in sections.items() if array.ndim == 1}
+        self._mmap = mapped
+        self._order_cache: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        self._year_cache: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+    @classmethod
+    def build(cls, tracks: Iterable[Dict], meta: Optional[Dict] = None, phonetic=None,
+              stats: Optional[List[Tuple[int, int]]] = None) -> "TrackStore":
+        return cls(build_sections(tracks, phonetic, stats), meta)
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+    def save(self, path: str) -> None:
+        """Write atomically (temp file + os.replace)."""
+        layout = {}
+        offset = 0
+        for name, array in self._s.items():
+            offset = -(-offset // _ALIGN) * _ALIGN
+            layout[name] = [offset, array.dtype.str, int(array.size)]
+            offset += array.nbytes
+        header = json.dumps({"version": STORE_VERSION, "meta": self.meta, "sections": layout}).encode("utf-8")
+        base = -(-(len(MAGIC) + 4 + len(header)) // _ALIGN) * _ALIGN
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(MAGIC)
+                f.write(np.uint32(len(header)).tobytes())
+                f.write(header)
+                for name, array in self._s.items():
+                    f.write(b"\0" * (base + layout[name][0] - f.tell()))
+                    f.write(np.ascontiguousarray(array).tobytes())
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+    @classmethod
+    def load(cls, path: str) -> "TrackStore":
+        """Map an .idx file. Raises ValueError if it isn't a store of this version."""
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if mapped[:len(MAGIC)] != MAGIC:
+                raise ValueError(f"not a music index store: {path}")
+            header_len = int(np.frombuffer(mapped, dtype="<u4", count=1, offset=len(MAGIC))[0])
+            start = len(MAGIC) + 4
+            header = json.loads(bytes(mapped[start:start + header_len]).decode("utf-8"))
+            if header.get("version") != STORE_VERSION:
+                raise ValueError(f"music index store version {header.get('version')} != {STORE_VERSION}")
+            base = -(-(start + header_len) // _ALIGN) * _ALIGN
+            sections = {
+                name: np.frombuffer(mapped, dtype=np.dtype(dtype), count=count, offset=base + offset)
+                for name, (offset, dtype, count) in header["sections"].items()
+            }
+        except Exception:
+            mapped.close()
+            raise
+        return cls(sections, header.get("meta"), mapped)
+
+    def close(self) -> None:
+        """Release the mapping (required on Windows before replacing the file)."""
+        if self._mmap is not None:
+            for view in self._mv.values():
+                view.release()
+            self._mv = {}
+            self._s = {}
+            self._order_cache.clear()
+            self._year_cache = None
+            try:
+                self._mmap.close()
+            except BufferError:
+                pass  # a view is still referenced; the GC releases it with the last view
+            self._mmap = None
+
+    # ------------------------------------------------------------------
+    # Access
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        column = self._s.get("col.id")
+        return 0 if column is None else int(column.size)
+
+    @property
+    def has_phonetic(self) -> bool:
+        return "ph.keys" in self._s
+
+    @property
+    def has_stats(self) -> bool:
+        return "stat.size" in self._s
+
+    def stat(self, pos: int) -> Tuple[int, int]:
+        """(size, mtime_ns) recorded for a track; (-1, -1) if the store has no file stats."""
+        if not self.has_stats:
+            return -1, -1
+        return self._mv["stat.size"][pos], self._mv["stat.mtime_ns"][pos]
+
+    def stat_map(self) -> Dict[str, Tuple[int, int, int]]:
+        """path -> (position, size, mtime_ns)."""
+        return {self.value("path", pos): (pos, *self.stat(pos)) for pos in range(len(self))}
+
+    def string(self, sid: int) -> Optional[str]:
+        if sid < 0:
+            return None
+        offsets = self._mv["str.offsets"]
+        return str(self._mv["str.blob"][offsets[sid]:offsets[sid + 1]], "utf-8")
+
+    def value(self, field: str, pos: int):
+        if field == "year":
+            return self._mv["col.year"][pos] or None
+        return self.string(self._mv[f"col.{field}"][pos])
+
+    def tokens(self, pos: int) -> List[str]:
+        offsets = self._mv["tok.offsets"]
+        return [self.string(sid) for sid in self._mv["tok.ids"][offsets[pos]:offsets[pos + 1]]]
+
+    def track(self, pos: int) -> Dict:
+        """Materialize one track record (same keys as a scanned record)."""
+        record = {field: self.value(field, pos) for field in STRING_FIELDS}
+        record["year"] = self.value("year", pos)
+        record["tokens"] = self.tokens(pos)
+        return record
+
+    def _find(self, keys: np.ndarray, key: str) -> int:
+        """Index of key in a sorted key-id array, or -1."""
+        lo, hi = 0, int(keys.size)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.string(int(keys[mid])) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < keys.size and self.string(int(keys[lo])) == key:
+            return lo
+        return -1
+
+    def postings(self, name: str, key: str) -> np.ndarray:
+        """Track positions for a token / normalized field key (ascending)."""
+        keys = self._s[f"key.{name}.keys"]
+        index = self._find(keys, key)
+        if index < 0:
+            return _EMPTY
+        offsets = self._s[f"key.{name}.offsets"]
+        return self._s[f"key.{name}.positions"][int(offsets[index]):int(offsets[index + 1])]
+
+    def _value_order(self, field: str) -> Tuple[np.ndarray, np.ndarray]:
+        cached = self._order_cache.get(field)
+        if cached is None:
+            column = self._s[f"col.{field}"]
+            order = np.argsort(column, kind="stable").astype(np.int32)
+            cached = self._order_cache[field] = (order, column[order])
+        return cached
+
+    def distinct_values(self, field: str) -> Iterator[Tuple[str, np.ndarray]]:
+        """(raw value, positions) per distinct non-empty value of a string field."""
+        order, sorted_ids = self._value_order(field)
+        if not sorted_ids.size:
+            return
+        starts = np.flatnonzero(np.r_[True, sorted_ids[1:] != sorted_ids[:-1]])
+        ends = np.r_[starts[1:], sorted_ids.size]
+        for start, end in zip(starts.tolist(), ends.tolist()):
+            sid = int(sorted_ids[start])
+            if sid >= 0:
+                yield self.string(sid), order[start:end]
+
+    def year_range(self, year_start: Optional[int], year_end: Optional[int]) -> np.ndarray:
+        """Positions with year_start <= year <= year_end, oldest first."""
+        if self._year_cache is None:
+            years = self._s["col.year"]
+            dated = np.flatnonzero(years > 0).astype(np.int32)
+            order = dated[np.argsort(years[dated], kind="stable")]
+            self._year_cache = (years[order], order)
+        keys, order = self._year_cache
+        lo = 0 if year_start is None else int(np.searchsorted(keys, year_start, side="left"))
+        hi = keys.size if year_end is None else int(np.searchsorted(keys, year_end, side="right"))
+        return order[lo:hi]
+
+    def phonetic_entries(self, key: str) -> List[Tuple[str, str]]:
+        if not self.has_phonetic:
+            return []
+        index = self._find(self._s["ph.keys"], key)
+        if index < 0:
+            return []
+        offsets = self._s["ph.offsets"]
+        return self._phonetic_entries_at(int(offsets[index]), int(offsets[index + 1]))
+
+    def phonetic_rows(self) -> Iterator[Tuple[str, str, str]]:
+        if not self.has_phonetic:
+            return
+        keys, offsets = self._s["ph.keys"], self._s["ph.offsets"]
+        for i in range(keys.size):
+            key = self.string(int(keys[i]))
+            for field, value in self._phonetic_entries_at(int(offsets[i]), int(offsets[i + 1])):
+                yield key, field, value
+
+    def _phonetic_entries_at(self, start: int, end: int) -> List[Tuple[str, str]]:
+        fields = self._s["ph.fields"][start:end]
+        values = self._s["ph.values"][start:end]
+        return [(PHONETIC_FIELDS[int(f)], self.string(int(v))) for f, v in zip(fields, values)]
+
+
+class StorePhoneticIndex(PhoneticIndex):
+    """PhoneticIndex answered from a store's ph.* sections (nothing decoded up front)."""
+
+    def __init__(self, store: TrackStore):
+        super().__init__()
+        self._store = store
+
+    def __len__(self) -> int:
+        return int(self._store._s["ph.keys"].size)
+
+    def rows(self) -> Iterable[Tuple[str, str, str]]:
+        return self._store.phonetic_rows()
+
+    def _entries(self, key: str) -> Iterable[Tuple[str, str]]:
+        return self._store.phonetic_entries(key)
+
+
+# ============================================================================
+# 5) TRACK VIEWS
+# ============================================================================
+class _Tracks(Sequence):
+    """List-like read-only track sequence; subclasses provide __len__ and _get."""
+
+    __slots__ = ()
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("track index out of range")
+        return self._get(index)
+
+    def __iter__(self) -> Iterator[Dict]:
+        for index in range(len(self)):
+            yield self._get(index)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (list, tuple, _Tracks)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self)} tracks)"
+
+    def where(self, predicate: Callable[[Dict], bool]) -> List[Dict]:
+        return [track for track in self if predicate(track)]
+
+
+class TrackList(_Tracks):
+    """Read-only list of tracks backed by store positions; dicts are built on access."""
+
+    __slots__ = ("_store", "_positions")
+
+    def __init__(self, store: TrackStore, positions: Optional[np.ndarray] = None):
+        self._store = store
+        self._positions = positions
+
+    def __len__(self) -> int:
+        return len(self._store) if self._positions is None else int(self._positions.size)
+
+    def _get(self, index: int) -> Dict:
+        return self._store.track(index if self._positions is None else int(self._positions[index]))
+
+
+class TrackChain(_Tracks):
+    """TrackLists read back to back (base store, then the live-update delta)."""
+
+    __slots__ = ("_parts", "_ends")
+
+    def __init__(self, parts: List[TrackList]):
+        self._parts = [part for part in parts if len(part)]
+        self._ends = np.cumsum([len(part) for part in self._parts], dtype=np.int64)
+
+    def __len__(self) -> int:
+        return int(self._ends[-1]) if self._parts else 0
+
+    def _get(self, index: int) -> Dict:
+        part = int(np.searchsorted(self._ends, index, side="right"))
+        start = int(self._ends[part - 1]) if part else 0
+        return self._parts[part]._get(index - start)
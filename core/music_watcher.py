@@ -0,0 +1,190 @@
+"""
+MUSIC LIBRARY WATCHER
+
+Keeps the local MusicIndex live while ARGO runs: files added, changed,
+moved or deleted under MUSIC_DIR are applied with MusicIndex.apply_changes
+once events go quiet for the debounce window, so routine library edits
+(dropping in an album, retagging, deleting) don't need a rebuild.
+
+Backends:
+- watchdog: inotify on Linux (ReadDirectoryChangesW / FSEvents elsewhere)
+- poll: walks MUSIC_DIR every poll interval and diffs (size, mtime); used
+  when watchdog isn't installed or can't watch the directory
+
+Config (music.*): watch_enabled, watch_backend (auto|watchdog|poll),
+watch_debounce_seconds, watch_poll_seconds.
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+from core.config import get_config
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+    HAS_WATCHDOG = True
+except ImportError:
+    FileSystemEventHandler = object
+    Observer = None
+    HAS_WATCHDOG = False
+
+logger = logging.getLogger(__name__)
+
+
+class _EventHandler(FileSystemEventHandler):
+    def __init__(self, watcher: "MusicLibraryWatcher"):
+        super().__init__()
+        self._watcher = watcher
+
+    def on_any_event(self, event) -> None:
+        # A directory "modified" event only means its listing changed; the file events follow
+        if event.is_directory and event.event_type == "modified":
+            return
+        if event.event_type in ("opened", "closed_no_write"):
+            return
+        paths = [event.src_path]
+        if getattr(event, "dest_path", None):
+            paths.append(event.dest_path)
+        self._watcher.notify(paths)
+
+
+class MusicLibraryWatcher:
+    """Debounces filesystem changes under the index's music_dir into MusicIndex.apply_changes."""
+
+    def __init__(self, index, debounce_seconds: float = 2.0, poll_seconds: float = 30.0, backend: str = "auto"):
+        self.index = index
+        self.debounce_seconds = debounce_seconds
+        self.poll_seconds = poll_seconds
+        self.backend = backend
+        self._pending: Set[str] = set()
+        self._last_event = 0.0
+        self._cond = threading.Condition()
+        self._stop = threading.Event()
+        self._threads = []
+        self._observer = None
+
+    def start(self) -> str:
+        """Start watching; returns the backend in use ("watchdog" or "poll")."""
+        backend = self.backend
+        if backend in ("auto", "watchdog") and HAS_WATCHDOG:
+            try:
+                self._observer = Observer()
+                self._observer.schedule(_EventHandler(self), self.index.music_dir, recursive=True)
+                self._observer.start()
+                backend = "watchdog"
+            except Exception as e:
+                logger.warning(f"[ARGO] Music watcher: watchdog unavailable ({e}); polling instead")
+                self._observer = None
+                backend = "poll"
+        else:
+            if backend == "watchdog":
+                logger.warning("[ARGO] Music watcher: watchdog not installed; polling instead")
+            backend = "poll"
+
+        self._spawn(self._debounce_loop, "ARGO.MusicWatcher")
+        if backend == "poll":
+            # Baseline taken before returning, so changes made right after start() are seen
+            baseline = self._snapshot()
+            self._spawn(lambda: self._poll_loop(baseline), "ARGO.MusicWatcherPoll")
+        logger.info(f"[ARGO] Music watcher started ({backend}): {self.index.music_dir}")
+        return backend
+
+    def stop(self) -> None:
+        self._stop.set()
+        with self._cond:
+            self._cond.notify_all()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join(timeout=2.0)
+        for thread in self._threads:
+            thread.join(timeout=2.0)
+
+    def notify(self, paths: Iterable[str]) -> None:
+        """Queue changed paths; they're applied once no event has arrived for debounce_seconds."""
+        with self._cond:
+            self._pending.update(paths)
+            self._last_event = time.monotonic()
+            self._cond.notify_all()
+
+    def flush(self) -> Optional[Dict]:
+        """Apply queued changes now. Returns apply_changes counts, or None if nothing was queued."""
+        with self._cond:
+            paths, self._pending = self._pending, set()
+        if not paths:
+            return None
+        try:
+            return self.index.apply_changes(paths)
+        except Exception as e:
+            logger.error(f"[ARGO] Music watcher failed to apply {len(paths)} changes: {e}")
+            return None
+
+    def _spawn(self, target, name: str) -> None:
+        thread = threading.Thread(target=target, daemon=True, name=name)
+        thread.start()
+        self._threads.append(thread)
+
+    def _debounce_loop(self) -> None:
+        while not self._stop.is_set():
+            with self._cond:
+                if not self._pending:
+                    self._cond.wait()
+                    continue
+                remaining = self._last_event + self.debounce_seconds - time.monotonic()
+                if remaining > 0:
+                    self._cond.wait(remaining)
+                    continue
+            self.flush()
+
+    def _snapshot(self) -> Dict[str, Tuple[int, int]]:
+        return {path: (size, mtime_ns) for path, size, mtime_ns in self.index._walk_library()}
+
+    def _poll_loop(self, previous: Dict[str, Tuple[int, int]]) -> None:
+        while not self._stop.wait(self.poll_seconds):
+            current = self._snapshot()
+            changed = [path for path, stat in current.items() if previous.get(path) != stat]
+            changed.extend(previous.keys() - current.keys())
+            previous = current
+            if changed:
+                self.notify(changed)
+
+
+# ============================================================================
+# SINGLETON INSTANCE
+# ============================================================================
+
+_watcher: Optional[MusicLibraryWatcher] = None
+
+
+def start_music_watcher(index) -> Optional[MusicLibraryWatcher]:
+    """
+    Start the library watcher for a loaded local index (once per process).
+
+    Returns:
+        The watcher, or None if disabled or music_dir doesn't exist
+    """
+    global _watcher
+    config = get_config()
+    if not bool(config.get("music.watch_enabled", True)):
+        return None
+    if not index or not index.music_dir or not os.path.isdir(index.music_dir):
+        return None
+    if _watcher is None:
+        _watcher = MusicLibraryWatcher(
+            index,
+            debounce_seconds=float(config.get("music.watch_debounce_seconds", 2.0)),
+            poll_seconds=float(config.get("music.watch_poll_seconds", 30.0)),
+            backend=str(config.get("music.watch_backend", "auto")),
+        )
+        _watcher.start()
+    return _watcher
+
+
+def stop_music_watcher() -> None:
+    global _watcher
+    if _watcher is not None:
+        _watcher.stop()
+        _watcher = None
@@ -36,6 +36,7 @@ Hard stops:
 # 1) IMPORTS
 # ============================================================================
 import os
+import io
 import asyncio
 import subprocess
 import sys
@@ -45,11 +46,14 @@ from typing import Optional, Callable
 import queue
 import threading
 import re
+from collections import deque
 from datetime import datetime
 
 from core.policy import TTS_TIMEOUT_SECONDS, TTS_WATCHDOG_SECONDS
 from core.audio_owner import get_audio_owner
 from core.watchdog import Watchdog
+from core.piper_server import PiperSynthesisServer, PiperPCMStream, DEFAULT_LENGTH_SCALE
+from core.tts_cache import CacheablePhrase, CachedAudio, WARMUP_PHRASES, get_tts_cache
 
 
 # ============================================================================
@@ -81,6 +85,21 @@ PIPER_PROFILING = os.getenv("PIPER_PROFILING", "false").lower() == "true"
 FORCE_BLOCKING_TTS = os.getenv("FORCE_BLOCKING_TTS", "false").lower() == "true"
 """Force blocking TTS (wait for all audio to play before returning). For testing only."""
 
+PIPER_PERSISTENT = os.getenv("PIPER_PERSISTENT", "true").lower() == "true"
+"""Keep one warm Piper voice (PiperSynthesisServer) instead of one subprocess per sentence."""
+
+PIPER_PREFETCH_SENTENCES = max(0, int(os.getenv("PIPER_PREFETCH_SENTENCES", "2")))
+"""Sentences to pre-synthesize while the current one plays (persistent server only; 0 = off)."""
+
+PIPER_PREFETCH_MAX_BYTES = max(0, int(os.getenv("PIPER_PREFETCH_MAX_BYTES", str(2 * 1024 * 1024))))
+"""Memory cap for synthesized-but-unplayed PCM across the current and prefetched sentences."""
+
+EDGE_TTS_STREAMING = os.getenv("EDGE_TTS_STREAMING", "true").lower() == "true"
+"""Decode Edge-TTS MP3 chunks in memory as they arrive and start playback on the first frames."""
+
+EDGE_TTS_OUTPUT_GAIN = float(os.getenv("EDGE_TTS_OUTPUT_GAIN", "1.0"))
+"""Fixed gain on every decoded Edge-TTS frame (streamed, downloaded, warm-up); 1.0 = source level."""
+
 
 # ============================================================================
 # 4) OUTPUT SINK INTERFACE (PART 1)
@@ -209,11 +228,15 @@ _output_sink: Optional[OutputSink] = None
 _audio_disabled_warning_issued = False
 """Global output sink instance (lazy initialization)."""
 
+def piper_sink_selected() -> bool:
+    """True when the environment selects Piper as the global output sink."""
+    explicit_sink = os.getenv("OUTPUT_SINK", "").strip().lower()
+    return VOICE_ENABLED and PIPER_ENABLED and explicit_sink == "piper"
+
 def get_output_sink() -> OutputSink:
     global _output_sink, _audio_disabled_warning_issued
     if _output_sink is None:
-        explicit_sink = os.getenv("OUTPUT_SINK", "").strip().lower()
-        if not VOICE_ENABLED or not PIPER_ENABLED or explicit_sink != "piper":
+        if not piper_sink_selected():
             if not _audio_disabled_warning_issued:
                 print("\n[WARNING] Audio output is disabled by environment flags. ARGO will respond silently.\nTo enable voice output, set VOICE_ENABLED=true and PIPER_ENABLED=true\n", file=sys.stderr)
                 _audio_disabled_warning_issued = True
@@ -225,6 +248,9 @@ def get_output_sink() -> OutputSink:
             except Exception as e:
                 print(f"⚠ Failed to initialize PiperOutputSink: {e}", file=sys.stderr)
                 _output_sink = SilentOutputSink()
+            else:
+                # Fixed phrases render in the background so the first "Done." replays from cache
+                threading.Thread(target=_output_sink.warm_cache, daemon=True, name="ARGO.TTSCacheWarmup").start()
     return _output_sink
 
 def set_output_sink(sink: OutputSink) -> None:
@@ -242,6 +268,24 @@ def set_output_sink(sink: OutputSink) -> None:
 # PIPER IMPLEMENTATION (PART 2: INTEGRATED)
 # ============================================================================
 
+class _PCMCapture:
+    """Read-through wrapper that keeps a copy of the PCM played (for the TTS cache)."""
+
+    def __init__(self, source):
+        self._source = source
+        self._chunks: list = []
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._source.read(size)
+        if data:
+            self._chunks.append(data)
+        return data
+
+    @property
+    def data(self) -> bytes:
+        return b"".join(self._chunks)
+
+
 class PiperOutputSink(OutputSink):
     """
     Piper TTS integration using producer-consumer queue pattern.
@@ -308,6 +352,18 @@ class PiperOutputSink(OutputSink):
         self.text_queue: queue.Queue = queue.Queue()
         self._stop_event = threading.Event()
         self._piper_process: Optional[subprocess.Popen] = None
+        # Persistent synthesis server (started lazily on first sentence)
+        self._persistent = PIPER_PERSISTENT and self.piper_path != "echo"
+        self._piper_server: Optional[PiperSynthesisServer] = None
+        self._pcm_stream: Optional[PiperPCMStream] = None
+        # Look-ahead: (sentence, stream) pairs already handed to the server, in queue order
+        self._prefetch_depth = PIPER_PREFETCH_SENTENCES
+        self._prefetched: deque = deque()
+        self._prefetch_lock = threading.Lock()
+        # Synthesized-audio cache (fixed phrases replay without touching Piper)
+        self._length_scale = DEFAULT_LENGTH_SCALE
+        self._tts_cache = get_tts_cache()
+        self._warm_lock = threading.Lock()  # one warm-up at a time (factory + pipeline)
         self._playback_lock = threading.Lock()
         self._is_playing = False
         self._sd_stream = None
@@ -407,6 +463,10 @@ class PiperOutputSink(OutputSink):
                 if self._interaction_id is None:
                     continue
 
+                # Look-ahead: claim this sentence's prefetched audio, queue synthesis of the next ones
+                prefetched = self._take_prefetched(item)
+                self._prefetch_ahead()
+
                 # Process sentence
                 self._set_playing(True)
                 try:
@@ -418,8 +478,10 @@ class PiperOutputSink(OutputSink):
                     except Exception:
                         log_event(f"AUDIO_CONTESTED owner={audio_owner.get_owner()} requested=TTS")
                         self._set_playing(False)
+                        if prefetched is not None:
+                            prefetched.cancel()
                         continue
-                    self._play_sentence(item)
+                    self._play_sentence(item, prefetched)
                 finally:
                     try:
                         audio_owner.release("TTS")
@@ -452,16 +514,99 @@ class PiperOutputSink(OutputSink):
                     import traceback
                     traceback.print_exc()
     
-    def _play_sentence(self, sentence: str) -> None:
-        """Play a sentence via Piper subprocess with adaptive pacing."""
+    def _take_prefetched(self, sentence: str) -> Optional[PiperPCMStream]:
+        """Pop the prefetched stream for the sentence just dequeued (drops stale entries)."""
+        with self._prefetch_lock:
+            while self._prefetched:
+                text, stream = self._prefetched.popleft()
+                if stream is None:
+                    # Placeholder for a cached sentence (nothing was synthesized)
+                    if text == sentence:
+                        return None
+                    continue
+                if text == sentence and not stream.cancelled:
+                    return stream
+                stream.cancel()
+        return None
+
+    def _prefetch_ahead(self) -> None:
+        """
+        Hand the next queued sentences to the warm server so they synthesize while
+        the current one plays. Sentences stay in text_queue; only their audio is early.
+        """
+        if not self._prefetch_depth or self._interaction_id is None:
+            return
+        server = self._get_piper_server()
+        if server is None:
+            return
+        with self._prefetch_lock:
+            with self.text_queue.mutex:
+                upcoming = [s for s in list(self.text_queue.queue)[: self._prefetch_depth] if s is not None]
+            for sentence in upcoming[len(self._prefetched):]:
+                if self._is_cached(sentence):
+                    self._prefetched.append((sentence, None))
+                    continue
+                self._prefetched.append((sentence, server.synthesize(sentence)))
+                if self._profiling_enabled:
+                    print(f"[PIPER_PROFILING] prefetch: {sentence[:50]}...", file=sys.stderr)
+
+    def _discard_prefetched(self) -> None:
+        with self._prefetch_lock:
+            while self._prefetched:
+                _text, stream = self._prefetched.popleft()
+                if stream is not None:
+                    stream.cancel()
+
+    def _get_piper_server(self) -> Optional[PiperSynthesisServer]:
+        """Return the warm Piper server, (re)starting it if needed. None = use per-sentence subprocess."""
+        if not self._persistent:
+            return None
+        if self._piper_server is not None and self._piper_server.is_alive():
+            return self._piper_server
+        if self._piper_server is not None:
+            self._piper_server.close()
+            self._piper_server = None
+        try:
+            self._piper_server = PiperSynthesisServer(
+                self.piper_path,
+                self.voice_path,
+                max_buffered_bytes=PIPER_PREFETCH_MAX_BYTES or None,
+            ).start()
+        except Exception as e:
+            print(f"[AUDIO_ERROR] Piper server unavailable, using per-sentence subprocess: {type(e).__name__}: {e}", file=sys.stderr)
+            self._persistent = False
+            self._piper_server = None
+        return self._piper_server
+
+    def _play_sentence(self, sentence: str, prefetched: Optional[PiperPCMStream] = None) -> None:
+        """Play a sentence via Piper (warm server when available) with adaptive pacing."""
         import time
         
         if not sentence or not sentence.strip():
+            if prefetched is not None:
+                prefetched.cancel()
+            return
+
+        cache_key = self._cache_key(sentence)
+        cached = self._tts_cache.get(cache_key) if cache_key else None
+        if cached is not None:
+            if prefetched is not None:
+                prefetched.cancel()
+            self._play_cached(sentence, cached)
+            return
+
+        server = self._get_piper_server()
+        if server is not None:
+            self._play_sentence_persistent(server, sentence, prefetched, cache_key)
             return
+        if prefetched is not None:
+            prefetched.cancel()
         
         time_start = time.time()
         piper_process = None
         audio_duration = 0
+        interaction_id = self._interaction_id
+        capture = None
         
         try:
             if self._profiling_enabled:
@@ -476,7 +621,7 @@ class PiperOutputSink(OutputSink):
                         self.voice_path,
                         "--output-raw",
                         "--length_scale",
-                        "0.85",
+                        str(self._length_scale),
                     ],
                     stdin=subprocess.PIPE,
                     stdout=subprocess.PIPE,
@@ -500,10 +645,17 @@ class PiperOutputSink(OutputSink):
                     print(f"[PIPER_PROFILING] piper process started, text sent")
                 
                 # Read audio and play (BLOCKING)
-                audio_duration = self._stream_and_play(piper_process)
+                if cache_key:
+                    capture = _PCMCapture(piper_process.stdout)
+                    audio_duration = self._stream_and_play(capture)
+                else:
+                    audio_duration = self._stream_and_play(piper_process)
                 
                 # Wait for process to finish
                 piper_process.wait(timeout=TTS_TIMEOUT_SECONDS)
+
+                if capture is not None and piper_process.returncode == 0 and self._interaction_id == interaction_id:
+                    self._tts_cache.put(cache_key, capture.data, 22050)
                 
                 if wd.triggered:
                     print(f"[WATCHDOG] TTS exceeded watchdog threshold", file=sys.stderr)
@@ -532,16 +684,127 @@ class PiperOutputSink(OutputSink):
                 delay = min(audio_duration * 0.005, 0.02)
                 time.sleep(delay)
     
-    def _stream_and_play(self, process: subprocess.Popen):
+    def _play_sentence_persistent(
+        self,
+        server: PiperSynthesisServer,
+        sentence: str,
+        prefetched: Optional[PiperPCMStream] = None,
+        cache_key: Optional[str] = None,
+    ) -> None:
+        """Play a sentence synthesized by the warm Piper server (no model reload, possibly prefetched)."""
+        import time
+
+        time_start = time.time()
+        audio_duration = 0
+        stream = None
+        try:
+            if self._profiling_enabled:
+                print(f"[PIPER_PROFILING] play_sentence_start (server={server.backend_name}): {sentence[:50]}...")
+
+            with Watchdog("TTS", TTS_WATCHDOG_SECONDS) as wd:
+                stream = prefetched if prefetched is not None else server.synthesize(sentence)
+                self._pcm_stream = stream
+                if cache_key:
+                    capture = _PCMCapture(stream)
+                    audio_duration = self._stream_and_play(capture)
+                    # Only complete renders are cached (not barge-in truncated audio)
+                    if stream.done and not stream.cancelled:
+                        self._tts_cache.put(cache_key, capture.data, server.sample_rate)
+                else:
+                    audio_duration = self._stream_and_play(stream)
+
+            if wd.triggered:
+                print(f"[WATCHDOG] TTS exceeded watchdog threshold", file=sys.stderr)
+        except Exception as e:
+            print(f"[AUDIO_ERROR] Play sentence error: {type(e).__name__}: {e}", file=sys.stderr)
+        finally:
+            if stream is not None and not stream.done:
+                stream.cancel()
+            self._pcm_stream = None
+
+            if self._profiling_enabled:
+                duration_ms = (time.time() - time_start) * 1000
+                print(f"[PIPER_PROFILING] play_sentence_complete: {duration_ms:.1f}ms")
+
+            # Adaptive pacing: minimal gap between sentences (max 20ms)
+            if audio_duration:
+                delay = min(audio_duration * 0.005, 0.02)
+                time.sleep(delay)
+
+    def _cache_key(self, sentence: str) -> Optional[str]:
+        if self._tts_cache is None or not self._tts_cache.cacheable(sentence):
+            return None
+        return self._tts_cache.make_key(sentence, self.voice_path, self._length_scale)
+
+    def _is_cached(self, sentence: str) -> bool:
+        cache_key = self._cache_key(sentence)
+        return bool(cache_key) and cache_key in self._tts_cache
+
+    def _play_cached(self, sentence: str, cached: CachedAudio) -> None:
+        """Play a cache hit: PCM is already rendered, so playback starts immediately."""
+        import time
+
+        if self._profiling_enabled:
+            print(f"[PIPER_PROFILING] play_sentence_cached ({cached.duration_s:.2f}s): {sentence[:50]}...")
+        audio_duration = 0
+        try:
+            with Watchdog("TTS", TTS_WATCHDOG_SECONDS) as wd:
+                audio_duration = self._stream_and_play(io.BytesIO(cached.pcm))
+            if wd.triggered:
+                print(f"[WATCHDOG] TTS exceeded watchdog threshold", file=sys.stderr)
+        except Exception as e:
+            print(f"[AUDIO_ERROR] Play cached sentence error: {type(e).__name__}: {e}", file=sys.stderr)
+        finally:
+            # Adaptive pacing: minimal gap between sentences (max 20ms)
+            if audio_duration:
+                time.sleep(min(audio_duration * 0.005, 0.02))
+
+    def _render_sentence(self, sentence: str) -> Optional[CachedAudio]:
+        """Synthesize a sentence to PCM without playing it (cache warm-up)."""
+        server = self._get_piper_server()
+        if server is not None:
+            stream = server.synthesize(sentence)
+            chunks = []
+            while True:
+                data = stream.read(65536)
+                if not data:
+                    break
+                chunks.append(data)
+            if stream.cancelled:
+                return None
+            return CachedAudio(b"".join(chunks), server.sample_rate)
+        if self.piper_path == "echo":
+            return None
+        result = subprocess.run(
+            [self.piper_path, "--model", self.voice_path, "--output-raw", "--length_scale", str(self._length_scale)],
+            input=sentence.encode("utf-8"),
+            capture_output=True,
+            timeout=TTS_TIMEOUT_SECONDS,
+            creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0,
+        )
+        if result.returncode != 0:
+            return None
+        return CachedAudio(result.stdout, 22050)
+
+    def warm_cache(self, phrases=WARMUP_PHRASES) -> int:
+        """Pre-render fixed phrases into the TTS cache. Returns how many were rendered."""
+        if self._tts_cache is None:
+            return 0
+        with self._warm_lock:
+            return self._tts_cache.warm_up(phrases, self.voice_path, self._length_scale, self._render_sentence)
+
+    def _stream_and_play(self, process):
         """
-        Stream audio from Piper subprocess and play via sounddevice.
+        Stream audio from Piper and play via sounddevice.
         
-        Reads raw PCM (int16, 22050 Hz mono) from Piper stdout.
+        Reads raw PCM (int16, 22050 Hz mono) from Piper stdout, or from a
+        PiperPCMStream handed out by the persistent synthesis server.
         Plays audio in real-time as data arrives.
         
         Args:
-            process: Piper subprocess with stdout=PIPE
+            process: Piper subprocess with stdout=PIPE, or any PCM source with read()
         """
+        source = getattr(process, "stdout", process)
         try:
             import sounddevice
             import numpy as np
@@ -571,7 +834,7 @@ class PiperOutputSink(OutputSink):
                 nonlocal queued_frames, total_frames
                 while True:
                     try:
-                        data = process.stdout.read(CHUNK_BYTES)
+                        data = source.read(CHUNK_BYTES)
                     except (ValueError, OSError):
                         break
                     if not data:
@@ -683,6 +946,7 @@ class PiperOutputSink(OutputSink):
         """
         if not text or not text.strip():
             return
+        cacheable = isinstance(text, CacheablePhrase)
         
         # CRITICAL: Remove newlines before splitting
         text = text.replace('\n', ' ')
@@ -696,11 +960,15 @@ class PiperOutputSink(OutputSink):
         for sentence in sentences:
             sentence = sentence.strip()
             if sentence:
-                # Queue for worker thread (non-blocking)
-                self.text_queue.put(sentence)
+                # Queue for worker thread (non-blocking); the cache opt-in travels with each sentence
+                self.text_queue.put(CacheablePhrase(sentence) if cacheable else sentence)
                 if self._profiling_enabled:
                     print(f"[DEBUG] Queued sentence: {sentence[:50]}...", file=sys.stderr)
 
+        # Sentences arriving mid-playback start synthesizing now, not when dequeued
+        if not self.is_idle():
+            self._prefetch_ahead()
+
     async def send(self, text: str) -> bool:
         """
         Async send wrapper (non-blocking). Returns immediately.
@@ -757,7 +1025,8 @@ class PiperOutputSink(OutputSink):
         - Audio plays in background
         
         Args:
-            text: Text to synthesize and play
+            text: Text to synthesize and play (a CacheablePhrase or a warmed
+                phrase goes through the TTS cache; anything else does not)
             interaction_id: HARDENING STEP 2: Monotonic ID to prevent zombie callbacks
         """
         import time
@@ -830,6 +1099,9 @@ class PiperOutputSink(OutputSink):
             finally:
                 self._piper_process = None
 
+        # Drop in-flight synthesis on the warm server (voice stays loaded)
+        self._cancel_server_synthesis()
+
         # Abort audio output immediately (sounddevice)
         self._abort_audio_output()
         try:
@@ -841,6 +1113,16 @@ class PiperOutputSink(OutputSink):
         # Signal not playing
         self._is_playing = False
 
+    def _cancel_server_synthesis(self) -> None:
+        self._discard_prefetched()
+        try:
+            if self._pcm_stream is not None:
+                self._pcm_stream.cancel()
+            if self._piper_server is not None:
+                self._piper_server.cancel()
+        except Exception:
+            pass
+
     def suppress_interrupt(self, duration_s: float) -> None:
         import time
 
@@ -884,6 +1166,7 @@ class PiperOutputSink(OutputSink):
                 pass
             finally:
                 self._piper_process = None
+        self._cancel_server_synthesis()
 
         # Abort audio output immediately (sounddevice)
         self._abort_audio_output()
@@ -913,13 +1196,124 @@ class EdgeTTSLiveKitOutputSink(SilentOutputSink):
     """Lightweight stub for LiveKit output (tests only)."""
     pass
 
+class _EdgeTTSLoop:
+    """One asyncio event loop on a daemon thread, shared by every Edge-TTS request."""
+
+    def __init__(self):
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, daemon=True, name="ARGO.EdgeTTSLoop")
+        self._thread.start()
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    def submit(self, coro):
+        """Schedule a coroutine; returns a concurrent.futures.Future."""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+
+_edge_tts_loop: Optional[_EdgeTTSLoop] = None
+_edge_tts_loop_lock = threading.Lock()
+
+
+def _get_edge_tts_loop() -> _EdgeTTSLoop:
+    global _edge_tts_loop
+    with _edge_tts_loop_lock:
+        if _edge_tts_loop is None:
+            _edge_tts_loop = _EdgeTTSLoop()
+        return _edge_tts_loop
+
+
+class _MP3StreamDecoder:
+    """
+    Incremental in-memory MP3 decoder (PyAV, installed with faster-whisper).
+
+    decode(chunk) accepts arbitrary byte slices of the MP3 stream and returns
+    the int16 frames completed so far as an (n, channels) array.
+    """
+
+    def __init__(self):
+        import av  # optional dependency (ImportError -> caller falls back)
+
+        self._av = av
+        self._codec = av.CodecContext.create("mp3", "r")
+        self.sample_rate: Optional[int] = None
+        self.channels = 1
+
+    @staticmethod
+    def available() -> bool:
+        try:
+            import av  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    def decode(self, data: bytes):
+        import numpy as np
+
+        out = []
+        for packet in self._codec.parse(data):
+            out.extend(self._decode_packet(packet))
+        return np.concatenate(out) if out else np.zeros((0, self.channels), dtype=np.int16)
+
+    def flush(self):
+        import numpy as np
+
+        out = []
+        for packet in self._codec.parse(b""):
+            out.extend(self._decode_packet(packet))
+        out.extend(self._decode_packet(None))
+        return np.concatenate(out) if out else np.zeros((0, self.channels), dtype=np.int16)
+
+    def _decode_packet(self, packet) -> list:
+        import numpy as np
+
+        try:
+            frames = self._codec.decode(packet)
+        except self._av.error.InvalidDataError:
+            return []  # ID3/Xing header or a torn frame; the next sync word recovers
+        decoded = []
+        for frame in frames:
+            samples = frame.to_ndarray()
+            channels = len(frame.layout.channels)
+            if frame.format.is_planar:
+                samples = samples.T
+            else:
+                samples = samples.reshape(-1, channels)
+            if samples.dtype.kind == "f":
+                samples = np.clip(samples, -1.0, 1.0) * 32767.0
+            decoded.append(samples.astype(np.int16))
+            self.sample_rate = frame.sample_rate
+            self.channels = channels
+        return decoded
+
+
+def _apply_output_gain(samples, gain: Optional[float] = None):
+    """
+    The one place Edge-TTS output level is set: every path (streamed frames,
+    whole downloads, warm-up renders) goes through it before playback or the
+    cache, so a phrase sounds the same whichever path produced it. A fixed gain,
+    not peak normalization, because a stream plays before its peak is known.
+    """
+    import numpy as np
+
+    gain = EDGE_TTS_OUTPUT_GAIN if gain is None else gain
+    if gain == 1.0 or not samples.size:
+        return samples.astype(np.int16)
+    return np.clip(samples.astype(np.float32) * gain, -32768, 32767).astype(np.int16)
+
+
 class EdgeTTSOutputSink(OutputSink):
     """
     Edge-TTS output sink: cloud text-to-speech with blocking playback.
     
     Uses Microsoft Edge-TTS API (via edge-tts package).
     Synthesizes speech and plays to default speaker.
-    All operations block until complete (no async, no background threads).
+    speak() blocks until playback completes. Network I/O runs on one shared
+    event-loop thread; with EDGE_TTS_STREAMING the MP3 chunks are decoded in
+    memory as they arrive and playback starts on the first decoded frames, so
+    time-to-first-audio does not grow with utterance length.
     
     Suitable for half-duplex operation (blocks until audio playback finishes).
     
@@ -974,6 +1368,9 @@ class EdgeTTSOutputSink(OutputSink):
         self._interrupt_suppress_until = 0.0
         self._audio_device = None
         self._device_sample_rate = 48000  # Will be detected at init
+        self._tts_cache = get_tts_cache()
+        self._streaming = EDGE_TTS_STREAMING and _MP3StreamDecoder.available()
+        self.last_time_to_first_audio_ms: Optional[float] = None
         
         # Initialize WASAPI backend
         self._init_wasapi()
@@ -1019,13 +1416,14 @@ class EdgeTTSOutputSink(OutputSink):
         """
         Speak text synchronously (blocking until playback complete).
         
-        1. Synthesize audio using Edge-TTS (cloud API)
+        1. Replay from the TTS cache, or synthesize using Edge-TTS (cloud API)
         2. Save WAV file to audio/debug/ for verification
         3. Play to locked output device at 48kHz
         4. Block until playback finishes
         
         Args:
-            text: Text to synthesize and play
+            text: Text to synthesize and play (a CacheablePhrase or a warmed
+                phrase goes through the TTS cache; anything else does not)
         """
         if not text or not text.strip():
             return
@@ -1033,67 +1431,48 @@ class EdgeTTSOutputSink(OutputSink):
         self._stop_requested = False
 
         try:
-            import edge_tts
             import numpy as np
             import sounddevice as sd
-            import tempfile
-            from pydub import AudioSegment
-
-            # Synthesize to temp file
-            with tempfile.TemporaryDirectory() as tmpdir:
-                out_path = os.path.join(tmpdir, "edge_tts_output.mp3")
-                communicate = edge_tts.Communicate(
-                    text=text,
-                    voice=self.voice,
-                    rate="+0%",
-                    pitch="+0Hz",
-                    volume="+0%",
-                )
-
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    loop.run_until_complete(communicate.save(out_path))
-                finally:
-                    loop.close()
 
-                if self._stop_requested:
+            cache_key = self._cache_key(text)
+            audio = self._tts_cache.get(cache_key) if cache_key else None
+            if audio is None and self._streaming:
+                self._speak_streaming(text, cache_key)
+                return
+            if audio is None:
+                audio = self._synthesize(text)
+                if audio is None or self._stop_requested:
                     return
+                if cache_key:
+                    self._tts_cache.put(cache_key, audio.pcm, audio.sample_rate, audio.channels)
 
-                # Decode via pydub (ffmpeg) to get correct sample rate
-                audio = AudioSegment.from_file(out_path)
-                sample_rate = audio.frame_rate
-                channels = audio.channels
-                samples = np.array(audio.get_array_of_samples())
-                if channels > 1:
-                    samples = samples.reshape((-1, channels))
-                samples = samples.astype(np.float32) / (1 << (8 * audio.sample_width - 1))
-
-                # Normalize to prevent clipping
-                peak = float(np.max(np.abs(samples))) if samples.size else 0.0
-                if peak > 0:
-                    samples = samples * (0.8 / peak)
-
-                sd.play(samples, samplerate=sample_rate, blocking=False)
-                import time
-                while True:
-                    if self._stop_requested:
-                        try:
-                            sd.stop()
-                        except Exception:
-                            pass
-                        break
+            # Cached/synthesized PCM is already at its playback level
+            # (_apply_output_gain), so first use and replay sound the same
+            samples = np.frombuffer(audio.pcm, dtype=np.int16)
+            if audio.channels > 1:
+                samples = samples.reshape((-1, audio.channels))
+            samples = samples.astype(np.float32) / 32768.0
+
+            sd.play(samples, samplerate=audio.sample_rate, blocking=False)
+            import time
+            while True:
+                if self._stop_requested:
                     try:
-                        stream = sd.get_stream()
-                        if not stream or not stream.active:
-                            break
+                        sd.stop()
                     except Exception:
-                        break
-                    time.sleep(0.01)
+                        pass
+                    break
                 try:
-                    sd.wait()
+                    stream = sd.get_stream()
+                    if not stream or not stream.active:
+                        break
                 except Exception:
-                    pass
+                    break
+                time.sleep(0.01)
+            try:
+                sd.wait()
+            except Exception:
+                pass
         except ImportError as e:
             print(f"[EdgeTTS_ERROR] Missing dependency: {e}", file=sys.stderr)
             print(f"[EdgeTTS_ERROR] Install with: pip install edge-tts pydub sounddevice numpy", file=sys.stderr)
@@ -1101,6 +1480,163 @@ class EdgeTTSOutputSink(OutputSink):
             print(f"[EdgeTTS_ERROR] speak() failed: {type(e).__name__}: {e}", file=sys.stderr)
             import traceback
             traceback.print_exc()
+
+    def _communicate(self, text: str):
+        import edge_tts
+
+        return edge_tts.Communicate(
+            text=text,
+            voice=self.voice,
+            rate=self.rate,
+            pitch=self.pitch,
+            volume=self.volume,
+        )
+
+    def _speak_streaming(self, text: str, cache_key: Optional[str] = None) -> None:
+        """
+        Stream Edge-TTS MP3 chunks, decode them in memory and play as frames arrive.
+
+        The network/decode side runs on the shared Edge-TTS loop thread and hands
+        int16 frames over a queue; this thread writes them to a sounddevice
+        OutputStream in small blocks so stop_sync() takes effect within ~85ms.
+        Frames get the same fixed gain as every other path (_apply_output_gain;
+        whole-utterance peak normalization would need the full clip before the
+        first sample). The cache stores exactly the frames that were played,
+        so a replay matches the first use.
+        """
+        import time
+        import numpy as np
+        import sounddevice as sd
+
+        start = time.perf_counter()
+        self.last_time_to_first_audio_ms = None
+        communicate = self._communicate(text)
+        decoder = _MP3StreamDecoder()
+        frames: queue.Queue = queue.Queue()
+
+        async def _pump():
+            async for chunk in communicate.stream():
+                if self._stop_requested:
+                    return
+                if chunk.get("type") == "audio" and chunk.get("data"):
+                    samples = decoder.decode(chunk["data"])
+                    if len(samples):
+                        frames.put(_apply_output_gain(samples))
+            samples = decoder.flush()
+            if len(samples):
+                frames.put(_apply_output_gain(samples))
+
+        future = _get_edge_tts_loop().submit(_pump())
+        future.add_done_callback(lambda _f: frames.put(None))
+
+        block_frames = 2048
+        collected = []
+        completed = False
+        stream = None
+        try:
+            while not self._stop_requested:
+                try:
+                    samples = frames.get(timeout=0.05)
+                except queue.Empty:
+                    continue
+                if samples is None:
+                    completed = True
+                    break
+                if stream is None:
+                    self.last_time_to_first_audio_ms = (time.perf_counter() - start) * 1000
+                    stream = sd.OutputStream(
+                        samplerate=decoder.sample_rate,
+                        channels=decoder.channels,
+                        dtype="int16",
+                        device=self._audio_device,
+                    )
+                    stream.start()
+                collected.append(samples)
+                for offset in range(0, len(samples), block_frames):
+                    if self._stop_requested:
+                        break
+                    stream.write(samples[offset:offset + block_frames])
+        finally:
+            if not future.done():
+                future.cancel()
+            if stream is not None:
+                try:
+                    if self._stop_requested:
+                        stream.abort()
+                    else:
+                        stream.stop()  # drains buffered audio
+                    stream.close()
+                except Exception:
+                    pass
+
+        if future.done() and not future.cancelled() and future.exception() is not None:
+            raise future.exception()
+        if completed and cache_key and collected and not self._stop_requested:
+            pcm = np.concatenate(collected)
+            self._tts_cache.put(cache_key, pcm.tobytes(), decoder.sample_rate, decoder.channels)
+
+    def _fetch_mp3(self, text: str) -> Optional[bytes]:
+        """Download the whole utterance as MP3 bytes on the shared loop (None if stopped)."""
+        communicate = self._communicate(text)
+
+        async def _collect():
+            parts = []
+            async for chunk in communicate.stream():
+                if self._stop_requested:
+                    return None
+                if chunk.get("type") == "audio" and chunk.get("data"):
+                    parts.append(chunk["data"])
+            return b"".join(parts)
+
+        return _get_edge_tts_loop().submit(_collect()).result(timeout=TTS_TIMEOUT_SECONDS)
+
+    def _synthesize(self, text: str) -> Optional[CachedAudio]:
+        """
+        Synthesize text via Edge-TTS and decode it to int16 PCM in memory.
+
+        The PCM gets the same fixed gain as streamed audio, so the same buffer
+        is played and cached at the level streaming would have played it. Returns None if stop was requested while the request was
+        in flight. Raises ImportError if edge-tts (or both PyAV and pydub) are
+        missing.
+        """
+        mp3 = self._fetch_mp3(text)
+        if mp3 is None or self._stop_requested:
+            return None
+
+        if _MP3StreamDecoder.available():
+            import numpy as np
+
+            decoder = _MP3StreamDecoder()
+            samples = np.concatenate([decoder.decode(mp3), decoder.flush()])
+            if not len(samples):
+                return None
+            return CachedAudio(_apply_output_gain(samples).tobytes(), decoder.sample_rate, decoder.channels)
+
+        # Fallback: pydub (ffmpeg) when PyAV is unavailable
+        import numpy as np
+        from pydub import AudioSegment
+
+        segment = AudioSegment.from_file(io.BytesIO(mp3), format="mp3")
+        samples = np.array(segment.get_array_of_samples())
+        if segment.sample_width != 2:
+            scale = float(1 << (8 * segment.sample_width - 1))
+            samples = np.clip(samples.astype(np.float32) / scale * 32767.0, -32768, 32767)
+        return CachedAudio(_apply_output_gain(samples.astype(np.int16)).tobytes(), segment.frame_rate, segment.channels)
+
+    def _cache_key(self, text: str) -> Optional[str]:
+        if self._tts_cache is None or not self._tts_cache.cacheable(text):
+            return None
+        return self._tts_cache.make_key(text, *self._cache_voice())
+
+    def _cache_voice(self) -> tuple:
+        # rate/pitch/volume shape the audio the way Piper's length_scale does
+        return f"edge:{self.voice}", f"{self.rate}|{self.pitch}|{self.volume}"
+
+    def warm_cache(self, phrases=WARMUP_PHRASES) -> int:
+        """Pre-render fixed phrases into the TTS cache (network). Returns how many were rendered."""
+        if self._tts_cache is None:
+            return 0
+        return self._tts_cache.warm_up(phrases, *self._cache_voice(), self._synthesize)
     
     async def send(self, text: str) -> None:
         """
@@ -0,0 +1,472 @@
+"""
+Phonetic Matching (Double Metaphone)
+
+Sound-alike keys for artist/album/song names, so names Whisper spells wrong
+("Fleetwood Mack", "Deaf Leopard", "Meta Lica") still resolve locally instead
+of going to the LLM.
+
+- double_metaphone(): Lawrence Philips' Double Metaphone (primary + alternate code)
+- phonetic_keys(): keys for a whole name; per-word codes joined with spaces
+  (primary and alternate) plus a squashed code with word breaks removed, so
+  "metal ica" and "metallica" meet
+- PhoneticIndex: key -> [(label, value)], serializable to the JSON index and
+  mirrored in the SQLite phonetic_keys table
+
+Phonetic codes are lossy; callers rank hits by spelling similarity and ask
+when the top two are too close to call.
+"""
+
+from __future__ import annotations
+
+import functools
+import re
+import unicodedata
+from difflib import SequenceMatcher
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+PHONETIC_VERSION = 1
+CODE_LENGTH = 6          # per-word code length (reference algorithm uses 4)
+MIN_QUERY_CHARS = 4      # shorter queries collide with too many names
+MIN_SPELLING_RATIO = 0.5  # a sound-alike must still look somewhat like the query
+
+_VOWELS = frozenset("AEIOUY")
+_STOP_WORDS = {"the", "a", "an", "and", "of"}
+
+
+# ============================================================================
+# DOUBLE METAPHONE
+# ============================================================================
+
+def double_metaphone(text: str, max_length: int = 4) -> Tuple[str, str]:
+    """Return (primary, alternate) Double Metaphone codes for one word."""
+    word = "".join(
+        ch for ch in unicodedata.normalize("NFKD", text or "").upper() if "A" <= ch <= "Z"
+    )
+    length = len(word)
+    if not length:
+        return "", ""
+    last = length - 1
+    w = word + "     "
+    primary: List[str] = []
+    secondary: List[str] = []
+    slavo_germanic = "W" in word or "K" in word or "CZ" in word or "WITZ" in word
+
+    def add(main: str, alt: Optional[str] = None) -> None:
+        primary.append(main)
+        secondary.append(main if alt is None else alt)
+
+    def at(pos: int, *subs: str) -> bool:
+        return pos >= 0 and any(w.startswith(sub, pos) for sub in subs)
+
+    def vowel(pos: int) -> bool:
+        return 0 <= pos < length and w[pos] in _VOWELS
+
+    pos = 0
+    if at(0, "GN", "KN", "PN", "WR", "PS"):
+        pos = 1
+    if w[0] == "X":
+        add("S")
+        pos = 1
+
+    while pos < length and (len("".join(primary)) < max_length or len("".join(secondary)) < max_length):
+        ch = w[pos]
+        nxt = w[pos + 1]
+
+        if ch in _VOWELS:
+            if pos == 0:
+                add("A")
+            pos += 1
+
+        elif ch == "B":
+            add("P")
+            pos += 2 if nxt == "B" else 1
+
+        elif ch == "C":
+            if (pos > 1 and not vowel(pos - 2) and at(pos - 1, "ACH") and w[pos + 2] != "I"
+                    and (w[pos + 2] != "E" or at(pos - 2, "BACHER", "MACHER"))):
+                add("K")
+                pos += 2
+            elif pos == 0 and at(pos, "CAESAR"):
+                add("S")
+                pos += 2
+            elif at(pos, "CHIA"):
+                add("K")
+                pos += 2
+            elif at(pos, "CH"):
+                if pos > 0 and at(pos, "CHAE"):
+                    add("K", "X")
+                elif (pos == 0 and (at(pos + 1, "HARAC", "HARIS") or at(pos + 1, "HOR", "HYM", "HIA", "HEM"))
+                        and not at(0, "CHORE")):
+                    add("K")
+                elif (at(0, "VAN ", "VON ", "SCH") or at(pos - 2, "ORCHES", "ARCHIT", "ORCHID")
+                        or at(pos + 2, "T", "S")
+                        or ((at(pos - 1, "A", "O", "U", "E") or pos == 0)
+                            and at(pos + 2, "L", "R", "N", "M", "B", "H", "F", "V", "W", " "))):
+                    add("K")
+                elif pos > 0:
+                    add("K") if at(0, "MC") else add("X", "K")
+                else:
+                    add("X")
+                pos += 2
+            elif at(pos, "CZ") and not at(pos - 2, "WICZ"):
+                add("S", "X")
+                pos += 2
+            elif at(pos + 1, "CIA"):
+                add("X")
+                pos += 3
+            elif at(pos, "CC") and not (pos == 1 and w[0] == "M"):
+                if at(pos + 2, "I", "E", "H") and not at(pos + 2, "HU"):
+                    if (pos == 1 and w[0] == "A") or at(pos - 1, "UCCEE", "UCCES"):
+                        add("KS")
+                    else:
+                        add("X")
+                    pos += 3
+                else:
+                    add("K")
+                    pos += 2
+            elif at(pos, "CK", "CG", "CQ"):
+                add("K")
+                pos += 2
+            elif at(pos, "CI", "CE", "CY"):
+                add("S", "X") if at(pos, "CIO", "CIE", "CIA") else add("S")
+                pos += 2
+            else:
+                add("K")
+                if at(pos + 1, " C", " Q", " G"):
+                    pos += 3
+                elif at(pos + 1, "C", "K", "Q") and not at(pos + 1, "CE", "CI"):
+                    pos += 2
+                else:
+                    pos += 1
+
+        elif ch == "D":
+            if at(pos, "DG"):
+                if at(pos + 2, "I", "E", "Y"):
+                    add("J")
+                    pos += 3
+                else:
+                    add("TK")
+                    pos += 2
+            else:
+                add("T")
+                pos += 2 if at(pos, "DT", "DD") else 1
+
+        elif ch == "F":
+            add("F")
+            pos += 2 if nxt == "F" else 1
+
+        elif ch == "G":
+            if nxt == "H":
+                if pos > 0 and not vowel(pos - 1):
+                    add("K")
+                elif pos == 0:
+                    add("J") if w[pos + 2] == "I" else add("K")
+                elif ((pos > 1 and at(pos - 2, "B", "H", "D")) or (pos > 2 and at(pos - 3, "B", "H", "D"))
+                        or (pos > 3 and at(pos - 4, "B", "H"))):
+                    pass
+                elif pos > 2 and w[pos - 1] == "U" and at(pos - 3, "C", "G", "L", "R", "T"):
+                    add("F")
+                elif pos > 0 and w[pos - 1] != "I":
+                    add("K")
+                pos += 2
+            elif nxt == "N":
+                if pos == 1 and vowel(0) and not slavo_germanic:
+                    add("KN", "N")
+                elif not at(pos + 2, "EY") and not slavo_germanic:
+                    add("N", "KN")
+                else:
+                    add("KN")
+                pos += 2
+            elif at(pos + 1, "LI") and not slavo_germanic:
+                add("KL", "L")
+                pos += 2
+            elif pos == 0 and (nxt == "Y" or at(pos + 1, "ES", "EP", "EB", "EL", "EY", "IB", "IL", "IN", "IE", "EI", "ER")):
+                add("K", "J")
+                pos += 2
+            elif ((at(pos + 1, "ER") or nxt == "Y") and not at(0, "DANGER", "RANGER", "MANGER")
+                    and not at(pos - 1, "E", "I") and not at(pos - 1, "RGY", "OGY")):
+                add("K", "J")
+                pos += 2
+            elif at(pos + 1, "E", "I", "Y") or at(pos - 1, "AGGI", "OGGI"):
+                if at(0, "VAN ", "VON ", "SCH") or at(pos + 1, "ET"):
+                    add("K")
+                elif at(pos + 1, "IER "):
+                    add("J")
+                else:
+                    add("J", "K")
+                pos += 2
+            else:
+                add("K")
+                pos += 2 if nxt == "G" else 1
+
+        elif ch == "H":
+            if (pos == 0 or vowel(pos - 1)) and vowel(pos + 1):
+                add("H")
+                pos += 2
+            else:
+                pos += 1
+
+        elif ch == "J":
+            if at(pos, "JOSE") or at(0, "SAN "):
+                if (pos == 0 and w[pos + 4] == " ") or at(0, "SAN "):
+                    add("H")
+                else:
+                    add("J", "H")
+                pos += 1
+            else:
+                if pos == 0:
+                    add("J", "A")
+                elif vowel(pos - 1) and not slavo_germanic and nxt in "AO":
+                    add("J", "H")
+                elif pos == last:
+                    add("J", "")
+                elif not at(pos + 1, "L", "T", "K", "S", "N", "M", "B", "Z") and not at(pos - 1, "S", "K", "L"):
+                    add("J")
+                pos += 2 if nxt == "J" else 1
+
+        elif ch == "K":
+            add("K")
+            pos += 2 if nxt == "K" else 1
+
+        elif ch == "L":
+            if nxt == "L":
+                if ((pos == length - 3 and at(pos - 1, "ILLO", "ILLA", "ALLE"))
+                        or ((at(last - 1, "AS", "OS") or at(last, "A", "O")) and at(pos - 1, "ALLE"))):
+                    add("L", "")
+                else:
+                    add("L")
+                pos += 2
+            else:
+                add("L")
+                pos += 1
+
+        elif ch == "M":
+            add("M")
+            if (at(pos - 1, "UMB") and (pos + 1 == last or at(pos + 2, "ER"))) or nxt == "M":
+                pos += 2
+            else:
+                pos += 1
+
+        elif ch == "N":
+            add("N")
+            pos += 2 if nxt == "N" else 1
+
+        elif ch == "P":
+            if nxt == "H":
+                add("F")
+                pos += 2
+            else:
+                add("P")
+                pos += 2 if nxt in "PB" else 1
+
+        elif ch == "Q":
+            add("K")
+            pos += 2 if nxt == "Q" else 1
+
+        elif ch == "R":
+            if pos == last and not slavo_germanic and at(pos - 2, "IE") and not at(pos - 4, "ME", "MA"):
+                add("", "R")
+            else:
+                add("R")
+            pos += 2 if nxt == "R" else 1
+
+        elif ch == "S":
+            if at(pos - 1, "ISL", "YSL"):
+                pos += 1
+            elif pos == 0 and at(pos, "SUGAR"):
+                add("X", "S")
+                pos += 1
+            elif at(pos, "SH"):
+                add("S") if at(pos + 1, "HEIM", "HOEK", "HOLM", "HOLZ") else add("X")
+                pos += 2
+            elif at(pos, "SIO", "SIA", "SIAN"):
+                add("S") if slavo_germanic else add("S", "X")
+                pos += 3
+            elif (pos == 0 and at(pos + 1, "M", "N", "L", "W")) or nxt == "Z":
+                add("S", "X")
+                pos += 2 if nxt == "Z" else 1
+            elif at(pos, "SC"):
+                if w[pos + 2] == "H":
+                    if at(pos + 3, "OO", "ER", "EN", "UY", "ED", "EM"):
+                        add("X", "SK") if at(pos + 3, "ER", "EN") else add("SK")
+                    elif pos == 0 and not vowel(3) and w[3] != "W":
+                        add("X", "S")
+                    else:
+                        add("X")
+                elif at(pos + 2, "I", "E", "Y"):
+                    add("S")
+                else:
+                    add("SK")
+                pos += 3
+            else:
+                if pos == last and at(pos - 2, "AI", "OI"):
+                    add("", "S")
+                else:
+                    add("S")
+                pos += 2 if nxt in "SZ" else 1
+
+        elif ch == "T":
+            if at(pos, "TION", "TIA", "TCH"):
+                add("X")
+                pos += 3
+            elif at(pos, "TH", "TTH"):
+                if at(pos + 2, "OM", "AM") or at(0, "VAN ", "VON ", "SCH"):
+                    add("T")
+                else:
+                    add("0", "T")
+                pos += 2
+            else:
+                add("T")
+                pos += 2 if nxt in "TD" else 1
+
+        elif ch == "V":
+            add("F")
+            pos += 2 if nxt == "V" else 1
+
+        elif ch == "W":
+            if at(pos, "WR"):
+                add("R")
+                pos += 2
+                continue
+            if pos == 0 and (vowel(pos + 1) or at(pos, "WH")):
+                add("A", "F") if vowel(pos + 1) else add("A")
+            if ((pos == last and vowel(pos - 1)) or at(pos - 1, "EWSKI", "EWSKY", "OWSKI", "OWSKY")
+                    or at(0, "SCH")):
+                add("", "F")
+                pos += 1
+            elif at(pos, "WICZ", "WITZ"):
+                add("TS", "FX")
+                pos += 4
+            else:
+                pos += 1
+
+        elif ch == "X":
+            if not (pos == last and (at(pos - 3, "IAU", "EAU") or at(pos - 2, "AU", "OU"))):
+                add("KS")
+            pos += 2 if nxt in "CX" else 1
+
+        elif ch == "Z":
+            if nxt == "H":
+                add("J")
+                pos += 2
+                continue
+            if at(pos + 1, "ZO", "ZI", "ZA") or (slavo_germanic and pos > 0 and w[pos - 1] != "T"):
+                add("S", "TS")
+            else:
+                add("S")
+            pos += 2 if nxt == "Z" else 1
+
+        else:
+            pos += 1
+
+    return "".join(primary)[:max_length], "".join(secondary)[:max_length]
+
+
+# ============================================================================
+# NAME KEYS
+# ============================================================================
+
+def _words(text: str) -> List[str]:
+    words = re.findall(r"[a-z0-9]+", unicodedata.normalize("NFKD", text or "").lower())
+    content = [word for word in words if word not in _STOP_WORDS]
+    return content or words
+
+
+@functools.lru_cache(maxsize=65536)
+def _word_codes(word: str) -> Tuple[str, str]:
+    # Library names share most of their words; key rebuilds code each one once
+    return (word, word) if word.isdigit() else double_metaphone(word, CODE_LENGTH)
+
+
+def phonetic_keys(text: str) -> Set[str]:
+    """Lookup keys for a name: word-joined primary/alternate codes and a squashed code."""
+    words = _words(text)
+    if not words:
+        return set()
+    # Numbers stay literal: "metallica 1984" must not collapse onto "metallica"
+    codes = [_word_codes(word) for word in words]
+    keys = {
+        " ".join(code[0] for code in codes if code[0]),
+        " ".join(code[1] for code in codes if code[1]),
+    }
+    if not any(word.isdigit() for word in words):
+        squashed = double_metaphone("".join(words), CODE_LENGTH * len(words))[0]
+        if squashed:
+            keys.add("~" + squashed)
+    keys.discard("")
+    return keys
+
+
+def spelling_ratio(a: str, b: str) -> float:
+    return SequenceMatcher(None, " ".join(_words(a)), " ".join(_words(b))).ratio()
+
+
+class PhoneticIndex:
+    """Phonetic key -> [(label, value)] over a set of names."""
+
+    def __init__(self, entries: Iterable[Tuple[str, str]] = ()):
+        self._keys: Dict[str, List[Tuple[str, str]]] = {}
+        seen = set()
+        for label, value in entries:
+            if not value or (label, value) in seen:
+                continue
+            seen.add((label, value))
+            for key in phonetic_keys(value):
+                self._keys.setdefault(key, []).append((label, value))
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def rows(self) -> Iterable[Tuple[str, str, str]]:
+        """(key, label, value) rows, e.g. for the SQLite phonetic_keys table."""
+        for key, entries in self._keys.items():
+            for label, value in entries:
+                yield key, label, value
+
+    def _entries(self, key: str) -> Iterable[Tuple[str, str]]:
+        return self._keys.get(key, ())
+
+    def lookup(self, query: str) -> List[Tuple[float, str, str]]:
+        """(spelling_ratio, label, value) for sound-alike names, best first."""
+        return rank_matches(query, (entry for key in phonetic_keys(query) for entry in self._entries(key)))
+
+    def rebuilt(self, entries: Iterable[Tuple[str, str]]) -> "PhoneticIndex":
+        """Index over entries, reusing this index's keys for names it already has."""
+        known: Dict[Tuple[str, str], List[str]] = {}
+        for key, label, value in self.rows():
+            known.setdefault((label, value), []).append(key)
+        index = PhoneticIndex()
+        for label, value in dict.fromkeys(entries):
+            if not value:
+                continue
+            for key in known.get((label, value)) or phonetic_keys(value):
+                index._keys.setdefault(key, []).append((label, value))
+        return index
+
+    def to_dict(self) -> Dict:
+        keys: Dict[str, List[List[str]]] = {}
+        for key, label, value in self.rows():
+            keys.setdefault(key, []).append([label, value])
+        return {"version": PHONETIC_VERSION, "keys": keys}
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict]) -> Optional["PhoneticIndex"]:
+        """Rebuild from to_dict() output; None if missing or from another version."""
+        if not isinstance(data, dict) or data.get("version") != PHONETIC_VERSION:
+            return None
+        index = cls()
+        index._keys = {key: [tuple(e) for e in entries] for key, entries in (data.get("keys") or {}).items()}
+        return index
+
+
+def rank_matches(query: str, hits: Iterable[Tuple[str, str]]) -> List[Tuple[float, str, str]]:
+    """Dedupe phonetic hits and rank by spelling similarity to the query."""
+    if len(re.sub(r"[^a-z0-9]", "", (query or "").lower())) < MIN_QUERY_CHARS:
+        return []
+    ranked = []
+    for label, value in dict.fromkeys(hits):
+        ratio = spelling_ratio(query, value)
+        if ratio >= MIN_SPELLING_RATIO:
+            ranked.append((ratio, label, value))
+    ranked.sort(key=lambda item: -item[0])
+    return ranked
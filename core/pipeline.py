@@ -4,6 +4,10 @@ ARGO Pipeline: STT -> LLM -> TTS
 
 Synchronous, queue-based processing pipeline.
 Uses faster-whisper, ollama, and Edge TTS.
+
+Heavy optional subsystems are imported lazily (core/lazy_import.py); keep
+`import core.pipeline` under system.import_budget_ms
+(python -m core.import_profile core.pipeline shows where the time goes).
 """
 
 # ============================================================================
@@ -17,10 +21,9 @@ import sys
 import uuid
 import json
 import re
+import queue
 from datetime import datetime
-from typing import Optional
-from faster_whisper import WhisperModel
-import ollama
+from typing import Callable, Optional
 import subprocess
 import shutil
 import os
@@ -31,6 +34,7 @@ from core.instrumentation import log_event
 from core.config import (
     get_runtime_overrides,
     get_config,
+    ENABLE_LLM_TTS_STREAMING,
     MIN_TTS_CONFIDENCE,
     MIN_TTS_TEXT_LEN,
     PERSONAL_MODE_MIN_CONFIDENCE,
@@ -40,38 +44,22 @@ from core.config import (
     ActionRisk,
 )
 from core.intent_parser import RuleBasedIntentParser, Intent, IntentType, normalize_system_text, is_system_keyword
-from core.stt_engine_manager import STTEngineManager, verify_engine_dependencies
-from core.music_player import get_music_player
-from core.music_status import query_music_status
-from core.bluetooth import (
-    get_bluetooth_status,
-    set_bluetooth_enabled,
-    connect_device,
-    disconnect_device,
-    pair_device,
-)
-from core.audio_routing import get_audio_routing_status, set_audio_routing
-from core.app_control import app_status_response, open_app, close_app_deterministic, focus_app_deterministic, get_active_app, is_app_running
+from core.stt_engine_manager import STTEngineManager, live_decode_kwargs, verify_engine_dependencies
+from core.stt_service import STTPriority, STTQueueFull, STTService
+from core.speculative_intent import SpeculativeAction, SpeculativeIntentDispatcher, OUTCOME_CONFIRMED
+from core.playback_state import get_playback_state
 from core.app_registry import APP_REGISTRY
-from core.system_volume import get_status as get_system_volume_status, set_volume_percent as set_system_volume_percent, adjust_volume_percent as adjust_system_volume_percent, mute_volume as mute_system_volume, unmute_volume as unmute_system_volume
-from core.app_launch import launch_app, resolve_app_launch_target
 from core.app_registry import resolve_app_name
+from core.lazy_import import lazy_callable, lazy_module
 
 # TTS bypass reason for deterministic commands (for logging/debugging)
 TTS_ALLOWED_REASON_DETERMINISTIC = "DETERMINISTIC_CONFIDENCE_BYPASS"
 from core.memory_store import get_memory_store
 from core.conversation_buffer import ConversationBuffer
+from core.sentence_split import cut_sentences
+from core.tts_cache import CacheablePhrase, WARMUP_PHRASES as TTS_WARMUP_PHRASES
 from core.registries import is_capability_enabled, is_permission_allowed, is_module_enabled
 from core.runtime_constants import GATES_ORDER, Gate
-from system_health import (
-    get_system_health,
-    get_memory_info,
-    get_temperatures,
-    get_temperature_health,
-    get_disk_info,
-    get_system_full_report,
-)
-from system_profile import get_system_profile, get_gpu_profile
 from core.personality import format_response as personality_format_response, get_personality_state
 
 # Persona module - text transformers gated by response type
@@ -79,6 +67,92 @@ from personas import ResponseType, apply_persona, PERSONA_REGISTRY
 # Import all persona modules to register them
 from personas import neutral, rick, claptrap, jarvis, tommy_gunn, tommy_mix, plain
 
+# Heavy optional subsystems: resolved on first use (see core/lazy_import.py)
+ollama = lazy_module("ollama")
+get_music_player = lazy_callable("core.music_player", "get_music_player")
+query_music_status = lazy_callable("core.music_status", "query_music_status")
+get_bluetooth_status = lazy_callable("core.bluetooth", "get_bluetooth_status")
+set_bluetooth_enabled = lazy_callable("core.bluetooth", "set_bluetooth_enabled")
+connect_device = lazy_callable("core.bluetooth", "connect_device")
+disconnect_device = lazy_callable("core.bluetooth", "disconnect_device")
+pair_device = lazy_callable("core.bluetooth", "pair_device")
+get_audio_routing_status = lazy_callable("core.audio_routing", "get_audio_routing_status")
+set_audio_routing = lazy_callable("core.audio_routing", "set_audio_routing")
+app_status_response = lazy_callable("core.app_control", "app_status_response")
+open_app = lazy_callable("core.app_control", "open_app")
+close_app_deterministic = lazy_callable("core.app_control", "close_app_deterministic")
+focus_app_deterministic = lazy_callable("core.app_control", "focus_app_deterministic")
+get_active_app = lazy_callable("core.app_control", "get_active_app")
+is_app_running = lazy_callable("core.app_control", "is_app_running")
+get_system_volume_status = lazy_callable("core.system_volume", "get_status")
+set_system_volume_percent = lazy_callable("core.system_volume", "set_volume_percent")
+adjust_system_volume_percent = lazy_callable("core.system_volume", "adjust_volume_percent")
+mute_system_volume = lazy_callable("core.system_volume", "mute_volume")
+unmute_system_volume = lazy_callable("core.system_volume", "unmute_volume")
+launch_app = lazy_callable("core.app_launch", "launch_app")
+resolve_app_launch_target = lazy_callable("core.app_launch", "resolve_app_launch_target")
+get_system_health = lazy_callable("system_health", "get_system_health")
+get_memory_info = lazy_callable("system_health", "get_memory_info")
+get_temperatures = lazy_callable("system_health", "get_temperatures")
+get_temperature_health = lazy_callable("system_health", "get_temperature_health")
+get_disk_info = lazy_callable("system_health", "get_disk_info")
+get_system_full_report = lazy_callable("system_health", "get_system_full_report")
+get_system_profile = lazy_callable("system_profile", "get_system_profile")
+get_gpu_profile = lazy_callable("system_profile", "get_gpu_profile")
+
+
+class TurnLock:
+    """
+    Lock that hands the pipeline to waiting inputs in arrival order.
+
+    threading.Lock wakes an arbitrary waiter, so inputs queued while busy
+    could run out of order. Each waiter takes a place in line; release()
+    lets the head of the line in. A waiter that times out leaves the line.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._held = False
+        self._waiters = deque()
+
+    def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
+        with self._cond:
+            if not self._held and not self._waiters:
+                self._held = True
+                return True
+            if not blocking:
+                return False
+            ticket = object()
+            self._waiters.append(ticket)
+            if not self._cond.wait_for(
+                lambda: not self._held and self._waiters[0] is ticket,
+                None if timeout < 0 else timeout,
+            ):
+                self._waiters.remove(ticket)
+                self._cond.notify_all()  # the head may have changed
+                return False
+            self._waiters.popleft()
+            self._held = True
+            return True
+
+    def release(self) -> None:
+        with self._cond:
+            if not self._held:
+                raise RuntimeError("release unlocked TurnLock")
+            self._held = False
+            self._cond.notify_all()
+
+    def locked(self) -> bool:
+        return self._held
+
+    def waiting(self) -> int:
+        return len(self._waiters)
+
+    __enter__ = acquire
+
+    def __exit__(self, *exc) -> None:
+        self.release()
+
 # ============================================================================
 # 2) PIPELINE ORCHESTRATOR
 # ============================================================================
@@ -111,6 +185,14 @@ class ArgoPipeline:
             "deadline", "production", "incident", "outage",
         }
         self.llm_enabled = True
+        self._enable_tts_streaming = ENABLE_LLM_TTS_STREAMING
+        try:
+            if self._config is not None:
+                self._enable_tts_streaming = bool(
+                    self._config.get("llm.enable_tts_streaming", ENABLE_LLM_TTS_STREAMING)
+                )
+        except Exception:
+            self._enable_tts_streaming = ENABLE_LLM_TTS_STREAMING
 
         # State machine
         self._state_lock = threading.Lock()
@@ -124,12 +206,14 @@ class ArgoPipeline:
             "SPEAKING": {"LISTENING", "IDLE", "THINKING"},  # THINKING for text barge-in
         }
         
-        # Concurrency Lock
-        self.processing_lock = threading.Lock()
+        # Concurrency Lock (FIFO: queued inputs run in the order they arrived)
+        self.processing_lock = TurnLock()
         
         # Models
         self.stt_model = None
         self.stt_engine_manager = None
+        # Request queue in front of stt_engine_manager (built on first use)
+        self.stt_service = None
         self.stt_engine = "openai"  # Default engine name
         self.tts_process = None
         self.stt_model_name = "unknown"
@@ -171,6 +255,10 @@ class ArgoPipeline:
         self._stt_silence_ratio_threshold = 0.90
         self._stt_min_duration_s = 0.3
         self._vad_silence_pad_ms = 300
+        self._stt_incremental = {"enabled": True}
+        self._stt_speculative = {"enabled": True}
+        self._stt_queue = {}
+        self._stt_priority = STTPriority.LIVE
         self.strict_lab_mode = False
         try:
             if self._config is not None:
@@ -187,6 +275,9 @@ class ArgoPipeline:
                 self.strict_lab_mode = bool(self._config.get("modes.strict_lab_mode", False))
                 profiles = self._config.get("speech_to_text.initial_prompt_profiles", {}) or {}
                 self._stt_initial_prompt = str(profiles.get(self._stt_prompt_profile, ""))
+                self._stt_incremental = dict(self._config.get("speech_to_text.incremental", self._stt_incremental) or {})
+                self._stt_speculative = dict(self._config.get("speech_to_text.speculative", self._stt_speculative) or {})
+                self._stt_queue = dict(self._config.get("speech_to_text.queue", self._stt_queue) or {})
                 self._tts_min_text_length = int(
                     self._config.get("guards.tts.min_text_length", self._tts_min_text_length)
                 )
@@ -392,6 +483,12 @@ class ArgoPipeline:
         return cleaned
 
     def warmup(self):
+        self.warmup_stt()
+        self.warmup_llm()
+        self.finish_warmup()
+
+    def warmup_stt(self):
+        """Load the configured STT engine (raises on a bad engine or failed load)."""
         self.logger.info("Warming up models...")
         self.broadcast("status", "WARMING_UP")
         if self._stt_prompt_profile:
@@ -407,6 +504,8 @@ class ArgoPipeline:
             stt_engine = "openai"  # Default
             stt_model_size = "base"  # Default
             stt_device = "cpu"  # Default
+            # compute_type / cpu_threads / num_workers (written by core.stt_calibration)
+            stt_tuning = {}
             
             if self._config is not None:
                 stt_config = self._config.get("speech_to_text", {})
@@ -414,6 +513,11 @@ class ArgoPipeline:
                     stt_engine = stt_config.get("engine", "openai")
                     stt_model_size = stt_config.get("model", "base")
                     stt_device = stt_config.get("device", "cpu")
+                    stt_tuning = {
+                        key: stt_config[key]
+                        for key in ("compute_type", "cpu_threads", "num_workers")
+                        if stt_config.get(key) is not None
+                    }
 
             # Validate engine selection
             if stt_engine not in STTEngineManager.SUPPORTED_ENGINES:
@@ -426,6 +530,7 @@ class ArgoPipeline:
             self.logger.info(
                 f"[STT] Engine configuration: engine={stt_engine}, "
                 f"model={stt_model_size}, device={stt_device}"
+                + "".join(f", {key}={value}" for key, value in stt_tuning.items())
             )
 
             # ✅ PREFLIGHT CHECK: Verify engine dependencies before audio init
@@ -435,7 +540,8 @@ class ArgoPipeline:
             self.stt_engine_manager = STTEngineManager(
                 engine=stt_engine,
                 model_size=stt_model_size,
-                device=stt_device
+                device=stt_device,
+                **stt_tuning,
             )
             self.stt_model_name = f"{stt_model_size}"
             self.stt_engine = stt_engine
@@ -449,7 +555,9 @@ class ArgoPipeline:
         except Exception as e:
             self.logger.error(f"[STT] Initialization Error: {e}")
             raise
-        
+
+    def warmup_llm(self):
+        """Load the LLM into Ollama with a one-word generate (no-op in no-brain mode)."""
         if self.llm_enabled:
             try:
                 model_name = "qwen:latest"
@@ -461,9 +569,64 @@ class ArgoPipeline:
                 self.logger.info("LLM model warmed up")
             except Exception as e:
                 self.logger.warning(f"LLM Warmup Warning: {e}")
+
+    def finish_warmup(self):
+        """Start the TTS cache warm-up and report READY."""
+        self._start_tts_cache_warmup()
         
         self.broadcast("status", "READY")
 
+    def _start_tts_cache_warmup(self) -> Optional[threading.Thread]:
+        """
+        Pre-render fixed spoken phrases into the TTS cache on a background thread.
+
+        Warms the pipeline's Edge-TTS sink and, when the environment selects
+        Piper (OUTPUT_SINK=piper), the global Piper sink from get_output_sink().
+        """
+        if not self.runtime_overrides.get("tts_enabled", True):
+            return None
+        sinks = []
+        try:
+            if self._edge_tts is None:
+                from core.output_sink import EdgeTTSOutputSink
+                self._edge_tts = EdgeTTSOutputSink(voice=self.voices.get(self.current_voice_key, "en-US-AriaNeural"))
+            sinks.append(self._edge_tts)
+        except Exception as e:
+            self.logger.warning(f"[TTS] Edge-TTS cache warm-up skipped: {e}")
+        try:
+            from core.output_sink import get_output_sink, piper_sink_selected
+            if piper_sink_selected():
+                sinks.append(get_output_sink())
+        except Exception as e:
+            self.logger.warning(f"[TTS] Piper cache warm-up skipped: {e}")
+        warmers = [
+            (type(sink).__name__, sink.warm_cache)
+            for sink in dict.fromkeys(sinks)
+            if callable(getattr(sink, "warm_cache", None))
+        ]
+        if not warmers:
+            return None
+        persona_name = self._resolve_personality_mode()
+        phrases = []
+        for phrase in TTS_WARMUP_PHRASES:
+            phrases.append(self._sanitize_tts_text(phrase, deterministic=True))
+            phrases.append(
+                self._sanitize_tts_text(apply_persona(phrase, ResponseType.SYSTEM, persona_name), deterministic=True)
+            )
+        phrases = [p for p in dict.fromkeys(phrases) if p]
+
+        def _warm():
+            for sink_name, warm_cache in warmers:
+                try:
+                    rendered = warm_cache(phrases)
+                    self.logger.info(f"[TTS] Cache warm-up rendered {rendered} phrase(s) for {sink_name}")
+                except Exception as e:
+                    self.logger.warning(f"[TTS] Cache warm-up failed for {sink_name}: {e}")
+
+        thread = threading.Thread(target=_warm, daemon=True, name="ARGO.TTSCacheWarmup")
+        thread.start()
+        return thread
+
     def _record_timeline(self, event: str, stage: str, interaction_id: str = ""):
         ts = int(time.monotonic() * 1000)
         self.timeline_events.append({
@@ -846,12 +1009,12 @@ class ArgoPipeline:
         if action_result:
             # Some actions deserve acknowledgment
             if context in {"closed", "stopped", "muted", "unmuted"}:
-                return "Done."
+                return CacheablePhrase("Done.")
             # Default success = silence
             return None
         
         # Failure = brief error
-        return "That didn't work."
+        return CacheablePhrase("That didn't work.")
     
     def _get_clarification_prompt(self, intent: Intent | None = None, candidates: list[str] | None = None) -> str:
         """Generate context-aware clarification prompt.
@@ -1627,9 +1790,238 @@ class ArgoPipeline:
         return "\n\n".join(parts)
 
 
-    def transcribe(self, audio_data, interaction_id: str = ""):
+    def begin_incremental_stt(self, interaction_id: str = ""):
+        """
+        Start incremental transcription for an utterance being captured.
+
+        Returns an IncrementalTranscriber to feed() frames into (hand it to
+        run_interaction at VAD end), or None when disabled/not ready.
+        Partial hypotheses are broadcast as `stt_partial` events.
+        """
+        settings = self._stt_incremental or {}
+        if not settings.get("enabled", True):
+            return None
+        if self.stt_engine_manager is None or self.stt_engine_manager.model is None:
+            return None
+        if not hasattr(self.stt_engine_manager, "start_incremental"):
+            return None
+        speculation = self._new_speculation(interaction_id)
+        early = {}
+        if speculation is not None:
+            # Short commands are decided in the first second or two: decode that part more often
+            speculative = self._stt_speculative or {}
+            early = {
+                "early_step_ms": int(speculative.get("early_step_ms", 200)),
+                "early_window_s": float(speculative.get("early_window_s", 2.0)),
+            }
+        try:
+            session = self.stt_engine_manager.start_incremental(
+                language="en",
+                on_partial=lambda partial: self._on_stt_partial(partial, interaction_id, speculation),
+                step_ms=int(settings.get("step_ms", 500)),
+                min_window_ms=int(settings.get("min_window_ms", 1000)),
+                max_window_s=float(settings.get("max_window_s", 12.0)),
+                commit_margin_s=float(settings.get("commit_margin_s", 1.0)),
+                **early,
+                **live_decode_kwargs(self.stt_engine, self._stt_initial_prompt),
+            )
+        except Exception as e:
+            self.logger.warning(f"[STT] Incremental session unavailable: {e}")
+            return None
+        session.speculation = speculation
+        return session
+
+    def _on_stt_partial(self, partial, interaction_id: str = "", speculation=None) -> None:
+        self.logger.debug(f"[STT] Partial: stable='{partial.stable}' tentative='{partial.tentative}'")
+        self.broadcast("stt_partial", {
+            "interaction_id": interaction_id,
+            "stable": partial.stable,
+            "tentative": partial.tentative,
+            "text": partial.text,
+            "audio_s": round(partial.audio_s, 2),
+            "decode_ms": round(partial.decode_ms, 1),
+        })
+        if speculation is not None:
+            action = speculation.on_partial(partial)
+            if action is not None:
+                self._report_speculation("fired", action, interaction_id)
+
+    # =========================================================================
+    # SPECULATIVE INTENT DISPATCH (stop / next / volume before end-of-speech)
+    # =========================================================================
+    def _new_speculation(self, interaction_id: str):
+        settings = self._stt_speculative or {}
+        if not settings.get("enabled", True):
+            return None
+        return SpeculativeIntentDispatcher(
+            executor=lambda intent, text: self._execute_speculative_intent(intent, text, interaction_id),
+            signature=self._speculative_signature,
+            exact_rollback=self._speculative_rollback_is_exact,
+            parser=self._intent_parser,
+            max_words=int(settings.get("max_words", 4)),
+            min_confidence=float(settings.get("min_confidence", 1.0)),
+            interaction_id=interaction_id,
+        )
+
+    def _speculative_signature(self, intent: Intent, text: str):
+        if intent.intent_type == IntentType.VOLUME_CONTROL:
+            return intent.intent_type, self._system_volume_command(text)
+        return intent.intent_type
+
+    def _speculative_rollback_is_exact(self, intent: Intent) -> bool:
+        # Stop/next can only be undone without restarting the song when we know where it was
+        if intent.intent_type in {IntentType.MUSIC_STOP, IntentType.MUSIC_NEXT}:
+            return get_music_player().playback_position() is not None
+        return True
+
+    def _execute_speculative_intent(self, intent: Intent, text: str, interaction_id: str) -> Optional[SpeculativeAction]:
+        """Run a canonical command early. Returns None (nothing done) when it doesn't apply."""
+        if intent.intent_type in {IntentType.MUSIC_STOP, IntentType.MUSIC_NEXT}:
+            if not self.runtime_overrides.get("music_enabled", True):
+                return None
+            allowed, _reason = self._evaluate_gates("music_playback", "music_playback", interaction_id)
+            music_player = get_music_player()
+            if not allowed or not music_player.is_playing():
+                return None
+            previous_track = dict(music_player.current_track or {})
+            previous_position = music_player.playback_position()
+            state = get_playback_state()
+            previous_state = (state.mode, state.artist, state.genre, state.current_track)
+
+            def _restore():
+                if music_player.resume_track(previous_track, previous_position):
+                    state.mode, state.artist, state.genre, state.current_track = previous_state
+
+            if intent.intent_type == IntentType.MUSIC_STOP:
+                music_player.stop()
+                return SpeculativeAction(intent.intent_type, text, response="Stopped.", rollback=_restore)
+            if not music_player.play_next(None):
+                return None
+            return SpeculativeAction(intent.intent_type, text, rollback=_restore)
+
+        if intent.intent_type == IntentType.VOLUME_CONTROL:
+            command = self._system_volume_command(text)
+            if command is None or not self._is_system_volume_text(text):
+                return None
+            allowed, _reason = self._evaluate_gates("system_volume", "system_volume", interaction_id)
+            if not allowed:
+                return None
+            prev_volume, prev_muted = get_system_volume_status()
+            ok, _msg, prev_volume, new_volume, new_muted = self._apply_system_volume_command(command)
+            if not ok:
+                return None
+
+            def _restore_volume():
+                set_system_volume_percent(prev_volume)
+                if prev_muted:
+                    mute_system_volume()
+                elif new_muted:
+                    unmute_system_volume()
+
+            response = "System volume muted." if new_muted else f"System volume set to {new_volume}%."
+            return SpeculativeAction(intent.intent_type, text, response=response, rollback=_restore_volume)
+        return None
+
+    def _report_speculation(self, status: str, action: SpeculativeAction, interaction_id: str) -> None:
+        latency_ms = (time.monotonic() - action.fired_at) * 1000
+        self._record_timeline(
+            f"SPECULATIVE_DISPATCH {status} intent={action.intent_type.value} text='{action.text}' audio_s={action.audio_s:.2f}",
+            stage="intent",
+            interaction_id=interaction_id,
+        )
+        self.broadcast("speculative_intent", {
+            "interaction_id": interaction_id,
+            "status": status,
+            "intent": action.intent_type.value,
+            "text": action.text,
+            "audio_s": round(action.audio_s, 2),
+            "since_fired_ms": round(latency_ms, 1),
+        })
+
+    def _settle_speculation(self, speculation, user_text: str, interaction_id: str, replay_mode: bool, overrides: dict | None) -> bool:
+        """
+        Reconcile a speculative command with the final transcript.
+
+        Returns True when the command was confirmed and the interaction is
+        complete; False when nothing fired or it was rolled back, in which case
+        the transcript is routed normally.
+        """
+        outcome, action = speculation.reconcile(user_text)
+        if action is None:
+            return False
+        self._report_speculation(outcome, action, interaction_id)
+        if outcome != OUTCOME_CONFIRMED:
+            return False
+        if action.response:
+            return self._deliver_canonical_response(
+                action.response,
+                interaction_id,
+                replay_mode,
+                overrides,
+                enforce_confidence=False,
+                force_tts=action.intent_type == IntentType.VOLUME_CONTROL,
+            )
+        self.transition_state("LISTENING", interaction_id=interaction_id, source="audio")
+        self.logger.info("--- Interaction Complete ---")
+        self._record_timeline("INTERACTION_END", stage="pipeline", interaction_id=interaction_id)
+        return True
+
+    def abandon_incremental_stt(self, stt_session) -> None:
+        """Utterance dropped or refused: cancel decoding and undo any speculative command."""
+        if stt_session is None:
+            return
+        stt_session.cancel()
+        speculation = getattr(stt_session, "speculation", None)
+        if speculation is not None:
+            action = speculation.abandon()
+            if action is not None:
+                self._report_speculation("rolled_back", action, speculation.interaction_id)
+
+    def _get_stt_service(self) -> STTService:
+        """The request queue for the current STT engine manager."""
+        service = self.stt_service
+        if service is None or service.manager is not self.stt_engine_manager:
+            if service is not None:
+                service.close()
+            service = STTService(
+                self.stt_engine_manager,
+                max_pending=int(self._stt_queue.get("max_pending", 16)),
+                max_batch=int(self._stt_queue.get("max_batch", 4)),
+                batch_window_ms=float(self._stt_queue.get("batch_window_ms", 0)),
+            )
+            self.stt_service = service
+        return service
+
+    def _submit_stt(self, audio_data, priority: int = STTPriority.LIVE, source: str = "mic"):
+        """Queue a full-utterance decode; returns its Future."""
+        peak = float(np.max(np.abs(audio_data))) if len(audio_data) else 0.0
+        # Clamp normalization: avoid noise amplification
+        if peak > 1.0:
+            audio_data = audio_data / peak
+        return self._get_stt_service().submit(
+            audio_data,
+            priority=priority,
+            language="en",
+            source=source,
+            **live_decode_kwargs(self.stt_engine, self._stt_initial_prompt),
+        )
+
+    def transcribe(self, audio_data, interaction_id: str = "", stt_session=None, stt_future=None):
+        """
+        Transcribe one utterance through the STT queue, at the current
+        interaction's priority.
+
+        stt_future: a decode already queued with _submit_stt() (used when the
+        input arrived while the pipeline was busy); cancelled if the audio is
+        rejected. It replaces the incremental session's finalize(), which
+        would otherwise start only now.
+        """
         if self.stt_engine_manager is None or self.stt_engine_manager.model is None:
             self.logger.error("[STT] Engine not initialized")
+            if stt_session is not None:
+                stt_session.cancel()
+            if stt_future is not None:
+                stt_future.cancel()
             return ""
         
         self.logger.info(
@@ -1650,20 +2042,31 @@ class ArgoPipeline:
             if reject:
                 self.logger.info(reason)
                 self._record_timeline(f"STT_DISCARD {reason}", stage="stt", interaction_id=interaction_id)
+                if stt_session is not None:
+                    stt_session.cancel()
+                if stt_future is not None:
+                    stt_future.cancel()
                 return ""
 
-            # Clamp normalization: avoid noise amplification
-            if peak > 1.0:
-                audio_data = audio_data / peak
+            stt_result = None
+            if stt_session is not None and stt_future is not None:
+                stt_session.cancel()  # the full decode ran while we were queued
+            elif stt_session is not None:
+                # Incremental: windows were decoded during capture; only the tail is left
+                try:
+                    stt_result = stt_session.finalize()
+                    self.logger.info(
+                        f"[STT] Incremental finalize: tail={stt_result.get('tail_s', 0.0):.2f}s "
+                        f"of {duration_s:.2f}s, windows={stt_result.get('window_decodes', 0)}"
+                    )
+                except Exception as e:
+                    self.logger.warning(f"[STT] Incremental finalize failed, decoding full utterance: {e}")
+                    stt_result = None
 
-            # Use STT engine manager for transcription
-            stt_result = self.stt_engine_manager.transcribe(
-                audio_data,
-                language="en",
-                beam_size=1 if self.stt_engine == "faster" else None,
-                condition_on_previous_text=False if self.stt_engine == "faster" else None,
-                initial_prompt=self._stt_initial_prompt or None,
-            )
+            if stt_result is None:
+                if stt_future is None:
+                    stt_future = self._submit_stt(audio_data, priority=self._stt_priority)
+                stt_result = stt_future.result()
             
             text = stt_result["text"]
             engine = stt_result["engine"]
@@ -1720,9 +2123,12 @@ class ArgoPipeline:
             self._record_timeline("STT_ERROR", stage="stt", interaction_id=interaction_id)
             return ""
 
-    def generate_response(self, text, interaction_id: str = "", rag_context: str = "", memory_context: str = "", use_convo_buffer: bool = True, intent_type: Optional[str] = None, confidence: float = 1.0):
+    def generate_response(self, text, interaction_id: str = "", rag_context: str = "", memory_context: str = "", use_convo_buffer: bool = True, intent_type: Optional[str] = None, confidence: float = 1.0, on_sentence: Optional[Callable[[str], None]] = None):
         """
         Generate a response, enforcing principle/mechanism explanation for knowledge intents.
+
+        If on_sentence is given, each complete sentence is handed to it as soon as
+        it is cut off the token stream (used for sentence-level LLM->TTS streaming).
         """
         if not self.llm_enabled:
             self.logger.info("LLM offline: skipping generation")
@@ -1734,6 +2140,7 @@ class ArgoPipeline:
         self.logger.info(f"[LLM] Prompt: '{text}'")
         self.logger.debug(f"[LLM] Full prompt (first 500 chars): {prompt[:500]}")
         full_response = ""
+        sentence_buffer = ""
         try:
             model_name = "qwen:latest"
             if self._config is not None:
@@ -1764,6 +2171,13 @@ class ArgoPipeline:
                         interaction_id=interaction_id,
                     )
                 full_response += part
+                if on_sentence is not None and part:
+                    sentence_buffer += part
+                    ready, sentence_buffer = self._cut_stream_sentences(sentence_buffer)
+                    for sentence in ready:
+                        on_sentence(sentence)
+            if on_sentence is not None and sentence_buffer.strip() and not self.stop_signal.is_set():
+                on_sentence(sentence_buffer.strip())
             total_ms = (time.perf_counter() - start) * 1000
             self._record_timeline(
                 f"LLM_DONE {total_ms:.0f}ms",
@@ -1885,6 +2299,87 @@ class ArgoPipeline:
             self._record_timeline("LLM_ERROR", stage="llm", interaction_id=interaction_id)
             return "[Error connecting to LLM]"
 
+    def _cut_stream_sentences(self, buffer: str, max_chars: int = 150) -> tuple[list[str], str]:
+        """
+        Cut complete sentences off the front of a streaming LLM buffer with the
+        shared splitter (core/sentence_split.py). Returns (sentences, remainder).
+        """
+        return cut_sentences(buffer, max_chars=max_chars)
+
+    def _prepare_stream_sentence(self, sentence: str, persona_name: str) -> str:
+        """Apply the same cleanup as the full-response path to a single streamed sentence."""
+        sentence = self._strip_prompt_artifacts(sentence)
+        sentence = re.sub(r"[^\x00-\x7F]+", "", sentence or "")
+        sentence = self._strip_disallowed_phrases(sentence)
+        sentence = apply_persona(sentence, ResponseType.ANSWER, persona_name)
+        return self._sanitize_tts_text(sentence, enforce_confidence=False, deterministic=True)
+
+    def _speak_sentence_stream(self, sentences: "queue.Queue", interaction_id: str) -> None:
+        """
+        TTS side of streaming: play sentences from the queue until the None sentinel.
+        Audio is acquired once for the whole answer. Barge-in (stop_signal) ends
+        playback and drops anything still queued.
+        """
+        started = False
+        try:
+            while True:
+                sentence = sentences.get()
+                if sentence is None or self.stop_signal.is_set():
+                    break
+                if not started:
+                    if not self._begin_speech(interaction_id, clear_stop=False):
+                        break
+                    started = True
+                    self._record_timeline("TTS_FIRST_SENTENCE", stage="tts", interaction_id=interaction_id)
+                try:
+                    self._edge_tts.speak(sentence)
+                except Exception as e:
+                    self.logger.error(f"[TTS] Error: {e}")
+                if self.stop_signal.is_set():
+                    break
+        finally:
+            if started:
+                self._end_speech(interaction_id)
+
+    def stream_response(self, text, interaction_id: str = "", rag_context: str = "", memory_context: str = "", use_convo_buffer: bool = True) -> str:
+        """
+        Generate an LLM response and speak it sentence by sentence while the model
+        is still generating. Returns the full raw response text (already spoken).
+
+        Time-to-first-audio becomes first-sentence latency instead of total LLM
+        time plus synthesis. stop_signal cancels both the LLM stream and playback.
+        """
+        persona_name = self._resolve_personality_mode()
+        sentences: "queue.Queue" = queue.Queue()
+        self.stop_signal.clear()
+        speaker = threading.Thread(
+            target=self._speak_sentence_stream,
+            args=(sentences, interaction_id),
+            daemon=True,
+            name="ARGO.StreamTTS",
+        )
+        speaker.start()
+
+        def on_sentence(sentence: str) -> None:
+            tts_text = self._prepare_stream_sentence(sentence, persona_name)
+            if tts_text:
+                sentences.put(tts_text)
+
+        self._record_timeline("LLM_STREAM_TTS_START", stage="llm", interaction_id=interaction_id)
+        try:
+            return self.generate_response(
+                text,
+                interaction_id=interaction_id,
+                rag_context=rag_context,
+                memory_context=memory_context,
+                use_convo_buffer=use_convo_buffer,
+                on_sentence=on_sentence,
+            )
+        finally:
+            sentences.put(None)
+            speaker.join()
+            self._record_timeline("LLM_STREAM_TTS_END", stage="llm", interaction_id=interaction_id)
+
     def set_llm_enabled(self, enabled: bool) -> None:
         self.llm_enabled = bool(enabled)
 
@@ -2552,6 +3047,36 @@ class ArgoPipeline:
         message = f"System volume is {volume}%. Muted: {'true' if muted else 'false'}."
         return self._deliver_canonical_response(message, interaction_id, replay_mode, overrides, enforce_confidence=False, force_tts=True)
 
+    def _system_volume_command(self, user_text: str) -> tuple | None:
+        """Parse a system volume command into (op, value); None if no explicit command."""
+        lowered = (user_text or "").lower()
+        match = re.search(r"set volume to (\d{1,3})%?", lowered)
+        if not match:
+            # Also match "volume 20%" or "volume to 20%"
+            match = re.search(r"\bvolume\s+(?:to\s+)?(\d{1,3})%?", lowered)
+        if match:
+            return ("set", int(match.group(1)))
+        if re.search(r"\bvolume up\b|\bturn volume up\b|\bincrease volume\b|\braise volume\b|\braise the volume\b|\blouder\b", lowered):
+            return ("adjust", 5)
+        if re.search(r"\bvolume down\b|\bturn volume down\b|\bdecrease volume\b|\blower volume\b|\blower the volume\b|\bquieter\b", lowered):
+            return ("adjust", -5)
+        if re.search(r"\bmute\b", lowered):
+            return ("mute", None)
+        if re.search(r"\bunmute\b", lowered):
+            return ("unmute", None)
+        return None
+
+    def _apply_system_volume_command(self, command: tuple) -> tuple:
+        """Execute a parsed volume command. Returns (ok, msg, prev_volume, new_volume, new_muted)."""
+        op, value = command
+        if op == "set":
+            return set_system_volume_percent(value)
+        if op == "adjust":
+            return adjust_system_volume_percent(value)
+        if op == "mute":
+            return mute_system_volume()
+        return unmute_system_volume()
+
     def _respond_with_system_volume_control(self, user_text: str, interaction_id: str, replay_mode: bool, overrides: dict | None) -> bool:
         if not self._is_system_volume_text(user_text):
             message = "System volume control requires a direct system volume command."
@@ -2560,29 +3085,12 @@ class ArgoPipeline:
         if not allowed:
             message = f"System volume control blocked by policy ({reason})."
             return self._deliver_canonical_response(message, interaction_id, replay_mode, overrides, enforce_confidence=False, force_tts=True)
-        lowered = (user_text or "").lower()
-        prev_volume, prev_muted = get_system_volume_status()
-        ok = False
-        msg = ""
-        new_volume = prev_volume
-        new_muted = prev_muted
-
-        match = re.search(r"set volume to (\d{1,3})%?", lowered)
-        if not match:
-            # Also match "volume 20%" or "volume to 20%"
-            match = re.search(r"\bvolume\s+(?:to\s+)?(\d{1,3})%?", lowered)
-        if match:
-            ok, msg, prev_volume, new_volume, new_muted = set_system_volume_percent(int(match.group(1)))
-        elif re.search(r"\bvolume up\b|\bturn volume up\b|\bincrease volume\b|\braise volume\b|\braise the volume\b|\blouder\b", lowered):
-            ok, msg, prev_volume, new_volume, new_muted = adjust_system_volume_percent(5)
-        elif re.search(r"\bvolume down\b|\bturn volume down\b|\bdecrease volume\b|\blower volume\b|\blower the volume\b|\bquieter\b", lowered):
-            ok, msg, prev_volume, new_volume, new_muted = adjust_system_volume_percent(-5)
-        elif re.search(r"\bmute\b", lowered):
-            ok, msg, prev_volume, new_volume, new_muted = mute_system_volume()
-        elif re.search(r"\bunmute\b", lowered):
-            ok, msg, prev_volume, new_volume, new_muted = unmute_system_volume()
+        command = self._system_volume_command(user_text)
+        if command is None:
+            prev_volume, prev_muted = get_system_volume_status()
+            ok, msg, new_volume, new_muted = False, "System volume control requires an explicit command.", prev_volume, prev_muted
         else:
-            msg = "System volume control requires an explicit command."
+            ok, msg, prev_volume, new_volume, new_muted = self._apply_system_volume_command(command)
 
         self.logger.info(
             f"[SYSTEM_VOLUME] prev={prev_volume} new={new_volume} muted={new_muted}"
@@ -2872,7 +3380,7 @@ class ArgoPipeline:
                             self._edge_tts.suppress_interrupt(suppress_barge_in_seconds)
                         except Exception:
                             pass
-                self.speak(tts_text, interaction_id=interaction_id)
+                self.speak(tts_text, interaction_id=interaction_id, cacheable=True)
         self.transition_state("LISTENING", interaction_id=interaction_id, source="audio")
         self.logger.info("--- Interaction Complete ---")
         self._record_timeline("INTERACTION_END", stage="pipeline", interaction_id=interaction_id)
@@ -3230,15 +3738,14 @@ class ArgoPipeline:
         cleaned = " ".join(filtered).strip()
         return cleaned
 
-    def speak(self, text, interaction_id: str = "", force_tts: bool = False):
-        if not self.runtime_overrides.get("tts_enabled", True) and not force_tts:
-            self.logger.info("[TTS] Disabled by runtime override")
-            return
+    def _begin_speech(self, interaction_id: str = "", clear_stop: bool = True) -> bool:
+        """Enter SPEAKING, acquire audio and make sure the TTS sink exists. Returns False if audio is contested."""
         self.logger.info(f"[TTS] Speaking with {self.current_voice_key}...")
         if self.current_state == "TRANSCRIBING":
             self.transition_state("THINKING", interaction_id=interaction_id, source="tts")
         self.transition_state("SPEAKING", interaction_id=interaction_id, source="tts")
-        self.stop_signal.clear()
+        if clear_stop:
+            self.stop_signal.clear()
         self.is_speaking = True
         self._record_timeline("TTS_START", stage="tts", interaction_id=interaction_id)
         try:
@@ -3247,7 +3754,8 @@ class ArgoPipeline:
             except Exception as e:
                 self.logger.error(f"[TTS] Audio ownership error: {e}")
                 log_event("TTS_AUDIO_CONTESTED", stage="audio", interaction_id=interaction_id)
-                return
+                self._end_speech(interaction_id)
+                return False
 
             if self._edge_tts is None:
                 from core.output_sink import EdgeTTSOutputSink
@@ -3258,18 +3766,36 @@ class ArgoPipeline:
                 except Exception:
                     pass
                 self._pending_barge_in_suppression = None
+        except Exception as e:
+            self.logger.error(f"[TTS] Error: {e}")
+            self._end_speech(interaction_id)
+            return False
+        return True
 
+    def _end_speech(self, interaction_id: str = "") -> None:
+        try:
+            self.audio.release_audio("TTS", interaction_id=interaction_id)
+        except Exception as e:
+            self.logger.error(f"[TTS] Exception during audio.release_audio: {e}")
+        self.is_speaking = False
+        self._record_timeline("TTS_DONE", stage="tts", interaction_id=interaction_id)
+
+    def speak(self, text, interaction_id: str = "", force_tts: bool = False, cacheable: bool = False):
+        """Speak text (blocking). cacheable=True lets a fixed/canonical response use the TTS cache."""
+        if not self.runtime_overrides.get("tts_enabled", True) and not force_tts:
+            self.logger.info("[TTS] Disabled by runtime override")
+            return
+        if not self._begin_speech(interaction_id):
+            return
+        try:
+            if cacheable and text:
+                text = CacheablePhrase(text)
             # Edge TTS playback (blocking)
             self._edge_tts.speak(text)
         except Exception as e:
             self.logger.error(f"[TTS] Error: {e}")
         finally:
-            try:
-                self.audio.release_audio("TTS", interaction_id=interaction_id)
-            except Exception as e:
-                self.logger.error(f"[TTS] Exception during audio.release_audio: {e}")
-            self.is_speaking = False
-            self._record_timeline("TTS_DONE", stage="tts", interaction_id=interaction_id)
+            self._end_speech(interaction_id)
 
 
     def _classify_canonical_topic(self, user_text):
@@ -3478,13 +4004,30 @@ class ArgoPipeline:
             return "ARGO_IDENTITY", (identity_specific | question_cue)
         return None, set()
 
-    def run_interaction(self, audio_data, interaction_id: str = "", replay_mode: bool = False, overrides: dict | None = None):
-        # THREAD SAFETY: Prevent overlapping runs which can crash models
+    def run_interaction(self, audio_data, interaction_id: str = "", replay_mode: bool = False, overrides: dict | None = None, stt_session=None):
+        # THREAD SAFETY: One interaction at a time. Input that arrives while
+        # busy waits its turn (in arrival order); its final STT decode is queued
+        # now, incremental session or not, so it runs while the previous
+        # interaction finishes
+        priority = STTPriority.REPLAY if replay_mode else STTPriority.LIVE
+        stt_future = None
         if not self.processing_lock.acquire(blocking=False):
-            self.logger.warning("[PIPELINE] Ignored input - System busy processing previous request")
-            return
+            busy_wait_s = float(self._stt_queue.get("busy_wait_s", 30))
+            if self.stt_engine_manager is not None:
+                try:
+                    stt_future = self._submit_stt(audio_data, priority=priority)
+                except (STTQueueFull, RuntimeError) as e:
+                    self.logger.warning(f"[PIPELINE] Could not queue STT early: {e}")
+            self.logger.info(f"[PIPELINE] Busy - input queued behind previous request (up to {busy_wait_s:.0f}s)")
+            if not self.processing_lock.acquire(timeout=busy_wait_s):
+                self.logger.warning("[PIPELINE] Ignored input - System busy processing previous request")
+                if stt_future is not None:
+                    stt_future.cancel()
+                self.abandon_incremental_stt(stt_session)
+                return
 
         try:
+            self._stt_priority = priority
             # Reset any prior barge-in state
             self.stop_signal.clear()
             self.timeline_events = []
@@ -3503,17 +4046,27 @@ class ArgoPipeline:
             except Exception as e:
                 self.logger.error(f"[STT] Audio ownership error: {e}")
                 self._record_timeline("STT_AUDIO_CONTESTED", stage="audio", interaction_id=interaction_id)
+                if stt_future is not None:
+                    stt_future.cancel()
+                self.abandon_incremental_stt(stt_session)
                 return
 
-            user_text = self.transcribe(audio_data, interaction_id=interaction_id)
+            # stt_future/stt_session are only passed when set (transcribe() overrides keep working)
+            stt_kwargs = {"stt_future": stt_future} if stt_future is not None else {}
+            if stt_session is not None:
+                stt_kwargs["stt_session"] = stt_session
+            user_text = self.transcribe(audio_data, interaction_id=interaction_id, **stt_kwargs)
             self.audio.release_audio("STT", interaction_id=interaction_id)
             confidence_hint = 1.0
             stt_result = self._last_stt_metrics
             if stt_result and "confidence" in stt_result:
                 confidence_hint = stt_result["confidence"]
             self._current_stt_confidence = confidence_hint
+            speculation = getattr(stt_session, "speculation", None)
 
             if not user_text:
+                if speculation is not None:
+                    self.abandon_incremental_stt(stt_session)
                 self.logger.warning("No speech recognized.")
                 self.broadcast("log", "User: [No speech recognized]")
                 response = "I didn't catch any words. Try again."
@@ -3535,6 +4088,9 @@ class ArgoPipeline:
             self._broadcast_turn_info()
             self._append_convo_ledger("user", user_text)
 
+            if speculation is not None and self._settle_speculation(speculation, user_text, interaction_id, replay_mode, overrides):
+                return
+
             self.handle_user_text(
                 user_text=user_text,
                 confidence_hint=confidence_hint,
@@ -4614,13 +5170,28 @@ class ArgoPipeline:
             return
         self.transition_state("THINKING", interaction_id=interaction_id, source="llm")
         self.logger.info(f"[LLM] context_scope={llm_context_scope}")
-        ai_text = self.generate_response(
-            user_text,
-            interaction_id=interaction_id,
-            rag_context=rag_context,
-            memory_context=memory_context,
-            use_convo_buffer=(llm_context_scope == "buffered"),
+        stream_tts = (
+            self._enable_tts_streaming
+            and not replay_mode
+            and not (overrides or {}).get("suppress_tts", False)
+            and self.runtime_overrides.get("tts_enabled", True)
         )
+        if stream_tts:
+            ai_text = self.stream_response(
+                user_text,
+                interaction_id=interaction_id,
+                rag_context=rag_context,
+                memory_context=memory_context,
+                use_convo_buffer=(llm_context_scope == "buffered"),
+            )
+        else:
+            ai_text = self.generate_response(
+                user_text,
+                interaction_id=interaction_id,
+                rag_context=rag_context,
+                memory_context=memory_context,
+                use_convo_buffer=(llm_context_scope == "buffered"),
+            )
         ai_text = re.sub(r"[^\x00-\x7F]+", "", ai_text or "")
         ai_text = self._strip_disallowed_phrases(ai_text)
         
@@ -4636,7 +5207,7 @@ class ArgoPipeline:
         self._conversation_buffer.add("Assistant", ai_text)
         self._append_convo_ledger("argo", ai_text)
 
-        if not self.stop_signal.is_set() and not replay_mode:
+        if not self.stop_signal.is_set() and not replay_mode and not stream_tts:
             tts_text = self._sanitize_tts_text(ai_text, enforce_confidence=False)
             tts_override = (overrides or {}).get("suppress_tts", False)
             if tts_override:
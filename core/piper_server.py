@@ -0,0 +1,396 @@
+"""
+Persistent Piper Synthesis Server
+
+Keeps one Piper voice warm for the lifetime of the output sink instead of
+spawning `piper --model ... --output-raw` (and reloading the ONNX model) for
+every sentence.
+
+Backends (picked at start, first that works):
+- In-process: `piper` Python package (PiperVoice), onnxruntime session kept warm
+- Process: one long-lived piper executable in `--output_dir` mode; one stdin
+  line per sentence, one WAV path per line back on stdout
+
+Sentences are submitted with synthesize(), which returns a PiperPCMStream
+immediately. A single synthesis thread fills the streams in order, so the
+caller can start playback as soon as the first chunk lands.
+
+Raw PCM is int16 mono at the voice sample rate (22050 Hz for the bundled voices).
+
+Look-ahead: callers may submit the next sentences while the current one plays.
+Buffered-but-unplayed PCM across all streams is bounded by max_buffered_bytes;
+the synthesis thread pauses when the budget is full and resumes as playback
+drains it.
+"""
+
+import os
+import sys
+import queue
+import shutil
+import logging
+import tempfile
+import threading
+import subprocess
+import wave
+from typing import Iterator, Optional
+
+from core.policy import TTS_TIMEOUT_SECONDS
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LENGTH_SCALE = 0.85
+PCM_CHUNK_BYTES = 4096
+DEFAULT_MAX_BUFFERED_BYTES = 2 * 1024 * 1024  # ~47s of 22050 Hz int16 mono
+
+
+class _PCMBudget:
+    """Shared cap on synthesized-but-unplayed PCM bytes."""
+
+    def __init__(self, max_bytes: Optional[int]):
+        self.max_bytes = max_bytes
+        self._used = 0
+        self._cond = threading.Condition()
+
+    @property
+    def used(self) -> int:
+        with self._cond:
+            return self._used
+
+    def acquire(self, nbytes: int, cancelled: threading.Event) -> bool:
+        """Block until nbytes fit (or nothing is buffered). False if cancelled while waiting."""
+        with self._cond:
+            while (
+                self.max_bytes
+                and self._used > 0
+                and self._used + nbytes > self.max_bytes
+                and not cancelled.is_set()
+            ):
+                self._cond.wait(timeout=0.05)
+            if cancelled.is_set():
+                return False
+            self._used += nbytes
+            return True
+
+    def release(self, nbytes: int) -> None:
+        if nbytes <= 0:
+            return
+        with self._cond:
+            self._used = max(0, self._used - nbytes)
+            self._cond.notify_all()
+
+
+class PiperPCMStream:
+    """
+    File-like PCM reader for one sentence.
+
+    read(n) blocks until data is available and returns b"" at end of sentence
+    or after cancel(). Compatible with PiperOutputSink._stream_and_play, which
+    only needs read().
+    """
+
+    _EOF = object()
+
+    def __init__(self, text: str, budget: Optional[_PCMBudget] = None):
+        self.text = text
+        self._chunks: queue.Queue = queue.Queue()
+        self._pending = b""
+        self._cancelled = threading.Event()
+        self._done = threading.Event()
+        self._budget = budget
+        self._buffered = 0
+        self._buffered_lock = threading.Lock()
+
+    @property
+    def buffered_bytes(self) -> int:
+        with self._buffered_lock:
+            return self._buffered
+
+    def _account(self, delta: int) -> None:
+        with self._buffered_lock:
+            if delta < 0:
+                delta = -min(-delta, self._buffered)
+            self._buffered += delta
+        if delta < 0 and self._budget is not None:
+            self._budget.release(-delta)
+
+    # Producer side (synthesis thread)
+    def _feed(self, data: bytes) -> None:
+        if not data or self._cancelled.is_set():
+            return
+        if self._budget is not None and not self._budget.acquire(len(data), self._cancelled):
+            return
+        self._account(len(data))
+        self._chunks.put(data)
+        if self._cancelled.is_set():
+            # cancel() raced with this feed; give the bytes back
+            self._account(-self._buffered)
+
+    def _finish(self) -> None:
+        self._done.set()
+        self._chunks.put(self._EOF)
+
+    # Consumer side (playback thread)
+    def read(self, size: int = -1) -> bytes:
+        while not self._pending:
+            if self._cancelled.is_set():
+                return b""
+            try:
+                item = self._chunks.get(timeout=0.05)
+            except queue.Empty:
+                continue
+            if item is self._EOF:
+                self._chunks.put(self._EOF)
+                return b""
+            self._pending = item
+        if size is None or size < 0:
+            size = len(self._pending)
+        data, self._pending = self._pending[:size], self._pending[size:]
+        self._account(-len(data))
+        return data
+
+    def cancel(self) -> None:
+        """Discard this sentence's audio (prefetched or playing) and free its budget."""
+        self._cancelled.set()
+        self._chunks.put(self._EOF)
+        self._account(-self._buffered)
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def close(self) -> None:
+        self.cancel()
+
+
+class _InProcessPiperBackend:
+    """Piper voice loaded in-process via the `piper` package (onnxruntime)."""
+
+    name = "inprocess"
+
+    def __init__(self, voice_path: str, length_scale: float):
+        from piper.voice import PiperVoice  # optional dependency
+
+        self._voice = PiperVoice.load(voice_path)
+        self._length_scale = length_scale
+        self.sample_rate = int(getattr(self._voice.config, "sample_rate", 22050))
+
+    def synthesize(self, text: str) -> Iterator[bytes]:
+        if hasattr(self._voice, "synthesize_stream_raw"):
+            # piper-tts 1.2.x
+            for audio_bytes in self._voice.synthesize_stream_raw(text, length_scale=self._length_scale):
+                yield audio_bytes
+            return
+        # piper-tts >= 1.3
+        from piper import SynthesisConfig
+
+        syn_config = SynthesisConfig(length_scale=self._length_scale)
+        for chunk in self._voice.synthesize(text, syn_config=syn_config):
+            yield chunk.audio_int16_bytes
+
+    def close(self) -> None:
+        self._voice = None
+
+
+class _ProcessPiperBackend:
+    """One long-lived piper executable; the model is loaded once at spawn."""
+
+    name = "process"
+
+    def __init__(self, piper_path: str, voice_path: str, length_scale: float):
+        if not os.path.exists(piper_path) and not shutil.which(piper_path):
+            raise ValueError(f"Piper binary not found: {piper_path}")
+        self._out_dir = tempfile.mkdtemp(prefix="argo_piper_")
+        self._proc = subprocess.Popen(
+            [
+                piper_path,
+                "--model",
+                voice_path,
+                "--output_dir",
+                self._out_dir,
+                "--length_scale",
+                str(length_scale),
+            ],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0,
+        )
+        self._paths: queue.Queue = queue.Queue()
+        self._reader = threading.Thread(target=self._read_paths, daemon=True, name="ARGO.PiperServer.stdout")
+        self._reader.start()
+        self.sample_rate = 22050
+
+    def _read_paths(self) -> None:
+        try:
+            for raw in iter(self._proc.stdout.readline, b""):
+                line = raw.decode("utf-8", errors="ignore").strip()
+                if line:
+                    self._paths.put(line)
+        except (ValueError, OSError):
+            pass
+        self._paths.put(None)
+
+    def alive(self) -> bool:
+        return self._proc is not None and self._proc.poll() is None
+
+    def synthesize(self, text: str) -> Iterator[bytes]:
+        if not self.alive():
+            raise RuntimeError("Piper server process is not running")
+        self._proc.stdin.write((text.replace("\n", " ").strip() + "\n").encode("utf-8"))
+        self._proc.stdin.flush()
+        try:
+            wav_path = self._paths.get(timeout=TTS_TIMEOUT_SECONDS)
+        except queue.Empty:
+            # A late WAV path would desync every following sentence; drop the process.
+            self.close()
+            raise TimeoutError("Piper server did not answer within TTS timeout")
+        if wav_path is None:
+            raise RuntimeError("Piper server process exited")
+        try:
+            with wave.open(wav_path, "rb") as wav:
+                self.sample_rate = wav.getframerate()
+                frames_per_chunk = PCM_CHUNK_BYTES // wav.getsampwidth()
+                while True:
+                    data = wav.readframes(frames_per_chunk)
+                    if not data:
+                        break
+                    yield data
+        finally:
+            try:
+                os.remove(wav_path)
+            except OSError:
+                pass
+
+    def close(self) -> None:
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            proc.stdin.close()
+        except Exception:
+            pass
+        try:
+            proc.terminate()
+            proc.wait(timeout=1.0)
+        except Exception:
+            try:
+                proc.kill()
+            except Exception:
+                pass
+        shutil.rmtree(self._out_dir, ignore_errors=True)
+
+
+class PiperSynthesisServer:
+    """
+    Long-lived Piper worker: sentences in over a queue, PCM streams back.
+
+    - synthesize(text) -> PiperPCMStream (non-blocking; synthesis runs on the server thread,
+      so the next sentences can be submitted while the current one plays)
+    - cancel() -> drop the current and all queued sentences (barge-in)
+    - close() -> stop the thread and release the voice
+    """
+
+    def __init__(
+        self,
+        piper_path: str,
+        voice_path: str,
+        length_scale: float = DEFAULT_LENGTH_SCALE,
+        backend=None,
+        max_buffered_bytes: Optional[int] = DEFAULT_MAX_BUFFERED_BYTES,
+    ):
+        self.piper_path = piper_path
+        self.voice_path = voice_path
+        self.length_scale = length_scale
+        self._backend = backend
+        self._budget = _PCMBudget(max_buffered_bytes)
+        self._requests: queue.Queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._active: list[PiperPCMStream] = []
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    @property
+    def backend_name(self) -> str:
+        return getattr(self._backend, "name", "none")
+
+    @property
+    def sample_rate(self) -> int:
+        return int(getattr(self._backend, "sample_rate", 22050))
+
+    def start(self) -> "PiperSynthesisServer":
+        """Load the voice once and start the synthesis thread. Raises if no backend works."""
+        if self._backend is None:
+            self._backend = self._create_backend()
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, daemon=True, name="ARGO.PiperServer")
+            self._thread.start()
+        logger.info("[PIPER_SERVER] Started (backend=%s, voice=%s)", self.backend_name, self.voice_path)
+        return self
+
+    def _create_backend(self):
+        try:
+            return _InProcessPiperBackend(self.voice_path, self.length_scale)
+        except ImportError:
+            pass
+        except Exception as e:
+            logger.warning("[PIPER_SERVER] In-process voice load failed: %s", e)
+        return _ProcessPiperBackend(self.piper_path, self.voice_path, self.length_scale)
+
+    def is_alive(self) -> bool:
+        if self._closed or self._thread is None or not self._thread.is_alive():
+            return False
+        alive = getattr(self._backend, "alive", None)
+        return alive() if callable(alive) else True
+
+    @property
+    def buffered_bytes(self) -> int:
+        return self._budget.used
+
+    def synthesize(self, text: str) -> PiperPCMStream:
+        stream = PiperPCMStream(text, budget=self._budget)
+        with self._lock:
+            self._active.append(stream)
+        self._requests.put(stream)
+        return stream
+
+    def cancel(self) -> None:
+        """Drop the sentence being synthesized and everything queued behind it."""
+        with self._lock:
+            streams, self._active = self._active, []
+        for stream in streams:
+            stream.cancel()
+
+    def close(self) -> None:
+        self._closed = True
+        self.cancel()
+        self._requests.put(None)
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+        if self._backend is not None:
+            try:
+                self._backend.close()
+            except Exception:
+                pass
+
+    def _run(self) -> None:
+        while True:
+            stream = self._requests.get()
+            if stream is None:
+                break
+            try:
+                if stream.cancelled:
+                    continue
+                for data in self._backend.synthesize(stream.text):
+                    if stream.cancelled:
+                        break
+                    stream._feed(data)
+            except Exception as e:
+                logger.error("[PIPER_SERVER] Synthesis failed: %s: %s", type(e).__name__, e)
+            finally:
+                stream._finish()
+                with self._lock:
+                    if stream in self._active:
+                        self._active.remove(stream)
@@ -45,6 +45,7 @@ from core.intent_parser import IntentType
 from system_health import get_temperature_health, get_disk_info, get_system_full_report
 from system_profile import get_system_profile, get_gpu_profile
 from core.instrumentation import log_event
+from core.sentence_split import find_sentence_boundary
 
 # ============================================================================
 # 1) PERSONALITY SUPPORT CONSTANTS
@@ -1488,15 +1489,8 @@ class LLMResponseGenerator(ResponseGenerator):
         return "".join(full_response_parts).strip()
 
     def _find_sentence_boundary(self, text: str) -> int:
-        """Return index after earliest sentence boundary (.?! + whitespace/end), or -1 if none."""
-        if not text:
-            return -1
-        for idx, ch in enumerate(text):
-            if ch in ".!?":
-                next_ch = text[idx + 1] if idx + 1 < len(text) else ""
-                if next_ch == "" or next_ch.isspace():
-                    return idx + 1
-        return -1
+        """Return index after earliest sentence boundary (shared rule in core/sentence_split.py), or -1 if none."""
+        return find_sentence_boundary(text)
 
     def _apply_inline_governor(self, sentence: str, first_sentence: bool) -> Optional[str]:
         """
@@ -0,0 +1,63 @@
+"""
+Sentence Splitting for Streamed LLM Text
+
+The one sentence-boundary rule every streaming path uses, so the pipeline's
+sentence-by-sentence TTS and ResponseGenerator's streaming sink cut text in
+the same places.
+
+- find_sentence_boundary(): index just past the earliest sentence end in a
+  buffer, or -1 while the sentence may still be growing
+- cut_sentences(): peel complete sentences off the front of a buffer,
+  hard-cutting run-on text so TTS never starves
+
+A boundary is . ! ? followed by whitespace. End of buffer is not a boundary:
+a streamed "3." may still become "3.14", so callers flush the remainder
+themselves when the stream ends. A period after a common abbreviation
+("Dr.", "e.g.") or a single initial ("J. R. R.") is not a boundary either.
+"""
+
+import re
+
+_BOUNDARY = re.compile(r"[.!?](?=\s)")
+
+_ABBREVIATIONS = frozenset({
+    "mr", "mrs", "ms", "dr", "prof", "sr", "jr", "st", "vs", "approx", "e.g", "i.e",
+})
+"""Lower-cased words (without the final period) whose period does not end a sentence."""
+
+
+def _is_abbreviation(text: str, period: int) -> bool:
+    words = text[:period].split()
+    word = words[-1].lstrip("\"'([").lower() if words else ""
+    return word in _ABBREVIATIONS or (len(word) == 1 and word.isalpha())
+
+
+def find_sentence_boundary(text: str) -> int:
+    """Return index after the earliest sentence boundary, or -1 if none yet."""
+    for match in _BOUNDARY.finditer(text or ""):
+        if match.group() == "." and _is_abbreviation(text, match.start()):
+            continue
+        return match.end()
+    return -1
+
+
+def cut_sentences(buffer: str, max_chars: int = 150) -> tuple[list[str], str]:
+    """
+    Cut complete sentences off the front of a streaming buffer.
+    Run-on text is hard-cut at max_chars (on a word boundary when possible).
+    Returns (sentences, remainder).
+    """
+    sentences = []
+    while buffer:
+        cut = find_sentence_boundary(buffer)
+        if cut == -1:
+            if len(buffer) < max_chars:
+                break
+            cut = buffer.rfind(" ", 0, max_chars)
+            if cut <= 0:
+                cut = max_chars
+        sentence = buffer[:cut].strip()
+        buffer = buffer[cut:].lstrip()
+        if sentence:
+            sentences.append(sentence)
+    return sentences, buffer
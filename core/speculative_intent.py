@@ -0,0 +1,194 @@
+"""
+Speculative Intent Dispatch
+
+Runs RuleBasedIntentParser on partial STT hypotheses while the user is still
+speaking and fires a small set of canonical, reversible commands early
+(MUSIC_STOP, MUSIC_NEXT, VOLUME_CONTROL) instead of waiting for VAD end plus
+the final decode.
+
+Policy:
+- Only the stable prefix of a partial is considered (two hypotheses agree);
+  "fast" intents (default: MUSIC_STOP) may also fire on the whole hypothesis
+  when it is a complete short command, since a wrong stop is cheap to undo;
+  when the pipeline reports it can't undo an intent exactly (e.g. the music
+  position is unknown), that intent waits for a stable prefix too
+- Short utterances only (max_words) and confidence >= min_confidence
+- At most one speculative action per utterance
+- At VAD end the final transcript is parsed again: same intent and same
+  command signature -> confirmed (not executed twice); otherwise the action's
+  rollback runs and the final transcript is routed normally
+
+Execution and rollback are supplied by the pipeline (executor callback), so
+this module has no side effects of its own.
+"""
+
+# ============================================================================
+# 1) IMPORTS
+# ============================================================================
+import logging
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+from core.intent_parser import Intent, IntentType, RuleBasedIntentParser
+
+logger = logging.getLogger("ARGO.Speculative")
+
+SPECULATIVE_INTENTS = frozenset({IntentType.MUSIC_STOP, IntentType.MUSIC_NEXT, IntentType.VOLUME_CONTROL})
+
+OUTCOME_NONE = "none"
+OUTCOME_CONFIRMED = "confirmed"
+OUTCOME_ROLLED_BACK = "rolled_back"
+
+
+# ============================================================================
+# 2) ACTION RECORD
+# ============================================================================
+@dataclass
+class SpeculativeAction:
+    """A command executed before end-of-speech, with the means to undo it."""
+
+    intent_type: IntentType
+    text: str
+    signature: Any = None
+    response: Optional[str] = None
+    rollback: Optional[Callable[[], None]] = None
+    fired_at: float = field(default_factory=time.monotonic)
+    audio_s: float = 0.0
+
+
+# ============================================================================
+# 3) DISPATCHER
+# ============================================================================
+class SpeculativeIntentDispatcher:
+    """
+    One dispatcher per captured utterance.
+
+    executor(intent, text) -> SpeculativeAction | None
+        Performs the command now; returns None if it declined (e.g. no music playing).
+    signature(intent, text) -> hashable
+        Identifies the concrete command (e.g. volume +5 vs set 30) for confirmation.
+    exact_rollback(intent) -> bool
+        False when undoing the intent right now would lose state; such intents
+        only fire on a stable prefix, never on the fast whole-hypothesis path.
+    """
+
+    def __init__(
+        self,
+        executor: Callable[[Intent, str], Optional[SpeculativeAction]],
+        signature: Optional[Callable[[Intent, str], Any]] = None,
+        exact_rollback: Optional[Callable[[Intent], bool]] = None,
+        parser: Optional[RuleBasedIntentParser] = None,
+        intents=SPECULATIVE_INTENTS,
+        fast_intents=frozenset({IntentType.MUSIC_STOP}),
+        max_words: int = 4,
+        min_confidence: float = 1.0,
+        interaction_id: str = "",
+    ):
+        self._executor = executor
+        self._signature = signature or (lambda intent, text: intent.intent_type)
+        self._exact_rollback = exact_rollback or (lambda intent: True)
+        self._parser = parser or RuleBasedIntentParser()
+        self._intents = frozenset(intents)
+        self._fast_intents = frozenset(fast_intents) & self._intents
+        self._max_words = max_words
+        self._min_confidence = min_confidence
+        self.interaction_id = interaction_id
+        self._lock = threading.Lock()
+        self._closed = False
+        self.action: Optional[SpeculativeAction] = None
+
+    @staticmethod
+    def _clean(text: str) -> str:
+        # Whisper punctuates even partial hypotheses ("Stop.", "Next,")
+        return (text or "").strip().rstrip(".,!?;:").strip()
+
+    def _parse(self, text: str) -> Optional[Intent]:
+        text = self._clean(text)
+        if not text or len(re.findall(r"[A-Za-z0-9']+", text)) > self._max_words:
+            return None
+        try:
+            return self._parser.parse(text)
+        except ValueError:
+            return None
+
+    def _candidate(self, partial) -> Optional[tuple]:
+        intent = self._parse(partial.stable)
+        if intent is not None and intent.intent_type in self._intents:
+            return intent, self._clean(partial.stable)
+        if self._fast_intents:
+            full = self._clean(partial.text)
+            intent = self._parse(full)
+            if intent is not None and intent.intent_type in self._fast_intents and self._exact_rollback(intent):
+                return intent, full
+        return None
+
+    def on_partial(self, partial) -> Optional[SpeculativeAction]:
+        """Feed a PartialTranscript; fires at most once per utterance."""
+        with self._lock:
+            if self._closed or self.action is not None:
+                return None
+            candidate = self._candidate(partial)
+            if candidate is None:
+                return None
+            intent, text = candidate
+            if (intent.confidence or 0.0) < self._min_confidence:
+                return None
+            try:
+                action = self._executor(intent, text)
+            except Exception as e:
+                logger.warning(f"[SPECULATIVE] Executor failed for {intent.intent_type.value}: {e}")
+                return None
+            if action is None:
+                return None
+            if action.signature is None:
+                action.signature = self._signature(intent, text)
+            action.audio_s = float(getattr(partial, "audio_s", 0.0) or 0.0)
+            self.action = action
+            logger.info(f"[SPECULATIVE] Fired {intent.intent_type.value} on partial '{text}'")
+            return action
+
+    def reconcile(self, final_text: str) -> tuple:
+        """
+        Compare the final transcript with the speculative action.
+
+        Returns (outcome, action): OUTCOME_NONE when nothing fired,
+        OUTCOME_CONFIRMED when the final command matches, OUTCOME_ROLLED_BACK
+        after undoing a mismatched action.
+        """
+        with self._lock:
+            self._closed = True
+            action = self.action
+        if action is None:
+            return OUTCOME_NONE, None
+        final_text = self._clean(final_text)
+        try:
+            final = self._parser.parse(final_text) if final_text else None
+        except ValueError:
+            final = None
+        if final is not None and final.intent_type == action.intent_type:
+            if self._signature(final, final_text) == action.signature:
+                logger.info(f"[SPECULATIVE] Confirmed {action.intent_type.value} by final '{final_text}'")
+                return OUTCOME_CONFIRMED, action
+        self._rollback(action, final_text)
+        return OUTCOME_ROLLED_BACK, action
+
+    def abandon(self) -> Optional[SpeculativeAction]:
+        """Utterance dropped without a final transcript: undo anything that fired."""
+        with self._lock:
+            self._closed = True
+            action = self.action
+        if action is not None:
+            self._rollback(action, "")
+        return action
+
+    def _rollback(self, action: SpeculativeAction, final_text: str) -> None:
+        logger.info(f"[SPECULATIVE] Rolling back {action.intent_type.value} (final='{final_text}')")
+        if action.rollback is None:
+            return
+        try:
+            action.rollback()
+        except Exception as e:
+            logger.warning(f"[SPECULATIVE] Rollback of {action.intent_type.value} failed: {e}")
@@ -69,8 +69,10 @@ class WhisperSTT(SpeechToText):
 
         self.whisper = whisper
         # Load base model (reasonable size, reasonable accuracy)
-        # Hardcoded for predictability
-        self.model = whisper.load_model("base")
+        # Hardcoded for predictability; shared with other "base" users
+        from core.model_registry import get_model_registry
+        self._model_handle = get_model_registry().acquire("openai", "base")
+        self.model = self._model_handle.model
         self.last_metrics = None
 
     def transcribe(self, audio_data: bytes, sample_rate: int) -> str:
@@ -0,0 +1,210 @@
+"""
+STARTUP ORCHESTRATOR
+
+Runs startup steps as a dependency graph instead of one after another.
+
+- StartupTask: a named callable plus the task names it depends on
+- StartupOrchestrator.start(): every task whose dependencies have finished
+  runs on a thread pool (by default one thread per task, so a ready task
+  never waits behind another), so independent steps (audio, Ollama probe,
+  music DB status, STT load) overlap and start-to-ready time follows the
+  critical path rather than the sum. Ready tasks are submitted in
+  declaration order: list the critical path first
+- wait_for(names): block until a subset is ready (e.g. the minimum needed to
+  start listening) while the rest keeps going in the background
+- on_event receives {"task", "state", "ms"} on every transition
+  (running / ready / failed / skipped) for the UI
+
+A task whose dependency failed or was skipped is skipped. A failed required
+task makes wait_for() raise StartupError; optional tasks only log.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+QUEUED = "queued"
+RUNNING = "running"
+READY = "ready"
+FAILED = "failed"
+SKIPPED = "skipped"
+
+_DONE = (READY, FAILED, SKIPPED)
+
+
+class StartupError(RuntimeError):
+    """A required startup task failed (or was skipped because a dependency did)."""
+
+    def __init__(self, task: str, error: Optional[BaseException]):
+        self.task = task
+        self.error = error
+        super().__init__(f"Startup task '{task}' failed: {error}" if error else f"Startup task '{task}' skipped")
+
+
+@dataclass
+class StartupTask:
+    name: str
+    fn: Callable[[], object]
+    deps: Sequence[str] = ()
+    required: bool = True
+    # Filled in while running
+    state: str = field(default=PENDING, init=False)
+    result: object = field(default=None, init=False)
+    error: Optional[BaseException] = field(default=None, init=False)
+    elapsed_ms: float = field(default=0.0, init=False)
+
+
+class StartupOrchestrator:
+    """Run StartupTasks concurrently in dependency order."""
+
+    def __init__(
+        self,
+        tasks: Iterable[StartupTask],
+        max_workers: Optional[int] = None,
+        on_event: Optional[Callable[[Dict], None]] = None,
+    ):
+        self.tasks: Dict[str, StartupTask] = {}
+        for task in tasks:
+            if task.name in self.tasks:
+                raise ValueError(f"Duplicate startup task: {task.name}")
+            self.tasks[task.name] = task
+        for task in self.tasks.values():
+            missing = [dep for dep in task.deps if dep not in self.tasks]
+            if missing:
+                raise ValueError(f"Startup task '{task.name}' depends on unknown task(s): {', '.join(missing)}")
+        self._check_acyclic()
+        self._on_event = on_event
+        self._max_workers = max(1, max_workers if max_workers is not None else len(self.tasks))
+        self._cond = threading.Condition()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._started_at = 0.0
+
+    def _check_acyclic(self) -> None:
+        visiting, done = set(), set()
+
+        def visit(name: str, path: Tuple[str, ...]) -> None:
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Startup task cycle: {' -> '.join(path + (name,))}")
+            visiting.add(name)
+            for dep in self.tasks[name].deps:
+                visit(dep, path + (name,))
+            visiting.discard(name)
+            done.add(name)
+
+        for name in self.tasks:
+            visit(name, ())
+
+    # ------------------------------------------------------------------
+    # Running
+    # ------------------------------------------------------------------
+    def start(self) -> "StartupOrchestrator":
+        """Begin running tasks (returns immediately)."""
+        self._started_at = time.perf_counter()
+        self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="ARGO.Startup")
+        with self._cond:
+            self._schedule()
+        return self
+
+    def _emit(self, task: StartupTask) -> None:
+        if self._on_event is None:
+            return
+        try:
+            self._on_event({"task": task.name, "state": task.state, "ms": round(task.elapsed_ms, 1)})
+        except Exception as e:
+            logger.debug(f"[STARTUP] Event callback failed: {e}")
+
+    def _schedule(self) -> None:
+        """Start or skip every pending task whose dependencies are done. Caller holds _cond."""
+        changed = True
+        while changed:
+            changed = False
+            for task in self.tasks.values():
+                if task.state != PENDING:
+                    continue
+                deps = [self.tasks[dep] for dep in task.deps]
+                if any(dep.state in (FAILED, SKIPPED) for dep in deps):
+                    task.state = SKIPPED
+                    logger.warning(f"[STARTUP] {task.name} skipped (dependency unavailable)")
+                    self._emit(task)
+                    changed = True
+                elif all(dep.state == READY for dep in deps):
+                    task.state = QUEUED  # "running" is reported once a worker picks it up
+                    self._executor.submit(self._run, task)
+        if all(task.state in _DONE for task in self.tasks.values()):
+            self._executor.shutdown(wait=False)
+        self._cond.notify_all()
+
+    def _run(self, task: StartupTask) -> None:
+        with self._cond:
+            task.state = RUNNING
+            self._emit(task)
+        start = time.perf_counter()
+        try:
+            result = task.fn()
+            error = None
+        except BaseException as e:  # surfaced through wait_for / the event
+            result, error = None, e
+        with self._cond:
+            task.elapsed_ms = (time.perf_counter() - start) * 1000
+            task.result = result
+            task.error = error
+            task.state = FAILED if error is not None else READY
+            if error is not None:
+                log = logger.error if task.required else logger.warning
+                log(f"[STARTUP] {task.name} failed after {task.elapsed_ms:.0f}ms: {error}")
+            else:
+                logger.info(f"[STARTUP] {task.name} ready in {task.elapsed_ms:.0f}ms")
+            self._emit(task)
+            self._schedule()
+
+    # ------------------------------------------------------------------
+    # Waiting
+    # ------------------------------------------------------------------
+    def wait_for(self, names: Iterable[str], timeout: Optional[float] = None) -> Dict[str, object]:
+        """
+        Block until the named tasks (and so their dependencies) are done.
+
+        Returns:
+            {name: result}
+
+        Raises:
+            StartupError: One of them failed or was skipped and is required
+            TimeoutError: Not done within timeout
+        """
+        names = list(names)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while not all(self.tasks[name].state in _DONE for name in names):
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    pending = [n for n in names if self.tasks[n].state not in _DONE]
+                    raise TimeoutError(f"Startup tasks not ready: {', '.join(pending)}")
+                self._cond.wait(remaining)
+            for name in names:
+                task = self.tasks[name]
+                if task.state != READY and task.required:
+                    raise StartupError(name, task.error)
+            return {name: self.tasks[name].result for name in names}
+
+    def wait_all(self, timeout: Optional[float] = None) -> Dict[str, object]:
+        return self.wait_for(self.tasks, timeout=timeout)
+
+    def timings(self) -> List[Dict]:
+        """Per-task state and duration, in declaration order."""
+        with self._cond:
+            return [
+                {"task": t.name, "state": t.state, "ms": round(t.elapsed_ms, 1), "deps": list(t.deps)}
+                for t in self.tasks.values()
+            ]
+
+    @property
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self._started_at) * 1000 if self._started_at else 0.0
@@ -0,0 +1,407 @@
+"""
+STT CALIBRATION
+
+Benchmarks the STT configurations this machine can run and writes the fastest
+one that is still accurate enough into config.json's speech_to_text section.
+
+- Reference set: audio/stt_reference/manifest.json lists short command clips
+  and their transcripts. The clips must be real recordings (your voice, your
+  mic, your room): synthesized speech is clean enough that every model scores
+  well and the smallest one always wins. Record them once with --record, or
+  drop in 16 kHz mono WAVs of the same text; calibration refuses to run while
+  any clip is missing
+- Candidates: every installed engine x model x compute_type x cpu_threads x
+  num_workers in the grid (faster-whisper: int8 and float32 by default;
+  openai-whisper: FP32 only)
+- Each candidate loads through STTEngineManager (the same path the pipeline
+  uses), decodes one clip to warm up, then every clip through
+  transcribe_batch(), the path STTService uses at runtime (faster-whisper
+  decodes num_workers clips at once there; transcribe() would serialize them).
+  Clips get the capture loop's input normalization and the pipeline's decode
+  options (live_decode_kwargs: greedy beam on faster-whisper, the configured
+  initial_prompt), so the numbers match what a live utterance costs.
+  Reported: real-time factor (decode wall time / audio time; lower is faster),
+  word error rate against the transcripts, and load time
+- Winner: lowest RTF with WER <= --max-wer and RTF < 1. Nothing is written if
+  no candidate qualifies
+
+Usage:
+    python -m core.stt_calibration --record          # first run: record clips
+    python -m core.stt_calibration                   # benchmark + write config.json
+    python -m core.stt_calibration --models tiny base --max-wer 0.1 --dry-run --json results.json
+"""
+
+import argparse
+import itertools
+import json
+import logging
+import os
+import re
+import sys
+import time
+import wave
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+REFERENCE_DIR = ROOT / "audio" / "stt_reference"
+CONFIG_PATH = ROOT / "config.json"
+SAMPLE_RATE = 16000
+
+DEFAULT_MODELS = ("tiny", "base", "small")
+DEFAULT_COMPUTE_TYPES = ("int8", "float32")
+DEFAULT_MAX_WER = 0.15
+
+logger = logging.getLogger("STT_CALIBRATION")
+
+
+@dataclass(frozen=True)
+class STTCandidate:
+    engine: str
+    model: str
+    compute_type: Optional[str] = None
+    cpu_threads: int = 0
+    num_workers: int = 1
+
+    def config(self) -> Dict:
+        """speech_to_text keys for this candidate."""
+        return {
+            "engine": self.engine,
+            "model": self.model,
+            "device": "cpu",
+            "compute_type": self.compute_type,
+            "cpu_threads": self.cpu_threads,
+            "num_workers": self.num_workers,
+        }
+
+
+@dataclass
+class ReferenceClip:
+    name: str
+    text: str
+    audio: np.ndarray
+
+    @property
+    def duration_s(self) -> float:
+        return len(self.audio) / SAMPLE_RATE
+
+
+# ============================================================================
+# Word error rate
+# ============================================================================
+def _words(text: str) -> List[str]:
+    return re.sub(r"[^a-z0-9' ]+", " ", text.lower()).split()
+
+
+def word_errors(reference: str, hypothesis: str) -> int:
+    """Word-level edit distance (substitutions + insertions + deletions)."""
+    ref, hyp = _words(reference), _words(hypothesis)
+    row = list(range(len(hyp) + 1))
+    for i, ref_word in enumerate(ref, 1):
+        prev, row[0] = row[0], i
+        for j, hyp_word in enumerate(hyp, 1):
+            prev, row[j] = row[j], min(row[j] + 1, row[j - 1] + 1, prev + (ref_word != hyp_word))
+    return row[-1]
+
+
+def word_error_rate(references: Sequence[str], hypotheses: Sequence[str]) -> float:
+    """Corpus WER: total word errors over total reference words."""
+    total = sum(len(_words(ref)) for ref in references)
+    errors = sum(word_errors(ref, hyp) for ref, hyp in zip(references, hypotheses))
+    return errors / total if total else 0.0
+
+
+# ============================================================================
+# Reference clips
+# ============================================================================
+def _resample(samples: np.ndarray, rate: int) -> np.ndarray:
+    if rate == SAMPLE_RATE or not len(samples):
+        return samples.astype(np.float32)
+    positions = np.arange(0, len(samples) * SAMPLE_RATE / rate) * rate / SAMPLE_RATE
+    return np.interp(positions, np.arange(len(samples)), samples).astype(np.float32)
+
+
+def read_wav(path: Path) -> np.ndarray:
+    """16 kHz mono float32 samples from a 16-bit PCM WAV."""
+    with wave.open(str(path), "rb") as wav:
+        rate, channels = wav.getframerate(), wav.getnchannels()
+        samples = np.frombuffer(wav.readframes(wav.getnframes()), dtype=np.int16).astype(np.float32) / 32768.0
+    if channels > 1:
+        samples = samples.reshape(-1, channels).mean(axis=1)
+    return _resample(samples, rate)
+
+
+def write_wav(path: Path, samples: np.ndarray) -> None:
+    pcm = (np.clip(samples, -1.0, 1.0) * 32767).astype(np.int16)
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(SAMPLE_RATE)
+        wav.writeframes(pcm.tobytes())
+
+
+def _manifest(reference_dir: Path) -> Dict:
+    return json.loads((reference_dir / "manifest.json").read_text(encoding="utf-8"))
+
+
+def missing_reference_clips(reference_dir: Path = REFERENCE_DIR) -> List[str]:
+    """Manifest clips that haven't been recorded yet."""
+    return [entry["file"] for entry in _manifest(reference_dir)["clips"] if not (reference_dir / entry["file"]).exists()]
+
+
+def load_reference_clips(reference_dir: Path = REFERENCE_DIR) -> List[ReferenceClip]:
+    """
+    Every clip in the manifest.
+
+    Raises:
+        FileNotFoundError: Some clips haven't been recorded (a partial set
+            would score WER on a different sample than the next machine)
+    """
+    missing = missing_reference_clips(reference_dir)
+    if missing:
+        raise FileNotFoundError(
+            f"{len(missing)} reference clip(s) missing in {reference_dir}: {', '.join(missing)}. "
+            "Record them with `python -m core.stt_calibration --record` or add 16 kHz mono WAVs "
+            "of your own voice reading the manifest text"
+        )
+    return [
+        ReferenceClip(entry["file"], entry["text"], read_wav(reference_dir / entry["file"]))
+        for entry in _manifest(reference_dir)["clips"]
+    ]
+
+
+def record_reference_clips(reference_dir: Path = REFERENCE_DIR, overwrite: bool = False, device=None) -> int:
+    """Prompt for and record each missing clip from the microphone. Returns how many were written."""
+    import sounddevice as sd
+
+    written = 0
+    for entry in _manifest(reference_dir)["clips"]:
+        path = reference_dir / entry["file"]
+        if path.exists() and not overwrite:
+            continue
+        # Half a second lead-in plus ~0.5s per word, like a real utterance after VAD
+        seconds = 1.5 + 0.5 * len(_words(entry["text"]))
+        input(f'Press Enter, then say: "{entry["text"]}" ({seconds:.1f}s)')
+        samples = sd.rec(int(seconds * SAMPLE_RATE), samplerate=SAMPLE_RATE, channels=1, dtype="float32", device=device)
+        sd.wait()
+        write_wav(path, samples.reshape(-1))
+        written += 1
+    return written
+
+
+# ============================================================================
+# Candidates and benchmarking
+# ============================================================================
+def available_engines() -> List[str]:
+    engines = []
+    for engine, module in (("faster", "faster_whisper"), ("openai", "whisper")):
+        try:
+            __import__(module)
+            engines.append(engine)
+        except ImportError:
+            pass
+    return engines
+
+
+def default_thread_counts() -> List[int]:
+    cores = os.cpu_count() or 1
+    return sorted({max(1, cores // 2), cores})
+
+
+def candidate_grid(
+    engines: Iterable[str],
+    models: Sequence[str] = DEFAULT_MODELS,
+    compute_types: Sequence[str] = DEFAULT_COMPUTE_TYPES,
+    cpu_threads: Sequence[int] = (),
+    num_workers: Sequence[int] = (1,),
+) -> List[STTCandidate]:
+    """Every combination to try (openai-whisper has no compute_type or workers)."""
+    threads = list(cpu_threads) or default_thread_counts()
+    candidates = []
+    for engine in engines:
+        if engine == "faster":
+            for model, compute_type, count, workers in itertools.product(models, compute_types, threads, num_workers):
+                candidates.append(STTCandidate(engine, model, compute_type, count, workers))
+        elif engine == "openai":
+            for model, count in itertools.product(models, threads):
+                candidates.append(STTCandidate(engine, model, None, count, 1))
+    return candidates
+
+
+def runtime_initial_prompt(config_path: Path = CONFIG_PATH) -> str:
+    """The initial_prompt the pipeline decodes with (speech_to_text.prompt_profile, resolved like ArgoPipeline)."""
+    from core.config import read_config
+
+    config = read_config(str(config_path))
+    profile = str(config.get("speech_to_text.prompt_profile", "general"))
+    profiles = config.get("speech_to_text.initial_prompt_profiles", {}) or {}
+    return str(profiles.get(profile, ""))
+
+
+def _manager_for(candidate: STTCandidate):
+    from core.stt_engine_manager import STTEngineManager
+
+    return STTEngineManager(
+        engine=candidate.engine,
+        model_size=candidate.model,
+        device="cpu",
+        compute_type=candidate.compute_type,
+        cpu_threads=candidate.cpu_threads,
+        num_workers=candidate.num_workers,
+    )
+
+
+def benchmark_candidate(
+    candidate: STTCandidate,
+    clips: Sequence[ReferenceClip],
+    manager_factory: Callable[[STTCandidate], object] = _manager_for,
+    initial_prompt: str = "",
+) -> Dict:
+    """Load, warm up and decode every clip. Returns the result row (error set on failure)."""
+    from core.stt_engine_manager import live_decode_kwargs, normalize_input_level
+
+    row = dict(asdict(candidate), rtf=None, wer=None, load_ms=None, error=None)
+    start = time.perf_counter()
+    try:
+        manager = manager_factory(candidate)
+    except Exception as e:
+        row["error"] = str(e)
+        return row
+    row["load_ms"] = round((time.perf_counter() - start) * 1000, 1)
+
+    decode_kwargs = live_decode_kwargs(candidate.engine, initial_prompt)
+    audios = [normalize_input_level(clip.audio) for clip in clips]
+
+    def decode(batch: Sequence[np.ndarray]) -> List[str]:
+        texts = []
+        for result in manager.transcribe_batch(list(batch), language="en", **decode_kwargs):
+            if isinstance(result, Exception):
+                raise result
+            texts.append(result.get("text", ""))
+        return texts
+
+    try:
+        decode(audios[:1])  # warm-up
+        start = time.perf_counter()
+        hypotheses = decode(audios)
+        wall_s = time.perf_counter() - start
+    except Exception as e:
+        row["error"] = str(e)
+        return row
+    finally:
+        close = getattr(manager, "close", None)
+        if callable(close):
+            close()
+
+    row["rtf"] = round(wall_s / sum(clip.duration_s for clip in clips), 4)
+    row["wer"] = round(word_error_rate([clip.text for clip in clips], hypotheses), 4)
+    row["hypotheses"] = hypotheses
+    return row
+
+
+def pick_best(rows: Sequence[Dict], max_wer: float = DEFAULT_MAX_WER) -> Optional[Dict]:
+    """Fastest row with WER <= max_wer and real-time factor < 1 (ties: smaller model first)."""
+    order = {name: i for i, name in enumerate(("tiny", "base", "small", "medium", "large"))}
+    eligible = [r for r in rows if r.get("error") is None and r["wer"] <= max_wer and r["rtf"] < 1.0]
+    if not eligible:
+        return None
+    return min(eligible, key=lambda r: (r["rtf"], order.get(r["model"], 99)))
+
+
+def calibrate(
+    clips: Sequence[ReferenceClip],
+    candidates: Sequence[STTCandidate],
+    max_wer: float = DEFAULT_MAX_WER,
+    manager_factory: Callable[[STTCandidate], object] = _manager_for,
+    initial_prompt: str = "",
+) -> Dict:
+    """Benchmark every candidate. Returns {"results": [...], "best": row or None}."""
+    rows = []
+    for candidate in candidates:
+        logger.info(f"[STT_CALIBRATION] {candidate}")
+        row = benchmark_candidate(candidate, clips, manager_factory, initial_prompt)
+        if row["error"]:
+            logger.warning(f"[STT_CALIBRATION]   failed: {row['error']}")
+        else:
+            logger.info(f"[STT_CALIBRATION]   rtf={row['rtf']:.3f} wer={row['wer']:.3f} load={row['load_ms']:.0f}ms")
+        rows.append(row)
+    return {"results": rows, "best": pick_best(rows, max_wer)}
+
+
+def write_stt_config(best: Dict, config_path: Path = CONFIG_PATH, max_wer: float = DEFAULT_MAX_WER) -> Dict:
+    """Merge the winner into config.json's speech_to_text section (other keys untouched)."""
+    data = {}
+    if config_path.exists():
+        data = json.loads(config_path.read_text(encoding="utf-8"))
+    section = data.setdefault("speech_to_text", {})
+    section.update(STTCandidate(**{k: best[k] for k in STTCandidate.__dataclass_fields__}).config())
+    section["calibration"] = {
+        "rtf": best["rtf"],
+        "wer": best["wer"],
+        "max_wer": max_wer,
+        "cpu_count": os.cpu_count(),
+        "calibrated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+    }
+    config_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    return section
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark STT configurations and write the best to config.json")
+    parser.add_argument("--engines", nargs="+", default=None, help="Engines to try (default: all installed)")
+    parser.add_argument("--models", nargs="+", default=list(DEFAULT_MODELS))
+    parser.add_argument("--compute-types", nargs="+", default=list(DEFAULT_COMPUTE_TYPES))
+    parser.add_argument("--cpu-threads", nargs="+", type=int, default=[], help="Default: half and all cores")
+    parser.add_argument("--num-workers", nargs="+", type=int, default=[1])
+    parser.add_argument("--max-wer", type=float, default=DEFAULT_MAX_WER, help="Accuracy floor (corpus WER)")
+    parser.add_argument("--reference-dir", default=str(REFERENCE_DIR))
+    parser.add_argument("--config", default=str(CONFIG_PATH), help="config.json to update")
+    parser.add_argument("--record", action="store_true", help="Record missing reference clips from the microphone first")
+    parser.add_argument("--dry-run", action="store_true", help="Report only; don't write config.json")
+    parser.add_argument("--json", dest="json_out", default=None, help="Optional path to write results JSON")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    reference_dir = Path(args.reference_dir)
+    if args.record:
+        print(f"Recorded {record_reference_clips(reference_dir)} reference clip(s)")
+    try:
+        clips = load_reference_clips(reference_dir)
+    except FileNotFoundError as e:
+        print(e)
+        return 1
+
+    engines = args.engines or available_engines()
+    candidates = candidate_grid(engines, args.models, args.compute_types, args.cpu_threads, args.num_workers)
+    if not candidates:
+        print("No STT engine installed (pip install faster-whisper or openai-whisper)")
+        return 1
+
+    results = calibrate(clips, candidates, max_wer=args.max_wer, initial_prompt=runtime_initial_prompt(Path(args.config)))
+    for row in sorted(results["results"], key=lambda r: (r["rtf"] is None, r["rtf"] or 0)):
+        if row["error"]:
+            print(f"  FAILED  {row['engine']:7} {row['model']:6} {row['compute_type']!s:8} t={row['cpu_threads']} w={row['num_workers']}: {row['error']}")
+        else:
+            print(
+                f"  rtf={row['rtf']:.3f} wer={row['wer']:.3f}  {row['engine']:7} {row['model']:6} "
+                f"{row['compute_type']!s:8} t={row['cpu_threads']} w={row['num_workers']}"
+            )
+    if args.json_out:
+        Path(args.json_out).write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+    best = results["best"]
+    if best is None:
+        print(f"No configuration met WER <= {args.max_wer} in real time; config.json unchanged")
+        return 1
+    print(f"Best: {STTCandidate(**{k: best[k] for k in STTCandidate.__dataclass_fields__})}")
+    if not args.dry_run:
+        write_stt_config(best, Path(args.config), args.max_wer)
+        print(f"Wrote speech_to_text to {args.config}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,13 +9,24 @@ Supported Engines:
 
 No automatic fallback. No dynamic switching. One engine per session.
 Engine choice is explicit and logged.
+
+Models come from the shared model registry (core/model_registry.py): managers
+with the same engine/model/device share one loaded instance and its lock.
 """
 
 import logging
+import threading
+import time
 import numpy as np
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
 from dataclasses import dataclass
 
+from core.model_registry import get_model_registry
+
+MIC_INPUT_GAIN = 1.8
+"""Boost openai-whisper applies to live-mic audio. File input passes input_gain=1.0."""
+
 
 @dataclass
 class STTSegment:
@@ -60,13 +71,59 @@ def verify_engine_dependencies(engine: str) -> None:
             )
 
 
+def engine_model_name(engine: str, model_size: str) -> str:
+    """Model name an engine loads for a configured size (faster-whisper uses the .en variants)."""
+    return f"{model_size}.en" if engine == "faster" else model_size
+
+
+def live_decode_kwargs(engine: str, initial_prompt: Optional[str] = None) -> dict:
+    """
+    Decode options for live utterances (pipeline queue, incremental windows
+    and calibration): greedy, unconditioned decoding on faster-whisper.
+    """
+    return {
+        "beam_size": 1 if engine == "faster" else None,
+        "condition_on_previous_text": False if engine == "faster" else None,
+        "initial_prompt": initial_prompt or None,
+    }
+
+
+def normalize_input_level(audio: np.ndarray) -> np.ndarray:
+    """Scale a quiet utterance so its peak sits at 0.9 (the capture loop's input normalization)."""
+    peak = float(np.max(np.abs(audio))) if audio.size else 0.0
+    if 0.01 < peak < 0.85:
+        return audio * (0.9 / peak)
+    return audio
+
+
+def preload_engine_model(engine: str = "openai", model_size: str = "base", device: str = "cpu", **tuning):
+    """
+    Load the model an STTEngineManager with these settings will use, on the calling thread.
+
+    tuning: compute_type / cpu_threads / num_workers, as passed to the manager.
+
+    main.py calls this before any other thread starts (see core/model_registry.py
+    for why the first native load stays on the main thread). Returns the model;
+    the manager created later picks up the same instance instead of loading its own.
+    """
+    return get_model_registry().load(engine, engine_model_name(engine, model_size), device=device, **tuning)
+
+
 class STTEngineManager:
     """Centralized STT engine initialization and selection."""
 
     SUPPORTED_ENGINES = ["openai", "faster"]
     DEFAULT_ENGINE = "openai"
 
-    def __init__(self, engine: str = DEFAULT_ENGINE, model_size: str = "base", device: str = "cpu"):
+    def __init__(
+        self,
+        engine: str = DEFAULT_ENGINE,
+        model_size: str = "base",
+        device: str = "cpu",
+        compute_type: Optional[str] = None,
+        cpu_threads: int = 0,
+        num_workers: int = 1,
+    ):
         """
         Initialize STT engine manager.
 
@@ -74,6 +131,9 @@ class STTEngineManager:
             engine: "openai" or "faster"
             model_size: Model size ("tiny", "base", "small", "medium", "large")
             device: "cpu" or "cuda"
+            compute_type: faster-whisper/CTranslate2 type (None = int8 on CPU, float16 on CUDA)
+            cpu_threads: Inference threads (0 = engine default)
+            num_workers: faster-whisper workers for concurrent transcriptions
 
         Raises:
             ValueError: If engine is not supported
@@ -87,8 +147,16 @@ class STTEngineManager:
         self.engine = engine
         self.model_size = model_size
         self.device = device
+        self.compute_type = compute_type
+        self.cpu_threads = int(cpu_threads or 0)
+        self.num_workers = max(1, int(num_workers or 1))
         self.model = None
         self.logger = logging.getLogger("STT_ENGINE")
+        # Whisper models are not safe to call from two threads at once
+        # (incremental windows run on a worker thread during capture);
+        # replaced by the shared model's lock once loaded
+        self._model_lock = threading.Lock()
+        self._model_handle = None
 
         self._load_engine()
 
@@ -102,7 +170,7 @@ class STTEngineManager:
     def _load_openai_whisper(self):
         """Load openai-whisper engine."""
         try:
-            import whisper
+            import whisper  # noqa: F401
         except ImportError:
             raise ImportError(
                 "openai-whisper not installed. "
@@ -114,7 +182,7 @@ class STTEngineManager:
         )
 
         try:
-            self.model = whisper.load_model(self.model_size, device=self.device)
+            self._acquire_model(engine_model_name("openai", self.model_size))
             self.logger.info(
                 f"[STT_ENGINE] openai-whisper loaded successfully "
                 f"(engine=openai, model={self.model_size}, device={self.device})"
@@ -126,7 +194,7 @@ class STTEngineManager:
     def _load_faster_whisper(self):
         """Load faster-whisper engine."""
         try:
-            from faster_whisper import WhisperModel
+            from faster_whisper import WhisperModel  # noqa: F401
         except ImportError:
             raise ImportError(
                 "faster-whisper not installed. "
@@ -138,19 +206,37 @@ class STTEngineManager:
         )
 
         try:
-            self.model = WhisperModel(
-                f"{self.model_size}.en",
-                device=self.device,
-                compute_type="float16" if self.device == "cuda" else "int8"
-            )
+            self._acquire_model(engine_model_name("faster", self.model_size))
             self.logger.info(
                 f"[STT_ENGINE] faster-whisper loaded successfully "
-                f"(engine=faster, model={self.model_size}.en, device={self.device})"
+                f"(engine=faster, model={self.model_size}.en, device={self.device}, "
+                f"compute_type={self._model_handle.key.compute_type}, cpu_threads={self.cpu_threads}, "
+                f"num_workers={self.num_workers})"
             )
         except Exception as e:
             self.logger.error(f"[STT_ENGINE] Failed to load faster-whisper: {e}")
             raise
 
+    def _acquire_model(self, model_name: str) -> None:
+        handle = get_model_registry().acquire(
+            self.engine,
+            model_name,
+            device=self.device,
+            compute_type=self.compute_type,
+            cpu_threads=self.cpu_threads,
+            num_workers=self.num_workers,
+        )
+        self._model_handle = handle
+        self._model_lock = handle.lock
+        self.model = handle.model
+
+    def close(self) -> None:
+        """Release the shared model (freed once no other manager holds it)."""
+        if self._model_handle is not None:
+            self._model_handle.release()
+            self._model_handle = None
+        self.model = None
+
     def _normalize_segments(self, raw_segments) -> list:
         """
         Normalize segments to a consistent STTSegment structure.
@@ -195,7 +281,8 @@ class STTEngineManager:
         Args:
             audio_data: Audio samples (float32, [-1, 1])
             language: Language code (e.g., "en")
-            **kwargs: Additional engine-specific parameters
+            **kwargs: Additional engine-specific parameters; input_gain
+                overrides the openai-whisper mic boost (1.0 = none, for files)
 
         Returns:
             {
@@ -216,23 +303,60 @@ class STTEngineManager:
         start = time.perf_counter()
 
         try:
-            if self.engine == "openai":
-                return self._transcribe_openai(audio_data, language, **kwargs)
-            elif self.engine == "faster":
-                return self._transcribe_faster(audio_data, language, **kwargs)
+            with self._model_lock:
+                if self.engine == "openai":
+                    return self._transcribe_openai(audio_data, language, **kwargs)
+                elif self.engine == "faster":
+                    return self._transcribe_faster(audio_data, language, **kwargs)
         except Exception as e:
             self.logger.error(f"[STT_ENGINE] Transcription failed: {e}")
             raise
 
+    @property
+    def batch_parallelism(self) -> int:
+        """Clips transcribe_batch() decodes at once."""
+        return self.num_workers if self.engine == "faster" else 1
+
+    def transcribe_batch(self, audios: list, language: str = "en", **kwargs) -> list:
+        """
+        Transcribe several clips with the same options under one model-lock hold.
+
+        faster-whisper decodes up to num_workers clips at once (CTranslate2
+        runs one transcription per worker); openai-whisper decodes them in turn.
+
+        Returns:
+            One entry per clip: the transcribe() result dict, or the exception
+            that clip raised
+        """
+        if self.model is None:
+            raise ValueError("STT engine not initialized")
+
+        decode = self._transcribe_openai if self.engine == "openai" else self._transcribe_faster
+
+        def decode_one(audio_data):
+            try:
+                return decode(audio_data, language, **kwargs)
+            except Exception as e:
+                self.logger.error(f"[STT_ENGINE] Transcription failed: {e}")
+                return e
+
+        workers = min(self.batch_parallelism, len(audios))
+        with self._model_lock:
+            if workers <= 1:
+                return [decode_one(audio_data) for audio_data in audios]
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="stt-batch") as pool:
+                return list(pool.map(decode_one, audios))
+
     def _transcribe_openai(self, audio_data: np.ndarray, language: str, **kwargs) -> dict:
         """Transcribe using openai-whisper."""
         import time
 
         start = time.perf_counter()
 
-        # Apply audio boost before transcription
-        audio_data = audio_data * 1.8
-        audio_data = np.clip(audio_data, -1.0, 1.0)
+        # Apply audio boost before transcription (mic input; files are already at level)
+        gain = kwargs.pop("input_gain", MIC_INPUT_GAIN)
+        if gain != 1.0:
+            audio_data = np.clip(audio_data * gain, -1.0, 1.0)
 
         result = self.model.transcribe(
             audio_data,
@@ -256,12 +380,16 @@ class STTEngineManager:
         # Normalize segments to consistent structure
         normalized_segments = self._normalize_segments(raw_segments)
 
+        no_speech = [seg.get("no_speech_prob", 0.0) for seg in raw_segments]
+
         return {
             "text": text,
             "confidence": confidence,  # Engine-native (log scale for openai-whisper)
             "segments": normalized_segments,
             "engine": "openai",
             "duration_ms": duration_ms,
+            "language": result.get("language", language),
+            "no_speech_prob": float(np.mean(no_speech)) if no_speech else None,
         }
 
     def _transcribe_faster(self, audio_data: np.ndarray, language: str, **kwargs) -> dict:
@@ -270,6 +398,10 @@ class STTEngineManager:
 
         start = time.perf_counter()
 
+        gain = kwargs.pop("input_gain", 1.0)  # mic audio isn't boosted for faster-whisper
+        if gain != 1.0:
+            audio_data = np.clip(audio_data * gain, -1.0, 1.0)
+
         segments, info = self.model.transcribe(
             audio_data,
             language=language,
@@ -290,12 +422,16 @@ class STTEngineManager:
         # Normalize segments to consistent structure
         normalized_segments = self._normalize_segments(segments_list)
 
+        no_speech = [getattr(seg, "no_speech_prob", 0.0) for seg in segments_list]
+
         return {
             "text": text,
             "confidence": confidence,  # Engine-native (log scale)
             "segments": normalized_segments,
             "engine": "faster",
             "duration_ms": duration_ms,
+            "language": getattr(info, "language", language),
+            "no_speech_prob": float(np.mean(no_speech)) if no_speech else None,
         }
 
     def warmup(self, duration_s: float = 1.0):
@@ -313,3 +449,291 @@ class STTEngineManager:
             self.logger.info(f"[STT_ENGINE] {self.engine} engine warmed up successfully")
         except Exception as e:
             self.logger.warning(f"[STT_ENGINE] Warmup failed: {e}")
+
+    def start_incremental(
+        self,
+        language: str = "en",
+        on_partial: Optional[Callable[["PartialTranscript"], None]] = None,
+        **kwargs,
+    ) -> "IncrementalTranscriber":
+        """
+        Start an incremental transcription session for one utterance.
+
+        Feed audio while the user speaks; finalize() at VAD end decodes only
+        the uncommitted tail. Extra kwargs are passed to every transcribe() call.
+        """
+        return IncrementalTranscriber(self, language=language, on_partial=on_partial, **kwargs)
+
+
+@dataclass
+class PartialTranscript:
+    """Rolling hypothesis during capture: stable prefix + tentative tail."""
+    stable: str
+    tentative: str
+    audio_s: float
+    decode_ms: float = 0.0
+
+    @property
+    def text(self) -> str:
+        return " ".join(part for part in (self.stable, self.tentative) if part)
+
+
+def _common_prefix_len(a: list, b: list) -> int:
+    """Length of the common word prefix (case/punctuation-insensitive)."""
+    count = 0
+    for left, right in zip(a, b):
+        if _word_key(left) != _word_key(right):
+            break
+        count += 1
+    return count
+
+
+def _word_key(word: str) -> str:
+    return "".join(ch for ch in word.lower() if ch.isalnum())
+
+
+class IncrementalTranscriber:
+    """
+    Incremental (streaming) Whisper transcription over rolling windows.
+
+    Policy (local agreement):
+    - Every step_ms of new audio, the uncommitted window is re-decoded
+    - Words on which two consecutive hypotheses agree form the stable prefix;
+      the rest is the tentative tail
+    - Whole segments inside the stable prefix that end at least
+      commit_margin_s before the window end are committed: their text is
+      frozen and their audio is dropped from the window
+    - The window never exceeds max_window_s (oldest segments are committed)
+    - Optionally, the first early_window_s of an utterance is decoded every
+      early_step_ms instead, so short commands ("stop") surface quickly
+
+    At VAD end, finalize() decodes only the remaining window, so latency
+    after end-of-speech scales with the tail, not the whole utterance.
+
+    Decodes run on a worker thread; feed() never blocks the capture loop.
+    """
+
+    SAMPLE_RATE = 16000
+
+    def __init__(
+        self,
+        manager: "STTEngineManager",
+        language: str = "en",
+        on_partial: Optional[Callable[[PartialTranscript], None]] = None,
+        step_ms: int = 500,
+        min_window_ms: int = 1000,
+        max_window_s: float = 12.0,
+        commit_margin_s: float = 1.0,
+        early_step_ms: Optional[int] = None,
+        early_window_s: float = 0.0,
+        **transcribe_kwargs,
+    ):
+        self._manager = manager
+        self._language = language
+        self._on_partial = on_partial
+        self._kwargs = {k: v for k, v in transcribe_kwargs.items() if v is not None}
+        self._base_prompt = self._kwargs.pop("initial_prompt", None) or ""
+        self._step = int(self.SAMPLE_RATE * step_ms / 1000)
+        self._min_window = int(self.SAMPLE_RATE * min_window_ms / 1000)
+        self._max_window = int(self.SAMPLE_RATE * max_window_s)
+        self._commit_margin = int(self.SAMPLE_RATE * commit_margin_s)
+        self._early_step = int(self.SAMPLE_RATE * early_step_ms / 1000) if early_step_ms else self._step
+        self._early_until = int(self.SAMPLE_RATE * early_window_s) if early_step_ms else 0
+        self.logger = manager.logger
+
+        self._lock = threading.Lock()
+        self._chunks: list = []
+        self._total = 0                   # samples fed so far
+        self._window_start = 0            # first uncommitted sample
+        self._decoded_upto = 0            # window end of the last decode
+        self._committed: list = []        # frozen words
+        self._committed_logprobs: list = []
+        self._committed_segments: list = []
+        self._previous: list = []         # last hypothesis (uncommitted words)
+        self._stable_len = 0              # agreed words in _previous
+        self._last_partial: Optional[PartialTranscript] = None
+        self.window_decodes = 0
+        self.speculation = None           # optional early-intent dispatcher attached by the caller
+
+        self._wake = threading.Event()
+        self._closed = False
+        self._busy = threading.Lock()
+        self._worker = threading.Thread(target=self._run, daemon=True, name="ARGO.STT.Incremental")
+        self._worker.start()
+
+    # ------------------------------------------------------------------
+    # Capture side
+    # ------------------------------------------------------------------
+    def feed(self, audio: np.ndarray) -> None:
+        """Append captured audio (float32 mono 16 kHz, any shape squeezable to 1-D)."""
+        if self._closed:
+            return
+        # Copy: capture frames are views into the input ring and get overwritten
+        samples = np.array(audio, dtype=np.float32).reshape(-1)
+        if not samples.size:
+            return
+        with self._lock:
+            self._chunks.append(samples)
+            self._total += samples.size
+            step = self._early_step if self._total <= self._early_until else self._step
+            ready = self._total - self._decoded_upto >= step
+        if ready:
+            self._wake.set()
+
+    @property
+    def partial(self) -> Optional[PartialTranscript]:
+        return self._last_partial
+
+    @property
+    def audio_s(self) -> float:
+        """Seconds of audio fed so far (same clock as PartialTranscript.audio_s)."""
+        return self._total / self.SAMPLE_RATE
+
+    # ------------------------------------------------------------------
+    # Worker
+    # ------------------------------------------------------------------
+    def _run(self) -> None:
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            if self._closed:
+                return
+            with self._busy:
+                if self._closed:
+                    return
+                try:
+                    self._decode_window()
+                except Exception as e:
+                    self.logger.warning(f"[STT_ENGINE] Incremental window decode failed: {e}")
+
+    def _audio(self, start: int, end: int) -> np.ndarray:
+        with self._lock:
+            audio = np.concatenate(self._chunks) if self._chunks else np.zeros(0, dtype=np.float32)
+            self._chunks = [audio]
+        return audio[start:end]
+
+    def _prompt(self) -> Optional[str]:
+        prompt = " ".join(filter(None, [self._base_prompt, " ".join(self._committed[-30:])]))
+        return prompt or None
+
+    def _transcribe_window(self, start: int, end: int) -> dict:
+        return self._manager.transcribe(
+            normalize_input_level(self._audio(start, end)),
+            language=self._language,
+            initial_prompt=self._prompt(),
+            **self._kwargs,
+        )
+
+    def _decode_window(self) -> None:
+        with self._lock:
+            end = self._total
+            start = self._window_start
+        min_window = self._early_step if end <= self._early_until else self._min_window
+        if end - start < min_window:
+            return
+        result = self._transcribe_window(start, end)
+        self.window_decodes += 1
+        self._decoded_upto = end
+        words = result["text"].split()
+
+        agreed = _common_prefix_len(self._previous, words)
+        self._previous = words
+        self._stable_len = agreed
+        self._commit_segments(result, start, end, agreed)
+
+        partial = PartialTranscript(
+            stable=" ".join(self._committed + self._previous[: self._stable_len]),
+            tentative=" ".join(self._previous[self._stable_len:]),
+            audio_s=end / self.SAMPLE_RATE,
+            decode_ms=float(result.get("duration_ms", 0.0)),
+        )
+        self._last_partial = partial
+        if self._on_partial is not None:
+            try:
+                self._on_partial(partial)
+            except Exception as e:
+                self.logger.debug(f"[STT_ENGINE] Partial callback failed: {e}")
+
+    def _commit_segments(self, result: dict, start: int, end: int, agreed: int) -> None:
+        """Freeze agreed whole segments that ended well before the window end."""
+        segments = result.get("segments") or []
+        force = end - start > self._max_window
+        words_seen = 0
+        cut_index = -1
+        for idx, seg in enumerate(segments):
+            seg_words = len((seg.text or "").split())
+            if seg.end is None:
+                break
+            seg_end = start + int(seg.end * self.SAMPLE_RATE)
+            within_margin = seg_end <= end - self._commit_margin
+            agreed_seg = words_seen + seg_words <= agreed
+            is_last = idx == len(segments) - 1
+            if (agreed_seg and within_margin) or (force and not is_last):
+                cut_index = idx
+                words_seen += seg_words
+                continue
+            break
+        if cut_index < 0:
+            return
+        committed_segments = segments[: cut_index + 1]
+        count = sum(len((seg.text or "").split()) for seg in committed_segments)
+        cut_sample = start + int(committed_segments[-1].end * self.SAMPLE_RATE)
+        self._committed.extend(self._previous[:count])
+        self._committed_logprobs.append(float(result.get("confidence", 0.0)))
+        offset = start / self.SAMPLE_RATE
+        for seg in committed_segments:
+            self._committed_segments.append(STTSegment(
+                text=seg.text,
+                start=seg.start + offset if seg.start is not None else None,
+                end=seg.end + offset,
+            ))
+        self._previous = self._previous[count:]
+        self._stable_len = max(0, self._stable_len - count)
+        with self._lock:
+            self._window_start = min(cut_sample, end)
+
+    # ------------------------------------------------------------------
+    # End of utterance
+    # ------------------------------------------------------------------
+    def finalize(self) -> dict:
+        """
+        Decode the uncommitted tail and return a transcribe()-shaped result.
+
+        duration_ms covers only the work done after VAD end (waiting for an
+        in-flight window plus the tail decode).
+        """
+        start_time = time.perf_counter()
+        self._closed = True
+        self._wake.set()
+        with self._busy:
+            with self._lock:
+                start = self._window_start
+                end = self._total
+            tail = {"text": "", "confidence": 0.0, "segments": [], "engine": self._manager.engine}
+            if end > start:
+                tail = self._transcribe_window(start, end)
+        words = self._committed + tail["text"].split()
+        logprobs = self._committed_logprobs + ([float(tail.get("confidence", 0.0))] if tail["text"] else [])
+        segments = list(self._committed_segments)
+        offset = start / self.SAMPLE_RATE
+        for seg in tail.get("segments") or []:
+            segments.append(STTSegment(
+                text=seg.text,
+                start=seg.start + offset if seg.start is not None else None,
+                end=seg.end + offset if seg.end is not None else None,
+            ))
+        return {
+            "text": " ".join(words).strip(),
+            "confidence": float(np.mean(logprobs)) if logprobs else 0.0,
+            "segments": segments,
+            "engine": tail.get("engine", self._manager.engine),
+            "duration_ms": (time.perf_counter() - start_time) * 1000,
+            "committed_text": " ".join(self._committed),
+            "tail_s": (end - start) / self.SAMPLE_RATE,
+            "window_decodes": self.window_decodes,
+        }
+
+    def cancel(self) -> None:
+        """Abandon the session (utterance discarded); stops the worker."""
+        self._closed = True
+        self._wake.set()
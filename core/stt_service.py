@@ -0,0 +1,229 @@
+"""
+STT SERVICE
+
+One request queue in front of an STTEngineManager, so every source that needs
+a transcription (live mic, UI upload, replay) shares the loaded model instead
+of racing for it or being turned away.
+
+- submit(): queue audio and get a concurrent.futures.Future for the
+  transcribe() result. future.cancel() withdraws a request that hasn't
+  started decoding
+- Priorities: LIVE (mic) before UPLOAD before REPLAY; FIFO within a priority
+- Bounded: at most max_pending requests wait. When full, a new request evicts
+  the newest lower-priority one (its future fails with STTQueueFull), or is
+  refused with STTQueueFull if nothing queued ranks below it
+- Micro-batching: the worker takes the next request plus queued requests
+  with the same decode options (optionally waiting batch_window_ms for more)
+  and hands them to manager.transcribe_batch(), which decodes them under one
+  model-lock hold, num_workers at a time on faster-whisper. A batch is at
+  most max_batch and at most what the manager decodes in parallel
+  (manager.batch_parallelism), so batching never makes a request wait for
+  someone else's decode
+
+Incremental (streaming) windows still call the manager directly; they are
+serialized with the queue by the shared model lock.
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger("STT_SERVICE")
+
+
+class STTPriority(IntEnum):
+    """Lower runs first."""
+    LIVE = 0
+    UPLOAD = 1
+    REPLAY = 2
+
+
+class STTQueueFull(RuntimeError):
+    """The request queue is full of equal or higher priority work."""
+
+
+@dataclass(order=True)
+class _Request:
+    priority: int
+    seq: int
+    audio: Any = field(compare=False)
+    language: Optional[str] = field(compare=False)
+    kwargs: Dict = field(compare=False)
+    future: Future = field(compare=False)
+    source: str = field(compare=False, default="")
+    submitted_at: float = field(compare=False, default=0.0)
+
+    def batch_key(self):
+        return (self.language, tuple(sorted((k, repr(v)) for k, v in self.kwargs.items())))
+
+
+class STTService:
+    """Priority request queue + micro-batching worker for one STTEngineManager."""
+
+    def __init__(self, manager, max_pending: int = 16, max_batch: int = 4, batch_window_ms: float = 0.0):
+        self.manager = manager
+        self.max_pending = max(1, int(max_pending))
+        self.max_batch = max(1, min(int(max_batch), int(getattr(manager, "batch_parallelism", 1))))
+        self.batch_window_s = max(0.0, float(batch_window_ms)) / 1000.0
+        self._queue: List[_Request] = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._closed = False
+        self._stats = {"submitted": 0, "completed": 0, "failed": 0, "cancelled": 0, "rejected": 0, "batches": 0, "largest_batch": 0}
+        self._worker = threading.Thread(target=self._run, name="stt-service", daemon=True)
+        self._worker.start()
+
+    def submit(self, audio, priority: int = STTPriority.LIVE, language: Optional[str] = "en", source: str = "", **kwargs) -> Future:
+        """
+        Queue audio for transcription.
+
+        kwargs are passed to manager.transcribe() as-is.
+
+        Returns:
+            Future resolving to the transcribe() result dict
+
+        Raises:
+            STTQueueFull: Queue is full of equal or higher priority requests
+            RuntimeError: Service is closed
+        """
+        request = _Request(
+            priority=int(priority),
+            seq=next(self._seq),
+            audio=audio,
+            language=language,
+            kwargs=kwargs,
+            future=Future(),
+            source=source,
+            submitted_at=time.perf_counter(),
+        )
+        evicted = None
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("STT service is closed")
+            self._purge_cancelled()
+            if len(self._queue) >= self.max_pending:
+                worst = max(self._queue)
+                if worst.priority <= request.priority:
+                    self._stats["rejected"] += 1
+                    raise STTQueueFull(f"STT queue full ({self.max_pending} pending)")
+                self._queue.remove(worst)
+                heapq.heapify(self._queue)
+                self._stats["rejected"] += 1
+                evicted = worst
+            heapq.heappush(self._queue, request)
+            self._stats["submitted"] += 1
+            self._cond.notify()
+        if evicted is not None:
+            logger.warning(f"[STT_SERVICE] Queue full: dropped {evicted.source or 'request'} (priority {evicted.priority})")
+            evicted.future.set_exception(STTQueueFull("Evicted by a higher-priority request"))
+        return request.future
+
+    def transcribe(self, audio, priority: int = STTPriority.LIVE, timeout: Optional[float] = None, **kwargs) -> dict:
+        """submit() and wait for the result."""
+        return self.submit(audio, priority=priority, **kwargs).result(timeout=timeout)
+
+    def pending(self) -> int:
+        with self._cond:
+            self._purge_cancelled()
+            return len(self._queue)
+
+    def stats(self) -> Dict:
+        with self._cond:
+            return dict(self._stats, pending=len(self._queue))
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        """Stop the worker; requests still queued are cancelled."""
+        with self._cond:
+            self._closed = True
+            queued, self._queue = self._queue, []
+            self._cond.notify_all()
+        for request in queued:
+            request.future.cancel()
+        if self._worker is not threading.current_thread():
+            self._worker.join(timeout)
+
+    # ------------------------------------------------------------------
+    # Worker
+    # ------------------------------------------------------------------
+    def _purge_cancelled(self) -> None:
+        live = [r for r in self._queue if not r.future.cancelled()]
+        if len(live) != len(self._queue):
+            self._stats["cancelled"] += len(self._queue) - len(live)
+            self._queue = live
+            heapq.heapify(self._queue)
+
+    def _take_batch(self) -> List[_Request]:
+        with self._cond:
+            while True:
+                self._purge_cancelled()
+                if self._queue or self._closed:
+                    break
+                self._cond.wait()
+            if not self._queue:
+                return []
+            first = heapq.heappop(self._queue)
+            batch = [first]
+            if self.max_batch > 1:
+                deadline = time.perf_counter() + self.batch_window_s
+                key = first.batch_key()
+                while True:
+                    for request in sorted(self._queue):
+                        if len(batch) >= self.max_batch:
+                            break
+                        if request.batch_key() == key and not request.future.cancelled():
+                            batch.append(request)
+                    self._queue = [r for r in self._queue if r not in batch]
+                    heapq.heapify(self._queue)
+                    remaining = deadline - time.perf_counter()
+                    if len(batch) >= self.max_batch or remaining <= 0 or self._closed:
+                        break
+                    self._cond.wait(remaining)
+            return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._take_batch()
+            if not batch:
+                return
+            live = [r for r in batch if r.future.set_running_or_notify_cancel()]
+            if len(live) != len(batch):
+                with self._cond:
+                    self._stats["cancelled"] += len(batch) - len(live)
+            self._decode(live)
+
+    def _decode(self, batch: List[_Request]) -> None:
+        if not batch:
+            return
+        first = batch[0]
+        try:
+            if len(batch) > 1:
+                results = self.manager.transcribe_batch([r.audio for r in batch], language=first.language, **first.kwargs)
+            else:
+                try:
+                    results = [self.manager.transcribe(first.audio, language=first.language, **first.kwargs)]
+                except Exception as e:
+                    results = [e]
+        except Exception as e:
+            results = [e] * len(batch)
+
+        with self._cond:
+            self._stats["batches"] += 1
+            self._stats["largest_batch"] = max(self._stats["largest_batch"], len(batch))
+        if len(batch) > 1:
+            waited_ms = (time.perf_counter() - min(r.submitted_at for r in batch)) * 1000
+            logger.info(f"[STT_SERVICE] Decoded batch of {len(batch)} (oldest waited {waited_ms:.0f}ms)")
+
+        for request, result in zip(batch, results):
+            failed = isinstance(result, BaseException)
+            with self._cond:
+                self._stats["failed" if failed else "completed"] += 1
+            if failed:
+                request.future.set_exception(result)
+            else:
+                request.future.set_result(result)
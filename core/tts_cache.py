@@ -0,0 +1,348 @@
+"""
+Synthesized Audio Cache
+
+Content-addressed PCM cache shared by the TTS output sinks. Deterministic
+responses ("Done.", clarification prompts, "I didn't catch any words. Try
+again.") are rendered once and replayed from memory instead of going back
+through Piper or the Edge-TTS network round trip.
+
+Key:
+- sha256 over normalized text + voice + length_scale (any voice-shaping
+  parameter that changes the audio must be part of the key)
+
+Tiers:
+- Memory: LRU (OrderedDict) bounded by total PCM bytes
+- Disk: one WAV per key under TTS_CACHE_DIR, bounded by total bytes;
+  least-recently-used files (by mtime, touched on hit) are evicted first
+
+PCM is stored as int16 at the producer's sample rate and channel count.
+Caching is opt-in: only texts the caller marks as CacheablePhrase
+(canonical responses, _minimal_ack) and phrases passed to warm_up() are
+looked up or stored, so free-form LLM sentences and streamed chunks never
+churn the tiers. TTS_CACHE_MAX_CHARS still caps what is stored.
+"""
+
+# ============================================================================
+# 1) IMPORTS
+# ============================================================================
+import os
+import re
+import hashlib
+import logging
+import threading
+import wave
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# 2) CONFIGURATION FLAGS
+# ============================================================================
+
+TTS_CACHE_ENABLED = os.getenv("TTS_CACHE_ENABLED", "true").lower() == "true"
+"""Enable the synthesized-audio cache for Piper and Edge-TTS sinks."""
+
+TTS_CACHE_DIR = os.getenv("TTS_CACHE_DIR", "runtime/tts_cache")
+"""Directory for the on-disk tier (empty string = memory tier only)."""
+
+TTS_CACHE_MEMORY_MB = max(0, int(os.getenv("TTS_CACHE_MEMORY_MB", "16")))
+"""Memory tier cap in MB of PCM (~6 minutes of 22050 Hz int16 mono at 16 MB)."""
+
+TTS_CACHE_DISK_MB = max(0, int(os.getenv("TTS_CACHE_DISK_MB", "128")))
+"""Disk tier cap in MB (0 = memory tier only)."""
+
+TTS_CACHE_MAX_CHARS = max(0, int(os.getenv("TTS_CACHE_MAX_CHARS", "120")))
+"""Longest text that is cached, even when the caller marks it cacheable."""
+
+# Fixed phrases the pipeline speaks verbatim (_minimal_ack, clarification prompts,
+# empty-transcript reply, startup announcement). Pre-rendered at warm-up.
+WARMUP_PHRASES = (
+    "Done.",
+    "That didn't work.",
+    "Which app?",
+    "Which app should I open?",
+    "What would you like to hear?",
+    "Louder or quieter?",
+    "What should I do?",
+    "Could you please rephrase that?",
+    "I didn't catch any words. Try again.",
+    "Ready.",
+    "Voice system online.",
+)
+
+
+# ============================================================================
+# 3) CACHE
+# ============================================================================
+
+class CacheablePhrase(str):
+    """Text the caller opted into the cache (a fixed or canonical response)."""
+
+
+@dataclass(frozen=True)
+class CachedAudio:
+    """Rendered int16 PCM for one (text, voice, length_scale)."""
+
+    pcm: bytes
+    sample_rate: int
+    channels: int = 1
+
+    @property
+    def duration_s(self) -> float:
+        frames = len(self.pcm) // (2 * max(1, self.channels))
+        return frames / float(self.sample_rate or 1)
+
+
+class TTSAudioCache:
+    """
+    Two-tier (memory LRU + disk) content-addressed PCM cache.
+
+    - make_key(text, voice, length_scale) -> hex digest
+    - cacheable(text) -> True for CacheablePhrase texts and warmed phrases
+    - get(key) -> CachedAudio or None (disk hits are promoted to memory)
+    - put(key, pcm, sample_rate, channels) -> store in both tiers, evicting LRU entries
+    - warm_up(phrases, render) -> render and store phrases that are not cached yet
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = TTS_CACHE_DIR,
+        max_memory_bytes: int = TTS_CACHE_MEMORY_MB * 1024 * 1024,
+        max_disk_bytes: int = TTS_CACHE_DISK_MB * 1024 * 1024,
+        max_text_chars: int = TTS_CACHE_MAX_CHARS,
+    ):
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.max_text_chars = max_text_chars
+        self._memory: "OrderedDict[str, CachedAudio]" = OrderedDict()
+        self._memory_bytes = 0
+        self._fixed_phrases: set = set()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self._dir: Optional[Path] = None
+        self._disk_bytes = 0
+        if cache_dir and max_disk_bytes > 0:
+            try:
+                self._dir = Path(cache_dir)
+                self._dir.mkdir(parents=True, exist_ok=True)
+                self._disk_bytes = sum(p.stat().st_size for p in self._dir.glob("*.wav"))
+            except OSError as e:
+                logger.warning("[TTS_CACHE] Disk tier disabled (%s): %s", cache_dir, e)
+                self._dir = None
+
+    # ------------------------------------------------------------------
+    # Keys
+    # ------------------------------------------------------------------
+    @staticmethod
+    def normalize_text(text: str) -> str:
+        return re.sub(r"\s+", " ", text or "").strip()
+
+    @classmethod
+    def make_key(cls, text: str, voice: str, length_scale) -> str:
+        payload = "\x1f".join((cls.normalize_text(text), str(voice), str(length_scale)))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def cacheable(self, text: str) -> bool:
+        if not self._fits(text):
+            return False
+        return isinstance(text, CacheablePhrase) or self.normalize_text(text) in self._fixed_phrases
+
+    def _fits(self, text: str) -> bool:
+        normalized = self.normalize_text(text)
+        return bool(normalized) and len(normalized) <= self.max_text_chars
+
+    # ------------------------------------------------------------------
+    # Lookup / store
+    # ------------------------------------------------------------------
+    def get(self, key: str) -> Optional[CachedAudio]:
+        with self._lock:
+            audio = self._memory.get(key)
+            if audio is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return audio
+        audio = self._read_disk(key)
+        with self._lock:
+            if audio is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._remember(key, audio)
+        return audio
+
+    def put(self, key: str, pcm: bytes, sample_rate: int, channels: int = 1) -> Optional[CachedAudio]:
+        if not pcm:
+            return None
+        audio = CachedAudio(bytes(pcm), int(sample_rate), int(channels))
+        with self._lock:
+            self._remember(key, audio)
+        self._write_disk(key, audio)
+        return audio
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            if key in self._memory:
+                return True
+        return self._dir is not None and (self._dir / f"{key}.wav").exists()
+
+    @property
+    def memory_bytes(self) -> int:
+        with self._lock:
+            return self._memory_bytes
+
+    @property
+    def disk_bytes(self) -> int:
+        with self._lock:
+            return self._disk_bytes
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            if self._dir is not None:
+                for path in self._dir.glob("*.wav"):
+                    try:
+                        path.unlink()
+                    except OSError:
+                        pass
+                self._disk_bytes = 0
+
+    def warm_up(self, phrases: Iterable[str], voice: str, length_scale, render: Callable[[str], Optional[CachedAudio]]) -> int:
+        """
+        Render each phrase that is not cached yet. Returns how many were rendered.
+
+        Warmed phrases stay cacheable when they are spoken later, whichever
+        caller speaks them.
+        """
+        rendered = 0
+        for phrase in phrases:
+            if not self._fits(phrase):
+                continue
+            with self._lock:
+                self._fixed_phrases.add(self.normalize_text(phrase))
+            key = self.make_key(phrase, voice, length_scale)
+            if key in self:
+                continue
+            try:
+                audio = render(phrase)
+            except Exception as e:
+                logger.warning("[TTS_CACHE] Warm-up render failed for %r: %s", phrase, e)
+                continue
+            if audio is not None and audio.pcm:
+                self.put(key, audio.pcm, audio.sample_rate, audio.channels)
+                rendered += 1
+        return rendered
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+    def _remember(self, key: str, audio: CachedAudio) -> None:
+        """Insert into the memory LRU (caller holds the lock)."""
+        size = len(audio.pcm)
+        if size > self.max_memory_bytes:
+            return
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= len(previous.pcm)
+        self._memory[key] = audio
+        self._memory_bytes += size
+        while self._memory_bytes > self.max_memory_bytes and self._memory:
+            _old_key, old = self._memory.popitem(last=False)
+            self._memory_bytes -= len(old.pcm)
+
+    def _read_disk(self, key: str) -> Optional[CachedAudio]:
+        if self._dir is None:
+            return None
+        path = self._dir / f"{key}.wav"
+        try:
+            with wave.open(str(path), "rb") as wav:
+                audio = CachedAudio(wav.readframes(wav.getnframes()), wav.getframerate(), wav.getnchannels())
+            os.utime(path, None)  # LRU order for disk eviction
+            return audio
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, wave.Error) as e:
+            logger.warning("[TTS_CACHE] Dropping unreadable entry %s: %s", path.name, e)
+            self._remove_disk(path)
+            return None
+
+    def _write_disk(self, key: str, audio: CachedAudio) -> None:
+        if self._dir is None or len(audio.pcm) > self.max_disk_bytes:
+            return
+        path = self._dir / f"{key}.wav"
+        tmp_path = path.with_name(f"{key}.{threading.get_ident()}.tmp")
+        try:
+            with wave.open(str(tmp_path), "wb") as wav:
+                wav.setnchannels(audio.channels)
+                wav.setsampwidth(2)
+                wav.setframerate(audio.sample_rate)
+                wav.writeframes(audio.pcm)
+            old_size = path.stat().st_size if path.exists() else 0
+            os.replace(tmp_path, path)
+            with self._lock:
+                self._disk_bytes += path.stat().st_size - old_size
+        except OSError as e:
+            logger.warning("[TTS_CACHE] Disk write failed: %s", e)
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+            return
+        self._evict_disk()
+
+    def _evict_disk(self) -> None:
+        with self._lock:
+            if self._disk_bytes <= self.max_disk_bytes:
+                return
+        try:
+            entries = sorted(
+                ((p.stat().st_mtime, p) for p in self._dir.glob("*.wav")),
+                key=lambda item: item[0],
+            )
+        except OSError:
+            return
+        for _mtime, path in entries:
+            with self._lock:
+                if self._disk_bytes <= self.max_disk_bytes:
+                    return
+            self._remove_disk(path)
+
+    def _remove_disk(self, path: Path) -> None:
+        try:
+            size = path.stat().st_size
+            path.unlink()
+        except OSError:
+            return
+        with self._lock:
+            self._disk_bytes = max(0, self._disk_bytes - size)
+
+
+# ============================================================================
+# 4) GLOBAL INSTANCE
+# ============================================================================
+
+_tts_cache: Optional[TTSAudioCache] = None
+_tts_cache_lock = threading.Lock()
+
+
+def get_tts_cache() -> Optional[TTSAudioCache]:
+    """Return the shared cache (created lazily), or None when TTS_CACHE_ENABLED=false."""
+    global _tts_cache
+    if not TTS_CACHE_ENABLED:
+        return None
+    with _tts_cache_lock:
+        if _tts_cache is None:
+            _tts_cache = TTSAudioCache()
+        return _tts_cache
+
+
+def set_tts_cache(cache: Optional[TTSAudioCache]) -> None:
+    """Replace the shared cache (tests, or a custom location)."""
+    global _tts_cache
+    with _tts_cache_lock:
+        _tts_cache = cache
@@ -0,0 +1,563 @@
+"""
+Voice Activity Detection
+
+Frame-level speech/silence decisions for the capture loop, replacing the
+raw `np.linalg.norm(frame) * 10 >= threshold` test.
+
+Engines (per-frame speech probability, 0..1):
+- "energy": built-in. Energy above an adaptive noise floor (SNR), gated by an
+  absolute level (the legacy audio.vad_threshold units) and by zero-crossing
+  rate, which rejects hum (too few crossings) and hiss (too many)
+- "silero": Silero VAD ONNX model on CPU (onnxruntime). Defaults to the model
+  bundled with faster-whisper; falls back to "energy" if unavailable
+
+VoiceActivityDetector turns probabilities into utterance events:
+- SPEECH_START after start_ms of consecutive speech frames (onset confirmation)
+- Hysteresis: start_threshold to enter speech, end_threshold to stay in it
+- hangover_ms: frames just after speech still count as speech (word tails),
+  and short gaps don't reset onset confirmation
+- SPEECH_END end_silence_ms after the last speech frame, if min_speech_ms
+  was voiced
+- NOISE_BURST when an onset ends before min_speech_ms was voiced (the
+  utterance should be dropped, not transcribed)
+
+EndpointPolicy (optional) makes end_silence_ms adaptive per utterance: short
+canonical commands close after ~300ms, transcripts ending on a connective or
+filler ("and", "um") keep the mic open longer, open-ended requests keep the
+default window. Without a transcript it falls back to acoustic cues: voiced
+duration and the trailing energy/pitch slope (falling = turn yielded, flat =
+speaker holding the floor).
+
+segment_audio() runs a detector over recorded audio (runtime/replays/*.npy)
+for offline tuning and tests.
+"""
+
+# ============================================================================
+# 1) IMPORTS
+# ============================================================================
+import logging
+import os
+import re
+from collections import deque
+from dataclasses import dataclass
+from typing import List, Optional
+
+import numpy as np
+
+logger = logging.getLogger("ARGO.VAD")
+
+SAMPLE_RATE = 16000
+FRAME_SIZE = 512
+
+SPEECH_START = "speech_start"
+SPEECH_END = "speech_end"
+NOISE_BURST = "noise_burst"
+
+
+def frame_level(frame: np.ndarray) -> float:
+    """Legacy loudness metric used by audio.vad_threshold / barge-in (L2 norm x 10)."""
+    return float(np.linalg.norm(frame) * 10)
+
+
+# ============================================================================
+# 2) ENGINES
+# ============================================================================
+class EnergyZCREngine:
+    """Energy + zero-crossing VAD with an adaptive noise floor."""
+
+    name = "energy"
+
+    def __init__(
+        self,
+        min_level: float = 5.0,
+        snr_db: float = 9.0,
+        snr_slope_db: float = 3.0,
+        min_zcr: float = 0.01,
+        max_zcr: float = 0.45,
+        floor_down: float = 0.2,
+        floor_up: float = 0.05,
+        floor_up_in_speech: float = 0.002,
+        initial_floor_db: float = -60.0,
+    ):
+        self.min_level = min_level
+        self.snr_db = snr_db
+        self.snr_slope_db = snr_slope_db
+        self.min_zcr = min_zcr
+        self.max_zcr = max_zcr
+        self.floor_down = floor_down
+        self.floor_up = floor_up
+        self.floor_up_in_speech = floor_up_in_speech
+        self.initial_floor_db = initial_floor_db
+        self.noise_floor_db = initial_floor_db
+        self._floor_seeded = False
+        self.zcr = 0.0
+
+    def reset(self) -> None:
+        self.noise_floor_db = self.initial_floor_db
+        self._floor_seeded = False
+
+    def probability(self, frame: np.ndarray) -> float:
+        samples = np.asarray(frame, dtype=np.float32).reshape(-1)
+        if not samples.size:
+            return 0.0
+        rms = float(np.sqrt(np.mean(samples * samples)))
+        level_db = 20.0 * np.log10(rms + 1e-10)
+        signs = np.signbit(samples)
+        self.zcr = float(np.count_nonzero(signs[1:] != signs[:-1])) / max(1, samples.size - 1)
+        if not self._floor_seeded:
+            self.noise_floor_db = max(self.initial_floor_db, level_db)
+            self._floor_seeded = True
+
+        snr = level_db - self.noise_floor_db
+        prob = float(1.0 / (1.0 + np.exp(-(snr - self.snr_db) / self.snr_slope_db)))
+        if frame_level(samples) < self.min_level:
+            prob = min(prob, 0.1)
+        if self.zcr < self.min_zcr or self.zcr > self.max_zcr:
+            prob *= 0.25
+
+        # Noise floor: drops quickly, rises slowly (and very slowly during speech)
+        if level_db < self.noise_floor_db:
+            rate = self.floor_down
+        elif snr < self.snr_db:
+            rate = self.floor_up
+        else:
+            rate = self.floor_up_in_speech
+        self.noise_floor_db += rate * (level_db - self.noise_floor_db)
+        return prob
+
+
+class SileroEngine:
+    """Silero VAD (ONNX, CPU). Streams 512-sample frames at 16 kHz with LSTM state."""
+
+    name = "silero"
+    CONTEXT = 64
+
+    def __init__(self, model_path: Optional[str] = None):
+        import onnxruntime
+
+        model_path = model_path or self.default_model_path()
+        if not model_path or not os.path.exists(model_path):
+            raise FileNotFoundError(f"Silero VAD model not found: {model_path}")
+        opts = onnxruntime.SessionOptions()
+        opts.inter_op_num_threads = 1
+        opts.intra_op_num_threads = 1
+        opts.log_severity_level = 4
+        self._session = onnxruntime.InferenceSession(model_path, providers=["CPUExecutionProvider"], sess_options=opts)
+        self._inputs = {i.name for i in self._session.get_inputs()}
+        self.model_path = model_path
+        self.reset()
+
+    @staticmethod
+    def default_model_path() -> Optional[str]:
+        try:
+            import faster_whisper
+        except Exception:
+            return None
+        assets = os.path.join(os.path.dirname(faster_whisper.__file__), "assets")
+        try:
+            candidates = sorted(name for name in os.listdir(assets) if name.startswith("silero_vad") and name.endswith(".onnx"))
+        except OSError:
+            return None
+        return os.path.join(assets, candidates[-1]) if candidates else None
+
+    def reset(self) -> None:
+        self._context = np.zeros(self.CONTEXT, dtype=np.float32)
+        if "state" in self._inputs:
+            self._state = {"state": np.zeros((2, 1, 128), dtype=np.float32)}
+        else:
+            self._state = {"h": np.zeros((1, 1, 128), dtype=np.float32), "c": np.zeros((1, 1, 128), dtype=np.float32)}
+
+    def probability(self, frame: np.ndarray) -> float:
+        samples = np.asarray(frame, dtype=np.float32).reshape(-1)
+        if samples.size != FRAME_SIZE:
+            samples = np.pad(samples, (0, max(0, FRAME_SIZE - samples.size)))[:FRAME_SIZE]
+        window = np.concatenate([self._context, samples]).reshape(1, -1)
+        self._context = samples[-self.CONTEXT:]
+        feeds = {"input": window, **self._state}
+        if "sr" in self._inputs:
+            feeds["sr"] = np.array(SAMPLE_RATE, dtype=np.int64)
+        outputs = self._session.run(None, feeds)
+        if "state" in self._inputs:
+            self._state = {"state": outputs[1]}
+        else:
+            self._state = {"h": outputs[1], "c": outputs[2]}
+        return float(np.asarray(outputs[0]).reshape(-1)[0])
+
+
+# ============================================================================
+# 3) ENDPOINT POLICY (adaptive end-of-utterance silence)
+# ============================================================================
+SHAPE_COMMAND = "command"
+SHAPE_COMPLETE = "complete"
+SHAPE_OPEN = "open"
+SHAPE_INCOMPLETE = "incomplete"
+
+_COMMAND_RE = re.compile(
+    r"^(?:stop|pause|resume|next|skip|cancel|never ?mind|mute|unmute|louder|quieter"
+    r"|stop (?:the )?music|stop talking|be quiet|shut up"
+    r"|(?:next|skip)(?: this)? (?:song|track)|skip it"
+    r"|(?:turn (?:the )?)?volume (?:up|down)|(?:turn (?:it|the volume) )?(?:up|down)"
+    r"|(?:raise|lower|increase|decrease) (?:the )?volume)$"
+)
+_TRAILING_CONTINUATION = {
+    "and", "or", "but", "so", "because", "if", "then", "to", "of", "for", "with", "about",
+    "the", "a", "an", "my", "your", "is", "are", "by", "from", "in", "on", "at", "like",
+    "um", "uh", "er", "erm", "hmm", "which", "that", "what", "play", "set", "turn",
+}
+_OPEN_START = re.compile(
+    r"^(?:tell me|explain|describe|how (?:do|does|can|would|should|come)|why|what do you think|"
+    r"can you (?:tell|explain|describe|help)|i (?:want|need|was wondering)|let's talk)\b"
+)
+_FILLER_PREFIX = re.compile(r"^(?:(?:hey |ok(?:ay)? )?argo|please|ok(?:ay)?|um|uh)[, ]+")
+
+
+def transcript_shape(text: Optional[str]) -> Optional[str]:
+    """Classify a (partial) transcript for endpointing; None if there is nothing to go on."""
+    raw = (text or "").strip()
+    if not raw:
+        return None
+    if raw.endswith((",", "-", "...", "\u2026")):
+        return SHAPE_INCOMPLETE
+    lowered = re.sub(r"[^\w' ]+", " ", raw.lower())
+    lowered = re.sub(r"\s+", " ", lowered).strip()
+    while True:
+        stripped = _FILLER_PREFIX.sub("", lowered, count=1)
+        if stripped == lowered:
+            break
+        lowered = stripped
+    lowered = re.sub(r"\s+please$", "", lowered)
+    if not lowered:
+        return SHAPE_INCOMPLETE
+    if _COMMAND_RE.match(lowered):
+        return SHAPE_COMMAND
+    words = lowered.split()
+    if words[-1] in _TRAILING_CONTINUATION:
+        return SHAPE_INCOMPLETE
+    if _OPEN_START.match(lowered) or len(words) > 8:
+        return SHAPE_OPEN
+    return SHAPE_COMPLETE
+
+
+def estimate_pitch(frame: np.ndarray, sample_rate: int = SAMPLE_RATE, fmin: float = 70.0, fmax: float = 400.0) -> Optional[float]:
+    """Autocorrelation F0 estimate for one voiced frame (Hz), None if unvoiced/unclear."""
+    samples = np.asarray(frame, dtype=np.float32).reshape(-1)
+    samples = samples - samples.mean()
+    n = samples.size
+    if n < 2 * int(sample_rate / fmax):
+        return None
+    spectrum = np.fft.rfft(samples, 2 * n)
+    corr = np.fft.irfft(spectrum * np.conj(spectrum))[:n]
+    if corr[0] <= 0:
+        return None
+    lo, hi = int(sample_rate / fmax), min(n - 1, int(sample_rate / fmin))
+    lag = lo + int(np.argmax(corr[lo:hi]))
+    if corr[lag] / corr[0] < 0.3:
+        return None
+    return sample_rate / lag
+
+
+class EndpointPolicy:
+    """
+    Chooses the end-of-utterance silence for the current utterance.
+
+    Transcript shape wins when a fresh partial is available; otherwise the
+    default window is nudged by acoustic cues.
+    """
+
+    def __init__(
+        self,
+        default_ms: float = 800.0,
+        min_ms: float = 300.0,
+        max_ms: float = 1400.0,
+        complete_ms: float = 500.0,
+        short_voiced_ms: float = 800.0,
+        long_voiced_ms: float = 3000.0,
+        acoustic_step_ms: float = 150.0,
+    ):
+        self.default_ms = default_ms
+        self.min_ms = min_ms
+        self.max_ms = max_ms
+        self.complete_ms = complete_ms
+        self.short_voiced_ms = short_voiced_ms
+        self.long_voiced_ms = long_voiced_ms
+        self.acoustic_step_ms = acoustic_step_ms
+
+    def silence_ms(
+        self,
+        voiced_ms: float,
+        energy_slope: Optional[float] = None,
+        pitch_slope: Optional[float] = None,
+        shape: Optional[str] = None,
+    ) -> tuple:
+        """
+        Returns (silence_ms, reason).
+
+        energy_slope: dB/s over the last voiced frames; pitch_slope: semitones/s.
+        """
+        if shape == SHAPE_COMMAND:
+            return self.min_ms, "command"
+        if shape == SHAPE_INCOMPLETE:
+            return self.max_ms, "incomplete"
+        if shape == SHAPE_OPEN:
+            floor = self.default_ms
+            base, reason = self.default_ms, "open"
+        elif shape == SHAPE_COMPLETE:
+            floor = self.min_ms
+            base, reason = self.complete_ms, "complete"
+        else:
+            floor = self.min_ms
+            base, reason = self.default_ms, "acoustic"
+
+        step = self.acoustic_step_ms
+        if voiced_ms < self.short_voiced_ms:
+            base -= step
+            reason += "+short"
+        elif voiced_ms > self.long_voiced_ms:
+            base += step
+            reason += "+long"
+        falling_energy = energy_slope is not None and energy_slope < -20.0
+        if falling_energy and pitch_slope is not None and pitch_slope < -4.0:
+            base -= step
+            reason += "+falling"
+        elif pitch_slope is not None and abs(pitch_slope) < 2.0 and not falling_energy:
+            base += step
+            reason += "+held"
+        return float(min(self.max_ms, max(floor, base))), reason
+
+
+# ============================================================================
+# 4) DETECTOR (events, hangover, endpointing)
+# ============================================================================
+@dataclass
+class VADFrame:
+    probability: float
+    is_speech: bool
+    in_utterance: bool
+    event: Optional[str]
+    level: float
+    voiced_ms: float
+    silence_ms: float
+    endpoint_ms: float = 0.0
+
+
+class VoiceActivityDetector:
+    def __init__(
+        self,
+        engine=None,
+        start_threshold: float = 0.5,
+        end_threshold: float = 0.35,
+        start_ms: float = 64.0,
+        hangover_ms: float = 160.0,
+        end_silence_ms: float = 800.0,
+        min_speech_ms: float = 180.0,
+        sample_rate: int = SAMPLE_RATE,
+        endpoint_policy: Optional[EndpointPolicy] = None,
+        tail_frames: int = 10,
+    ):
+        self.engine = engine or EnergyZCREngine()
+        self.endpoint_policy = endpoint_policy
+        self._tail = deque(maxlen=tail_frames)
+        self.start_threshold = start_threshold
+        self.end_threshold = min(end_threshold, start_threshold)
+        self.start_ms = start_ms
+        self.hangover_ms = hangover_ms
+        self.end_silence_ms = end_silence_ms
+        self.min_speech_ms = min_speech_ms
+        self.sample_rate = sample_rate
+        self.reset()
+
+    @property
+    def engine_name(self) -> str:
+        return getattr(self.engine, "name", type(self.engine).__name__)
+
+    def reset(self) -> None:
+        """Forget the current utterance (the engine keeps its noise estimate)."""
+        self.in_utterance = False
+        self._onset_ms = 0.0
+        self._since_speech_ms = float("inf")
+        self._begin_utterance_state()
+
+    def force_start(self) -> None:
+        """Enter an utterance without onset confirmation (e.g. barge-in)."""
+        self.in_utterance = True
+        self._onset_ms = 0.0
+        self._begin_utterance_state()
+
+    def _begin_utterance_state(self) -> None:
+        self.voiced_ms = 0.0
+        self.silence_ms = 0.0
+        self._elapsed_ms = 0.0
+        self._tail.clear()
+        self._tail_slopes = None
+        self._transcript = None
+        self._transcript_lag_ms = float("inf")
+        self.endpoint_ms = self.end_silence_ms
+        self.endpoint_reason = "fixed"
+
+    def set_transcript(self, text: Optional[str], lag_ms: float = 0.0) -> None:
+        """
+        Latest partial transcript for the current utterance.
+
+        lag_ms: captured audio not yet covered by the partial. The shape is only
+        trusted once the partial reaches the point where the silence began.
+        """
+        self._transcript = text
+        self._transcript_lag_ms = max(0.0, float(lag_ms))
+
+    def _track_tail(self, samples: np.ndarray) -> None:
+        if self.endpoint_policy is None:
+            return
+        rms = float(np.sqrt(np.mean(samples * samples))) if samples.size else 0.0
+        self._tail.append((self._elapsed_ms, 20.0 * np.log10(rms + 1e-10), estimate_pitch(samples, self.sample_rate)))
+        self._tail_slopes = None
+
+    def _slopes(self) -> tuple:
+        """(energy dB/s, pitch semitones/s) over the last voiced frames."""
+        if self._tail_slopes is None:
+            energy_slope = pitch_slope = None
+            if len(self._tail) >= 3:
+                times = np.array([t for t, _, _ in self._tail]) / 1000.0
+                energy_slope = float(np.polyfit(times, [e for _, e, _ in self._tail], 1)[0])
+                voiced = [(t / 1000.0, 12.0 * np.log2(f0)) for t, _, f0 in self._tail if f0]
+                if len(voiced) >= 3:
+                    pitch_slope = float(np.polyfit([t for t, _ in voiced], [p for _, p in voiced], 1)[0])
+            self._tail_slopes = (energy_slope, pitch_slope)
+        return self._tail_slopes
+
+    def _required_silence_ms(self) -> float:
+        if self.endpoint_policy is None:
+            return self.end_silence_ms
+        shape = None
+        if self._transcript is not None and self._transcript_lag_ms <= self.silence_ms + 100.0:
+            shape = transcript_shape(self._transcript)
+        energy_slope, pitch_slope = self._slopes()
+        self.endpoint_ms, self.endpoint_reason = self.endpoint_policy.silence_ms(
+            self.voiced_ms, energy_slope, pitch_slope, shape
+        )
+        return self.endpoint_ms
+
+    def process(self, frame: np.ndarray) -> VADFrame:
+        samples = np.asarray(frame, dtype=np.float32).reshape(-1)
+        frame_ms = 1000.0 * samples.size / self.sample_rate
+        prob = self.engine.probability(samples)
+        threshold = self.end_threshold if self.in_utterance else self.start_threshold
+        raw_speech = prob >= threshold
+        if raw_speech:
+            self._since_speech_ms = 0.0
+        else:
+            self._since_speech_ms += frame_ms
+        is_speech = raw_speech or self._since_speech_ms <= self.hangover_ms
+
+        event = None
+        if not self.in_utterance:
+            if raw_speech:
+                self._onset_ms += frame_ms
+            elif not is_speech:
+                self._onset_ms = 0.0  # gap longer than the hangover: onset starts over
+            if self._onset_ms >= self.start_ms:
+                self.in_utterance = True
+                self._begin_utterance_state()
+                self.voiced_ms = self._elapsed_ms = self._onset_ms
+                self._track_tail(samples)
+                event = SPEECH_START
+        elif raw_speech:
+            self._elapsed_ms += frame_ms
+            self.voiced_ms += frame_ms
+            self.silence_ms = 0.0
+            self._track_tail(samples)
+        else:
+            self._elapsed_ms += frame_ms
+            self.silence_ms += frame_ms
+            if self.silence_ms >= self._required_silence_ms():
+                event = SPEECH_END if self.voiced_ms >= self.min_speech_ms else NOISE_BURST
+                self.in_utterance = False
+                self._onset_ms = 0.0
+
+        return VADFrame(
+            probability=prob,
+            is_speech=is_speech,
+            in_utterance=self.in_utterance,
+            event=event,
+            level=frame_level(samples),
+            voiced_ms=self.voiced_ms,
+            silence_ms=self.silence_ms,
+            endpoint_ms=self.endpoint_ms,
+        )
+
+
+# ============================================================================
+# 5) FACTORY + OFFLINE EVALUATION
+# ============================================================================
+def create_vad(settings: Optional[dict] = None, min_level: Optional[float] = None) -> VoiceActivityDetector:
+    """Build a detector from the audio.vad config section."""
+    settings = dict(settings or {})
+    engine_name = str(settings.get("engine", "energy")).lower()
+    engine = None
+    if engine_name == "silero":
+        try:
+            engine = SileroEngine(settings.get("silero_model_path") or None)
+        except Exception as e:
+            logger.warning(f"[VAD] Silero unavailable ({e}); using energy engine")
+    if engine is None:
+        engine = EnergyZCREngine(
+            min_level=float(min_level if min_level is not None else settings.get("min_level", 5.0)),
+            snr_db=float(settings.get("snr_db", 9.0)),
+        )
+    return VoiceActivityDetector(
+        engine=engine,
+        start_threshold=float(settings.get("start_threshold", 0.5)),
+        end_threshold=float(settings.get("end_threshold", 0.35)),
+        start_ms=float(settings.get("start_ms", 64)),
+        hangover_ms=float(settings.get("hangover_ms", 160)),
+        end_silence_ms=float(settings.get("end_silence_ms", 800)),
+        min_speech_ms=float(settings.get("min_speech_ms", 180)),
+        endpoint_policy=_endpoint_policy(settings),
+    )
+
+
+def _endpoint_policy(settings: dict) -> Optional[EndpointPolicy]:
+    adaptive = settings.get("adaptive_endpoint", {})
+    if isinstance(adaptive, bool):
+        adaptive = {"enabled": adaptive}
+    adaptive = dict(adaptive or {})
+    if not adaptive.get("enabled", True):
+        return None
+    default_ms = float(settings.get("end_silence_ms", 800))
+    return EndpointPolicy(
+        default_ms=default_ms,
+        min_ms=float(adaptive.get("min_silence_ms", 300)),
+        max_ms=float(adaptive.get("max_silence_ms", max(1400.0, default_ms))),
+        complete_ms=float(adaptive.get("complete_silence_ms", 500)),
+        short_voiced_ms=float(adaptive.get("short_voiced_ms", 800)),
+        long_voiced_ms=float(adaptive.get("long_voiced_ms", 3000)),
+    )
+
+
+@dataclass
+class VADSegment:
+    start_s: float
+    end_s: Optional[float]
+    voiced_ms: float
+    kind: str = SPEECH_END
+
+
+def segment_audio(audio: np.ndarray, detector: VoiceActivityDetector, frame_size: int = FRAME_SIZE) -> List[VADSegment]:
+    """Run a detector over recorded audio; returns detected utterances and noise bursts."""
+    samples = np.asarray(audio, dtype=np.float32).reshape(-1)
+    segments: List[VADSegment] = []
+    open_segment: Optional[VADSegment] = None
+    for offset in range(0, samples.size - frame_size + 1, frame_size):
+        result = detector.process(samples[offset:offset + frame_size])
+        now_s = (offset + frame_size) / detector.sample_rate
+        if result.event == SPEECH_START:
+            open_segment = VADSegment(start_s=max(0.0, now_s - detector.start_ms / 1000.0), end_s=None, voiced_ms=0.0)
+        elif result.event in (SPEECH_END, NOISE_BURST) and open_segment is not None:
+            open_segment.end_s = now_s
+            open_segment.voiced_ms = result.voiced_ms
+            open_segment.kind = result.event
+            segments.append(open_segment)
+            open_segment = None
+    if open_segment is not None:
+        open_segment.voiced_ms = detector.voiced_ms
+        segments.append(open_segment)
+    return segments
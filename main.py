@@ -45,9 +45,12 @@ except Exception:
 # ============================================================================
 # 3) CORE IMPORTS
 # ============================================================================
-from core.audio_manager import AudioManager, INPUT_SAMPLE_RATE, BLOCK_SIZE
+from core.audio_manager import AudioManager
+from core.vad import create_vad, SPEECH_END, NOISE_BURST
 from core.pipeline import ArgoPipeline
+from core.stt_engine_manager import preload_engine_model
 from core.startup_checks import check_ollama
+from core.startup_orchestrator import StartupOrchestrator, StartupTask
 from core.database import music_db_exists, get_db_status
 from core.config import MUSIC_DB_PATH
 from core.self_diagnostics import SystemDiagnostics, AssistedRecovery, explain_error
@@ -69,6 +72,7 @@ from core.config import (
 # Thread-safe event loop reference BEFORE logging setup
 ui_loop = None
 connected_clients = set()
+_ui_ready = threading.Event()
 CURRENT_STATUS = "INITIALIZING"  # Stores the latest state to sync new clients
 pipeline_ref = None
 audio_ref = None
@@ -239,6 +243,8 @@ async def websocket_handler(websocket):
                 _handle_next_override(payload)
             if msg_type == "clear_overrides":
                 _handle_clear_overrides()
+            if msg_type == "music_rescan":
+                _handle_music_rescan(payload if isinstance(payload, dict) else {})
     finally:
         connected_clients.discard(websocket)
 
@@ -378,6 +384,35 @@ def _handle_clear_overrides():
     broadcast_msg("runtime_overrides", get_runtime_overrides())
 
 
+_music_rescan_lock = threading.Lock()
+
+
+def _handle_music_rescan(payload: dict):
+    """Rescan the local music library in the background; progress goes out as music_scan_progress."""
+    if not _music_rescan_lock.acquire(blocking=False):
+        broadcast_msg("log", "Music rescan already running")
+        return
+    incremental = bool(payload.get("incremental", True))
+    log_event(f"UI_CMD_MUSIC_RESCAN incremental={incremental}", stage="ui")
+
+    def run():
+        try:
+            from core.music_index import get_music_index
+            summary = get_music_index().rescan(
+                incremental=incremental,
+                progress=lambda event: broadcast_msg("music_scan_progress", event),
+            )
+            if not summary.get("saved", True):
+                broadcast_msg("log", f"Music rescan not saved: {summary.get('save_error')}")
+        except Exception as e:
+            logger.error(f"[MUSIC] Rescan failed: {e}", exc_info=True)
+            broadcast_msg("log", f"Music rescan failed: {e}")
+        finally:
+            _music_rescan_lock.release()
+
+    threading.Thread(target=run, daemon=True, name="ARGO.MusicRescan").start()
+
+
 def _handle_text_input(payload: dict | str):
     """Handle text input from frontend, bypassing STT entirely.
     
@@ -560,6 +595,7 @@ def _start_main_loop_thread():
 async def start_server():
     global ui_loop
     ui_loop = asyncio.get_running_loop()
+    _ui_ready.set()
     logger.info("UI Server running on ws://localhost:8001/ws")
     while True:
         try:
@@ -573,10 +609,56 @@ async def start_server():
             logger.error(f"WebSocket server error: {e}", exc_info=True)
             await asyncio.sleep(1)
 
+def _build_startup(audio, pipeline):
+    """
+    Startup steps as a dependency graph. Audio, the Ollama probe, the music DB
+    status and the STT load run side by side; the LLM warm-up only needs the
+    probe. Listening waits for STARTUP_LISTEN_TASKS alone, so those are
+    declared (and submitted) first.
+    """
+    require_llm = bool(config.get("llm.required", False))
+
+    def ollama_probe():
+        ollama_available = check_ollama()
+        if require_llm and not ollama_available:
+            raise RuntimeError("LLM required but Ollama is not running")
+        elif not ollama_available:
+            logger.info("LLM offline: running in no-brain mode")
+        else:
+            logger.info("Ollama online")
+        pipeline.set_llm_enabled(ollama_available)
+        return ollama_available
+
+    def music_db():
+        db_status = get_db_status(MUSIC_DB_PATH)
+        if music_db_exists(MUSIC_DB_PATH):
+            logger.info("Music DB detected")
+        else:
+            logger.info("Music DB not present (awaiting Jellyfin ingest)")
+        broadcast_msg("db_status", db_status)
+        return db_status
+
+    return StartupOrchestrator(
+        [
+            StartupTask("stt", pipeline.warmup_stt),
+            StartupTask("audio", audio.start),
+            StartupTask("ollama", ollama_probe, required=require_llm),
+            StartupTask("recovery", _init_recovery_system, required=False),
+            StartupTask("music_db", music_db, required=False),
+            StartupTask("llm", pipeline.warmup_llm, deps=("ollama",), required=False),
+        ],
+        on_event=lambda event: broadcast_msg("startup", event),
+    )
+
+
+# Minimum set before the VAD loop starts listening
+STARTUP_LISTEN_TASKS = ("audio", "stt")
+
+
 def main_loop():
     global LISTENING_ENABLED, SERVER_ENABLED
     # Wait briefly for UI server loop to be ready to capture early logs
-    time.sleep(1)
+    _ui_ready.wait(timeout=1.0)
     
     # Initialize Audio
     def on_owner_change(owner, contested):
@@ -593,36 +675,17 @@ def main_loop():
     global audio_ref
     audio_ref = audio
     
-    # Initialize assisted recovery system (Phase 1 & 2)
-    _init_recovery_system()
-    
+    startup = _build_startup(audio, pipeline).start()
+    listen_tasks = STARTUP_LISTEN_TASKS + (("ollama",) if config.get("llm.required", False) else ())
     try:
-        audio.start()
-
-        ollama_available = check_ollama()
-        require_llm = bool(config.get("llm.required", False))
-
-        if require_llm and not ollama_available:
-            raise RuntimeError("LLM required but Ollama is not running")
-        elif not ollama_available:
-            logger.info("LLM offline: running in no-brain mode")
-        else:
-            logger.info("Ollama online")
-
-        db_ready = music_db_exists(MUSIC_DB_PATH)
-        db_status = get_db_status(MUSIC_DB_PATH)
-        if db_ready:
-            logger.info("Music DB detected")
-        else:
-            logger.info("Music DB not present (awaiting Jellyfin ingest)")
-        broadcast_msg("db_status", db_status)
-
-        pipeline.set_llm_enabled(ollama_available)
-        pipeline.warmup()
+        startup.wait_for(listen_tasks)
+        pipeline.finish_warmup()
     except Exception as e:
         logger.critical(f"Startup Failed: {e}")
         broadcast_msg("status", "ERROR")
         return
+    logger.info(f"[STARTUP] Listening-ready in {startup.elapsed_ms:.0f}ms")
+    broadcast_msg("startup_timings", startup.timings())
     
     # --- VAD SETTINGS ---
     # Higher threshold = Less sensitive to background noise
@@ -630,6 +693,14 @@ def main_loop():
     # Default: 5.0, Quiet room: 3.0, Noisy environment: 7.0-10.0
     vad_threshold = float(config.get("audio.vad_threshold", os.getenv("ARGO_VAD_THRESHOLD", "5.0")))
     barge_in_threshold = float(config.get("audio.barge_in_threshold", os.getenv("ARGO_BARGE_IN_THRESHOLD", "6.0")))
+    vad_settings = dict(config.get("audio.vad", {}) or {})
+    if os.getenv("ARGO_VAD_ENGINE"):
+        vad_settings["engine"] = os.getenv("ARGO_VAD_ENGINE")
+    vad = create_vad(vad_settings, min_level=vad_threshold)
+    logger.info(
+        f"[VAD] Engine={vad.engine_name} start_ms={vad.start_ms:.0f} hangover_ms={vad.hangover_ms:.0f} "
+        f"end_silence_ms={vad.end_silence_ms:.0f} adaptive={vad.endpoint_policy is not None}"
+    )
     
     if LISTENING_ENABLED:
         logger.info("Starting in always-listening mode (VAD-based)")
@@ -641,13 +712,21 @@ def main_loop():
         pipeline.transition_state("IDLE")
         broadcast_msg("status", "IDLE")
     
-    speech_buffer = []
     is_recording = False
-    silence_counter = 0
-    silence_seconds = 0.8
-    silence_threshold = int((INPUT_SAMPLE_RATE / BLOCK_SIZE) * silence_seconds)
     current_interaction_id = ""
-    voiced_ms_accumulator = 0
+    stt_session = None  # incremental STT for the utterance being captured
+
+    def _start_stt_session(interaction_id, preroll):
+        session = pipeline.begin_incremental_stt(interaction_id)
+        if session is not None and len(preroll) > 0:
+            session.feed(preroll)
+        return session
+
+    def _drop_stt_session():
+        nonlocal stt_session
+        if stt_session is not None:
+            pipeline.abandon_incremental_stt(stt_session)
+            stt_session = None
     
     while SERVER_ENABLED:
         if pipeline.illegal_transition:
@@ -655,6 +734,7 @@ def main_loop():
             time.sleep(0.1)
             continue
         if not LISTENING_ENABLED:
+            vad.reset()
             time.sleep(0.1)
             continue
         frame = audio.read_frame()
@@ -662,8 +742,10 @@ def main_loop():
             continue
             
         # VAD Logic
-        # Frame is float32. L2 Norm of 512 samples.
-        volume = np.linalg.norm(frame) * 10
+        # Every frame goes through the detector so its noise floor keeps adapting.
+        # volume (L2 norm x 10) is kept for barge-in and logs.
+        vad_frame = vad.process(frame)
+        volume = vad_frame.level
         
         owner = audio.get_audio_owner() if audio else "NONE"
         try:
@@ -680,24 +762,21 @@ def main_loop():
             not passive_listen
             and not pipeline.is_speaking
             and not is_recording
-            and volume >= vad_threshold
+            and vad_frame.in_utterance
             and pipeline.current_state == "LISTENING"
         ):
             current_interaction_id = str(uuid.uuid4())
-            logger.info(f"[VAD] Speech detected (volume: {volume:.2f}, threshold: {vad_threshold})")
+            logger.info(f"[VAD] Speech detected (volume: {volume:.2f}, p={vad_frame.probability:.2f}, engine={vad.engine_name})")
             log_event(
-                f"VAD_START rms={volume:.2f} threshold={vad_threshold}",
+                f"VAD_START rms={volume:.2f} p={vad_frame.probability:.2f} engine={vad.engine_name}",
                 stage="vad",
                 interaction_id=current_interaction_id,
             )
             is_recording = True
-            silence_counter = 0
-            voiced_ms_accumulator = 0
-            preroll = audio.get_preroll()
-            if len(preroll) > 0:
-                speech_buffer = [preroll]
-            else:
-                speech_buffer = []
+            # Utterance audio stays in the input ring from here (pre-roll included)
+            preroll = audio.begin_utterance()
+            _drop_stt_session()
+            stt_session = _start_stt_session(current_interaction_id, preroll)
             pipeline.transition_state("TRANSCRIBING", interaction_id=current_interaction_id)
         
         # --- BARGE-IN: If speech detected during TTS ---
@@ -732,45 +811,57 @@ def main_loop():
                 pass
             
             # Reset state to listen to new command
-            silence_counter = 0
             if not is_recording:
                 is_recording = True
-                preroll = audio.get_preroll()
-                speech_buffer = [preroll] if len(preroll) > 0 else []
+                vad.force_start()
+                preroll = audio.begin_utterance()
+                _drop_stt_session()
+                stt_session = _start_stt_session(current_interaction_id, preroll)
         
         if is_recording and not passive_listen:
-            speech_buffer.append(frame)
-
-            # Only count voiced frames (rms >= threshold)
-            if volume >= vad_threshold:
-                voiced_ms_accumulator += (BLOCK_SIZE / INPUT_SAMPLE_RATE) * 1000
-                silence_counter = 0
-            else:
-                silence_counter += 1
-
-            # Stop Recording after silence
-            if silence_counter > silence_threshold:
-                # Only allow VAD_END if at least 180 ms of voiced frames have been accumulated
-                if voiced_ms_accumulator < 180:
-                    logger.debug(f"[VAD] Ignoring premature VAD_END (voiced_ms={voiced_ms_accumulator:.1f})")
-                    continue
+            if stt_session is not None:
+                stt_session.feed(frame)
+                partial = stt_session.partial
+                if partial is not None:
+                    # Transcript shape drives the adaptive endpoint (commands close fast)
+                    vad.set_transcript(partial.text, lag_ms=(stt_session.audio_s - partial.audio_s) * 1000)
+
+            # Onset that never reached min_speech_ms of voicing: drop it, don't run Whisper
+            if vad_frame.event == NOISE_BURST:
+                logger.debug(f"[VAD] Discarding noise burst (voiced_ms={vad_frame.voiced_ms:.1f})")
+                log_event(f"VAD_DISCARD voiced_ms={vad_frame.voiced_ms:.0f}", stage="vad", interaction_id=current_interaction_id)
                 is_recording = False
-                silence_counter = 0
-                log_event("VAD_END", stage="vad", interaction_id=current_interaction_id)
+                _drop_stt_session()
+                audio.clear_buffers()
+                pipeline.transition_state("LISTENING", interaction_id=current_interaction_id, source="vad")
+                current_interaction_id = ""
+                continue
 
-                # Process Audio
-                if len(speech_buffer) > 0:
-                    full_audio = np.concatenate(speech_buffer)
+            # Stop Recording after silence (detector endpoint)
+            if vad_frame.event == SPEECH_END:
+                is_recording = False
+                logger.info(f"[VAD] End of utterance after {vad_frame.endpoint_ms:.0f}ms silence ({vad.endpoint_reason})")
+                log_event(
+                    f"VAD_END voiced_ms={vad_frame.voiced_ms:.0f} silence_ms={vad_frame.silence_ms:.0f} "
+                    f"endpoint_ms={vad_frame.endpoint_ms:.0f} reason={vad.endpoint_reason}",
+                    stage="vad",
+                    interaction_id=current_interaction_id,
+                )
 
+                # Process Audio
+                # View into the input ring (pre-roll + utterance); no per-frame list to join
+                full_audio = audio.get_utterance()
+                if full_audio.size > 0:
                     # --- AUDIO NORMALIZATION ---
-                    peak = np.max(np.abs(full_audio))
+                    peak = float(max(full_audio.max(), -full_audio.min()))
                     if peak > 0.01:
-                        # Skip normalization if already loud enough (micro-latency win)
+                        # One copy either way: ring slots are reused once the pipeline thread owns this
                         if peak < 0.85:
                             normalization_factor = 0.9 / peak
                             full_audio = full_audio * normalization_factor
                             logger.info(f"[Audio] Normalized input (original peak: {peak:.4f} -> 0.9)")
                         else:
+                            full_audio = full_audio.copy()
                             logger.info(f"[Audio] Skipping normalization (peak: {peak:.4f} >= 0.85)")
 
                         # CRITICAL FIX: Squeeze 2D array (N, 1) -> 1D array (N,)
@@ -784,25 +875,38 @@ def main_loop():
                         t = threading.Thread(
                             target=pipeline.run_interaction,
                             args=(full_audio, current_interaction_id, False, overrides),
+                            kwargs={"stt_session": stt_session},
                         )
+                        stt_session = None
                         t.start()
                         current_interaction_id = ""
                     else:
                         logger.warning(f"[Audio] Input too quiet/silent (peak: {peak:.4f}), ignoring")
+                        _drop_stt_session()
                         audio.clear_buffers()
                 else:
+                    _drop_stt_session()
                     audio.clear_buffers()
 
 if __name__ == "__main__":
-    # Pre-load whisper model BEFORE any async/threading to avoid native crashes
+    # Pre-load the STT model BEFORE any async/threading to avoid native crashes;
+    # pipeline.warmup() picks up the same shared instance from the model registry
+    _stt_config = config.get("speech_to_text", {}) or {}
     logger.info("Pre-loading Whisper model...")
     try:
-        import whisper
-        _preloaded_whisper = whisper.load_model("small")
+        preload_engine_model(
+            engine=_stt_config.get("engine", "openai"),
+            model_size=_stt_config.get("model", "base"),
+            device=_stt_config.get("device", "cpu"),
+            **{
+                key: _stt_config[key]
+                for key in ("compute_type", "cpu_threads", "num_workers")
+                if _stt_config.get(key) is not None
+            },
+        )
         logger.info("Whisper model pre-loaded successfully")
     except Exception as e:
         logger.warning(f"Whisper pre-load failed: {e}")
-        _preloaded_whisper = None
     
     _start_main_loop_thread()
     
@@ -1,3 +1,21 @@
+"""
+Jellyfin stand-ins for scripts and tests.
+
+- MockJellyfinProvider: in-memory advanced_search/search_by_keyword over a
+  handful of tracks, for the music-flow scripts
+- MockJellyfinServer: a local HTTP server answering /Items like Jellyfin
+  (startIndex/limit paging with TotalRecordCount, includeItemTypes,
+  minDateLastSaved, ids), for exercising JellyfinMusicProvider end to end
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+
 class MockJellyfinProvider:
     def __init__(self):
         self._tracks = [
@@ -45,3 +63,127 @@ class MockJellyfinProvider:
             or keyword_lower in track["song"].lower()
             or keyword_lower in track["genre"].lower()
         ]
+
+
+def audio_item(n: int, saved: str = "2024-01-01T00:00:00Z", **fields) -> Dict:
+    """A Jellyfin Audio item (the fields JellyfinMusicProvider reads)."""
+    item = {
+        "Id": f"audio{n:06d}",
+        "Type": "Audio",
+        "Name": f"Song {n}",
+        "Artists": [f"Artist {n // 100}"],
+        "Album": f"Album {n // 10}",
+        "AlbumId": f"album{n // 10:05d}",
+        "ProductionYear": 1970 + n % 50,
+        "Genres": ["Rock"],
+        "DateCreated": saved,
+        "DateLastSaved": saved,
+    }
+    item.update(fields)
+    return item
+
+
+class MockJellyfinServer:
+    """
+    Local mock of the Jellyfin /Items endpoint, served from a background thread.
+
+    Usage:
+        with MockJellyfinServer([audio_item(n) for n in range(2500)]) as server:
+            provider.url = server.url
+    """
+
+    def __init__(self, items: List[Dict], api_key: str = "test-key", delay: float = 0.0):
+        self.items = items
+        self.api_key = api_key
+        self.delay = delay
+        self.fail_starts = set()   # startIndex values that answer 500
+        self.requests: List[Dict[str, str]] = []
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockJellyfinServer":
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server._handle(self)
+
+            def log_message(self, *_args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="MockJellyfin", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._httpd:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def __enter__(self) -> "MockJellyfinServer":
+        return self.start()
+
+    def __exit__(self, *_exc) -> None:
+        self.stop()
+
+    def _query(self, params: Dict[str, str]) -> List[Dict]:
+        types = set(filter(None, params.get("includeItemTypes", "").split(",")))
+        since = params.get("minDateLastSaved")
+        ids = set(filter(None, params.get("ids", "").split(",")))
+        return [
+            item for item in self.items
+            if (not types or item.get("Type") in types)
+            and (not since or item.get("DateLastSaved", "") >= since)
+            and (not ids or item.get("Id") in ids)
+        ]
+
+    def _handle(self, request: BaseHTTPRequestHandler) -> None:
+        parsed = urlparse(request.path)
+        params = {key: values[-1] for key, values in parse_qs(parsed.query).items()}
+        if request.headers.get("X-MediaBrowser-Token") != self.api_key:
+            self._reply(request, 401, {})
+            return
+        if parsed.path != "/Items":
+            self._reply(request, 404, {})
+            return
+
+        with self._lock:
+            self.requests.append(params)
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+        try:
+            if self.delay:
+                time.sleep(self.delay)
+            start = int(params.get("startIndex", 0))
+            if start in self.fail_starts:
+                self._reply(request, 500, {})
+                return
+            matches = self._query(params)
+            limit = int(params.get("limit", len(matches)))
+            body = {"Items": matches[start:start + limit], "StartIndex": start}
+            if params.get("enableTotalRecordCount", "true").lower() == "true":
+                body["TotalRecordCount"] = len(matches)
+            self._reply(request, 200, body)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    @staticmethod
+    def _reply(request: BaseHTTPRequestHandler, status: int, body: Dict) -> None:
+        payload = json.dumps(body).encode("utf-8")
+        request.send_response(status)
+        request.send_header("Content-Type", "application/json")
+        request.send_header("Content-Length", str(len(payload)))
+        request.end_headers()
+        request.wfile.write(payload)
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Edge-TTS Benchmark: download-then-decode vs streaming in-memory decode
+
+Measures time-to-first-audio (text handed to Edge-TTS -> first decoded PCM
+frames available for playback) for a short and a long utterance. No audio
+is played. Requires network access.
+
+Usage:
+    python research/edge_tts_stream_benchmark.py
+    python research/edge_tts_stream_benchmark.py --runs 5 --voice en-US-AriaNeural
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import edge_tts
+
+from core.output_sink import _MP3StreamDecoder, _get_edge_tts_loop
+
+TEXTS = {
+    "short": "Done.",
+    "long": (
+        "Water boils at a lower temperature at altitude because the air pressure is lower, "
+        "so the molecules need less energy to escape the surface. That is why pasta takes "
+        "longer to cook in the mountains, and why pressure cookers were invented."
+    ),
+}
+
+
+def measure_full(voice: str, text: str) -> float:
+    """Old mode: download the whole MP3, then decode it."""
+    start = time.perf_counter()
+
+    async def _collect():
+        parts = []
+        async for chunk in edge_tts.Communicate(text=text, voice=voice).stream():
+            if chunk.get("type") == "audio":
+                parts.append(chunk["data"])
+        return b"".join(parts)
+
+    mp3 = _get_edge_tts_loop().submit(_collect()).result(timeout=60)
+    decoder = _MP3StreamDecoder()
+    if not len(decoder.decode(mp3)) and not len(decoder.flush()):
+        raise RuntimeError("no audio decoded")
+    return (time.perf_counter() - start) * 1000
+
+
+def measure_streaming(voice: str, text: str) -> float:
+    """New mode: decode chunks as they arrive; stop at the first decoded frames."""
+    start = time.perf_counter()
+    decoder = _MP3StreamDecoder()
+
+    async def _first_frames():
+        async for chunk in edge_tts.Communicate(text=text, voice=voice).stream():
+            if chunk.get("type") == "audio" and len(decoder.decode(chunk["data"])):
+                return (time.perf_counter() - start) * 1000
+        raise RuntimeError("no audio decoded")
+
+    return _get_edge_tts_loop().submit(_first_frames()).result(timeout=60)
+
+
+def summarize(samples: list[float]) -> dict:
+    return {
+        "runs": len(samples),
+        "median_ms": round(statistics.median(samples), 1),
+        "min_ms": round(min(samples), 1),
+        "max_ms": round(max(samples), 1),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Edge-TTS time-to-first-audio benchmark")
+    parser.add_argument("--voice", default="en-US-AriaNeural")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--json", dest="json_out", default=None, help="Optional path to write results JSON")
+    args = parser.parse_args()
+
+    results = {}
+    for label, text in TEXTS.items():
+        full = [measure_full(args.voice, text) for _ in range(args.runs)]
+        streaming = [measure_streaming(args.voice, text) for _ in range(args.runs)]
+        results[label] = {
+            "chars": len(text),
+            "download_then_decode": summarize(full),
+            "streaming_decode": summarize(streaming),
+        }
+
+    print(json.dumps(results, indent=2))
+    if args.json_out:
+        Path(args.json_out).write_text(json.dumps(results, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Jellyfin Ingest Benchmark: MusicDatabase.ingest_jellyfin_tracks
+
+Builds a synthetic Jellyfin payload (the track records JellyfinMusicProvider
+returns: artist, album, song, year, genres, jellyfin_id) and loads it into a
+fresh SQLite DB, then re-ingests it incrementally (every path already
+present, genres refreshed). Reports wall time and tracks/s for each pass,
+plus the resulting DB size.
+
+Usage:
+    python research/jellyfin_ingest_benchmark.py
+    python research/jellyfin_ingest_benchmark.py --tracks 100000 --runs 3 --json results.json
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+GENRES = ["Rock", "Punk", "Jazz", "Soul", "Blues", "Metal", "Pop", "Folk", "Electronic", "Country", "Unknown"]
+
+
+def build_payload(count: int, seed: int) -> list:
+    """Synthetic provider records: ~12 tracks per album, ~8 albums per artist."""
+    rng = random.Random(seed)
+    tracks = []
+    for n in range(count):
+        album_no = n // 12
+        artist_no = album_no // 8
+        item_id = f"{n:032x}"
+        genres = rng.sample(GENRES, rng.choice((0, 1, 1, 2)))
+        tracks.append({
+            "id": item_id[:16],
+            "jellyfin_id": item_id,
+            "path": f"jellyfin://{item_id}",
+            "artist": f"Artist {artist_no}",
+            "song": f"Song {n} {rng.choice(['Blue', 'Night', 'Road', 'Fire', 'Home'])}",
+            "album": f"Album {album_no}" if rng.random() > 0.02 else None,
+            "year": 1960 + (album_no % 60),
+            "duration": rng.randrange(90, 600),
+            "genres": genres,
+        })
+    return tracks
+
+
+def summarize(samples: list) -> dict:
+    ordered = sorted(samples)
+    return {
+        "runs": len(samples),
+        "mean_ms": round(statistics.mean(samples), 2),
+        "median_ms": round(statistics.median(samples), 2),
+        "p95_ms": round(ordered[int(0.95 * (len(ordered) - 1))], 2),
+        "max_ms": round(max(samples), 2),
+    }
+
+
+def run_once(tracks: list) -> dict:
+    from core.database import MusicDatabase, init_schema
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "music.db")
+        init_schema(path)
+        db = MusicDatabase(path)
+
+        start = time.perf_counter()
+        full = db.ingest_jellyfin_tracks(tracks, incremental=False)
+        full_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        again = db.ingest_jellyfin_tracks(tracks, incremental=True)
+        incremental_ms = (time.perf_counter() - start) * 1000
+
+        size_mb = os.path.getsize(path) / 1e6
+        db._conn.close()
+    return {"full_ms": full_ms, "incremental_ms": incremental_ms, "full": full, "incremental": again, "db_mb": size_mb}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Jellyfin SQLite ingest benchmark")
+    parser.add_argument("--tracks", type=int, default=100_000, help="Synthetic payload size")
+    parser.add_argument("--runs", type=int, default=3, help="Fresh-DB ingests to time")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--json", dest="json_out", default=None, help="Optional path to write results JSON")
+    args = parser.parse_args()
+
+    tracks = build_payload(args.tracks, args.seed)
+    runs = [run_once(tracks) for _ in range(args.runs)]
+
+    full = summarize([r["full_ms"] for r in runs])
+    results = {
+        "tracks": len(tracks),
+        "full_ingest": full,
+        "incremental_reingest": summarize([r["incremental_ms"] for r in runs]),
+        "full_tracks_per_s": round(len(tracks) / (full["median_ms"] / 1000), 1),
+        "counts": {"full": runs[0]["full"], "incremental": runs[0]["incremental"]},
+        "db_mb": round(runs[0]["db_mb"], 2),
+    }
+
+    print(json.dumps(results, indent=2))
+    if args.json_out:
+        Path(args.json_out).write_text(json.dumps(results, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
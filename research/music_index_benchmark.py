@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Music Index Benchmark: JSON index vs compact mmap store (data/music_index.idx)
+
+Builds a synthetic library (default 100k tracks), writes it both as the JSON
+index (tracks + phonetic keys) and as the compact store, then measures for
+each format: file size, cold load time (parse + lookup maps for JSON, mmap
+for the store), first query latency and Python heap retained after load
+(tracemalloc). Every load runs in a fresh interpreter so caches don't carry over.
+
+Usage:
+    python research/music_index_benchmark.py
+    python research/music_index_benchmark.py --tracks 100000 --runs 5 --json results.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "research"))
+
+from music_resolver_benchmark import build_catalog
+
+# Load paths, each run in a child process. JSON rebuilds the lookup maps the
+# index used to build on every load; the store maps the file and is ready.
+LOADERS = {
+    "json": """
+import json, sys, time, tracemalloc
+tracemalloc.start()
+start = time.perf_counter()
+with open(sys.argv[1], encoding="utf-8") as f:
+    index = json.load(f)
+from core.music_store import KEY_FIELDS, normalize_key
+from core.phonetic import PhoneticIndex
+tracks = index["tracks"]
+postings, fields = {}, {field: {} for field in KEY_FIELDS}
+for pos, track in enumerate(tracks):
+    for token in track["tokens"]:
+        postings.setdefault(token, []).append(pos)
+    for field in KEY_FIELDS:
+        if track.get(field):
+            fields[field].setdefault(normalize_key(track[field]), []).append(pos)
+phonetic = PhoneticIndex.from_dict(index["phonetic"])
+load_ms = (time.perf_counter() - start) * 1000
+start = time.perf_counter()
+hits = [tracks[pos] for pos in fields["artist"].get(normalize_key(sys.argv[2]), ())]
+query_ms = (time.perf_counter() - start) * 1000
+print(json.dumps({"load_ms": load_ms, "query_ms": query_ms, "hits": len(hits),
+                  "heap_mb": tracemalloc.get_traced_memory()[0] / 1e6}))
+""",
+    "store": """
+import json, sys, time, tracemalloc
+tracemalloc.start()
+from core.music_index import MusicIndex
+from core.music_store import TrackStore
+start = time.perf_counter()
+index = MusicIndex("", "")
+index._set_store(TrackStore.load(sys.argv[1]))
+load_ms = (time.perf_counter() - start) * 1000
+start = time.perf_counter()
+hits = list(index.filter_by_artist(sys.argv[2]))
+query_ms = (time.perf_counter() - start) * 1000
+print(json.dumps({"load_ms": load_ms, "query_ms": query_ms, "hits": len(hits),
+                  "heap_mb": tracemalloc.get_traced_memory()[0] / 1e6}))
+""",
+}
+
+
+def full_records(tracks: list) -> list:
+    """Give synthetic catalog rows the fields a scanned track record has."""
+    for track in tracks:
+        name = track["song"].lower()
+        track.update({
+            "path": f"/music/{track['artist']}/{track['album']}/{track['song']}.mp3",
+            "filename": f"{track['song']}.mp3",
+            "name": name,
+            "tokens": sorted(set(f"{track['artist']} {track['album']} {name}".lower().split())),
+            "genre": None,
+            "ext": ".mp3",
+        })
+    return tracks
+
+
+def run_loader(kind: str, path: str, artist: str) -> dict:
+    env = dict(os.environ, MUSIC_ENABLED="false")
+    out = subprocess.run(
+        [sys.executable, "-c", LOADERS[kind], path, artist],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def summarize(samples: list) -> dict:
+    ordered = sorted(samples)
+    return {
+        "runs": len(samples),
+        "mean_ms": round(statistics.mean(samples), 2),
+        "median_ms": round(statistics.median(samples), 2),
+        "p95_ms": round(ordered[int(0.95 * (len(ordered) - 1))], 2),
+        "max_ms": round(max(samples), 2),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Music index load benchmark (JSON vs compact store)")
+    parser.add_argument("--tracks", type=int, default=100_000, help="Synthetic library size")
+    parser.add_argument("--runs", type=int, default=5, help="Cold loads per format")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--json", dest="json_out", default=None, help="Optional path to write results JSON")
+    args = parser.parse_args()
+
+    os.environ["MUSIC_ENABLED"] = "false"
+    from core.music_index import MusicIndex
+
+    tracks = full_records(build_catalog(args.tracks, args.seed))
+    artist = tracks[len(tracks) // 2]["artist"]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = os.path.join(tmp, "music_index.json")
+        index = MusicIndex(tmp, json_path)
+        build_start = time.perf_counter()
+        index._create_store(tracks)
+        build_ms = (time.perf_counter() - build_start) * 1000
+        index.export_json(json_path)
+
+        paths = {"json": json_path, "store": index.store_file}
+        results = {"tracks": len(tracks), "store_build_ms": round(build_ms, 1)}
+        for kind, path in paths.items():
+            runs = [run_loader(kind, path, artist) for _ in range(args.runs)]
+            results[kind] = {
+                "file_mb": round(os.path.getsize(path) / 1e6, 2),
+                "load": summarize([r["load_ms"] for r in runs]),
+                "first_query": summarize([r["query_ms"] for r in runs]),
+                "heap_mb": round(statistics.median(r["heap_mb"] for r in runs), 2),
+                "hits": runs[0]["hits"],
+            }
+
+    results["load_speedup"] = round(
+        results["json"]["load"]["median_ms"] / max(results["store"]["load"]["median_ms"], 0.01), 1
+    )
+    results["heap_ratio"] = round(results["json"]["heap_mb"] / max(results["store"]["heap_mb"], 0.01), 1)
+
+    print(json.dumps(results, indent=2))
+    if args.json_out:
+        Path(args.json_out).write_text(json.dumps(results, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+MusicResolver Benchmark: full SequenceMatcher scan vs trigram-shortlisted fuzzy index
+
+Builds a synthetic catalog (default 100k tracks), derives misspelled queries
+from real artist/album/song names and times MusicResolver._fuzzy_match
+against the legacy path (re-collect candidates, score every one). Also
+reports how often both paths reach the same decision (same best match, or
+both asking for clarification / both below threshold).
+
+Usage:
+    python research/music_resolver_benchmark.py
+    python research/music_resolver_benchmark.py --tracks 100000 --queries 200 --legacy-queries 10
+"""
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.music_resolver import CLARIFY_MARGIN, FUZZY_THRESHOLD, MusicResolver, Resolution
+
+SYLLABLES = [
+    "ka", "lo", "mi", "ther", "ston", "ri", "van", "el", "dor", "sha", "no", "bel", "tra",
+    "quin", "mar", "zu", "fen", "gol", "ra", "ness", "pa", "lin", "cor", "ve", "dra", "sol",
+]
+WORDS = [
+    "black", "night", "river", "electric", "dream", "fire", "summer", "road", "blue", "heart",
+    "city", "queen", "ghost", "wild", "silver", "rain", "love", "midnight", "machine", "stone",
+    "shadow", "golden", "broken", "highway", "ocean", "neon", "paper", "velvet", "thunder", "echo",
+]
+
+
+def _word(rng: random.Random) -> str:
+    if rng.random() < 0.5:
+        return rng.choice(WORDS)
+    return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 3)))
+
+
+def _name(rng: random.Random, low: int, high: int) -> str:
+    return " ".join(_word(rng) for _ in range(rng.randint(low, high))).title()
+
+
+def build_catalog(count: int, seed: int) -> list:
+    rng = random.Random(seed)
+    artists = [_name(rng, 1, 3) for _ in range(max(1, count // 40))]
+    tracks = []
+    albums = {}
+    for i in range(count):
+        artist = rng.choice(artists)
+        albums.setdefault(artist, [_name(rng, 1, 4) for _ in range(rng.randint(1, 6))])
+        tracks.append({
+            "id": f"{i:016x}",
+            "artist": artist,
+            "album": rng.choice(albums[artist]),
+            "song": _name(rng, 1, 5),
+            "year": rng.randint(1960, 2024),
+        })
+    return tracks
+
+
+def misspell(text: str, rng: random.Random) -> str:
+    chars = list(text)
+    for _ in range(1 if len(chars) < 12 else 2):
+        i = rng.randrange(len(chars))
+        op = rng.choice(("drop", "swap", "sub"))
+        if op == "drop" and len(chars) > 3:
+            del chars[i]
+        elif op == "swap" and i + 1 < len(chars):
+            chars[i], chars[i + 1] = chars[i + 1], chars[i]
+        else:
+            chars[i] = rng.choice("abcdefghijklmnopqrstuvwxyz")
+    return "".join(chars)
+
+
+def legacy_fuzzy(resolver: MusicResolver, clean: str) -> Resolution:
+    """The pre-index _fuzzy_match: rebuild candidates, score every one."""
+    candidates = []
+    seen = set()
+    for t in resolver.tracks:
+        for label in ("artist", "album", "song"):
+            value = t.get(label)
+            if not value:
+                continue
+            norm = resolver._normalize(str(value))
+            if norm and (label, norm) not in seen:
+                seen.add((label, norm))
+                candidates.append((label, norm))
+    scored = sorted(
+        ((resolver._ratio(clean, value), label, value) for label, value in candidates),
+        reverse=True,
+        key=lambda item: item[0],
+    )
+    if not scored or scored[0][0] < FUZZY_THRESHOLD:
+        return Resolution([], None, "fuzzy_below_threshold")
+    best_ratio, best_label, best_value = scored[0]
+    if len(scored) > 1:
+        second_ratio, second_label, second_value = scored[1]
+        if second_ratio >= FUZZY_THRESHOLD and abs(best_ratio - second_ratio) <= CLARIFY_MARGIN:
+            return Resolution([], resolver._format_clarification(best_label, best_value, second_label, second_value), "fuzzy_clarify")
+    return Resolution([], None, f"fuzzy:{best_label}:{best_value}")
+
+
+def decision(resolver: MusicResolver, result: Resolution, clean: str) -> str:
+    if result.reason != "fuzzy":
+        return result.reason
+    # Re-derive which candidate won from the index (tracks alone don't say which field matched)
+    ratio, position = resolver._get_fuzzy_index().search(clean, FUZZY_THRESHOLD)[0]
+    label, value = resolver._collect_candidates()[position]
+    return f"fuzzy:{label}:{value}"
+
+
+def summarize(samples: list) -> dict:
+    ordered = sorted(samples)
+    return {
+        "runs": len(samples),
+        "mean_ms": round(statistics.mean(samples), 2),
+        "median_ms": round(statistics.median(samples), 2),
+        "p95_ms": round(ordered[int(0.95 * (len(ordered) - 1))], 2),
+        "max_ms": round(max(samples), 2),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="MusicResolver fuzzy matching benchmark")
+    parser.add_argument("--tracks", type=int, default=100_000, help="Synthetic catalog size")
+    parser.add_argument("--queries", type=int, default=200, help="Queries timed on the indexed path")
+    parser.add_argument("--legacy-queries", type=int, default=10, help="Queries also run on the full-scan path")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--json", dest="json_out", default=None, help="Optional path to write results JSON")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    tracks = build_catalog(args.tracks, args.seed)
+    resolver = MusicResolver(tracks)
+
+    build_start = time.perf_counter()
+    candidates = resolver._collect_candidates()
+    resolver._get_fuzzy_index()
+    build_ms = (time.perf_counter() - build_start) * 1000
+
+    queries = []
+    for _ in range(args.queries):
+        label, value = rng.choice(candidates)
+        queries.append(resolver._normalize(misspell(value, rng)))
+
+    indexed_samples, legacy_samples = [], []
+    agree = 0
+    for i, clean in enumerate(queries):
+        start = time.perf_counter()
+        result = resolver._fuzzy_match(clean)
+        indexed_samples.append((time.perf_counter() - start) * 1000)
+        if i < args.legacy_queries:
+            start = time.perf_counter()
+            legacy = legacy_fuzzy(resolver, clean)
+            legacy_samples.append((time.perf_counter() - start) * 1000)
+            agree += decision(resolver, result, clean) == legacy.reason or (
+                result.reason == legacy.reason == "fuzzy_clarify" and result.clarification == legacy.clarification
+            )
+
+    results = {
+        "tracks": len(tracks),
+        "candidates": len(candidates),
+        "index_build_ms": round(build_ms, 1),
+        "indexed": summarize(indexed_samples),
+        "legacy_full_scan": summarize(legacy_samples) if legacy_samples else None,
+        "decision_agreement": f"{agree}/{len(legacy_samples)}",
+    }
+    if legacy_samples:
+        results["median_speedup"] = round(
+            results["legacy_full_scan"]["median_ms"] / max(results["indexed"]["median_ms"], 0.01), 1
+        )
+
+    print(json.dumps(results, indent=2))
+    if args.json_out:
+        Path(args.json_out).write_text(json.dumps(results, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Piper Benchmark: per-sentence subprocess vs persistent synthesis server
+
+Measures sentence-to-first-sample latency (text handed to Piper -> first PCM
+bytes available for playback). No audio is played.
+
+Usage:
+    python research/piper_server_benchmark.py
+    python research/piper_server_benchmark.py --runs 10 --piper audio/piper/piper/piper.exe \
+        --voice audio/piper/voices/en_US-lessac-medium.onnx
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.piper_server import PiperSynthesisServer, DEFAULT_LENGTH_SCALE
+
+SENTENCES = [
+    "Ready.",
+    "The kettle boils faster at altitude because the air pressure is lower.",
+    "I didn't catch any words. Try again.",
+    "Playing Pink Floyd, The Dark Side of the Moon.",
+    "It is seven forty five in the evening.",
+]
+
+
+def measure_subprocess(piper_path: str, voice_path: str, sentence: str) -> float:
+    """Old mode: spawn piper --output-raw for one sentence (model reload every time)."""
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [piper_path, "--model", voice_path, "--output-raw", "--length_scale", str(DEFAULT_LENGTH_SCALE)],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+    proc.stdin.write(sentence.encode("utf-8"))
+    proc.stdin.close()
+    first = proc.stdout.read(2)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    proc.stdout.read()
+    proc.wait(timeout=30)
+    if not first:
+        raise RuntimeError("piper produced no audio")
+    return elapsed_ms
+
+
+def measure_server(server: PiperSynthesisServer, sentence: str) -> float:
+    """New mode: hand the sentence to the warm server."""
+    start = time.perf_counter()
+    stream = server.synthesize(sentence)
+    first = stream.read(2)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    while stream.read(65536):
+        pass
+    if not first:
+        raise RuntimeError("server produced no audio")
+    return elapsed_ms
+
+
+def summarize(samples: list[float]) -> dict:
+    return {
+        "runs": len(samples),
+        "mean_ms": round(statistics.mean(samples), 1),
+        "median_ms": round(statistics.median(samples), 1),
+        "min_ms": round(min(samples), 1),
+        "max_ms": round(max(samples), 1),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Piper sentence-to-first-sample latency benchmark")
+    parser.add_argument("--piper", default=os.getenv("PIPER_PATH", "audio/piper/piper/piper.exe"))
+    parser.add_argument("--voice", default=os.getenv("PIPER_VOICE", "audio/piper/voices/en_US-lessac-medium.onnx"))
+    parser.add_argument("--runs", type=int, default=3, help="Passes over the sentence set per mode")
+    parser.add_argument("--json", dest="json_out", default=None, help="Optional path to write results JSON")
+    args = parser.parse_args()
+
+    old_samples = []
+    new_samples = []
+
+    print(f"Piper: {args.piper}")
+    print(f"Voice: {args.voice}")
+
+    for _ in range(args.runs):
+        for sentence in SENTENCES:
+            old_samples.append(measure_subprocess(args.piper, args.voice, sentence))
+
+    load_start = time.perf_counter()
+    server = PiperSynthesisServer(args.piper, args.voice).start()
+    # First sentence pays the one-time voice load; report it separately
+    warm_ms = measure_server(server, SENTENCES[0])
+    load_ms = (time.perf_counter() - load_start) * 1000
+    try:
+        for _ in range(args.runs):
+            for sentence in SENTENCES:
+                new_samples.append(measure_server(server, sentence))
+    finally:
+        server.close()
+
+    results = {
+        "subprocess_per_sentence": summarize(old_samples),
+        "persistent_server": summarize(new_samples),
+        "server_backend": server.backend_name,
+        "server_startup_ms": round(load_ms, 1),
+        "server_first_sentence_ms": round(warm_ms, 1),
+    }
+    speedup = results["subprocess_per_sentence"]["median_ms"] / max(results["persistent_server"]["median_ms"], 0.1)
+    results["median_speedup"] = round(speedup, 2)
+
+    print(json.dumps(results, indent=2))
+    if args.json_out:
+        Path(args.json_out).write_text(json.dumps(results, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,17 @@
-"""Rebuild local JSON music index from disk.
+"""Rebuild local music index from disk.
 
 Usage:
     I:/argo/.venv/Scripts/python.exe scripts/rebuild_music_index.py
+    I:/argo/.venv/Scripts/python.exe scripts/rebuild_music_index.py --export-json
+    I:/argo/.venv/Scripts/python.exe scripts/rebuild_music_index.py --from-json
+    I:/argo/.venv/Scripts/python.exe scripts/rebuild_music_index.py --incremental
+
+The index is stored in the compact format beside MUSIC_INDEX_FILE
+(data/music_index.<n>.idx, named by data/music_index.current); the JSON file
+is an import/export format. Exits with status 1 if the index can't be saved.
 """
 
+import argparse
 import os
 import sys
 from pathlib import Path
@@ -13,18 +21,56 @@ REPO_ROOT = Path(__file__).resolve().parents[1]
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
-from core.music_index import get_music_index
+from core.music_index import get_music_index, pointer_path_for, store_path_for
+
+
+def _print_progress(event: dict) -> None:
+    if event.get("phase") == "reading" and event.get("total"):
+        print(f"\rReading tags: {event['done']}/{event['total']}", end="", flush=True)
+    elif event.get("phase") == "done":
+        print()
 
 
 def main() -> None:
+    parser = argparse.ArgumentParser(description="Rebuild the local music index")
+    parser.add_argument("--export-json", nargs="?", const="", default=None, metavar="PATH",
+                        help="Also write the index as JSON (default: MUSIC_INDEX_FILE)")
+    parser.add_argument("--from-json", action="store_true",
+                        help="Rebuild the store from MUSIC_INDEX_FILE instead of rescanning")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Keep the index; only re-read new or changed files (path, size, mtime)")
+    args = parser.parse_args()
+
+    if args.incremental:
+        idx = get_music_index()
+        summary = idx.rescan(incremental=True, progress=_print_progress)
+        print(f"Index tracks: {summary['total']} (+{summary['added']} ~{summary['updated']} "
+              f"-{summary['removed']}, {summary['unchanged']} unchanged, {summary['elapsed_ms']} ms)")
+        if not summary["saved"]:
+            print(f"Index NOT saved: {summary['save_error']}", file=sys.stderr)
+            sys.exit(1)
+        print(f"Index file: {idx.store_file}")
+        if args.export_json is not None:
+            print(f"Exported JSON: {idx.export_json(args.export_json or None)}")
+        return
+
     index_path = os.getenv("MUSIC_INDEX_FILE", "data/music_index.json")
-    if os.path.exists(index_path):
-        os.remove(index_path)
-        print(f"Deleted existing index: {index_path}")
+    # Without a pointer (or pre-generation .idx) the index is rebuilt; old
+    # generation files are pruned by the first save
+    stores = (pointer_path_for(index_path), store_path_for(index_path))
+    for path in stores if args.from_json else (*stores, index_path):
+        if os.path.exists(path):
+            os.remove(path)
+            print(f"Deleted existing index: {path}")
 
     idx = get_music_index()
     print(f"Index tracks: {len(idx.tracks)}")
-    print(f"Index file: {index_path}")
+    if idx.save_error:
+        print(f"Index NOT saved: {idx.save_error}", file=sys.stderr)
+        sys.exit(1)
+    print(f"Index file: {idx.store_file}")
+    if args.export_json is not None:
+        print(f"Exported JSON: {idx.export_json(args.export_json or index_path)}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Offline VAD evaluation on recorded replays.
+
+Runs the configured VAD engines over runtime/replays/*.npy (16 kHz float32
+utterances saved by the pipeline) and reports detected speech segments,
+noise bursts and where each engine would have endpointed, next to the legacy
+`norm * 10 >= threshold` detector with its fixed 0.8s silence counter.
+
+Usage:
+    python scripts/vad_replay.py
+    python scripts/vad_replay.py --engine energy --engine silero --dir runtime/replays
+    python scripts/vad_replay.py --trailing-silence 1.0 --json vad_report.json
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.vad import FRAME_SIZE, SAMPLE_RATE, create_vad, frame_level, segment_audio
+
+
+def legacy_segments(audio: np.ndarray, threshold: float, silence_s: float = 0.8, min_voiced_ms: float = 180.0) -> list:
+    """The pre-VAD capture loop: start on one loud frame, end after a fixed silence."""
+    frame_ms = 1000.0 * FRAME_SIZE / SAMPLE_RATE
+    silence_frames = int((SAMPLE_RATE / FRAME_SIZE) * silence_s)
+    segments, start, silence, voiced = [], None, 0, 0.0
+    for index, offset in enumerate(range(0, len(audio) - FRAME_SIZE + 1, FRAME_SIZE)):
+        loud = frame_level(audio[offset:offset + FRAME_SIZE]) >= threshold
+        if start is None:
+            if loud:
+                start, silence, voiced = index, 0, frame_ms
+            continue
+        if loud:
+            voiced += frame_ms
+            silence = 0
+        else:
+            silence += 1
+        if silence > silence_frames and voiced >= min_voiced_ms:
+            segments.append({"start_s": round(start * frame_ms / 1000, 3), "end_s": round((index + 1) * frame_ms / 1000, 3)})
+            start = None
+    if start is not None:
+        segments.append({"start_s": round(start * frame_ms / 1000, 3), "end_s": None})
+    return segments
+
+
+def evaluate(path: Path, engines: list, settings: dict, threshold: float, trailing_silence_s: float) -> dict:
+    audio = np.asarray(np.load(path), dtype=np.float32).reshape(-1)
+    # Replays end where the old endpoint fired; pad so every engine can endpoint
+    audio = np.concatenate([audio, np.zeros(int(SAMPLE_RATE * trailing_silence_s), dtype=np.float32)])
+    report = {
+        "file": path.name,
+        "duration_s": round(len(audio) / SAMPLE_RATE, 3),
+        "legacy": legacy_segments(audio, threshold),
+    }
+    for engine in engines:
+        detector = create_vad({**settings, "engine": engine}, min_level=threshold)
+        report[detector.engine_name] = [
+            {
+                "start_s": round(seg.start_s, 3),
+                "end_s": None if seg.end_s is None else round(seg.end_s, 3),
+                "voiced_ms": round(seg.voiced_ms),
+                "kind": seg.kind,
+            }
+            for seg in segment_audio(audio, detector)
+        ]
+    return report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Run VAD engines over recorded replays")
+    parser.add_argument("--dir", default="runtime/replays", help="Directory with <interaction_id>.npy replays")
+    parser.add_argument("--engine", action="append", dest="engines", help="energy | silero (repeatable)")
+    parser.add_argument("--threshold", type=float, default=None, help="Legacy level threshold (default: audio.vad_threshold)")
+    parser.add_argument("--trailing-silence", type=float, default=1.0, help="Seconds of silence appended to each replay")
+    parser.add_argument("--json", dest="json_out", default=None, help="Optional path to write the report JSON")
+    args = parser.parse_args()
+
+    settings, threshold = {}, 5.0
+    try:
+        from core.config import get_config
+
+        config = get_config()
+        settings = dict(config.get("audio.vad", {}) or {})
+        threshold = float(config.get("audio.vad_threshold", threshold))
+    except Exception:
+        pass
+    if args.threshold is not None:
+        threshold = args.threshold
+
+    files = sorted(Path(args.dir).glob("*.npy"))
+    if not files:
+        print(f"No .npy replays found in {args.dir}")
+        return 1
+
+    engines = args.engines or ["energy", "silero"]
+    reports = [evaluate(path, engines, settings, threshold, args.trailing_silence) for path in files]
+    summary = {"files": len(reports), "threshold": threshold}
+    detectors = dict.fromkeys(name for report in reports for name in report if name not in {"file", "duration_s"})
+    for key in detectors:
+        segments = [seg for report in reports for seg in report.get(key, [])]
+        summary[key] = {
+            "utterances": sum(1 for seg in segments if seg.get("kind", "speech_end") == "speech_end"),
+            "noise_bursts": sum(1 for seg in segments if seg.get("kind") == "noise_burst"),
+        }
+
+    output = {"summary": summary, "replays": reports}
+    print(json.dumps(output, indent=2))
+    if args.json_out:
+        Path(args.json_out).write_text(json.dumps(output, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+"""
+Test: Input ring buffer (core/audio_ring.py)
+
+Validates:
+- Frames come back as views into the preallocated buffer (no per-frame allocation)
+- Pre-roll and whole-utterance slices cover the right samples, including
+  across the wrap point
+- A stalled consumer skips the oldest audio and counts the overrun instead of
+  growing memory
+- clear() drops unread audio and the utterance mark
+- Blocking read returns None on timeout and wakes up for a producer thread
+"""
+
+import threading
+import time
+
+import numpy as np
+
+from core.audio_ring import AudioRingBuffer
+
+FRAME = 512
+
+
+def _ramp(start, n):
+    return np.arange(start, start + n, dtype=np.float32)
+
+
+def test_frames_are_views_into_ring():
+    ring = AudioRingBuffer(FRAME * 16, frame_size=FRAME)
+    ring.write(_ramp(0, FRAME * 2).reshape(-1, 1))
+    first = ring.read()
+    second = ring.read()
+    assert np.shares_memory(first, ring._buf) and np.shares_memory(second, ring._buf)
+    assert first[0] == 0 and second[0] == FRAME
+    assert ring.read(timeout=0.01) is None
+
+
+def test_preroll_and_utterance_across_wrap():
+    ring = AudioRingBuffer(FRAME * 8, frame_size=FRAME, slack_frames=2)
+    written = 0
+    # Advance close to the end so the utterance straddles the wrap point
+    for _ in range(6):
+        ring.write(_ramp(written, FRAME))
+        written += FRAME
+        ring.read()
+    start = ring.mark(preroll_samples=FRAME * 2)
+    assert start == written - FRAME * 2
+    assert np.array_equal(ring.preroll(FRAME * 2), _ramp(start, FRAME * 2))
+    for _ in range(3):
+        ring.write(_ramp(written, FRAME))
+        written += FRAME
+        ring.read()
+    utterance = ring.utterance()
+    assert np.array_equal(utterance, _ramp(start, written - start))
+    assert ring.utterance_overruns == 0
+
+
+def test_stalled_consumer_overruns_with_bounded_memory():
+    ring = AudioRingBuffer(FRAME * 8, frame_size=FRAME, slack_frames=2)
+    nbytes = ring._buf.nbytes
+    for i in range(40):
+        ring.write(_ramp(i * FRAME, FRAME))
+    frame = ring.read()
+    assert ring.overruns == 1
+    assert ring.dropped_samples == 40 * FRAME - (8 - 2) * FRAME
+    # Resumes from the oldest safe sample, not the stale read position
+    assert frame[0] == (40 - 6) * FRAME
+    assert ring._buf.nbytes == nbytes
+
+
+def test_long_utterance_is_clipped_to_newest_audio():
+    ring = AudioRingBuffer(FRAME * 8, frame_size=FRAME, slack_frames=2)
+    ring.write(_ramp(0, FRAME))
+    ring.read()
+    ring.mark()
+    for i in range(1, 20):
+        ring.write(_ramp(i * FRAME, FRAME))
+        ring.read()
+    utterance = ring.utterance()
+    assert ring.utterance_overruns == 1
+    assert utterance[-1] == 20 * FRAME - 1
+    assert utterance.size <= ring.capacity
+
+
+def test_clear_drops_unread_audio_and_mark():
+    ring = AudioRingBuffer(FRAME * 8, frame_size=FRAME)
+    ring.write(_ramp(0, FRAME * 3))
+    ring.read()
+    ring.mark(FRAME)
+    ring.clear()
+    assert ring.available == 0
+    assert ring.utterance().size == 0
+    assert ring.preroll(FRAME).size == 0
+
+
+def test_blocking_read_wakes_for_producer():
+    ring = AudioRingBuffer(FRAME * 8, frame_size=FRAME)
+    t0 = time.monotonic()
+    assert ring.read(timeout=0.05) is None
+    assert time.monotonic() - t0 >= 0.04
+
+    def produce():
+        for i in range(4):
+            time.sleep(0.01)
+            ring.write(_ramp(i * 128, 128))
+
+    worker = threading.Thread(target=produce)
+    worker.start()
+    frame = ring.read(timeout=2.0)
+    worker.join()
+    assert frame is not None and np.array_equal(frame, _ramp(0, FRAME))
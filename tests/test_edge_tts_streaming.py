@@ -0,0 +1,193 @@
+"""
+Test: In-memory Edge-TTS streaming decode (EdgeTTSOutputSink)
+
+Validates:
+- MP3 chunks decode incrementally in memory (no temp files, no pydub)
+- Playback starts on the first decoded frames, before the stream ends
+- stop_sync() aborts playback and cancels the network side
+- All requests share one persistent event-loop thread
+- Streamed, downloaded and cached audio play at the same (fixed-gain) level
+"""
+
+import io
+import sys
+import threading
+import types
+
+import numpy as np
+import pytest
+
+av = pytest.importorskip("av")
+
+from core import output_sink
+from core.output_sink import EdgeTTSOutputSink, _MP3StreamDecoder
+
+
+def _encode_mp3(seconds=1.0, rate=24000):
+    buf = io.BytesIO()
+    container = av.open(buf, "w", format="mp3")
+    stream = container.add_stream("mp3", rate=rate)
+    stream.layout = "mono"
+    t = np.arange(int(rate * seconds)) / rate
+    signal = (0.5 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
+    for offset in range(0, len(signal), 1152):
+        frame = av.AudioFrame.from_ndarray(signal[offset:offset + 1152].reshape(1, -1), format="fltp", layout="mono")
+        frame.sample_rate = rate
+        for packet in stream.encode(frame):
+            container.mux(packet)
+    for packet in stream.encode(None):
+        container.mux(packet)
+    container.close()
+    return buf.getvalue()
+
+
+class FakeCommunicate:
+    """edge_tts.Communicate stand-in that streams scripted MP3 chunks."""
+
+    def __init__(self, mp3, chunk_size=2000, gate=None, gate_after=1):
+        self._mp3 = mp3
+        self._chunk_size = chunk_size
+        self._gate = gate
+        self._gate_after = gate_after
+        self.finished = False
+        self.threads = set()
+
+    async def stream(self):
+        import asyncio
+
+        self.threads.add(threading.current_thread().name)
+        chunks = [self._mp3[i:i + self._chunk_size] for i in range(0, len(self._mp3), self._chunk_size)]
+        for idx, chunk in enumerate(chunks):
+            if self._gate is not None and idx == self._gate_after:
+                while not self._gate.is_set():
+                    await asyncio.sleep(0.01)
+            yield {"type": "audio", "data": chunk}
+            yield {"type": "WordBoundary", "offset": idx}
+        self.finished = True
+
+
+class FakeOutputStream:
+    def __init__(self, recorder, **kwargs):
+        self.recorder = recorder
+        recorder.opened.append(kwargs)
+
+    def start(self):
+        pass
+
+    def write(self, data):
+        self.recorder.written.append(np.array(data))
+        if self.recorder.on_write:
+            self.recorder.on_write()
+
+    def stop(self):
+        self.recorder.closed_with = "stop"
+
+    def abort(self):
+        self.recorder.closed_with = "abort"
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def fake_sd(monkeypatch):
+    recorder = types.SimpleNamespace(opened=[], written=[], closed_with=None, on_write=None, played=[])
+    module = types.ModuleType("sounddevice")
+    module.OutputStream = lambda **kwargs: FakeOutputStream(recorder, **kwargs)
+    module.stop = lambda: None
+    module.play = lambda samples, samplerate=None, blocking=False: recorder.played.append(samples)
+    module.get_stream = lambda: None
+    module.wait = lambda: None
+    monkeypatch.setitem(sys.modules, "sounddevice", module)
+    return recorder
+
+
+def _make_sink(communicate):
+    sink = EdgeTTSOutputSink()
+    sink._tts_cache = None
+    sink._streaming = True
+    sink._communicate = lambda _text: communicate
+    return sink
+
+
+def test_decoder_is_incremental():
+    mp3 = _encode_mp3(seconds=1.0)
+    decoder = _MP3StreamDecoder()
+    first = decoder.decode(mp3[:2000])
+    assert len(first) > 0
+    rest = decoder.decode(mp3[2000:])
+    tail = decoder.flush()
+    total = len(first) + len(rest) + len(tail)
+    assert decoder.sample_rate == 24000
+    assert decoder.channels == 1
+    assert 24000 <= total <= 24000 + 2 * 1152
+    assert first.dtype == np.int16
+
+
+def test_playback_starts_before_stream_finishes(fake_sd):
+    first_write = threading.Event()
+    fake_sd.on_write = first_write.set
+    communicate = FakeCommunicate(_encode_mp3(seconds=2.0), gate=first_write, gate_after=2)
+    sink = _make_sink(communicate)
+
+    sink.speak("A reasonably long sentence for streaming.")
+
+    assert communicate.finished
+    assert fake_sd.opened[0]["samplerate"] == 24000
+    assert fake_sd.closed_with == "stop"
+    assert sum(len(block) for block in fake_sd.written) >= 48000
+    assert sink.last_time_to_first_audio_ms is not None
+
+
+def test_stop_aborts_playback_and_cancels_stream(fake_sd):
+    never = threading.Event()  # the network side can only end by cancellation
+    communicate = FakeCommunicate(_encode_mp3(seconds=2.0), gate=never, gate_after=2)
+    sink = _make_sink(communicate)
+    fake_sd.on_write = sink.stop_sync
+
+    sink.speak("Stop me.")
+
+    assert fake_sd.closed_with == "abort"
+    assert len(fake_sd.written) == 1
+    assert not communicate.finished
+
+
+def test_requests_share_one_event_loop_thread(fake_sd):
+    first = FakeCommunicate(_encode_mp3(seconds=0.3))
+    second = FakeCommunicate(_encode_mp3(seconds=0.3))
+    sink = _make_sink(first)
+    sink.speak("One.")
+    sink._communicate = lambda _text: second
+    sink.speak("Two.")
+    assert first.threads == second.threads == {"ARGO.EdgeTTSLoop"}
+    assert output_sink._get_edge_tts_loop() is output_sink._get_edge_tts_loop()
+
+
+def test_streamed_audio_replays_at_played_level(fake_sd):
+    from core.tts_cache import CacheablePhrase, TTSAudioCache
+
+    sink = _make_sink(FakeCommunicate(_encode_mp3(seconds=0.3)))
+    sink._tts_cache = TTSAudioCache(cache_dir=None)
+    sink.speak(CacheablePhrase("Done."))
+    streamed = np.concatenate(fake_sd.written)
+
+    sink.speak(CacheablePhrase("Done."))  # cache hit: replays the stored buffer verbatim
+    replayed = np.round(fake_sd.played[0] * 32768.0).astype(np.int16)
+    assert np.array_equal(replayed.reshape(streamed.shape), streamed)
+
+
+def test_streamed_and_downloaded_audio_play_at_the_same_level(fake_sd, monkeypatch):
+    monkeypatch.setattr(output_sink, "EDGE_TTS_OUTPUT_GAIN", 0.5)
+    mp3 = _encode_mp3(seconds=0.3)
+    sink = _make_sink(FakeCommunicate(mp3))
+    sink.speak("Done.")
+    streamed = np.concatenate(fake_sd.written).reshape(-1)
+
+    sink._fetch_mp3 = lambda _text: mp3
+    downloaded = np.frombuffer(sink._synthesize("Done.").pcm, dtype=np.int16)
+    decoder = _MP3StreamDecoder()
+    source = np.concatenate([decoder.decode(mp3), decoder.flush()]).reshape(-1)
+
+    assert np.array_equal(streamed, downloaded)
+    peak = int(np.max(np.abs(source.astype(np.int32))))
+    assert abs(int(np.max(np.abs(downloaded.astype(np.int32)))) - peak // 2) <= 1
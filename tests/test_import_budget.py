@@ -0,0 +1,96 @@
+"""
+Test: Lazy imports and the core.pipeline import-time budget
+
+Validates:
+- lazy_module defers running a module until first attribute access, and
+  threads racing on that access all see the fully executed module;
+  lazy_callable imports on first call and keeps its own __module__
+- -X importtime output parses into per-module records and an import cost
+- `import core.pipeline` in a fresh interpreter stays under
+  system.import_budget_ms and leaves the heavy subsystems unimported
+"""
+
+import os
+import sys
+import threading
+
+import pytest
+
+from core.config import get_config
+from core.import_profile import import_cost_us, parse_importtime, profile_import, report
+from core.lazy_import import lazy_callable, lazy_module
+
+SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 | site
+import time:       300 |        300 |     numpy._core
+import time:       200 |        500 |   numpy
+import time:        50 |         50 | core
+import time:      1000 |       1550 | core.pipeline
+"""
+
+
+def test_lazy_module_runs_on_first_access(tmp_path, monkeypatch):
+    (tmp_path / "argo_lazy_probe.py").write_text("LOADS = []\nLOADS.append(1)\nVALUE = 42\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "argo_lazy_probe", raising=False)
+
+    probe = lazy_module("argo_lazy_probe")
+    assert "LOADS" not in object.__getattribute__(probe, "__dict__")
+    assert probe.VALUE == 42
+    assert probe.LOADS == [1]
+    assert lazy_module("argo_lazy_probe") is probe
+    with pytest.raises(ModuleNotFoundError):
+        lazy_module("argo_no_such_module")
+
+    join = lazy_callable("os.path", "join")
+    assert join.__name__ == "join"
+    assert join.__module__ == "core.lazy_import"
+    assert join("a", "b") == os.path.join("a", "b")
+    assert join.__wrapped__ is os.path.join
+
+
+def test_lazy_module_first_access_from_threads(tmp_path, monkeypatch):
+    (tmp_path / "argo_lazy_slow.py").write_text(
+        "import time\nRUNS = [1]\ntime.sleep(0.2)\nVALUE = 42\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "argo_lazy_slow", raising=False)
+
+    slow = lazy_module("argo_lazy_slow")
+    start = threading.Barrier(4)
+    seen = []
+
+    def touch():
+        start.wait()
+        try:
+            seen.append(slow.VALUE)
+        except AttributeError as e:
+            seen.append(e)
+
+    threads = [threading.Thread(target=touch) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+    assert seen == [42, 42, 42, 42]
+    assert slow.RUNS == [1]
+
+
+def test_parse_importtime():
+    records = parse_importtime(SAMPLE)
+    assert [(r.module, r.depth) for r in records] == [
+        ("site", 0), ("numpy._core", 2), ("numpy", 1), ("core", 0), ("core.pipeline", 0),
+    ]
+    assert import_cost_us(records, "core.pipeline") == 1600
+    text = report({"module": "core.pipeline", "total_ms": 1.6, "records": records}, top=2)
+    assert text.splitlines()[0] == "import core.pipeline: 1.6 ms (5 modules)"
+
+
+def test_core_pipeline_import_budget():
+    budget_ms = float(get_config().get("system.import_budget_ms", 500))
+    profile = profile_import("core.pipeline")
+    imported = {r.module for r in profile["records"]}
+
+    assert not imported & {"ollama", "faster_whisper", "core.music_player", "system_health", "core.bluetooth"}
+    assert profile["total_ms"] <= budget_ms, report(profile, top=15)
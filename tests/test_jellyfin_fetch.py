@@ -0,0 +1,122 @@
+"""
+Test: Paginated Jellyfin fetch and delta sync (against MockJellyfinServer)
+
+Validates:
+- Libraries larger than one page are fetched in full, in order, with at most
+  music.jellyfin_fetch_workers page requests in flight
+- since= sends minDateLastSaved and returns only items saved after it
+- Delta fetches don't page through artists/albums; genres for changed tracks
+  come from an ids= lookup of their parents
+- A failed page is skipped and clears last_fetch_complete
+- ingest_jellyfin_library streams pages into SQLite: the first sync is full,
+  later ones fetch and replace only changed items, and the sync watermark only
+  advances after a complete fetch
+"""
+
+import pytest
+
+import core.jellyfin_ingest as jellyfin_ingest
+import core.jellyfin_provider as jellyfin_provider
+from core.database import MusicDatabase
+from mock_jellyfin_provider import MockJellyfinServer, audio_item
+
+
+@pytest.fixture
+def paging(monkeypatch):
+    monkeypatch.setattr(jellyfin_provider, "_get_page_size", lambda: 100)
+    monkeypatch.setattr(jellyfin_provider, "_get_fetch_workers", lambda: 3)
+
+
+@pytest.fixture
+def connect(monkeypatch):
+    def _connect(server):
+        monkeypatch.setattr(jellyfin_provider, "JELLYFIN_URL", server.url)
+        monkeypatch.setattr(jellyfin_provider, "JELLYFIN_API_KEY", server.api_key)
+        monkeypatch.setattr(jellyfin_provider, "JELLYFIN_USER_ID", "user")
+        return jellyfin_provider.JellyfinMusicProvider()
+    return _connect
+
+
+def _audio_requests(server):
+    return [r for r in server.requests if r.get("includeItemTypes") == "Audio"]
+
+
+def test_fetches_every_page_with_bounded_concurrency(paging, connect):
+    with MockJellyfinServer([audio_item(n) for n in range(1050)], delay=0.02) as server:
+        provider = connect(server)
+        tracks = provider.load_music_library()
+
+        assert [t["jellyfin_id"] for t in tracks] == [f"audio{n:06d}" for n in range(1050)]
+        assert provider.last_fetch_complete
+        starts = sorted(int(r["startIndex"]) for r in _audio_requests(server))
+        assert starts == list(range(0, 1100, 100))
+        assert {r["limit"] for r in _audio_requests(server)} == {"100"}
+        assert 1 < server.max_in_flight <= 3
+
+
+def test_delta_and_failed_pages(paging, connect):
+    items = [audio_item(n) for n in range(300)]
+    items[42] = audio_item(42, saved="2024-03-01T00:00:00Z", Name="Retitled")
+    with MockJellyfinServer(items) as server:
+        provider = connect(server)
+        changed = provider.load_music_library(since="2024-02-01T00:00:00Z")
+        assert [t["song"] for t in changed] == ["Retitled"]
+        assert _audio_requests(server)[-1]["minDateLastSaved"] == "2024-02-01T00:00:00Z"
+
+        server.fail_starts = {100}
+        tracks = provider.load_music_library()
+        assert len(tracks) == 200
+        assert not provider.last_fetch_complete
+
+
+def test_ingest_full_then_delta(paging, connect, monkeypatch, tmp_path):
+    monkeypatch.setattr(jellyfin_ingest, "LOCK_FILE", tmp_path / ".ingest.lock")
+    db_path = str(tmp_path / "music.db")
+    items = [audio_item(n) for n in range(250)]
+
+    with MockJellyfinServer(items) as server:
+        provider = connect(server)
+        result = jellyfin_ingest.ingest_jellyfin_library(db_path=db_path, provider=provider)
+        assert result["ingested"] == 250
+        db = MusicDatabase(db_path)
+        watermark = db.get_meta(jellyfin_ingest.SYNC_META_KEY)
+        assert watermark
+
+        # Nightly delta: only the changed item is fetched, and it replaces its row
+        items[7] = audio_item(7, saved="2999-01-01T00:00:00Z", Name="Remastered")
+        items.append(audio_item(250, saved="2999-01-01T00:00:00Z"))
+        server.requests.clear()
+        result = jellyfin_ingest.ingest_jellyfin_library(db_path=db_path, provider=provider)
+        assert result["ingested"] == 2
+        assert len(_audio_requests(server)) == 1
+        assert _audio_requests(server)[0]["minDateLastSaved"] < watermark
+        db = MusicDatabase(db_path)
+        assert db.count_tracks() == 251
+        assert db.query_tracks(title="Song 7") == []
+        assert db.query_tracks_soft_title("remastered")[0]["artist"] == "Artist 0"
+
+        # An incomplete fetch keeps the old watermark
+        previous = db.get_meta(jellyfin_ingest.SYNC_META_KEY)
+        server.fail_starts = {0}
+        jellyfin_ingest.ingest_jellyfin_library(db_path=db_path, provider=provider, delta=False)
+        assert MusicDatabase(db_path).get_meta(jellyfin_ingest.SYNC_META_KEY) == previous
+
+
+def test_delta_looks_up_only_changed_tracks_parents(paging, connect):
+    items = [audio_item(n) for n in range(300)]
+    items[42] = audio_item(42, saved="2024-03-01T00:00:00Z", Genres=[], AlbumArtists=[{"Id": "artist0", "Name": "Artist 0"}])
+    items += [
+        {"Id": "album00004", "Type": "MusicAlbum", "Name": "Album 4", "Genres": ["Jazz"]},
+        {"Id": "album00005", "Type": "MusicAlbum", "Name": "Album 5", "Genres": ["Pop"]},
+        {"Id": "artist0", "Type": "MusicArtist", "Name": "Artist 0", "Genres": ["Blues"]},
+    ]
+    with MockJellyfinServer(items) as server:
+        provider = connect(server)
+        changed = provider.load_music_library(since="2024-02-01T00:00:00Z")
+
+        assert [t["genres"] for t in changed] == [["jazz"]]
+        assert provider.last_fetch_complete
+        assert not [r for r in server.requests if r.get("includeItemTypes") in ("MusicAlbum", "MusicArtist")]
+        lookups = [r for r in server.requests if "ids" in r]
+        assert [sorted(r["ids"].split(",")) for r in lookups] == [["album00004", "artist0"]]
+        assert "album00005" not in provider.album_genres_by_id
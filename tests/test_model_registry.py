@@ -0,0 +1,172 @@
+"""
+Test: Shared model registry (core/model_registry.py)
+
+Validates:
+- Equal (engine, size, device, compute_type) keys share one load, one model
+  and one lock; with idle_ttl=0 the model is dropped once the last handle is
+  released (or garbage collected)
+- With an idle TTL the model stays resident after the last release, is
+  reused by an acquire() inside the window and unloaded after it
+- load() runs the loader on the calling thread and later acquires share it
+- preload() loads in the background and returns a Future; an acquire()
+  during that load waits for it instead of loading again
+- A failed load raises from acquire() and is retried on the next request
+- STTEngineManagers with the same settings share one Whisper instance
+"""
+
+import gc
+import sys
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+import core.model_registry as model_registry
+from core.model_registry import ModelRegistry
+
+
+class _Loader:
+    def __init__(self):
+        self.calls = []
+        self.threads = []
+        self.gate = threading.Event()
+        self.gate.set()
+        self.fail = False
+
+    def __call__(self, key):
+        self.calls.append(key)
+        self.threads.append(threading.current_thread())
+        self.gate.wait(5)
+        if self.fail:
+            raise RuntimeError("CUDA not available")
+        return object()
+
+
+@pytest.fixture
+def loader():
+    return _Loader()
+
+
+@pytest.fixture
+def registry(loader):
+    return ModelRegistry(loaders={"fake": loader}, idle_ttl=0)
+
+
+def test_acquire_shares_and_refcounts(registry, loader):
+    first = registry.acquire("fake", "small")
+    second = registry.acquire("fake", "small")
+    other = registry.acquire("fake", "small", device="cuda")
+
+    assert first.model is second.model
+    assert first.lock is second.lock
+    assert other.model is not first.model
+    assert len(loader.calls) == 2
+    assert registry.refcount("fake", "small") == 2
+
+    first.release()
+    first.release()  # idempotent
+    assert registry.refcount("fake", "small") == 1
+    second.release()
+    assert registry.loaded() == {registry.key("fake", "small", "cuda"): 1}
+
+    del other
+    gc.collect()
+    assert registry.loaded() == {}
+    registry.acquire("fake", "small")
+    assert len(loader.calls) == 3
+
+
+def _wait_unloaded(registry, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while registry.loaded() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_idle_model_stays_resident_for_ttl(loader):
+    registry = ModelRegistry(loaders={"fake": loader}, idle_ttl=0.2)
+    key = registry.key("fake", "small")
+
+    first = registry.acquire("fake", "small")
+    model = first.model
+    first.release()
+    assert registry.loaded() == {key: 0}
+
+    second = registry.acquire("fake", "small")  # inside the window: no reload
+    assert second.model is model
+    assert len(loader.calls) == 1
+    time.sleep(0.3)  # the first release's unload must not fire while held
+    assert registry.loaded() == {key: 1}
+
+    second.release()
+    _wait_unloaded(registry)
+    assert registry.loaded() == {}
+    registry.acquire("fake", "small")
+    assert len(loader.calls) == 2
+
+
+def test_load_runs_on_calling_thread(registry, loader):
+    model = registry.load("fake", "small")
+
+    assert loader.threads == [threading.current_thread()]
+    assert registry.ready("fake", "small")
+    assert registry.load("fake", "small") is model
+    assert registry.acquire("fake", "small").model is model
+    assert len(loader.calls) == 1
+
+    loader.fail = True
+    with pytest.raises(RuntimeError, match="CUDA"):
+        registry.load("fake", "base")
+    loader.fail = False
+    assert registry.load("fake", "base") is not None
+    assert len(loader.calls) == 3
+
+
+def test_preload_in_background(registry, loader):
+    loader.gate.clear()
+    future = registry.preload("fake", "base")
+    assert not registry.ready("fake", "base")
+
+    acquired = []
+    waiter = threading.Thread(target=lambda: acquired.append(registry.acquire("fake", "base")))
+    waiter.start()
+    loader.gate.set()
+    waiter.join(5)
+
+    assert acquired[0].model is future.result(5)
+    assert registry.ready("fake", "base")
+    assert len(loader.calls) == 1
+    assert registry.preload("fake", "base") is future
+
+
+def test_failed_load_is_retried(registry, loader):
+    loader.fail = True
+    with pytest.raises(RuntimeError, match="CUDA"):
+        registry.acquire("fake", "base")
+    assert registry.loaded() == {}
+
+    loader.fail = False
+    assert registry.acquire("fake", "base").model is not None
+    assert len(loader.calls) == 2
+    with pytest.raises(ValueError):
+        registry.acquire("nope", "base")
+
+
+def test_stt_managers_share_one_whisper(monkeypatch):
+    from core.stt_engine_manager import STTEngineManager, preload_engine_model
+
+    whisper = MagicMock()
+    monkeypatch.setitem(sys.modules, "whisper", whisper)
+    monkeypatch.setattr(model_registry, "_registry", ModelRegistry(idle_ttl=0))
+
+    preloaded = preload_engine_model("openai", "tiny", "cpu")
+    first = STTEngineManager(engine="openai", model_size="tiny", device="cpu")
+    second = STTEngineManager(engine="openai", model_size="tiny", device="cpu")
+
+    whisper.load_model.assert_called_once_with("tiny", device="cpu")
+    assert first.model is second.model is preloaded
+    assert first._model_lock is second._model_lock
+
+    first.close()
+    second.close()
+    assert model_registry.get_model_registry().loaded() == {}
@@ -0,0 +1,94 @@
+"""
+Test: Bulk Jellyfin ingest (MusicDatabase.ingest_jellyfin_tracks)
+
+Validates:
+- Tracks, artists, albums and genres land correctly across batch boundaries
+  (one album row per artist + title, junk artists/genres handled as before)
+- Incremental re-ingest skips known paths but refreshes their genres; a full
+  re-ingest replaces them; a path repeated in one payload keeps the last copy
+- Records without a title or Jellyfin id count as errors; a failing batch
+  rolls back and raises
+- Phonetic keys follow renamed titles
+- The DB is left in WAL mode with the connection's synchronous setting restored
+"""
+
+import sqlite3
+
+import pytest
+
+import core.database as database
+from core.database import MusicDatabase, init_schema
+
+
+def _track(n, **fields):
+    track = {"jellyfin_id": f"id{n}", "artist": "Pink Floyd", "album": "Meddle", "song": f"Song {n}",
+             "year": 1971, "genres": ["Rock"]}
+    track.update(fields)
+    return track
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    monkeypatch.setattr(database, "INGEST_BATCH_SIZE", 2)
+    path = tmp_path / "music.db"
+    init_schema(str(path))
+    return MusicDatabase(path)
+
+
+def _rows(db, sql):
+    return db._ensure_connection().execute(sql).fetchall()
+
+
+def test_bulk_ingest_across_batches(db):
+    payload = [
+        _track(1),
+        _track(2, genres=["Rock", "Psychedelic", "Unknown"]),
+        _track(3, album="Animals", year=1977),
+        _track(4, artist="unknown artist", album=None, genres="Ambient"),
+        _track(5, song=" ", name=None),
+        _track(6, jellyfin_id=None),
+        _track(7, artist="The Clash", album="London Calling", genres=[], genre="Punk"),
+    ]
+    assert db.ingest_jellyfin_tracks(payload, incremental=False) == {"ingested": 5, "skipped": 0, "errors": 2}
+
+    assert _rows(db, "SELECT a.name, al.title, al.year FROM albums al JOIN artists a ON a.id = al.artist_id ORDER BY al.id") == [
+        ("Pink Floyd", "Meddle", 1971),
+        ("Pink Floyd", "Animals", 1977),
+        ("Unknown Artist", None, 1971),
+        ("The Clash", "London Calling", 1971),
+    ]
+    assert [t["song"] for t in db.query_tracks(genre="psychedelic")] == ["Song 2"]
+    assert db.query_tracks(title="Song 4")[0]["artist"] == "Unknown Artist"
+    assert db.query_tracks(genre="punk")[0]["artist"] == "The Clash"
+    assert _rows(db, "SELECT COUNT(*) FROM genres WHERE name = 'Unknown'") == [(0,)]
+
+    conn = db._ensure_connection()
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] != 0
+
+
+def test_reingest_modes(db):
+    db.ingest_jellyfin_tracks([_track(1), _track(2)], incremental=False)
+
+    counts = db.ingest_jellyfin_tracks([_track(1, genres=["Prog"], song="Renamed"), _track(3)])
+    assert counts == {"ingested": 1, "skipped": 1, "errors": 0}
+    assert db.query_tracks(title="Song 1")[0]["genre"] == ["Prog"]  # kept title, new genres
+
+    counts = db.ingest_jellyfin_tracks([_track(1, song="Echoes"), _track(1, song="One of These Days")], incremental=False)
+    assert counts == {"ingested": 1, "skipped": 0, "errors": 0}
+    assert _rows(db, "SELECT title FROM tracks WHERE path = 'jellyfin://id1'") == [("One of These Days",)]
+    assert _rows(db, "SELECT COUNT(*) FROM albums") == [(1,)]
+    assert _rows(db, "SELECT COUNT(*) FROM phonetic_keys WHERE value = 'Song 1'") == [(0,)]
+    assert db.phonetic_lookup("one of these daze")[0][1:] == ("song", "One of These Days")
+    assert db.query_tracks_soft_title("one of these days")[0]["genre"] == ["Rock"]
+    assert db.query_tracks_artist_like("floyd", limit=10)[0]["artist"] == "Pink Floyd"
+
+
+def test_missing_schema_table_raises_and_rolls_back(db):
+    db.ingest_jellyfin_tracks([_track(1)], incremental=False)
+    conn = db._ensure_connection()
+    conn.execute("DROP TABLE track_genres")
+    conn.commit()
+    with pytest.raises(sqlite3.OperationalError):
+        db.ingest_jellyfin_tracks([_track(2)], incremental=False)
+    assert _rows(db, "SELECT COUNT(*) FROM tracks") == [(1,)]
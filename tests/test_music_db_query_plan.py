@@ -0,0 +1,150 @@
+"""
+Test: Indexed SQLite music lookups (core/database.py)
+
+Validates:
+- query_tracks title/artist/genre filters are case-insensitive and start
+  from the NOCASE indexes (EXPLAIN QUERY PLAN never scans tracks/artists/genres)
+- query_tracks_soft_title searches tracks.title_key (exact, then prefix)
+- query_tracks_artist_like substring matches come from the track_search FTS5
+  table, which follows incremental ingests
+- A 1.0 database is migrated in place on first connect
+"""
+
+import sqlite3
+
+import pytest
+
+from core.database import EXPECTED_SCHEMA_VERSION, MusicDatabase, init_schema
+
+TRACKS = [
+    {"jellyfin_id": "1", "artist": "Pink Floyd", "album": "Meddle", "song": "Echoes", "year": 1971, "genres": ["Rock"]},
+    {"jellyfin_id": "2", "artist": "Pink Floyd", "album": "Animals", "song": "Dogs", "year": 1977, "genres": ["Rock"]},
+    {"jellyfin_id": "3", "artist": "The Clash", "album": "London Calling", "song": "The Guns of Brixton", "year": 1979, "genres": ["Punk"]},
+    {"jellyfin_id": "4", "artist": "Echo & the Bunnymen", "album": "Ocean Rain", "song": "The Killing Moon", "year": 1984, "genres": ["Post-Punk"]},
+]
+
+
+class _RecordingCursor:
+    def __init__(self, recorder, cursor):
+        self._recorder = recorder
+        self._cursor = cursor
+
+    def execute(self, sql, params=()):
+        self._recorder.statements.append((sql, params))
+        return self._cursor.execute(sql, params)
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+class _Recorder:
+    """Connection stand-in that keeps every (sql, params) its cursors run."""
+
+    def __init__(self, conn):
+        self._conn = conn
+        self.statements = []
+
+    def cursor(self):
+        return _RecordingCursor(self, self._conn.cursor())
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+
+@pytest.fixture
+def db(tmp_path):
+    path = tmp_path / "music.db"
+    init_schema(str(path))
+    database = MusicDatabase(path)
+    database.ingest_jellyfin_tracks(TRACKS, incremental=False)
+    database._conn = _Recorder(database._ensure_connection())
+    return database
+
+
+def _plan(db, sql, params):
+    rows = db._conn._conn.execute("EXPLAIN QUERY PLAN " + sql, params).fetchall()
+    return [row[3] for row in rows]
+
+
+def _last_plan(db):
+    sql, params = next(s for s in reversed(db._conn.statements) if "FROM tracks t" in s[0])
+    return _plan(db, sql, params)
+
+
+def _assert_no_scan(plan, *aliases):
+    for alias in aliases:
+        assert not any(step.startswith(f"SCAN {alias}") for step in plan), plan
+
+
+@pytest.mark.parametrize(
+    "filters, index, songs",
+    [
+        ({"title": "ECHOES"}, "idx_tracks_title_nocase", ["Echoes"]),
+        ({"artist": "pink floyd"}, "idx_artists_name_nocase", ["Echoes", "Dogs"]),
+        ({"genre": "punk"}, "idx_genres_name_nocase", ["The Guns of Brixton"]),
+        ({"title": "dogs", "artist": "PINK FLOYD"}, "idx_tracks_title_nocase", ["Dogs"]),
+    ],
+)
+def test_query_tracks_uses_nocase_indexes(db, filters, index, songs):
+    assert [t["song"] for t in db.query_tracks(**filters)] == songs
+    args = dict(title=None, artist=None, genre=None, year_start=None, year_end=None, limit=50)
+    args.update(filters)
+    plan = _plan(db, *db._track_query_sql(**args))
+    _assert_no_scan(plan, "t", "a", "g")
+    assert any(index in step for step in plan), plan
+
+
+def test_soft_title_searches_title_key(db):
+    assert [t["song"] for t in db.query_tracks_soft_title("guns of brixton!")] == ["The Guns of Brixton"]
+    plan = _last_plan(db)
+    _assert_no_scan(plan, "t")
+    assert any("idx_tracks_title_key" in step for step in plan), plan
+
+    # No exact key -> every title whose key starts with it
+    assert [t["song"] for t in db.query_tracks_soft_title("the killing")] == ["The Killing Moon"]
+    assert db.query_tracks_soft_title("nothing like it") == []
+
+
+def test_artist_like_uses_fts(db):
+    assert [t["song"] for t in db.query_tracks_artist_like("floyd")] == ["Echoes", "Dogs"]
+    plan = _last_plan(db)
+    assert any("track_search VIRTUAL TABLE" in step for step in plan), plan
+    _assert_no_scan(plan, "a")
+
+    db.ingest_jellyfin_tracks(
+        [{"jellyfin_id": "5", "artist": "Floydian Slip", "album": "Demo", "song": "Intro", "genres": []}]
+    )
+    assert [t["artist"] for t in db.query_tracks_artist_like("FLOYD")] == ["Pink Floyd", "Pink Floyd", "Floydian Slip"]
+
+
+def test_migrates_1_0_database(tmp_path):
+    path = tmp_path / "music.db"
+    conn = sqlite3.connect(path)
+    conn.executescript(
+        """
+        CREATE TABLE artists (id INTEGER PRIMARY KEY, name TEXT UNIQUE NOT NULL, sovereignty_rank INTEGER DEFAULT 0);
+        CREATE TABLE albums (id INTEGER PRIMARY KEY, artist_id INTEGER, title TEXT, year INTEGER);
+        CREATE TABLE tracks (id INTEGER PRIMARY KEY, album_id INTEGER, title TEXT, year INTEGER, duration INTEGER, path TEXT);
+        CREATE TABLE genres (id INTEGER PRIMARY KEY, name TEXT UNIQUE);
+        CREATE TABLE track_genres (track_id INTEGER, genre_id INTEGER, PRIMARY KEY (track_id, genre_id));
+        CREATE TABLE ingest_anomalies (jellyfin_id TEXT PRIMARY KEY, issue TEXT, raw_name TEXT, path TEXT);
+        CREATE TABLE genre_adjacency (genre_id INTEGER, adjacent_genre_id INTEGER, PRIMARY KEY (genre_id, adjacent_genre_id));
+        CREATE INDEX idx_tracks_title ON tracks(title);
+        CREATE INDEX idx_artists_name ON artists(name);
+        CREATE INDEX idx_genres_name ON genres(name);
+        CREATE INDEX idx_tracks_year ON tracks(year);
+        CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+        INSERT INTO meta VALUES ('schema_version', '1.0');
+        INSERT INTO artists(id, name) VALUES (1, 'Metallica');
+        INSERT INTO albums(id, artist_id, title) VALUES (1, 1, 'Ride the Lightning');
+        INSERT INTO tracks(album_id, title, path) VALUES (1, 'Fade to Black', 'jellyfin://1');
+        """
+    )
+    conn.close()
+
+    db = MusicDatabase(path)
+    assert db.query_tracks_soft_title("fade to black")[0]["artist"] == "Metallica"
+    assert db.query_tracks_artist_like("tallic")[0]["song"] == "Fade to Black"
+    version = db._ensure_connection().execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+    assert version[0] == EXPECTED_SCHEMA_VERSION
+    init_schema(str(path))  # already current: no mismatch
@@ -0,0 +1,93 @@
+"""
+Test: MusicIndex lookup index (core/music_index.py)
+
+Validates:
+- filter_by_genre/artist/song/album/keyword answer from the prebuilt maps
+  and agree with a linear scan over the same tracks
+- Keys are case- and whitespace-insensitive
+- Year range queries come from the year-sorted arrays
+- filter_where runs its predicate once per distinct value
+- Reassigning tracks rebuilds the index
+"""
+
+import random
+
+import pytest
+
+from core.music_index import MusicIndex
+
+ARTISTS = ["Pink Floyd", "The Clash", "Sex Pistols", "David Bowie", "Metallica"]
+GENRES = ["rock", "punk", "glam rock", "metal", None]
+
+
+@pytest.fixture
+def index(monkeypatch, tmp_path):
+    monkeypatch.setenv("MUSIC_ENABLED", "false")
+    idx = MusicIndex(str(tmp_path), str(tmp_path / "index.json"))
+    rng = random.Random(11)
+    tracks = []
+    for i in range(2000):
+        artist = rng.choice(ARTISTS)
+        song = f"Song {i % 300}"
+        album = f"{artist} Album {i % 7}"
+        tracks.append({
+            "id": f"{i:016x}",
+            "path": f"/music/{artist}/{album}/{song}.mp3",
+            "artist": artist,
+            "song": song,
+            "album": album,
+            "genre": rng.choice(GENRES),
+            "year": rng.choice([None, 1969, 1977, 1979, 1984, 1991]),
+            "tokens": sorted(set((artist + " " + song).lower().split())),
+        })
+    idx.tracks = tracks
+    return idx
+
+
+def _scan(index, field, value):
+    return [t for t in index.tracks if t.get(field) and t[field].lower() == value.lower()]
+
+
+def test_field_filters_match_linear_scan(index):
+    assert index.filter_by_artist("pink floyd") == _scan(index, "artist", "Pink Floyd")
+    assert index.filter_by_genre("Glam Rock") == _scan(index, "genre", "glam rock")
+    assert index.filter_by_song("song 42") == _scan(index, "song", "Song 42")
+    assert index.filter_by_album("The Clash Album 3") == _scan(index, "album", "The Clash Album 3")
+    assert index.filter_by_artist("  the   CLASH ") == _scan(index, "artist", "The Clash")
+    assert index.filter_by_artist("Nobody") == []
+
+
+def test_keyword_and_search(index):
+    expected = [t for t in index.tracks if "bowie" in t["tokens"]]
+    assert expected and index.filter_by_keyword("Bowie") == expected
+    assert index.search("punk") == _scan(index, "genre", "punk")
+    assert index.search("metallica") == [t for t in index.tracks if "metallica" in t["tokens"]]
+    assert index.search("zzz") == []
+
+
+def test_year_range(index):
+    seventies = index.filter_by_year_range(1970, 1979)
+    assert len(seventies) == sum(1 for t in index.tracks if t["year"] and 1970 <= t["year"] <= 1979)
+    assert [t["year"] for t in seventies] == sorted(t["year"] for t in seventies)
+    assert all(t["year"] == 1984 for t in index.filter_by_year_range(1984))
+    assert index.filter_by_year_range(None, None) == []
+
+
+def test_filter_where_runs_per_distinct_value(index):
+    calls = []
+
+    def predicate(name):
+        calls.append(name)
+        return "pistols" in name.lower()
+
+    tracks = index.filter_where("artist", predicate)
+    assert len(calls) == len(ARTISTS)
+    assert tracks == _scan(index, "artist", "Sex Pistols")
+
+
+def test_reassigning_tracks_rebuilds(index):
+    index.tracks = [{"id": "1", "artist": "Blondie", "song": "Call Me", "tokens": ["blondie", "call", "me"]}]
+    assert index.filter_by_artist("Pink Floyd") == []
+    assert index.filter_by_keyword("call")[0]["song"] == "Call Me"
+    index.tracks = []
+    assert index.is_empty() and index.filter_by_keyword("call") == []
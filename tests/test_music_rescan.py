@@ -0,0 +1,124 @@
+"""
+Test: Incremental music rescan (core/music_index.py)
+
+Validates:
+- A rescan only reads tags for new or changed files (path, size, mtime)
+- Added / updated / removed / unchanged counts and progress events
+- File stats persist in the store, so a reloaded index rescans incrementally
+- The process pool path builds the same records as the serial path
+- Each save is a new store generation; old ones go once nothing maps them
+- A failed save is reported and leaves the previous index in place
+"""
+
+import os
+
+import pytest
+
+import core.music_index as music_index
+from core.music_index import MusicIndex
+from core.music_store import TrackStore
+
+
+def _write(path, data=b"x"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+
+
+@pytest.fixture
+def library(monkeypatch, tmp_path):
+    monkeypatch.setenv("MUSIC_ENABLED", "false")
+    monkeypatch.setattr(music_index, "_get_scan_workers", lambda: 1)
+    root = tmp_path / "music"
+    for artist in ("Pink Floyd", "The Clash"):
+        for n in range(3):
+            _write(root / "Rock" / artist / "Album" / f"0{n} - Song {n}.mp3")
+    return root
+
+
+def _index(library, tmp_path):
+    idx = MusicIndex(str(library), str(tmp_path / "music_index.json"))
+    idx.load_or_create()
+    return idx
+
+
+def test_rescan_reads_only_changed_files(library, tmp_path, monkeypatch):
+    idx = _index(library, tmp_path)
+    assert len(idx.tracks) == 6
+
+    changed = library / "Rock" / "Pink Floyd" / "Album" / "00 - Song 0.mp3"
+    _write(changed, b"longer file")
+    os.utime(changed, ns=(0, 1_000_000_000))
+    _write(library / "Punk" / "Sex Pistols" / "Album" / "01 - Anarchy.mp3")
+    (library / "Rock" / "The Clash" / "Album" / "02 - Song 2.mp3").unlink()
+
+    read = []
+    original = MusicIndex._build_track_record
+    monkeypatch.setattr(MusicIndex, "_build_track_record", lambda self, path: read.append(path) or original(self, path))
+    events = []
+    summary = idx.rescan(progress=events.append)
+
+    assert sorted(os.path.basename(p) for p in read) == ["00 - Song 0.mp3", "01 - Anarchy.mp3"]
+    assert {k: summary[k] for k in ("total", "added", "updated", "removed", "unchanged", "failed")} == {
+        "total": 6, "added": 1, "updated": 1, "removed": 1, "unchanged": 4, "failed": 0,
+    }
+    assert events[0] == {"phase": "reading", "done": 0, "total": 2}
+    assert events[-1]["phase"] == "done"
+    assert idx.filter_by_artist("sex pistols")[0]["song"] == "Anarchy"
+    assert idx.filter_by_phonetic("sex pistolz")
+    assert [t["artist"] for t in idx.filter_by_song("Song 2")] == ["Pink Floyd"]
+
+
+def test_reloaded_index_rescans_incrementally(library, tmp_path):
+    _index(library, tmp_path)
+    reloaded = _index(library, tmp_path)
+    summary = reloaded.rescan()
+    assert summary["unchanged"] == 6 and summary["added"] == summary["updated"] == 0
+    full = reloaded.rescan(incremental=False)
+    assert full["added"] == 6 and full["total"] == 6
+
+
+def test_process_pool_matches_serial(library, tmp_path, monkeypatch):
+    serial = _index(library, tmp_path)
+    monkeypatch.setattr(music_index, "_get_scan_workers", lambda: 2)
+    monkeypatch.setattr(music_index, "POOL_MIN_FILES", 1)
+    pooled = MusicIndex(str(library), str(tmp_path / "pooled.json"))
+    pooled.load_or_create()
+    assert pooled.tracks == serial.tracks
+
+
+def test_rescan_writes_a_new_generation(library, tmp_path):
+    _index(library, tmp_path)
+    reloaded = _index(library, tmp_path)
+    first = reloaded.store_file
+    held = reloaded.tracks  # a reader still on the mapped generation
+
+    _write(library / "Punk" / "Sex Pistols" / "Album" / "01 - Anarchy.mp3")
+    assert reloaded.rescan()["saved"]
+    assert reloaded.store_file != first
+    assert os.path.exists(first) and len(held) == 6
+
+    del held
+    reloaded._prune_generations()
+    assert not os.path.exists(first)
+    assert _index(library, tmp_path).store_file == reloaded.store_file
+    assert len(_index(library, tmp_path).tracks) == 7
+
+
+def test_rescan_reports_failed_save(library, tmp_path, monkeypatch):
+    idx = _index(library, tmp_path)
+    _write(library / "Punk" / "Sex Pistols" / "Album" / "01 - Anarchy.mp3")
+
+    save = TrackStore.save
+
+    def refuse(self, path):
+        raise PermissionError("file is mapped")
+
+    monkeypatch.setattr(TrackStore, "save", refuse)
+    events = []
+    summary = idx.rescan(progress=events.append)
+    assert summary["saved"] is False and "file is mapped" in summary["save_error"]
+    assert events[-1]["saved"] is False
+    assert len(idx.tracks) == 6  # previous index kept
+
+    monkeypatch.setattr(TrackStore, "save", save)
+    assert idx.rescan()["saved"] and len(idx.tracks) == 7
@@ -0,0 +1,102 @@
+"""
+Test: MusicResolver fuzzy matching (core/music_resolver.py, core/fuzzy_index.py)
+
+Validates:
+- Misspelled artist/album/song names resolve through the trigram index
+- The 0.85 threshold and the ±0.02 clarification band behave as before
+- Decisions match the legacy full SequenceMatcher scan on a random catalog
+- Normalized field maps and the index are cached and rebuilt when tracks change
+"""
+
+import random
+from difflib import SequenceMatcher
+
+import pytest
+
+from core.fuzzy_index import TrigramIndex
+from core.music_resolver import CLARIFY_MARGIN, FUZZY_THRESHOLD, MusicResolver
+
+
+def _track(artist, album, song):
+    return {"artist": artist, "album": album, "song": song}
+
+
+@pytest.fixture
+def resolver(monkeypatch):
+    monkeypatch.setattr(MusicResolver, "_load_aliases", lambda self: {})
+    return MusicResolver([
+        _track("Pink Floyd", "The Wall", "Comfortably Numb"),
+        _track("Pink Floyd", "Animals", "Dogs"),
+        _track("Fleetwood Mac", "Rumours", "Dreams"),
+        _track("The Clash", "London Calling", "Train in Vain"),
+    ])
+
+
+def test_misspelled_names_resolve(resolver):
+    result = resolver.resolve("fleetwod mac")
+    assert result.reason == "fuzzy"
+    assert [t["song"] for t in result.tracks] == ["Dreams"]
+    assert resolver.resolve("comfortabley numb").tracks[0]["album"] == "The Wall"
+    assert resolver.resolve("london caling").tracks[0]["artist"] == "The Clash"
+
+
+def test_threshold_and_clarification_band(resolver):
+    assert resolver._fuzzy_match("zeppelin").reason == "fuzzy_below_threshold"
+    # "dreamer" scores 0.833 against "dream": just under the threshold
+    resolver.tracks = [_track("Dreamer", "Nightfall", "Zzz")]
+    assert resolver._fuzzy_match("dream").reason == "fuzzy_below_threshold"
+    # Two candidates at 0.90: within the band, ask
+    resolver.tracks = [_track("Abcdefghij", "Abcdefghik", "Zzz")]
+    result = resolver._fuzzy_match("abcdefghix")
+    assert result.reason == "fuzzy_clarify"
+    assert "artist abcdefghij" in result.clarification and "album abcdefghik" in result.clarification
+
+
+def _legacy(resolver, clean):
+    scored = sorted(
+        ((SequenceMatcher(None, clean, value).ratio(), label, value) for label, value in resolver._collect_candidates()),
+        reverse=True,
+        key=lambda item: item[0],
+    )
+    if not scored or scored[0][0] < FUZZY_THRESHOLD:
+        return ("below",)
+    if len(scored) > 1 and scored[1][0] >= FUZZY_THRESHOLD and scored[0][0] - scored[1][0] <= CLARIFY_MARGIN:
+        return ("clarify", scored[0][1:], scored[1][1:])
+    return ("match",) + scored[0][1:]
+
+
+def test_agrees_with_full_scan(resolver):
+    rng = random.Random(3)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    names = ["".join(rng.choice(letters) for _ in range(rng.randint(5, 14))) for _ in range(400)]
+    resolver.tracks = [_track(names[i], names[i + 1], names[i + 2]) for i in range(0, 396, 3)]
+    for name in names[:150]:
+        chars = list(name)
+        chars[rng.randrange(len(chars))] = rng.choice(letters)
+        query = "".join(chars)
+        expected = _legacy(resolver, query)
+        scored = resolver._get_fuzzy_index().search(query, FUZZY_THRESHOLD)
+        if expected[0] == "below":
+            assert not scored
+        else:
+            best = resolver._collect_candidates()[scored[0][1]]
+            assert best == (expected[1] if expected[0] == "clarify" else expected[1:])
+            assert resolver._fuzzy_match(query).reason == ("fuzzy_clarify" if expected[0] == "clarify" else "fuzzy")
+
+
+def test_caches_rebuild_on_new_tracks(resolver):
+    index = resolver._get_fuzzy_index()
+    assert resolver._get_fuzzy_index() is index
+    assert len(resolver._filter_by_artist("PINK  floyd")) == 2
+    resolver.tracks = [_track("Blondie", "Parallel Lines", "Heart of Glass")]
+    assert resolver._get_fuzzy_index() is not index
+    assert resolver._filter_by_artist("pink floyd") == []
+    assert resolver.resolve("blondi").tracks[0]["song"] == "Heart of Glass"
+
+
+def test_trigram_shortlist_respects_length_bound():
+    index = TrigramIndex(["abc", "abcdefghijklmnop", "abd"])
+    # "abcdefghijklmnop" shares trigrams but can't reach 0.85 at that length
+    assert index.shortlist("abc", min_ratio=0.85).tolist() == [0, 2]
+    assert sorted(index.shortlist("abc").tolist()) == [0, 1, 2]
+    assert index.shortlist("").size == 0
@@ -0,0 +1,99 @@
+"""
+Test: Shuffle-bag random picks (core/music_shuffle.py)
+
+Validates:
+- Every track comes up once per pass; recent picks aren't replayed when the
+  bag reshuffles, and are deferred within the pass rather than skipped
+- Candidates load once per library/genre and reload after invalidate()
+- MusicIndex.get_random_track picks per genre and follows index changes
+- MusicDatabase.random_track never sorts by RANDOM(), picks per genre and
+  sees ingests made through another connection
+"""
+
+import random
+import sqlite3
+
+from core.database import MusicDatabase, init_schema
+from core.music_index import MusicIndex
+from core.music_shuffle import ShuffleBag, TrackShuffler
+
+
+def _tracks(count, genre="rock"):
+    return [{"path": f"/m/{genre}/{n}.mp3", "song": f"Song {n}", "genre": genre} for n in range(count)]
+
+
+def test_bag_draws_each_index_once_per_pass():
+    bag = ShuffleBag(20, random.Random(1))
+    for _ in range(3):
+        assert sorted(bag.draw() for _ in range(20)) == list(range(20))
+
+
+def test_recent_picks_held_back_across_reshuffles():
+    shuffler = TrackShuffler(history=4, rng=random.Random(3))
+    tracks = _tracks(8)
+    loads = []
+    picks = [shuffler.pick(None, lambda: loads.append(1) or tracks)["path"] for _ in range(200)]
+
+    assert len(loads) == 1
+    last_seen = {}
+    for n, path in enumerate(picks):
+        assert n - last_seen.get(path, -10) >= 4
+        last_seen[path] = n
+
+    shuffler.invalidate()
+    shuffler.pick(None, lambda: loads.append(1) or tracks)
+    assert len(loads) == 2
+    assert shuffler.pick("jazz", lambda: []) is None
+
+
+def test_deferred_recent_tracks_still_play_once_per_pass():
+    shuffler = TrackShuffler(history=5, rng=random.Random(7))
+    tracks = _tracks(10)
+    for track in tracks[:5]:
+        shuffler._remember(track["path"])  # the end of a previous pass
+
+    picks = [shuffler.pick(None, lambda: tracks)["path"] for _ in range(10)]
+    assert sorted(picks) == sorted(t["path"] for t in tracks)
+    history = [t["path"] for t in tracks[:5]] + picks
+    for n, path in enumerate(history[5:], start=5):
+        assert path not in history[n - 5:n]
+
+
+def test_music_index_random_by_genre(monkeypatch, tmp_path):
+    monkeypatch.setenv("MUSIC_ENABLED", "false")
+    idx = MusicIndex(str(tmp_path), str(tmp_path / "music_index.json"))
+    idx.tracks = _tracks(3, "rock") + _tracks(2, "jazz")
+    assert {idx.get_random_track("Jazz")["path"] for _ in range(10)} == {"/m/jazz/0.mp3", "/m/jazz/1.mp3"}
+    assert idx.get_random_track("polka") is None
+
+    idx.tracks = _tracks(1, "jazz")
+    assert idx.get_random_track("jazz")["path"] == "/m/jazz/0.mp3"
+    assert idx.get_random_track()["path"] == "/m/jazz/0.mp3"
+
+
+def test_database_random_track(tmp_path):
+    path = tmp_path / "music.db"
+    init_schema(str(path))
+    db = MusicDatabase(path)
+    db.ingest_jellyfin_tracks(
+        [{"jellyfin_id": str(n), "artist": "Artist", "album": "Album", "song": f"Song {n}",
+          "genres": ["Punk" if n < 2 else "Jazz"]} for n in range(6)],
+        incremental=False,
+    )
+    statements = []
+    db._ensure_connection().set_trace_callback(statements.append)
+
+    assert len({db.random_track()["song"] for _ in range(6)}) == 6
+    assert {db.random_track(genre="punk")["song"] for _ in range(6)} == {"Song 0", "Song 1"}
+    assert db.random_track(genre="polka") is None
+    assert not any("RANDOM()" in sql for sql in statements)
+
+    # Ingest through another connection: the next pick sees it
+    other = MusicDatabase(path)
+    other.ingest_jellyfin_tracks([{"jellyfin_id": "9", "artist": "Artist", "album": "Album", "song": "New", "genres": ["Ska"]}])
+    assert db.random_track(genre="ska")["song"] == "New"
+    conn = sqlite3.connect(path)
+    conn.execute("DELETE FROM tracks")
+    conn.commit()
+    conn.close()
+    assert db.random_track() is None
@@ -0,0 +1,102 @@
+"""
+Test: Compact music index store (core/music_store.py)
+
+Validates:
+- Tracks round-trip through the .idx file (None values, unicode, years, tokens)
+- Postings, year ranges and distinct values answer from the loaded arrays
+- Files with the wrong magic or version are rejected
+- MusicIndex imports a JSON index once, then loads the store; export_json
+  writes the same tracks back
+- TrackList behaves like the list callers used to get
+"""
+
+import json
+import os
+import random
+
+import pytest
+
+from core.music_index import MusicIndex
+from core.music_store import MAGIC, TrackList, TrackStore
+
+TRACKS = [
+    {"id": "a1", "path": "/m/Björk/Homogenic/Jóga.mp3", "filename": "Jóga.mp3", "name": "jóga",
+     "artist": "Björk", "song": "Jóga", "album": "Homogenic", "year": 1997,
+     "tokens": ["björk", "jóga", "homogenic"], "genre": "electronic", "ext": ".mp3"},
+    {"id": "b2", "path": "/m/Rock/untitled.flac", "filename": "untitled.flac", "name": "untitled",
+     "artist": None, "song": "untitled", "album": None, "year": None,
+     "tokens": ["untitled", "rock"], "genre": "rock", "ext": ".flac"},
+    {"id": "c3", "path": "/m/Björk/Post/Army of Me.mp3", "filename": "Army of Me.mp3", "name": "army of me",
+     "artist": "Björk", "song": "Army of Me", "album": "Post", "year": 1995,
+     "tokens": ["björk", "army", "me", "post"], "genre": "electronic", "ext": ".mp3"},
+]
+
+
+@pytest.fixture
+def store(tmp_path):
+    path = tmp_path / "music_index.idx"
+    TrackStore.build(TRACKS, {"music_dir": "/m"}).save(str(path))
+    loaded = TrackStore.load(str(path))
+    yield loaded
+    loaded.close()
+
+
+def test_round_trip(store):
+    assert len(store) == 3
+    assert [store.track(i) for i in range(3)] == TRACKS
+    assert store.meta["music_dir"] == "/m"
+
+
+def test_lookups(store):
+    assert store.postings("artist", "björk").tolist() == [0, 2]
+    assert store.postings("token", "rock").tolist() == [1]
+    assert store.postings("album", "nothing").size == 0
+    assert store.year_range(1990, 1996).tolist() == [2]
+    assert store.year_range(None, None).tolist() == [2, 0]
+    assert {value: positions.tolist() for value, positions in store.distinct_values("artist")} == {"Björk": [0, 2]}
+
+
+def test_rejects_foreign_files(tmp_path):
+    bad = tmp_path / "bad.idx"
+    bad.write_bytes(b"not an index at all")
+    with pytest.raises(ValueError):
+        TrackStore.load(str(bad))
+    old = tmp_path / "old.idx"
+    header = json.dumps({"version": 0, "meta": {}, "sections": {}}).encode()
+    old.write_bytes(MAGIC + len(header).to_bytes(4, "little") + header)
+    with pytest.raises(ValueError):
+        TrackStore.load(str(old))
+
+
+def test_music_index_imports_json_once(monkeypatch, tmp_path):
+    monkeypatch.setenv("MUSIC_ENABLED", "false")
+    index_file = tmp_path / "music_index.json"
+    index_file.write_text(json.dumps({"version": "1.0", "tracks": TRACKS}), encoding="utf-8")
+
+    idx = MusicIndex(str(tmp_path), str(index_file))
+    idx.load_or_create()
+    assert idx.store_file == str(tmp_path / "music_index.1.idx")
+    assert os.path.exists(idx.store_file) and (tmp_path / "music_index.current").exists()
+
+    index_file.unlink()
+    reloaded = MusicIndex(str(tmp_path), str(index_file))
+    document = reloaded.load_or_create()
+    assert document["track_count"] == 3
+    assert reloaded.filter_by_artist("BJÖRK") == [TRACKS[0], TRACKS[2]]
+    assert reloaded.filter_by_phonetic("bjork")[0]["artist"] == "Björk"
+
+    out = reloaded.export_json(str(tmp_path / "out.json"))
+    exported = json.loads(open(out, encoding="utf-8").read())
+    assert exported["tracks"] == TRACKS
+    assert exported["phonetic"]["keys"]
+
+
+def test_track_list_acts_like_a_list(store):
+    tracks = TrackList(store)
+    assert len(tracks) == 3 and tracks[-1] == TRACKS[2]
+    assert tracks[1:] == TRACKS[1:]
+    assert tracks == TRACKS and tracks != TRACKS[:2]
+    assert random.choice(tracks) in TRACKS
+    assert list(TrackList(store, store.postings("genre", "electronic"))) == [TRACKS[0], TRACKS[2]]
+    with pytest.raises(IndexError):
+        tracks[3]
@@ -0,0 +1,153 @@
+"""
+Test: Live music index updates (core/music_watcher.py, MusicIndex.apply_changes)
+
+Validates:
+- Added, retagged, deleted files and deleted folders update the filters in
+  place, without rebuilding the store
+- Changes are journaled and replayed when the index is reloaded; a corrupt
+  journal that can't be deleted is ignored without dropping the store
+- The overlay is folded into the store once it passes the compaction limit;
+  if that store can't be written, the overlay and its journal are kept
+- The polling backend debounces changes into the index; watchdog events
+  are filtered and forwarded (moves report both ends)
+"""
+
+import os
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import core.music_index as music_index
+from core.music_index import MusicIndex
+from core.music_store import TrackStore
+from core.music_watcher import MusicLibraryWatcher, _EventHandler
+
+
+def _write(path, data=b"x"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return str(path)
+
+
+@pytest.fixture
+def library(monkeypatch, tmp_path):
+    monkeypatch.setenv("MUSIC_ENABLED", "false")
+    monkeypatch.setattr(music_index, "_get_scan_workers", lambda: 1)
+    root = tmp_path / "music"
+    for n in range(3):
+        _write(root / "Rock" / "Pink Floyd" / f"0{n} - Song {n}.mp3")
+    _write(root / "Punk" / "The Clash" / "01 - Train in Vain.mp3")
+    return root
+
+
+def _index(library, tmp_path):
+    idx = MusicIndex(str(library), str(tmp_path / "music_index.json"))
+    idx.load_or_create()
+    return idx
+
+
+def test_apply_changes_updates_in_place(library, tmp_path):
+    idx = _index(library, tmp_path)
+    store = idx._store
+
+    added = _write(library / "Rock" / "Blondie" / "01 - Heart of Glass.mp3")
+    changed = library / "Rock" / "Pink Floyd" / "00 - Song 0.mp3"
+    changed.unlink()
+    renamed = _write(library / "Rock" / "Pink Floyd" / "00 - Dogs.mp3")
+    clash = library / "Punk" / "The Clash"
+    for file in clash.rglob("*.mp3"):
+        file.unlink()
+    clash.rmdir()
+
+    counts = idx.apply_changes([added, str(changed), renamed, str(clash)])
+    assert counts == {"added": 2, "updated": 0, "removed": 2}
+    assert idx._store is store  # overlay, not a rebuild
+    assert len(idx.tracks) == 4
+    assert [t["song"] for t in idx.filter_by_artist("pink floyd")] == ["Song 1", "Song 2", "Dogs"]
+    assert idx.filter_by_artist("the clash") == []
+    assert idx.filter_by_keyword("glass")[0]["artist"] == "Blondie"
+    assert idx.filter_by_phonetic("blondee")[0]["song"] == "Heart of Glass"
+    assert idx.apply_changes([added]) == {"added": 0, "updated": 0, "removed": 0}
+
+    reloaded = _index(library, tmp_path)
+    assert os.path.exists(reloaded.delta_file)
+    assert sorted(t["song"] for t in reloaded.tracks) == ["Dogs", "Heart of Glass", "Song 1", "Song 2"]
+
+
+def test_undeletable_corrupt_journal_keeps_store(library, tmp_path, monkeypatch):
+    idx = _index(library, tmp_path)
+    store_file = idx.store_file
+    with open(idx.delta_file, "w", encoding="utf-8") as f:
+        f.write("{not json")
+
+    real_remove = os.remove
+
+    def refuse(path):
+        if path == idx.delta_file:
+            raise PermissionError("journal is locked")
+        real_remove(path)
+
+    monkeypatch.setattr(music_index.os, "remove", refuse)
+    monkeypatch.setattr(MusicIndex, "_scan_directory", lambda *a, **k: pytest.fail("rescanned"))
+    reloaded = _index(library, tmp_path)
+
+    assert reloaded.store_file == store_file
+    assert len(reloaded.tracks) == 4
+    assert os.path.exists(reloaded.delta_file)
+
+
+def test_overlay_compacts_into_store(library, tmp_path, monkeypatch):
+    idx = _index(library, tmp_path)
+    monkeypatch.setattr(music_index, "DELTA_COMPACT_MIN", 1)
+    monkeypatch.setattr(music_index, "DELTA_COMPACT_RATIO", 0.0)
+    store = idx._store
+    first = _write(library / "Jazz" / "Miles Davis" / "01 - So What.mp3")
+    second = _write(library / "Jazz" / "Miles Davis" / "02 - Freddie Freeloader.mp3")
+    idx.apply_changes([first, second])
+
+    assert idx._store is not store and not idx._state.has_overlay
+    assert not os.path.exists(idx.delta_file)
+    assert len(_index(library, tmp_path).filter_by_artist("Miles Davis")) == 2
+
+
+def test_failed_compaction_keeps_journal(library, tmp_path, monkeypatch):
+    idx = _index(library, tmp_path)
+    monkeypatch.setattr(music_index, "DELTA_COMPACT_MIN", 1)
+    monkeypatch.setattr(music_index, "DELTA_COMPACT_RATIO", 0.0)
+    store, generated_at = idx._store, idx._store.meta["generated_at"]
+
+    def refuse(self, path):
+        raise PermissionError("file is mapped")
+
+    monkeypatch.setattr(TrackStore, "save", refuse)
+    first = _write(library / "Jazz" / "Miles Davis" / "01 - So What.mp3")
+    second = _write(library / "Jazz" / "Miles Davis" / "02 - Freddie Freeloader.mp3")
+    idx.apply_changes([first, second])
+
+    assert idx._store is store and idx._store.meta["generated_at"] == generated_at
+    assert idx._state.has_overlay and os.path.exists(idx.delta_file)
+    assert len(_index(library, tmp_path).filter_by_artist("Miles Davis")) == 2
+
+
+def test_polling_watcher_applies_changes(library, tmp_path):
+    idx = _index(library, tmp_path)
+    watcher = MusicLibraryWatcher(idx, debounce_seconds=0.05, poll_seconds=0.05, backend="poll")
+    assert watcher.start() == "poll"
+    try:
+        _write(library / "Rock" / "Blondie" / "02 - Call Me.mp3")
+        deadline = time.monotonic() + 5
+        while not idx.filter_by_artist("blondie") and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert idx.filter_by_artist("blondie")[0]["song"] == "Call Me"
+    finally:
+        watcher.stop()
+
+
+def test_event_handler_forwards_file_events():
+    seen = []
+    handler = _EventHandler(SimpleNamespace(notify=seen.extend))
+    handler.on_any_event(SimpleNamespace(event_type="modified", is_directory=True, src_path="/m/Rock"))
+    handler.on_any_event(SimpleNamespace(event_type="created", is_directory=False, src_path="/m/a.mp3"))
+    handler.on_any_event(SimpleNamespace(event_type="moved", is_directory=True, src_path="/m/Old", dest_path="/m/New"))
+    assert seen == ["/m/a.mp3", "/m/Old", "/m/New"]
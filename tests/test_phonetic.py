@@ -0,0 +1,100 @@
+"""
+Test: Phonetic matching tier (core/phonetic.py)
+
+Validates:
+- Double Metaphone codes match the reference algorithm on classic cases
+- Misheard names ("deaf leopard", "metal icka", "beyonsay") share a key with
+  the real name; numbers and very short queries don't collapse onto names
+- MusicIndex stores phonetic keys in its store (and adds them to old JSON imports)
+- MusicDatabase builds the phonetic_keys table lazily and looks names up
+- MusicResolver answers from the phonetic tier before calling the LLM
+"""
+
+import json
+import sqlite3
+
+import pytest
+
+from core.database import MusicDatabase, init_schema
+from core.music_index import MusicIndex
+from core.music_resolver import MusicResolver
+from core.phonetic import PhoneticIndex, double_metaphone, phonetic_keys
+
+
+@pytest.mark.parametrize("word, codes", [
+    ("Smith", ("SM0", "XMT")),
+    ("Schmidt", ("XMT", "SMT")),
+    ("Michael", ("MKL", "MXL")),
+    ("Xavier", ("SF", "SFR")),
+    ("Czerny", ("SRN", "XRN")),
+    ("Wasserman", ("ASRM", "FSRM")),
+    ("laugh", ("LF", "LF")),
+    ("Thumb", ("0M", "TM")),
+])
+def test_double_metaphone_reference_codes(word, codes):
+    assert double_metaphone(word) == codes
+
+
+def test_misheard_names_share_keys():
+    assert phonetic_keys("Deaf Leopard") & phonetic_keys("Def Leppard")
+    assert phonetic_keys("metal icka") & phonetic_keys("Metallica")
+    assert phonetic_keys("Beyonsay") & phonetic_keys("Beyoncé")
+    assert not phonetic_keys("metallica 1984") & phonetic_keys("Metallica")
+    index = PhoneticIndex([("artist", "Metallica"), ("artist", "Def Leppard")])
+    assert index.lookup("deaf leopard")[0][1:] == ("artist", "Def Leppard")
+    assert index.lookup("red") == []
+
+
+def test_index_round_trip():
+    index = PhoneticIndex([("artist", "Fleetwood Mac"), ("song", "Dreams")])
+    restored = PhoneticIndex.from_dict(json.loads(json.dumps(index.to_dict())))
+    assert restored.lookup("fleetwood mack") == index.lookup("fleetwood mack")
+    assert PhoneticIndex.from_dict({"version": -1, "keys": {}}) is None
+
+
+def test_music_index_persists_and_backfills_keys(monkeypatch, tmp_path):
+    monkeypatch.setenv("MUSIC_ENABLED", "false")
+    index_file = tmp_path / "music_index.json"
+    tracks = [{"id": "1", "artist": "Def Leppard", "song": "Photograph", "tokens": ["def", "leppard", "photograph"]}]
+    index_file.write_text(json.dumps({"version": "1.0", "tracks": tracks}), encoding="utf-8")
+
+    idx = MusicIndex(str(tmp_path), str(index_file))
+    idx.load_or_create()
+    assert idx._store.has_phonetic
+    assert idx.filter_by_phonetic("deaf leopard")[0]["song"] == "Photograph"
+
+    reloaded = MusicIndex(str(tmp_path), str(index_file))
+    reloaded.load_or_create()
+    assert reloaded._phonetic is not None  # read from the store, not rebuilt
+    assert reloaded.filter_by_phonetic("foto graph")[0]["artist"] == "Def Leppard"
+
+
+def test_database_phonetic_lookup(tmp_path):
+    path = tmp_path / "music.db"
+    init_schema(str(path))
+    conn = sqlite3.connect(path)
+    conn.execute("INSERT INTO artists(id, name) VALUES (1, 'Metallica')")
+    conn.execute("INSERT INTO albums(id, artist_id, title) VALUES (1, 1, 'Ride the Lightning')")
+    conn.execute("INSERT INTO tracks(album_id, title, path) VALUES (1, 'Fade to Black', 'jellyfin://1')")
+    conn.commit()
+    conn.close()
+
+    db = MusicDatabase(path)
+    assert db.phonetic_lookup("metal lika")[0][1:] == ("artist", "Metallica")
+    assert db.phonetic_lookup("fade two black")[0][1:] == ("song", "Fade to Black")
+    assert db.phonetic_lookup("zz") == []
+
+
+def test_resolver_uses_phonetic_before_llm(monkeypatch):
+    monkeypatch.setattr(MusicResolver, "_load_aliases", lambda self: {})
+    resolver = MusicResolver([
+        {"artist": "Metallica", "album": "Master of Puppets", "song": "Battery"},
+        {"artist": "Def Leppard", "album": "Hysteria", "song": "Armageddon It"},
+    ])
+
+    def llm(_query):
+        raise AssertionError("LLM should not be called")
+
+    result = resolver.resolve("metal icka", llm_interpret=llm)
+    assert result.reason == "phonetic"
+    assert result.tracks[0]["song"] == "Battery"
@@ -0,0 +1,141 @@
+"""
+Test: Sentence-level LLM -> TTS streaming in ArgoPipeline
+
+Validates:
+- Sentences are cut off the token stream as they complete, with the shared
+  splitter: abbreviations, initials and a trailing "3." (maybe "3.14") don't
+  end a sentence
+- First sentence reaches TTS while the LLM is still generating
+- stop_signal (barge-in) cancels both the LLM stream and playback
+- Streamed sentences skip the TTS cache; canonical responses opt in
+"""
+
+import threading
+from unittest.mock import patch
+
+from core.pipeline import ArgoPipeline
+from core.sentence_split import find_sentence_boundary
+from core.tts_cache import CacheablePhrase
+
+
+class DummyAudio:
+    def acquire_audio(self, *args, **kwargs):
+        return True
+
+    def release_audio(self, *args, **kwargs):
+        return True
+
+    def stop_playback(self, *args, **kwargs):
+        return True
+
+    def force_release_audio(self, *args, **kwargs):
+        return True
+
+
+class RecordingSink:
+    def __init__(self, on_speak=None):
+        self.spoken = []
+        self._on_speak = on_speak
+
+    def speak(self, text):
+        self.spoken.append(text)
+        if self._on_speak:
+            self._on_speak(text)
+
+    def stop_sync(self):
+        pass
+
+
+class FakeClient:
+    """Ollama client stand-in that yields scripted tokens."""
+
+    def __init__(self, tokens, gate=None, gate_after=None):
+        self._tokens = tokens
+        self._gate = gate
+        self._gate_after = gate_after
+
+    def generate(self, **kwargs):
+        def _stream():
+            for idx, token in enumerate(self._tokens):
+                if self._gate is not None and idx == self._gate_after:
+                    assert self._gate.wait(timeout=2.0), "TTS never received first sentence"
+                yield {"response": token}
+        return _stream()
+
+
+def _make_pipeline(sink):
+    pipeline = ArgoPipeline(DummyAudio(), lambda *_: None)
+    pipeline._edge_tts = sink
+    pipeline.runtime_overrides["personality_mode"] = "neutral"
+    return pipeline
+
+
+def test_cut_stream_sentences_splits_on_boundaries():
+    pipeline = _make_pipeline(RecordingSink())
+    sentences, rest = pipeline._cut_stream_sentences("Hello there. How are you? I am fi")
+    assert sentences == ["Hello there.", "How are you?"]
+    assert rest == "I am fi"
+
+
+def test_cut_stream_sentences_keeps_abbreviations_and_decimals():
+    pipeline = _make_pipeline(RecordingSink())
+    sentences, rest = pipeline._cut_stream_sentences("Dr. Smith said J. R. R. Tolkien, e.g. this one. It costs 3.")
+    assert sentences == ["Dr. Smith said J. R. R. Tolkien, e.g. this one."]
+    assert rest == "It costs 3."
+    assert find_sentence_boundary(rest) == -1
+    assert find_sentence_boundary("It costs 3.14 now! More") == len("It costs 3.14 now!")
+
+
+def test_cut_stream_sentences_hard_cuts_run_on_text():
+    pipeline = _make_pipeline(RecordingSink())
+    run_on = "word " * 60
+    sentences, rest = pipeline._cut_stream_sentences(run_on, max_chars=150)
+    assert sentences
+    assert all(len(s) <= 150 for s in sentences)
+    assert not sentences[0].endswith("wor")
+
+
+def test_first_sentence_spoken_before_llm_finishes():
+    first_spoken = threading.Event()
+    sink = RecordingSink(on_speak=lambda _text: first_spoken.set())
+    pipeline = _make_pipeline(sink)
+    tokens = ["Water boils ", "at one hundred degrees. ", "At altitude ", "it boils lower."]
+    client = FakeClient(tokens, gate=first_spoken, gate_after=2)
+
+    with patch("core.pipeline.ollama.Client", return_value=client):
+        text = pipeline.stream_response("why does water boil", interaction_id="s1")
+
+    assert "it boils lower." in text
+    assert sink.spoken == ["Water boils at one hundred degrees.", "At altitude it boils lower."]
+    assert pipeline.is_speaking is False
+
+
+def test_stop_signal_cancels_llm_and_playback():
+    pipeline = None
+
+    def barge_in(_text):
+        pipeline.stop_signal.set()
+
+    sink = RecordingSink(on_speak=barge_in)
+    pipeline = _make_pipeline(sink)
+    tokens = ["One. ", "Two. ", "Three. ", "Four."]
+
+    with patch("core.pipeline.ollama.Client", return_value=FakeClient(tokens)):
+        pipeline.stream_response("count", interaction_id="s2")
+
+    assert sink.spoken == ["One."]
+    assert pipeline.is_speaking is False
+
+
+def test_only_canonical_responses_opt_into_tts_cache():
+    sink = RecordingSink()
+    pipeline = _make_pipeline(sink)
+    tokens = ["Water boils ", "at one hundred degrees."]
+
+    with patch("core.pipeline.ollama.Client", return_value=FakeClient(tokens)):
+        pipeline.stream_response("why does water boil", interaction_id="s3")
+    pipeline._deliver_canonical_response("Volume set to 40 percent.", "s4", False, None, force_tts=True)
+
+    assert sink.spoken == ["Water boils at one hundred degrees.", "Volume set to 40 percent."]
+    assert not isinstance(sink.spoken[0], CacheablePhrase)
+    assert isinstance(sink.spoken[1], CacheablePhrase)
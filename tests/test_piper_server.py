@@ -0,0 +1,154 @@
+"""
+Test: Persistent Piper synthesis server
+
+Validates:
+- Voice backend is loaded once and reused for every sentence
+- PCM streams back in order through PiperPCMStream.read()
+- cancel() drops in-flight and queued sentences (barge-in)
+- PiperOutputSink plays through the server via _stream_and_play
+"""
+
+import threading
+import time
+
+from core.piper_server import PiperSynthesisServer
+
+
+class FakeBackend:
+    name = "fake"
+    sample_rate = 22050
+
+    def __init__(self, chunks_per_sentence=3, delay_s=0.0, gate=None):
+        self.loads = 1
+        self.calls = []
+        self._chunks = chunks_per_sentence
+        self._delay_s = delay_s
+        self._gate = gate
+        self.closed = False
+
+    def synthesize(self, text):
+        self.calls.append(text)
+        for idx in range(self._chunks):
+            if self._gate is not None:
+                self._gate.wait(timeout=2.0)
+            if self._delay_s:
+                time.sleep(self._delay_s)
+            yield f"{text}:{idx};".encode("utf-8")
+
+    def close(self):
+        self.closed = True
+
+
+def _drain(stream):
+    data = b""
+    while True:
+        chunk = stream.read(4)
+        if not chunk:
+            return data
+        data += chunk
+
+
+def test_server_reuses_backend_for_every_sentence():
+    backend = FakeBackend()
+    server = PiperSynthesisServer("piper", "voice.onnx", backend=backend).start()
+    try:
+        first = server.synthesize("one")
+        second = server.synthesize("two")
+        assert _drain(first) == b"one:0;one:1;one:2;"
+        assert _drain(second) == b"two:0;two:1;two:2;"
+        assert backend.calls == ["one", "two"]
+        assert backend.loads == 1
+        assert server.is_alive()
+    finally:
+        server.close()
+    assert backend.closed
+
+
+def test_cancel_drops_current_and_queued_sentences():
+    gate = threading.Event()
+    backend = FakeBackend(gate=gate)
+    server = PiperSynthesisServer("piper", "voice.onnx", backend=backend).start()
+    try:
+        current = server.synthesize("current")
+        queued = server.synthesize("queued")
+        server.cancel()
+        gate.set()
+        assert current.read(4) == b""
+        assert queued.read(4) == b""
+        # Server keeps serving after a barge-in
+        after = server.synthesize("after")
+        assert _drain(after) == b"after:0;after:1;after:2;"
+        assert "queued" not in backend.calls
+    finally:
+        server.close()
+
+
+def test_output_sink_plays_through_persistent_server():
+    from core.output_sink import PiperOutputSink
+
+    sink = PiperOutputSink(piper_path="echo", voice_path="dummy.onnx")
+    sink._tts_cache = None
+    backend = FakeBackend()
+    sink._persistent = True
+    sink._piper_server = PiperSynthesisServer("piper", "voice.onnx", backend=backend).start()
+    played = []
+
+    def fake_stream_and_play(source):
+        played.append(_drain(source))
+        return 0
+
+    sink._stream_and_play = fake_stream_and_play
+    try:
+        sink._play_sentence("Hello there.")
+        assert played == [b"Hello there.:0;Hello there.:1;Hello there.:2;"]
+        assert sink._pcm_stream is None
+    finally:
+        sink._piper_server.close()
+
+
+def test_buffered_audio_is_bounded_by_memory_cap():
+    backend = FakeBackend(chunks_per_sentence=20)
+    server = PiperSynthesisServer("piper", "voice.onnx", backend=backend, max_buffered_bytes=32).start()
+    try:
+        stream = server.synthesize("long")
+        time.sleep(0.2)
+        # Synthesis pauses once the cap is reached instead of buffering the whole sentence
+        assert server.buffered_bytes <= 32
+        assert not stream.done
+        data = _drain(stream)
+        assert data.count(b";") == 20
+        assert server.buffered_bytes == 0
+    finally:
+        server.close()
+
+
+def test_sink_prefetches_next_sentences_and_discards_on_interrupt():
+    from core.output_sink import PiperOutputSink
+
+    sink = PiperOutputSink(piper_path="echo", voice_path="dummy.onnx")
+    # Park the worker so the queue stays put while we inspect it
+    sink.text_queue.put(None)
+    sink.worker_thread.join(timeout=2.0)
+    sink._tts_cache = None
+    backend = FakeBackend()
+    sink._persistent = True
+    sink._piper_server = PiperSynthesisServer("piper", "voice.onnx", backend=backend).start()
+    sink._interaction_id = 1
+    try:
+        for sentence in ("First.", "Second.", "Third."):
+            sink.text_queue.put(sentence)
+        sink._prefetch_ahead()
+        assert [text for text, _ in sink._prefetched] == ["First.", "Second."]
+
+        first = sink._take_prefetched(sink.text_queue.get_nowait())
+        assert _drain(first) == b"First.:0;First.:1;First.:2;"
+        sink._prefetch_ahead()
+        assert [text for text, _ in sink._prefetched] == ["Second.", "Third."]
+
+        pending = [stream for _, stream in sink._prefetched]
+        sink.stop_interrupt()
+        assert not sink._prefetched
+        assert all(stream.cancelled for stream in pending)
+        assert sink._piper_server.buffered_bytes == 0
+    finally:
+        sink._piper_server.close()
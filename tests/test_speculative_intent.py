@@ -0,0 +1,256 @@
+"""
+Test: Speculative intent dispatch from partial transcripts
+
+Validates:
+- MUSIC_STOP / MUSIC_NEXT / volume fire once on a stable partial prefix
+- A matching final transcript confirms the action without running it twice
+- A disagreeing final transcript (different intent or volume command) rolls it back
+- Long or non-canonical partials never fire
+- Intents whose rollback would lose state skip the fast path
+- Through ArgoPipeline, "stop" stops music well before end-of-speech, and a
+  dropped utterance restores the track at the position it was stopped
+"""
+
+import logging
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+from core.intent_parser import IntentType
+from core.speculative_intent import (
+    OUTCOME_CONFIRMED,
+    OUTCOME_NONE,
+    OUTCOME_ROLLED_BACK,
+    SpeculativeAction,
+    SpeculativeIntentDispatcher,
+)
+from core.stt_engine_manager import IncrementalTranscriber, STTSegment
+
+SR = 16000
+
+
+def _partial(stable, tentative="", audio_s=1.0):
+    text = " ".join(filter(None, [stable, tentative]))
+    return SimpleNamespace(stable=stable, tentative=tentative, text=text, audio_s=audio_s)
+
+
+class Recorder:
+    def __init__(self):
+        self.executed = []
+        self.rolled_back = []
+
+    def executor(self, intent, text):
+        self.executed.append((intent.intent_type, text))
+        return SpeculativeAction(intent.intent_type, text, rollback=lambda: self.rolled_back.append(text))
+
+
+def test_fires_once_on_stable_prefix_and_confirms():
+    rec = Recorder()
+    dispatcher = SpeculativeIntentDispatcher(rec.executor)
+    assert dispatcher.on_partial(_partial("", "what time")) is None
+    action = dispatcher.on_partial(_partial("skip", "this"))
+    assert action.intent_type == IntentType.MUSIC_NEXT
+    assert dispatcher.on_partial(_partial("skip this", "one")) is None
+
+    outcome, confirmed = dispatcher.reconcile("Skip this one.")
+    assert outcome == OUTCOME_CONFIRMED and confirmed is action
+    assert rec.executed == [(IntentType.MUSIC_NEXT, "skip")]
+    assert rec.rolled_back == []
+
+
+def test_stop_fires_on_short_tentative_hypothesis():
+    rec = Recorder()
+    dispatcher = SpeculativeIntentDispatcher(rec.executor)
+    action = dispatcher.on_partial(_partial("", "Stop."))
+    assert action.intent_type == IntentType.MUSIC_STOP
+    # Volume is not a fast intent: it waits for a stable prefix
+    rec2 = Recorder()
+    assert SpeculativeIntentDispatcher(rec2.executor).on_partial(_partial("", "volume up")) is None
+
+
+def test_inexact_rollback_waits_for_stable_prefix():
+    rec = Recorder()
+    dispatcher = SpeculativeIntentDispatcher(rec.executor, exact_rollback=lambda intent: False)
+    assert dispatcher.on_partial(_partial("", "Stop.")) is None
+    action = dispatcher.on_partial(_partial("stop", ""))
+    assert action.intent_type == IntentType.MUSIC_STOP
+    assert rec.executed == [(IntentType.MUSIC_STOP, "stop")]
+
+
+def test_disagreeing_final_transcript_rolls_back():
+    rec = Recorder()
+    dispatcher = SpeculativeIntentDispatcher(rec.executor)
+    dispatcher.on_partial(_partial("", "stop"))
+    outcome, action = dispatcher.reconcile("Stop talking.")
+    assert outcome == OUTCOME_ROLLED_BACK
+    assert rec.rolled_back == ["stop"]
+    # Closed after reconcile
+    assert dispatcher.on_partial(_partial("next")) is None
+
+
+def test_volume_signature_mismatch_rolls_back():
+    rec = Recorder()
+
+    def signature(intent, text):
+        return intent.intent_type, "up" if "up" in text else text
+
+    dispatcher = SpeculativeIntentDispatcher(rec.executor, signature=signature)
+    assert dispatcher.on_partial(_partial("volume up")).intent_type == IntentType.VOLUME_CONTROL
+    outcome, _ = dispatcher.reconcile("volume 30")
+    assert outcome == OUTCOME_ROLLED_BACK
+    assert rec.rolled_back == ["volume up"]
+
+
+def test_long_or_unrelated_partials_never_fire():
+    rec = Recorder()
+    dispatcher = SpeculativeIntentDispatcher(rec.executor, max_words=4)
+    assert dispatcher.on_partial(_partial("stop the music and then play some jazz")) is None
+    assert dispatcher.on_partial(_partial("play some music")) is None
+    assert rec.executed == []
+    assert dispatcher.reconcile("play some music") == (OUTCOME_NONE, None)
+
+
+# ----------------------------------------------------------------------------
+# Pipeline integration
+# ----------------------------------------------------------------------------
+WORD_S = 0.3
+WORDS = ["stop", "the", "music", "talking"]
+
+
+def _word_audio(index):
+    return np.full(int(SR * WORD_S), 0.86 + 0.01 * index, dtype=np.float32)
+
+
+class WordManager:
+    """Whisper stand-in: every 0.3s block of constant amplitude is one word."""
+
+    engine = "faster"
+
+    def __init__(self):
+        self.model = object()
+        self.logger = logging.getLogger("STT_ENGINE")
+
+    def transcribe(self, audio, language="en", **kwargs):
+        audio = np.asarray(audio).reshape(-1)
+        block = int(SR * WORD_S)
+        words = []
+        for offset in range(0, len(audio), block):
+            chunk = audio[offset:offset + block]
+            if len(chunk) < block // 2:
+                break
+            words.append(WORDS[int(round((float(np.median(chunk)) - 0.86) / 0.01))])
+        segments = [STTSegment(text=" " + " ".join(words), start=0.0, end=len(audio) / SR)] if words else []
+        return {"text": " ".join(words), "confidence": -0.2, "segments": segments, "engine": self.engine, "duration_ms": 1.0}
+
+    def start_incremental(self, language="en", on_partial=None, **kwargs):
+        return IncrementalTranscriber(self, language=language, on_partial=on_partial, **kwargs)
+
+
+class FakePlayer:
+    def __init__(self):
+        self.playing = True
+        self.current_track = {"path": "/music/song.mp3", "name": "Song"}
+        self.stopped_at = None
+        self.resumed = []
+        self.position = 42.5
+
+    def is_playing(self):
+        return self.playing
+
+    def playback_position(self):
+        return self.position if self.playing else None
+
+    def stop(self):
+        self.playing = False
+        self.current_track = {}
+        self.stopped_at = time.perf_counter()
+
+    def play_next(self, output_sink=None):
+        return False
+
+    def resume_track(self, track, position_s=None):
+        self.resumed.append((track, position_s))
+        self.playing = True
+        self.current_track = track
+        return True
+
+
+class DummyAudio:
+    def acquire_audio(self, *args, **kwargs):
+        return True
+
+    def release_audio(self, *args, **kwargs):
+        return True
+
+
+def _make_pipeline(monkeypatch):
+    from core import pipeline as pipeline_module
+
+    player = FakePlayer()
+    monkeypatch.setattr(pipeline_module, "get_music_player", lambda: player)
+    events = []
+    pipeline = pipeline_module.ArgoPipeline(DummyAudio(), lambda kind, payload: events.append((kind, payload)))
+    pipeline.stt_engine_manager = WordManager()
+    pipeline.stt_engine = "faster"
+    pipeline._evaluate_gates = lambda *args, **kwargs: (True, "")
+    spoken = []
+    pipeline.speak = lambda text, interaction_id=None, **kwargs: spoken.append(text)
+    return pipeline, player, events, spoken
+
+
+def _feed(session, audio, frame=512):
+    for offset in range(0, len(audio), frame):
+        session.feed(audio[offset:offset + frame])
+
+
+def test_pipeline_stops_music_before_end_of_speech(monkeypatch):
+    pipeline, player, events, spoken = _make_pipeline(monkeypatch)
+    session = pipeline.begin_incremental_stt("i-stop")
+    assert session is not None and session.speculation is not None
+
+    word = _word_audio(WORDS.index("stop"))
+    _feed(session, word)
+    word_end = time.perf_counter()
+    deadline = word_end + 1.0
+    while player.stopped_at is None and time.perf_counter() < deadline:
+        time.sleep(0.002)
+    assert player.stopped_at is not None
+    assert (player.stopped_at - word_end) * 1000 < 300
+
+    pipeline.run_interaction(word, interaction_id="i-stop", stt_session=session)
+    assert spoken == ["Stopped."]
+    statuses = [payload["status"] for kind, payload in events if kind == "speculative_intent"]
+    assert statuses == ["fired", "confirmed"]
+    assert player.resumed == []
+
+
+def test_pipeline_abandoned_utterance_restores_track(monkeypatch):
+    pipeline, player, events, _spoken = _make_pipeline(monkeypatch)
+    session = pipeline.begin_incremental_stt("i-drop")
+    _feed(session, _word_audio(WORDS.index("stop")))
+    deadline = time.perf_counter() + 1.0
+    while player.playing and time.perf_counter() < deadline:
+        time.sleep(0.002)
+    assert not player.playing
+
+    pipeline.abandon_incremental_stt(session)
+    assert player.playing
+    assert player.resumed == [({"path": "/music/song.mp3", "name": "Song"}, 42.5)]
+    statuses = [payload["status"] for kind, payload in events if kind == "speculative_intent"]
+    assert statuses == ["fired", "rolled_back"]
+
+
+def test_music_player_resumes_at_position(monkeypatch):
+    from core import music_player as music_player_module
+
+    player = music_player_module.MusicPlayer.__new__(music_player_module.MusicPlayer)
+    player.current_process = None
+    player._is_playing_flag = True
+    player._position_anchor = (10.0, time.monotonic() - 2.0)
+    assert 11.9 < player.playback_position() < 12.5
+
+    started = []
+    monkeypatch.setattr(player, "play", lambda path, name, sink, track_data=None, start_s=0.0: started.append((path, start_s)) or True)
+    assert player.resume_track({"path": "/music/song.mp3"}, 12.0)
+    assert started == [("/music/song.mp3", 12.0)]
@@ -0,0 +1,122 @@
+"""
+Test: Startup orchestrator (core/startup_orchestrator.py)
+
+Validates:
+- Independent tasks run concurrently; a task starts only after its
+  dependencies are ready
+- wait_for() returns once its subset is ready while slower tasks keep running
+- A failed dependency skips its dependents; required failures raise
+  StartupError, optional ones don't
+- Unknown dependencies and cycles are rejected up front
+- Every transition is reported through on_event; "running" only once a
+  worker has actually started the task
+- The default pool never leaves a ready task queued behind another
+"""
+
+import threading
+
+import pytest
+
+from core.startup_orchestrator import StartupError, StartupOrchestrator, StartupTask
+
+
+def test_independent_tasks_overlap_and_deps_order():
+    barrier = threading.Barrier(2, timeout=5)
+    order = []
+    events = []
+
+    def side_by_side(name):
+        def run():
+            barrier.wait()  # only passes if both run at once
+            order.append(name)
+            return name
+        return run
+
+    startup = StartupOrchestrator(
+        [
+            StartupTask("audio", side_by_side("audio")),
+            StartupTask("stt", side_by_side("stt")),
+            StartupTask("ready", lambda: order.append("ready"), deps=("audio", "stt")),
+        ],
+        on_event=events.append,
+    ).start()
+
+    results = startup.wait_all(timeout=5)
+    assert results["audio"] == "audio"
+    assert order[-1] == "ready"
+    assert [e["state"] for e in events if e["task"] == "ready"] == ["running", "ready"]
+    assert {t["task"]: t["state"] for t in startup.timings()} == {"audio": "ready", "stt": "ready", "ready": "ready"}
+
+
+def test_wait_for_subset_while_slow_task_runs():
+    release = threading.Event()
+    started = threading.Event()
+    startup = StartupOrchestrator(
+        [
+            StartupTask("audio", lambda: "ok"),
+            StartupTask("llm", lambda: started.set() or release.wait(5), required=False),
+        ]
+    ).start()
+
+    assert startup.wait_for(["audio"], timeout=5) == {"audio": "ok"}
+    assert started.wait(5)
+    assert startup.tasks["llm"].state == "running"
+    with pytest.raises(TimeoutError):
+        startup.wait_for(["llm"], timeout=0.05)
+    release.set()
+    startup.wait_all(timeout=5)
+
+
+def test_failures_skip_dependents():
+    def boom():
+        raise RuntimeError("Ollama is not running")
+
+    startup = StartupOrchestrator(
+        [
+            StartupTask("ollama", boom, required=False),
+            StartupTask("llm", lambda: "warm", deps=("ollama",), required=False),
+            StartupTask("stt", boom),
+        ]
+    ).start()
+
+    with pytest.raises(StartupError) as excinfo:
+        startup.wait_all(timeout=5)
+    assert excinfo.value.task == "stt"
+    assert startup.tasks["llm"].state == "skipped"
+    assert startup.wait_for(["ollama", "llm"], timeout=5) == {"ollama": None, "llm": None}
+
+
+def test_rejects_bad_graphs():
+    with pytest.raises(ValueError, match="unknown"):
+        StartupOrchestrator([StartupTask("a", lambda: None, deps=("b",))])
+    with pytest.raises(ValueError, match="cycle"):
+        StartupOrchestrator([
+            StartupTask("a", lambda: None, deps=("b",)),
+            StartupTask("b", lambda: None, deps=("a",)),
+        ])
+
+
+def test_running_is_reported_when_work_starts():
+    release = threading.Event()
+    events = []
+    blockers = [StartupTask(f"slow{n}", lambda: release.wait(5), required=False) for n in range(5)]
+    startup = StartupOrchestrator(blockers + [StartupTask("stt", lambda: "loaded")], on_event=events.append).start()
+
+    # Five slow roots don't hold the last-declared task back
+    assert startup.wait_for(["stt"], timeout=5) == {"stt": "loaded"}
+    release.set()
+    startup.wait_all(timeout=5)
+
+    limited = StartupOrchestrator(
+        [StartupTask("slow", lambda: release.wait(5)), StartupTask("stt", lambda: "loaded")],
+        max_workers=1,
+        on_event=events.append,
+    )
+    release.clear()
+    events.clear()
+    limited.start()
+    assert limited.tasks["stt"].state == "queued"
+    assert ("stt", "running") not in [(e["task"], e["state"]) for e in events]
+    release.set()
+    limited.wait_all(timeout=5)
+    assert [e["state"] for e in events if e["task"] == "stt"] == ["running", "ready"]
@@ -0,0 +1,146 @@
+"""
+Test: STT calibration (core/stt_calibration.py)
+
+Validates:
+- Word error rate counts substitutions, insertions and deletions over the
+  reference word count, ignoring case and punctuation
+- The candidate grid covers engine x model x compute_type x threads x workers
+  (openai-whisper has no compute_type)
+- calibrate() decodes through transcribe_batch() (the runtime batching
+  path) with the pipeline's decode options and input normalization, and picks the fastest candidate under the WER floor; failures and
+  inaccurate candidates are never picked
+- The winner is merged into config.json's speech_to_text section without
+  touching other keys
+- The shipped manifest lists every clip with a transcript; missing
+  recordings stop calibration with a message naming them
+"""
+
+import json
+import time
+
+import numpy as np
+import pytest
+
+from core.stt_calibration import (
+    REFERENCE_DIR,
+    ReferenceClip,
+    STTCandidate,
+    calibrate,
+    candidate_grid,
+    load_reference_clips,
+    read_wav,
+    runtime_initial_prompt,
+    word_error_rate,
+    write_stt_config,
+    write_wav,
+)
+
+
+def test_word_error_rate():
+    assert word_error_rate(["Play some Pink Floyd."], ["play some pink floyd"]) == 0.0
+    assert word_error_rate(["play some pink floyd"], ["play sum pink"]) == 0.5
+    assert word_error_rate(["stop", "next song"], ["stop it", "next song"]) == 1 / 3
+
+
+def test_candidate_grid():
+    grid = candidate_grid(["faster", "openai"], models=["tiny", "base"], compute_types=["int8", "float32"],
+                          cpu_threads=[2, 4], num_workers=[1, 2])
+    faster = [c for c in grid if c.engine == "faster"]
+    openai = [c for c in grid if c.engine == "openai"]
+    assert len(faster) == 16
+    assert len(openai) == 4
+    assert {c.compute_type for c in openai} == {None}
+    assert STTCandidate("faster", "tiny", "int8", 4, 2) in faster
+
+
+def test_calibrate_picks_fastest_accurate_candidate():
+    clips = [ReferenceClip("a.wav", "play some pink floyd", np.full(16000, 0.3, dtype=np.float32))] * 2
+    behaviour = {
+        "tiny": "play sum pink",  # fast but inaccurate
+        "base": "play some pink floyd",
+        "small": "play some pink floyd",
+    }
+    closed = []
+    batches = []
+    seen_kwargs = []
+    peaks = []
+
+    class FakeManager:
+        def __init__(self, candidate):
+            if candidate.compute_type == "float16":
+                raise RuntimeError("unsupported compute type")
+            self.candidate = candidate
+
+        def transcribe_batch(self, audios, language=None, **kwargs):
+            batches.append(len(audios))
+            seen_kwargs.append(kwargs)
+            peaks.extend(float(np.max(np.abs(a))) for a in audios)
+            if self.candidate.model == "small":
+                time.sleep(0.02)
+            return [{"text": behaviour[self.candidate.model]} for _ in audios]
+
+        def close(self):
+            closed.append(self.candidate)
+
+    candidates = [STTCandidate("faster", m, "int8", 2) for m in behaviour] + [STTCandidate("faster", "base", "float16", 2)]
+    factory = FakeManager
+
+    results = calibrate(clips, candidates, max_wer=0.15, manager_factory=factory, initial_prompt="Argo")
+    rows = {(r["model"], r["compute_type"]): r for r in results["results"]}
+    assert rows[("base", "float16")]["error"] == "unsupported compute type"
+    assert rows[("tiny", "int8")]["wer"] == 0.5
+    assert results["best"]["model"] == "base"
+    assert results["best"]["wer"] == 0.0
+    assert len(closed) == 3
+    assert batches == [1, 2] * 3  # warm-up, then every clip in one batch
+    assert seen_kwargs[0] == {"beam_size": 1, "condition_on_previous_text": False, "initial_prompt": "Argo"}
+    assert peaks and all(abs(p - 0.9) < 1e-6 for p in peaks)
+
+    assert calibrate(clips, candidates[:1], max_wer=0.15, manager_factory=factory)["best"] is None
+
+
+def test_write_stt_config_merges(tmp_path):
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps({"llm": {"model": "qwen"}, "speech_to_text": {"engine": "openai", "prompt_profile": "technical"}}))
+    best = dict(STTCandidate("faster", "base", "int8", 4, 2).__dict__, rtf=0.12, wer=0.05)
+
+    write_stt_config(best, path, max_wer=0.15)
+
+    data = json.loads(path.read_text())
+    assert data["llm"] == {"model": "qwen"}
+    stt = data["speech_to_text"]
+    assert stt["prompt_profile"] == "technical"
+    assert (stt["engine"], stt["model"], stt["compute_type"], stt["cpu_threads"], stt["num_workers"]) == (
+        "faster", "base", "int8", 4, 2,
+    )
+    assert stt["calibration"]["rtf"] == 0.12
+
+
+def test_wav_round_trip_and_manifest(tmp_path):
+    samples = np.sin(np.linspace(0, 100, 16000)).astype(np.float32) * 0.5
+    write_wav(tmp_path / "clip.wav", samples)
+    assert np.allclose(read_wav(tmp_path / "clip.wav"), samples, atol=1e-3)
+
+    manifest = json.loads((REFERENCE_DIR / "manifest.json").read_text())
+    assert manifest["clips"]
+    assert all(entry["file"].endswith(".wav") and entry["text"].strip() for entry in manifest["clips"])
+
+
+def test_missing_recordings_stop_calibration(tmp_path):
+    (tmp_path / "manifest.json").write_text(json.dumps({"clips": [
+        {"file": "stop.wav", "text": "stop"},
+        {"file": "next_song.wav", "text": "skip to the next song"},
+    ]}))
+    write_wav(tmp_path / "stop.wav", np.zeros(16000, dtype=np.float32))
+    with pytest.raises(FileNotFoundError, match="next_song.wav"):
+        load_reference_clips(tmp_path)
+
+    write_wav(tmp_path / "next_song.wav", np.zeros(16000, dtype=np.float32))
+    assert [clip.text for clip in load_reference_clips(tmp_path)] == ["stop", "skip to the next song"]
+
+
+def test_runtime_initial_prompt_follows_config_profile(tmp_path):
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps({"speech_to_text": {"prompt_profile": "technical"}}), encoding="utf-8")
+    assert "SQLite" in runtime_initial_prompt(config_path)
+    assert runtime_initial_prompt(tmp_path / "missing.json") == ""
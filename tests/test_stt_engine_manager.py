@@ -340,3 +340,26 @@ def test_segment_normalization_missing_text():
     assert len(normalized) == 1
     assert isinstance(normalized[0], STTSegment)
     assert normalized[0].text == ""
+
+
+def test_openai_input_gain_applies_to_mic_audio_only():
+    """Regression: File input (input_gain=1.0) reaches openai-whisper unscaled."""
+    from core.stt_engine_manager import STTEngineManager, MIC_INPUT_GAIN
+
+    seen = []
+
+    class FakeModel:
+        def transcribe(self, audio, **kwargs):
+            assert "input_gain" not in kwargs
+            seen.append(audio)
+            return {"text": "ok", "segments": []}
+
+    manager = STTEngineManager.__new__(STTEngineManager)
+    manager.model = FakeModel()
+    audio = np.full(160, 0.7, dtype=np.float32)
+
+    manager._transcribe_openai(audio, "en")
+    manager._transcribe_openai(audio, "en", input_gain=1.0)
+
+    assert np.allclose(seen[0], min(0.7 * MIC_INPUT_GAIN, 1.0))
+    assert np.array_equal(seen[1], audio)
@@ -0,0 +1,147 @@
+"""
+Test: Incremental (partial) STT during capture
+
+Validates:
+- Rolling windows produce a stable prefix + tentative tail while audio is fed
+- Agreed segments are committed and their audio dropped from the window
+- finalize() only decodes the uncommitted tail and returns the full text
+- ArgoPipeline broadcasts stt_partial events and uses the session at VAD end
+"""
+
+import logging
+import time
+
+import numpy as np
+
+from core.stt_engine_manager import IncrementalTranscriber, STTSegment
+
+SR = 16000
+WORD_S = 0.5
+WORDS = ["play", "some", "music", "by", "the", "rolling", "stones", "please", "right", "now"]
+
+
+def _word_audio(index):
+    # Peaks >= 0.85 so window normalization leaves the encoding intact
+    return np.full(int(SR * WORD_S), 0.86 + 0.01 * index, dtype=np.float32)
+
+
+class FakeManager:
+    """Whisper stand-in: every 0.5s block of constant amplitude is one word."""
+
+    engine = "faster"
+
+    def __init__(self):
+        self.model = object()
+        self.logger = logging.getLogger("STT_ENGINE")
+        self.decoded_seconds = []
+
+    def transcribe(self, audio, language="en", **kwargs):
+        audio = np.asarray(audio).reshape(-1)
+        self.decoded_seconds.append(len(audio) / SR)
+        block = int(SR * WORD_S)
+        words = []
+        for offset in range(0, len(audio), block):
+            chunk = audio[offset:offset + block]
+            if len(chunk) < block // 2:
+                break
+            index = int(round((float(np.median(chunk)) - 0.86) / 0.01))
+            words.append(WORDS[index])
+        segments = []
+        for first in range(0, len(words), 2):
+            pair = words[first:first + 2]
+            segments.append(STTSegment(
+                text=" " + " ".join(pair),
+                start=first * WORD_S,
+                end=min((first + len(pair)) * WORD_S, len(audio) / SR),
+            ))
+        return {
+            "text": " ".join(words),
+            "confidence": -0.2,
+            "segments": segments,
+            "engine": self.engine,
+            "duration_ms": 1.0,
+        }
+
+    def start_incremental(self, language="en", on_partial=None, **kwargs):
+        return IncrementalTranscriber(self, language=language, on_partial=on_partial, **kwargs)
+
+
+def _feed_words(session, count, frame=512):
+    """Feed words frame by frame, waiting for the worker after each step."""
+    for index in range(count):
+        audio = _word_audio(index)
+        for offset in range(0, len(audio), frame):
+            session.feed(audio[offset:offset + frame])
+        deadline = time.time() + 2.0
+        while time.time() < deadline:
+            caught_up = session._decoded_upto >= session._total
+            too_short = session._total - session._window_start < session._min_window
+            if caught_up or too_short:
+                break
+            time.sleep(0.005)
+
+
+def test_partials_have_stable_prefix_and_tentative_tail():
+    partials = []
+    session = IncrementalTranscriber(FakeManager(), on_partial=partials.append, step_ms=500, min_window_ms=1000)
+    _feed_words(session, 4)
+    assert partials
+    last = partials[-1]
+    assert last.text == "play some music by"
+    assert last.stable.startswith("play some")
+    assert last.tentative
+    session.cancel()
+
+
+def test_finalize_decodes_only_the_tail():
+    manager = FakeManager()
+    session = IncrementalTranscriber(manager, step_ms=500, min_window_ms=1000, commit_margin_s=1.0)
+    _feed_words(session, len(WORDS))
+    result = session.finalize()
+    assert result["text"] == " ".join(WORDS)
+    assert result["committed_text"]
+    utterance_s = len(WORDS) * WORD_S
+    assert result["tail_s"] < utterance_s / 2
+    assert manager.decoded_seconds[-1] == result["tail_s"]
+    assert result["segments"][-1].end == utterance_s
+
+
+def test_window_is_bounded_without_agreement():
+    manager = FakeManager()
+    session = IncrementalTranscriber(manager, step_ms=500, min_window_ms=1000, max_window_s=2.0, commit_margin_s=10.0)
+    _feed_words(session, 8)
+    result = session.finalize()
+    assert result["text"] == " ".join(WORDS[:8])
+    assert max(manager.decoded_seconds) <= 3.0
+
+
+def test_pipeline_broadcasts_partials_and_finalizes_session():
+    from core.pipeline import ArgoPipeline
+
+    class DummyAudio:
+        def acquire_audio(self, *args, **kwargs):
+            return True
+
+        def release_audio(self, *args, **kwargs):
+            return True
+
+    events = []
+    pipeline = ArgoPipeline(DummyAudio(), lambda kind, payload: events.append((kind, payload)))
+    manager = FakeManager()
+    pipeline.stt_engine_manager = manager
+    pipeline.stt_engine = "faster"
+
+    session = pipeline.begin_incremental_stt("i-1")
+    assert session is not None
+    full_audio = np.concatenate([_word_audio(i) for i in range(4)])
+    _feed_words(session, 4)
+    text = pipeline.transcribe(full_audio, interaction_id="i-1", stt_session=session)
+
+    assert text == "play some music by"
+    partials = [payload for kind, payload in events if kind == "stt_partial"]
+    assert partials and partials[-1]["interaction_id"] == "i-1"
+    # No full-utterance decode at VAD end
+    assert manager.decoded_seconds[-1] < len(full_audio) / SR
+
+    pipeline._stt_incremental = {"enabled": False}
+    assert pipeline.begin_incremental_stt("i-2") is None
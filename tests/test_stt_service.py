@@ -0,0 +1,245 @@
+"""
+Test: STT request queue (core/stt_service.py)
+
+Validates:
+- Requests decode in priority order (live mic > upload > replay), FIFO within
+  a priority, each resolving its own Future
+- A cancelled request is never decoded
+- The queue is bounded: higher priority evicts the newest lower-priority
+  request, otherwise submit() raises STTQueueFull
+- Queued requests with the same options are decoded as one batch (up to the
+  manager's parallelism); a failing clip only fails its own Future
+- ArgoPipeline queues input that arrives while busy instead of dropping it,
+  decoding it before the previous interaction finishes
+"""
+
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from core.stt_service import STTPriority, STTQueueFull, STTService
+
+
+class GatedManager:
+    """Records decode order; the first decode blocks until released."""
+
+    def __init__(self, parallelism=1):
+        self.batch_parallelism = parallelism
+        self.gate = threading.Event()
+        self.started = threading.Event()
+        self.decoded = []
+        self.batches = []
+
+    def _decode(self, audio):
+        if not self.decoded:
+            self.started.set()
+            assert self.gate.wait(5)
+        tag = audio["tag"]
+        if tag == "bad":
+            raise RuntimeError("decode failed")
+        self.decoded.append(tag)
+        return {"text": tag}
+
+    def transcribe(self, audio, language="en", **kwargs):
+        return self._decode(audio)
+
+    def transcribe_batch(self, audios, language="en", **kwargs):
+        self.batches.append([a["tag"] for a in audios])
+        results = []
+        for audio in audios:
+            try:
+                results.append(self._decode(audio))
+            except Exception as e:
+                results.append(e)
+        return results
+
+
+def _clip(tag):
+    return {"tag": tag}
+
+
+def test_priority_order_and_cancellation():
+    manager = GatedManager()
+    service = STTService(manager)
+    first = service.submit(_clip("first"))
+    assert manager.started.wait(5)
+
+    replay = service.submit(_clip("replay"), priority=STTPriority.REPLAY)
+    upload = service.submit(_clip("upload"), priority=STTPriority.UPLOAD)
+    live_a = service.submit(_clip("live-a"))
+    cancelled = service.submit(_clip("cancelled"), priority=STTPriority.UPLOAD)
+    live_b = service.submit(_clip("live-b"))
+    assert cancelled.cancel()
+    manager.gate.set()
+
+    assert replay.result(5) == {"text": "replay"}
+    assert [f.result(5)["text"] for f in (first, upload, live_a, live_b)] == ["first", "upload", "live-a", "live-b"]
+    assert manager.decoded == ["first", "live-a", "live-b", "upload", "replay"]
+    assert service.stats()["cancelled"] == 1
+    service.close()
+
+
+def test_bounded_queue_evicts_lower_priority():
+    manager = GatedManager()
+    service = STTService(manager, max_pending=2)
+    service.submit(_clip("running"))
+    assert manager.started.wait(5)
+
+    older = service.submit(_clip("replay-1"), priority=STTPriority.REPLAY)
+    newer = service.submit(_clip("replay-2"), priority=STTPriority.REPLAY)
+    live = service.submit(_clip("live"))
+    with pytest.raises(STTQueueFull):
+        newer.result(1)
+    with pytest.raises(STTQueueFull):
+        service.submit(_clip("replay-3"), priority=STTPriority.REPLAY)
+
+    manager.gate.set()
+    assert live.result(5)["text"] == "live"
+    assert older.result(5)["text"] == "replay-1"
+    service.close()
+
+
+def test_compatible_requests_decode_as_one_batch():
+    manager = GatedManager(parallelism=4)
+    service = STTService(manager, max_batch=8)
+    service.submit(_clip("first"))
+    assert manager.started.wait(5)
+
+    a = service.submit(_clip("a"))
+    bad = service.submit(_clip("bad"))
+    other = service.submit(_clip("other"), beam_size=5)
+    b = service.submit(_clip("b"), priority=STTPriority.UPLOAD)
+    manager.gate.set()
+
+    assert [f.result(5)["text"] for f in (a, b, other)] == ["a", "b", "other"]
+    with pytest.raises(RuntimeError, match="decode failed"):
+        bad.result(5)
+    assert manager.batches == [["a", "bad", "b"]]
+    assert service.stats()["largest_batch"] == 3
+    service.close()
+
+
+def test_pipeline_queues_input_while_busy(monkeypatch):
+    from core.pipeline import ArgoPipeline
+
+    class DummyAudio:
+        def acquire_audio(self, *args, **kwargs):
+            return True
+
+        def release_audio(self, *args, **kwargs):
+            return True
+
+    class Manager:
+        model = object()
+        decoded = threading.Event()
+
+        def transcribe(self, audio, language="en", **kwargs):
+            self.decoded.set()
+            return {"text": "play some music", "engine": "faster", "duration_ms": 1.0, "segments": []}
+
+    pipeline = ArgoPipeline(DummyAudio(), lambda kind, payload: None)
+    pipeline.stt_engine_manager = Manager()
+    pipeline.stt_engine = "faster"
+    handled = []
+    monkeypatch.setattr(pipeline, "handle_user_text", lambda user_text, **kwargs: handled.append(user_text))
+
+    audio = (np.random.default_rng(0).standard_normal(16000) * 0.3).astype(np.float32)
+    pipeline.processing_lock.acquire()
+    worker = threading.Thread(target=pipeline.run_interaction, args=(audio, "i-busy"))
+    worker.start()
+    # Decoded while the previous interaction still holds the pipeline
+    assert Manager.decoded.wait(5)
+    assert handled == []
+    pipeline.processing_lock.release()
+    worker.join(5)
+    assert handled == ["play some music"]
+    pipeline.stt_service.close()
+
+
+def test_turn_lock_serves_waiters_in_arrival_order():
+    from core.pipeline import TurnLock
+
+    lock = TurnLock()
+    lock.acquire()
+    order = []
+
+    def wait_turn(n):
+        with lock:
+            order.append(n)
+
+    workers = []
+    for n in range(4):
+        worker = threading.Thread(target=wait_turn, args=(n,))
+        worker.start()
+        workers.append(worker)
+        deadline = time.monotonic() + 5
+        while lock.waiting() < n + 1 and time.monotonic() < deadline:
+            time.sleep(0.001)
+    # A late non-blocking attempt does not jump the line
+    assert not lock.acquire(blocking=False)
+    lock.release()
+    for worker in workers:
+        worker.join(5)
+    assert order == [0, 1, 2, 3]
+
+
+def test_turn_lock_timed_out_waiter_leaves_the_line():
+    from core.pipeline import TurnLock
+
+    lock = TurnLock()
+    lock.acquire()
+    assert not lock.acquire(timeout=0.01)
+    assert lock.waiting() == 0
+    lock.release()
+    assert lock.acquire(blocking=False)
+    lock.release()
+
+
+def test_pipeline_decodes_early_while_busy_with_incremental_session(monkeypatch):
+    from core.pipeline import ArgoPipeline
+
+    class DummyAudio:
+        def acquire_audio(self, *args, **kwargs):
+            return True
+
+        def release_audio(self, *args, **kwargs):
+            return True
+
+    class Manager:
+        model = object()
+        decoded = threading.Event()
+
+        def transcribe(self, audio, language="en", **kwargs):
+            self.decoded.set()
+            return {"text": "play some music", "engine": "faster", "duration_ms": 1.0, "segments": []}
+
+    class Session:
+        speculation = None
+        cancelled = False
+
+        def finalize(self):
+            raise AssertionError("finalize() should not run after an early decode")
+
+        def cancel(self):
+            self.cancelled = True
+
+    pipeline = ArgoPipeline(DummyAudio(), lambda kind, payload: None)
+    pipeline.stt_engine_manager = Manager()
+    pipeline.stt_engine = "faster"
+    handled = []
+    monkeypatch.setattr(pipeline, "handle_user_text", lambda user_text, **kwargs: handled.append(user_text))
+
+    audio = (np.random.default_rng(0).standard_normal(16000) * 0.3).astype(np.float32)
+    session = Session()
+    pipeline.processing_lock.acquire()
+    worker = threading.Thread(target=pipeline.run_interaction, args=(audio, "i-busy"), kwargs={"stt_session": session})
+    worker.start()
+    assert Manager.decoded.wait(5)
+    assert handled == []
+    pipeline.processing_lock.release()
+    worker.join(5)
+    assert handled == ["play some music"]
+    assert session.cancelled
+    pipeline.stt_service.close()
@@ -0,0 +1,230 @@
+"""
+Test: Synthesized audio cache (core/tts_cache.py)
+
+Validates:
+- Keys are content-addressed over text + voice + length_scale
+- Memory tier is an LRU bounded by PCM bytes
+- Disk tier survives restarts and evicts least-recently-used files past its cap
+- Only texts the caller opts in (CacheablePhrase) or warmed phrases are cached
+- PiperOutputSink replays cached sentences without synthesizing, and never
+  caches audio truncated by barge-in
+- Warm-up renders only phrases that are not cached yet
+- The Piper sink is warmed at startup when it is the selected output sink
+"""
+
+import os
+import threading
+import time
+
+from core.piper_server import PiperSynthesisServer
+from core.tts_cache import CacheablePhrase, CachedAudio, TTSAudioCache
+
+
+class FakeBackend:
+    name = "fake"
+    sample_rate = 22050
+
+    def __init__(self):
+        self.calls = []
+
+    def synthesize(self, text):
+        self.calls.append(text)
+        yield f"{text}|".encode("utf-8")
+        yield b"tail"
+
+    def close(self):
+        pass
+
+
+def _drain(source):
+    data = b""
+    while True:
+        chunk = source.read(4)
+        if not chunk:
+            return data
+        data += chunk
+
+
+def _make_sink(tmp_path):
+    from core.output_sink import PiperOutputSink
+
+    sink = PiperOutputSink(piper_path="echo", voice_path="dummy.onnx")
+    sink._tts_cache = TTSAudioCache(cache_dir=str(tmp_path))
+    sink._persistent = True
+    backend = FakeBackend()
+    sink._piper_server = PiperSynthesisServer("piper", "voice.onnx", backend=backend).start()
+    played = []
+
+    def fake_stream_and_play(source):
+        played.append(_drain(source))
+        return 0
+
+    sink._stream_and_play = fake_stream_and_play
+    return sink, backend, played
+
+
+def test_key_covers_text_voice_and_length_scale():
+    key = TTSAudioCache.make_key("Done.", "lessac.onnx", 0.85)
+    assert key == TTSAudioCache.make_key("  Done. ", "lessac.onnx", 0.85)
+    assert key != TTSAudioCache.make_key("Done!", "lessac.onnx", 0.85)
+    assert key != TTSAudioCache.make_key("Done.", "allen.onnx", 0.85)
+    assert key != TTSAudioCache.make_key("Done.", "lessac.onnx", 1.0)
+
+
+def test_memory_tier_is_byte_bounded_lru():
+    cache = TTSAudioCache(cache_dir=None, max_memory_bytes=10)
+    cache.put("a", b"aaaa", 22050)
+    cache.put("b", b"bbbb", 22050)
+    assert cache.get("a") is not None  # "a" is now most recent
+    cache.put("c", b"cccc", 22050)
+    assert cache.get("b") is None
+    assert cache.get("a").pcm == b"aaaa"
+    assert cache.get("c").pcm == b"cccc"
+    assert cache.memory_bytes == 8
+
+
+def test_disk_tier_persists_and_evicts_oldest(tmp_path):
+    cache = TTSAudioCache(cache_dir=str(tmp_path), max_disk_bytes=300)
+    cache.put("old", b"\x01\x00" * 40, 22050)
+    past = time.time() - 60
+    os.utime(tmp_path / "old.wav", (past, past))
+    cache.put("new", b"\x02\x00" * 40, 16000, channels=2)
+
+    reopened = TTSAudioCache(cache_dir=str(tmp_path), max_disk_bytes=300)
+    audio = reopened.get("new")
+    assert audio == CachedAudio(b"\x02\x00" * 40, 16000, 2)
+
+    reopened.put("third", b"\x03\x00" * 40, 22050)
+    assert not (tmp_path / "old.wav").exists()
+    assert (tmp_path / "new.wav").exists()
+    assert reopened.disk_bytes <= 300
+
+
+def test_long_text_is_not_cacheable():
+    cache = TTSAudioCache(cache_dir=None, max_text_chars=20)
+    assert cache.cacheable(CacheablePhrase("What should I do?"))
+    assert not cache.cacheable(CacheablePhrase("This sentence is far too long to be a fixed phrase."))
+    assert not cache.cacheable(CacheablePhrase("   "))
+
+
+def test_caching_is_opt_in():
+    cache = TTSAudioCache(cache_dir=None)
+    assert not cache.cacheable("It is sunny and 21 degrees.")
+    assert cache.cacheable(CacheablePhrase("It is sunny and 21 degrees."))
+    cache.warm_up(["Which app?"], "voice", 1.0, lambda text: None)
+    assert cache.cacheable("Which app?")
+
+
+def test_piper_sink_skips_cache_for_free_form_sentences(tmp_path):
+    sink, backend, played = _make_sink(tmp_path)
+    try:
+        sink._send_sync("Sure. Here is a long answer.")
+        queued = list(sink.text_queue.queue)
+        sink._send_sync(CacheablePhrase("Done. Which app?"))
+        marked = list(sink.text_queue.queue)[len(queued):]
+        assert [type(s) for s in queued] == [str, str]
+        assert marked == ["Done.", "Which app?"]
+        assert all(isinstance(s, CacheablePhrase) for s in marked)
+    finally:
+        with sink.text_queue.mutex:
+            sink.text_queue.queue.clear()
+        sink._piper_server.close()
+
+    sink, backend, played = _make_sink(tmp_path)
+    try:
+        sink._play_sentence("Sure.")
+        sink._play_sentence("Sure.")
+        assert backend.calls == ["Sure.", "Sure."]
+        assert sink._tts_cache.hits == 0
+    finally:
+        sink._piper_server.close()
+
+
+def test_piper_sink_replays_cached_sentence_without_synthesis(tmp_path):
+    sink, backend, played = _make_sink(tmp_path)
+    try:
+        sink._play_sentence(CacheablePhrase("Done."))
+        sink._play_sentence(CacheablePhrase("Done."))
+        assert played == [b"Done.|tail", b"Done.|tail"]
+        assert backend.calls == ["Done."]
+        assert sink._tts_cache.hits == 1
+    finally:
+        sink._piper_server.close()
+
+
+def test_piper_sink_does_not_cache_interrupted_audio(tmp_path):
+    sink, backend, played = _make_sink(tmp_path)
+
+    def interrupted_play(source):
+        played.append(source.read(2))
+        sink._pcm_stream.cancel()
+        return 0
+
+    sink._stream_and_play = interrupted_play
+    try:
+        sink._play_sentence(CacheablePhrase("Done."))
+        key = sink._cache_key(CacheablePhrase("Done."))
+        assert key not in sink._tts_cache
+    finally:
+        sink._piper_server.close()
+
+
+def test_warm_up_renders_only_missing_phrases(tmp_path):
+    sink, backend, _played = _make_sink(tmp_path)
+    try:
+        sink._tts_cache.put(sink._cache_key(CacheablePhrase("Done.")), b"\x00\x00", 22050)
+        rendered = sink.warm_cache(["Done.", "Which app?", "x" * 500])
+        assert rendered == 1
+        assert backend.calls == ["Which app?"]
+        assert sink._is_cached("Which app?")
+    finally:
+        sink._piper_server.close()
+
+
+def test_piper_sink_is_warmed_when_selected(tmp_path, monkeypatch):
+    from core import output_sink
+    from core.pipeline import ArgoPipeline
+
+    sink, backend, _played = _make_sink(tmp_path)
+    edge_phrases = []
+
+    class EdgeStub:
+        def warm_cache(self, phrases):
+            edge_phrases.extend(phrases)
+            return 0
+
+    class DummyAudio:
+        pass
+
+    monkeypatch.setenv("OUTPUT_SINK", "piper")
+    monkeypatch.setattr(output_sink, "VOICE_ENABLED", True)
+    monkeypatch.setattr(output_sink, "PIPER_ENABLED", True)
+    monkeypatch.setattr(output_sink, "_output_sink", sink)
+    try:
+        pipeline = ArgoPipeline(DummyAudio(), lambda *_: None)
+        pipeline._edge_tts = EdgeStub()
+        pipeline._start_tts_cache_warmup().join(5)
+        assert "Done." in backend.calls
+        assert sink._is_cached("Done.")
+        assert "Done." in edge_phrases
+    finally:
+        sink._piper_server.close()
+
+
+def test_get_output_sink_warms_new_piper_sink(monkeypatch):
+    from core import output_sink
+
+    warmed = threading.Event()
+
+    class FakePiper(output_sink.SilentOutputSink):
+        def warm_cache(self, phrases=None):
+            warmed.set()
+            return 0
+
+    monkeypatch.setenv("OUTPUT_SINK", "piper")
+    monkeypatch.setattr(output_sink, "VOICE_ENABLED", True)
+    monkeypatch.setattr(output_sink, "PIPER_ENABLED", True)
+    monkeypatch.setattr(output_sink, "_output_sink", None)
+    monkeypatch.setattr(output_sink, "PiperOutputSink", FakePiper)
+    assert isinstance(output_sink.get_output_sink(), FakePiper)
+    assert warmed.wait(5)
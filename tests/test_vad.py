@@ -0,0 +1,160 @@
+"""
+Test: Frame-level VAD (core/vad.py)
+
+Validates:
+- Energy+ZCR engine detects a speech-like utterance in background noise and
+  endpoints end_silence_ms after it ends
+- Clicks, a loud steady fan and mains hum never start an utterance (the
+  legacy norm threshold fires on all of them)
+- Onsets that never voice min_speech_ms end as NOISE_BURST, not SPEECH_END
+- Offline segmentation works on .npy replays
+- Adaptive endpoint: canonical commands close after ~300ms, incomplete or
+  open-ended transcripts keep the longer window, stale partials are ignored,
+  and a falling energy/pitch tail closes sooner than a held one
+- Silero engine (when onnxruntime + model are available) streams frames
+"""
+
+import numpy as np
+import pytest
+
+from core.vad import (
+    NOISE_BURST,
+    SHAPE_COMMAND,
+    SHAPE_COMPLETE,
+    SHAPE_INCOMPLETE,
+    SHAPE_OPEN,
+    SPEECH_END,
+    SPEECH_START,
+    EnergyZCREngine,
+    VoiceActivityDetector,
+    create_vad,
+    frame_level,
+    segment_audio,
+    transcript_shape,
+)
+
+SR = 16000
+rng = np.random.default_rng(7)
+
+
+def _noise(seconds, amp=0.003):
+    return (amp * rng.standard_normal(int(SR * seconds))).astype(np.float32)
+
+
+def _speechlike(seconds, f0=140.0, amp=0.2):
+    """Harmonic voice with a 4 Hz syllable envelope."""
+    t = np.arange(int(SR * seconds)) / SR
+    voiced = sum(np.sin(2 * np.pi * f0 * k * t) / k for k in range(1, 12))
+    envelope = 0.55 + 0.45 * np.sin(2 * np.pi * 4 * t)
+    return (amp * envelope * voiced / 2).astype(np.float32) + _noise(seconds)
+
+
+def _legacy_triggers(audio, threshold=5.0):
+    return sum(frame_level(audio[i:i + 512]) >= threshold for i in range(0, len(audio) - 511, 512))
+
+
+def test_detects_utterance_and_endpoints_after_silence():
+    audio = np.concatenate([_noise(1.0), _speechlike(1.2), _noise(1.5)])
+    segments = segment_audio(audio, create_vad({"end_silence_ms": 800}))
+    assert len(segments) == 1
+    seg = segments[0]
+    assert seg.kind == SPEECH_END
+    assert abs(seg.start_s - 1.0) < 0.1
+    assert 2.2 + 0.6 < seg.end_s < 2.2 + 0.8 + 0.15
+
+
+def test_clicks_fan_and_hum_do_not_trigger():
+    click = np.concatenate([_noise(1.0), 0.5 * np.sign(rng.standard_normal(320)).astype(np.float32), _noise(1.5)])
+    fan = np.concatenate([_noise(1.0), _noise(6.0, amp=0.06)])
+    t = np.arange(SR * 3) / SR
+    hum = np.concatenate([_noise(1.0), (0.3 * np.sin(2 * np.pi * 50 * t)).astype(np.float32)])
+    for audio in (click, fan, hum):
+        assert _legacy_triggers(audio) > 0
+        assert segment_audio(audio, create_vad()) == []
+
+
+def test_short_onset_is_reported_as_noise_burst():
+    detector = VoiceActivityDetector(EnergyZCREngine(), start_ms=64, min_speech_ms=300, end_silence_ms=320)
+    audio = np.concatenate([_noise(1.0), _speechlike(0.15), _noise(1.0)])
+    events = [detector.process(audio[i:i + 512]).event for i in range(0, len(audio) - 511, 512)]
+    assert SPEECH_START in events
+    assert NOISE_BURST in events
+    assert SPEECH_END not in events
+
+
+def test_force_start_and_reset():
+    detector = create_vad({"end_silence_ms": 200})
+    for _ in range(30):
+        detector.process(_noise(0.032))
+    detector.force_start()
+    assert detector.in_utterance
+    detector.reset()
+    assert not detector.in_utterance and detector.voiced_ms == 0.0
+
+
+def test_segments_npy_replay(tmp_path):
+    path = tmp_path / "replay.npy"
+    np.save(path, np.concatenate([_noise(0.5), _speechlike(1.0), _noise(1.2)]))
+    segments = segment_audio(np.load(path), create_vad())
+    assert [seg.kind for seg in segments] == [SPEECH_END]
+
+
+def _glide(seconds, f0_start, f0_end, amp_start, amp_end):
+    n = int(SR * seconds)
+    phase = 2 * np.pi * np.cumsum(np.linspace(f0_start, f0_end, n)) / SR
+    voiced = sum(np.sin(k * phase) / k for k in range(1, 10))
+    return (np.linspace(amp_start, amp_end, n) * voiced / 2).astype(np.float32) + _noise(seconds)
+
+
+def _endpoint_after_speech(detector, speech, transcript=None, lag_ms=0.0):
+    """Silence (ms) after the speech ends until SPEECH_END fires."""
+    audio = np.concatenate([_noise(1.0), speech, _noise(2.0)])
+    speech_end_s = 1.0 + len(speech) / SR
+    for offset in range(0, len(audio) - 511, 512):
+        if transcript is not None and detector.in_utterance:
+            detector.set_transcript(transcript, lag_ms=lag_ms)
+        if detector.process(audio[offset:offset + 512]).event == SPEECH_END:
+            return ((offset + 512) / SR - speech_end_s) * 1000
+    return None
+
+
+def test_transcript_shape():
+    assert transcript_shape("Stop.") == SHAPE_COMMAND
+    assert transcript_shape("Argo, skip this song please") == SHAPE_COMMAND
+    assert transcript_shape("What time is it?") == SHAPE_COMPLETE
+    assert transcript_shape("play some music by") == SHAPE_INCOMPLETE
+    assert transcript_shape("I was thinking, um") == SHAPE_INCOMPLETE
+    assert transcript_shape("Tell me about the Roman empire.") == SHAPE_OPEN
+    assert transcript_shape("") is None
+
+
+def test_command_transcript_closes_fast_and_open_question_waits():
+    word = _speechlike(0.4)
+    fast = _endpoint_after_speech(create_vad(), word, transcript="Stop.")
+    assert fast is not None and fast <= 300 + 100
+    slow = _endpoint_after_speech(create_vad(), word, transcript="Tell me why the")
+    assert slow >= 1400 - 50
+    open_question = _endpoint_after_speech(create_vad(), _speechlike(1.5), transcript="Explain how tides work")
+    assert open_question >= 800 - 50
+    # A partial that stops short of the silence is stale: no fast close
+    stale = _endpoint_after_speech(create_vad(), word, transcript="Stop.", lag_ms=2000)
+    assert stale > 300 + 100
+
+
+def test_acoustic_tail_shapes_endpoint():
+    falling = np.concatenate([_glide(1.0, 150, 150, 0.2, 0.2), _glide(0.4, 150, 100, 0.2, 0.03)])
+    held = _glide(1.4, 150, 150, 0.2, 0.2)
+    assert _endpoint_after_speech(create_vad(), falling) < _endpoint_after_speech(create_vad(), held)
+    fixed = create_vad({"adaptive_endpoint": {"enabled": False}})
+    assert fixed.endpoint_policy is None
+    assert abs(_endpoint_after_speech(fixed, held) - 800) < 100
+
+
+def test_silero_engine_streams_frames():
+    pytest.importorskip("onnxruntime")
+    detector = create_vad({"engine": "silero"})
+    if detector.engine_name != "silero":
+        pytest.skip("Silero VAD model not available")
+    silence = [detector.process(_noise(0.032, amp=0.001)).probability for _ in range(20)]
+    assert max(silence) < 0.5
+    assert all(0.0 <= p <= 1.0 for p in silence)
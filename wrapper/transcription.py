@@ -179,9 +179,17 @@ class WhisperTranscriber:
     def _load_model(self):
         """Load Whisper model into memory."""
         try:
-            import whisper
+            import whisper  # noqa: F401
+            from core.stt_engine_manager import STTEngineManager
+            from core.stt_service import STTService
             logger.info(f"Loading Whisper model: {self.model_name} on device: {self.device}")
-            self.model = whisper.load_model(self.model_name, device=self.device)
+            # Shared per process through the model registry. The input shell
+            # (input_shell/app.py) is its own process, so it loads its own copy
+            # and its queue only orders requests within that process: upload
+            # priority does not defer to the main pipeline's live mic
+            self._manager = STTEngineManager(engine="openai", model_size=self.model_name, device=self.device)
+            self._service = STTService(self._manager)
+            self.model = self._manager.model
             logger.info(f"Whisper model loaded successfully")
         except ImportError:
             logger.error("Whisper not installed. Install with: pip install openai-whisper")
@@ -251,22 +259,24 @@ class WhisperTranscriber:
         try:
             logger.info(f"[{artifact.id}] Transcribing: {audio_path}")
             
-            # Whisper inference
-            result = self.model.transcribe(
-                str(audio_file),
+            # Whisper inference (FP32, queued behind any live-mic requests in
+            # this process). No mic boost: a file is already at its own level
+            import whisper
+            from core.stt_service import STTPriority
+            result = self._service.transcribe(
+                whisper.load_audio(str(audio_file)),
+                priority=STTPriority.UPLOAD,
                 language=language,
-                fp16=False,  # Force FP32 (CPU optimized)
-                verbose=False
+                source="upload",
+                input_gain=1.0,
             )
             
             artifact.transcript_text = result.get("text", "").strip()
-            artifact.language_detected = result.get("language", "unknown")
+            artifact.language_detected = result.get("language") or "unknown"
             
             # Confidence proxy: use average probability from segments
-            if "segments" in result and result["segments"]:
-                probs = [seg.get("no_speech_prob", 0.0) for seg in result["segments"]]
-                avg_no_speech_prob = sum(probs) / len(probs) if probs else 0.0
-                artifact.confidence = 1.0 - avg_no_speech_prob  # Inverse of no-speech probability
+            if result.get("no_speech_prob") is not None:
+                artifact.confidence = 1.0 - result["no_speech_prob"]  # Inverse of no-speech probability
             else:
                 artifact.confidence = 0.9  # Default high confidence if no segments
             